@@ -6,30 +6,32 @@ Endpoints:
     GET  /api/health
     POST /api/extratos/processar   → retorna JSON com transações
     POST /api/boletos/processar    → retorna JSON com correspondências
+    GET  /metrics                  → métricas no formato do Prometheus
 """
 
 import os
 import sys
-import io
 from flask import Flask, request, jsonify
 from flask_cors import CORS
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from extrator_contajur.auxiliares.pdf_reader import read_pdf
-from extrator_contajur.auxiliares.pdf_reader2 import read_pdf2
-from extrator_contajur.banco import get_processor
-from extrator_contajur.auxiliares.xml_to_csv import xml_to_csv
-from boletos.processador import processar_boletos
+from extrator_contajur.auxiliares.documento import banco_identificado
+from extrator_contajur.auxiliares.processamento import PIPELINE_EXTRATOS, ErroLeituraPDF, ErroParser, medir
+from extrator_contajur.auxiliares.tempos import tempos_pedidos
+from extrator_contajur.auxiliares.upload import PDFEnviado, RequisicaoUpload
+from extrator_contajur.auxiliares.utils import ResultadoExtrato
+from home.metricas import instrumentar
 
 app = Flask(__name__)
 CORS(app)
+# Uploads grandes gravados direto em UPLOAD_DIR, sem uma segunda cópia (ver PDFEnviado)
+app.request_class = RequisicaoUpload
 app.config['MAX_CONTENT_LENGTH'] = 80 * 1024 * 1024
+instrumentar(app)
 
-BANKS_USING_PDF2 = {
-    'Asaas', 'Bradesco', 'Sicoob1', 'Sicoob2', 'Sicoob3', 'Stone', 'Sicredi', 'Itaú4',
-    'Banco do Brasil1', 'Safra', 'Santander2', 'Efi1', 'Efi2', 'Mercado Pago', 'Caixa2'
-}
+# Rota nos ganchos do pipeline (logs e histograma de tempos)
+ROTA_EXTRATOS = 'extratos/processar'
 
 
 # ---------------------------------------------------------------------------
@@ -54,10 +56,15 @@ def processar_extratos():
     Form-data:
         file: arquivo PDF
 
+    Query string (opcional):
+        tempos=1: inclui "tempos" (ms por etapa) na resposta
+
     Resposta de sucesso (200):
         {
             "success": true,
             "banco": str,
+            "cliente": str | null,     # nome do titular, como está no extrato
+            "periodo": str | null,     # "04-2025" ou "01-04-2025_30-04-2025"
             "filename": str,
             "transacoes": [
                 {"data": str, "descricao": str, "valor": str, "tipo": str}
@@ -74,62 +81,40 @@ def processar_extratos():
     if not file.filename.lower().endswith('.pdf'):
         return jsonify({'success': False, 'error': 'Extensão inválida (esperado .pdf)'}), 400
 
-    content = file.read()
-    if not content.startswith(b'%PDF-'):
-        return jsonify({'success': False, 'error': 'Conteúdo não é um PDF válido'}), 400
-
-    file.seek(0)
-    try:
-        text, bank = read_pdf(file)
-    except Exception as e:
-        return jsonify({'success': False, 'error': f'Erro ao ler PDF: {e}'}), 500
-
-    if bank.startswith('Erro') or bank == 'Banco não identificado':
-        return jsonify({'success': False, 'error': 'Banco não identificado'}), 422
+    with PDFEnviado.de_upload(file) as pdf:
+        if not pdf.eh_pdf:
+            return jsonify({'success': False, 'error': 'Conteúdo não é um PDF válido'}), 400
 
-    if bank in BANKS_USING_PDF2:
-        file.seek(0)
+        tempos = {}
         try:
-            text = read_pdf2(file)
-        except Exception as e:
-            return jsonify({'success': False, 'error': f'Erro ao re-ler PDF: {e}'}), 500
-
-    try:
-        processor = get_processor(bank)
-        xml_data, _ = processor(text)
-        if xml_data is None:
-            return jsonify({'success': False, 'error': 'Nenhuma transação encontrada'}), 422
-        xml_data.seek(0)
-        csv_data = xml_to_csv(xml_data)
-    except Exception as e:
-        return jsonify({'success': False, 'error': f'Erro no processamento: {e}'}), 500
-
-    if isinstance(csv_data, io.BytesIO):
-        csv_text = csv_data.getvalue().decode('utf-8-sig')
-    elif isinstance(csv_data, io.StringIO):
-        csv_text = csv_data.getvalue()
-    else:
-        csv_text = csv_data if isinstance(csv_data, str) else csv_data.decode('utf-8-sig')
-
-    transacoes = []
-    for line in csv_text.splitlines():
-        line = line.strip()
-        if not line:
-            continue
-        parts = line.split(';')
-        if len(parts) >= 4:
-            transacoes.append({
-                'data': parts[0],
-                'descricao': parts[1],
-                'valor': parts[2],
-                'tipo': parts[3]
-            })
+            extracao = PIPELINE_EXTRATOS.extrair(pdf.fonte, file.filename, tempos=tempos)
+        except ErroLeituraPDF as e:
+            PIPELINE_EXTRATOS.concluir(ROTA_EXTRATOS, file.filename, None, tempos, sucesso=False)
+            return jsonify({'success': False, 'error': f'Erro ao ler PDF: {e}'}), 500
+        except ErroParser as e:
+            PIPELINE_EXTRATOS.concluir(ROTA_EXTRATOS, file.filename, None, tempos, sucesso=False)
+            return jsonify({'success': False, 'error': f'Erro no processamento: {e}'}), 500
+
+    bank, extraidas = extracao.banco, extracao.transacoes
+    extras = {'tempos': tempos} if tempos_pedidos(request.args.get('tempos')) else {}
+    if not banco_identificado(bank):
+        PIPELINE_EXTRATOS.concluir(ROTA_EXTRATOS, file.filename, None, tempos, sucesso=False)
+        return jsonify({'success': False, 'error': 'Banco não identificado', **extras}), 422
+    if not extraidas:
+        PIPELINE_EXTRATOS.concluir(ROTA_EXTRATOS, file.filename, bank, tempos, sucesso=False)
+        return jsonify({'success': False, 'error': 'Nenhuma transação encontrada', **extras}), 422
+    with medir(tempos, 'json'):
+        transacoes = ResultadoExtrato(extraidas).para_json()
+    PIPELINE_EXTRATOS.concluir(ROTA_EXTRATOS, file.filename, bank, tempos, transacoes=len(transacoes))
 
     return jsonify({
         'success': True,
         'banco': bank,
+        'cliente': extracao.cliente,
+        'periodo': extracao.periodo,
         'filename': file.filename,
-        'transacoes': transacoes
+        'transacoes': transacoes,
+        **extras
     })
 
 
@@ -155,6 +140,8 @@ def processar_boletos_endpoint():
             "total_sem_correspondencia": int
         }
     """
+    from boletos.processador import processar_boletos
+
     if 'csv1' not in request.files or 'csv2' not in request.files:
         return jsonify({'success': False,
                         'error': 'Ambos os arquivos são obrigatórios (csv1 e csv2)'}), 400
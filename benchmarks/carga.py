@@ -0,0 +1,224 @@
+"""
+Teste de carga dos modos de servir o portal (gunicorn.conf.py).
+
+    python benchmarks/carga.py                              # flask, sync e gthread, com home.main
+    python benchmarks/carga.py --app api_server -d 30
+    python benchmarks/carga.py --modos gthread gevent --pesados 4 --leves 8 --workers 2
+
+Para cada modo sobe o servidor numa porta livre e, durante `--duracao` segundos,
+`--pesados` clientes enviam sem parar um extrato em PDF para a rota de
+processamento enquanto `--leves` clientes pedem uma página leve (/ no portal,
+/api/health no api_server). O que interessa é a latência das requisições leves:
+se o processamento de PDF segura o servidor, elas esperam junto.
+
+O modo "flask" é o servidor de desenvolvimento (python -m home.main ou python
+api_server.py), para comparação; os demais são o GUNICORN_WORKER_CLASS do
+gunicorn.conf.py. O PDF é gerado de um extrato sintético (extratos_sinteticos.py)
+ou lido de --pdf. O cache de extratos fica desligado, senão só o primeiro envio
+processaria de verdade.
+"""
+import argparse
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+import uuid
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+MODOS = ("flask", "sync", "gthread", "gevent")
+# (módulo do app, comando do servidor de desenvolvimento, rota leve, rota de PDF, campo do arquivo)
+APPS = {
+    "home.main": ("home.main:app", [sys.executable, "-m", "home.main"], "/", "/api/process-extracts", "files"),
+    "api_server": ("api_server:app", [sys.executable, "api_server.py"], "/api/health",
+                   "/api/extratos/processar", "file"),
+}
+
+
+def _porta_livre():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def gerar_pdf(banco, lancamentos):
+    """PDF de texto com o extrato sintético do banco (45 linhas por página)."""
+    import fitz
+
+    from extratos_sinteticos import gerar
+
+    linhas = gerar(banco, lancamentos).split("\n")
+    doc = fitz.open()
+    for i in range(0, len(linhas), 45):
+        doc.new_page().insert_text((30, 30), "\n".join(linhas[i:i + 45]), fontsize=9)
+    return doc.tobytes()
+
+
+def _multipart(campo, nome, conteudo):
+    fronteira = uuid.uuid4().hex
+    corpo = (
+        f'--{fronteira}\r\nContent-Disposition: form-data; name="{campo}"; filename="{nome}"\r\n'
+        f"Content-Type: application/pdf\r\n\r\n"
+    ).encode() + conteudo + f"\r\n--{fronteira}--\r\n".encode()
+    return corpo, f"multipart/form-data; boundary={fronteira}"
+
+
+class Servidor:
+    """Servidor do app num subprocesso, no modo pedido, até sair do bloco with."""
+
+    def __init__(self, app, modo, workers, threads):
+        self.app = app
+        self.modo = modo
+        self.workers = workers
+        self.threads = threads
+        self.porta = _porta_livre()
+        self._processo = None
+        self._pasta = None
+
+    def __enter__(self):
+        self._pasta = tempfile.mkdtemp(prefix="carga_")
+        ambiente = dict(
+            os.environ,
+            PYTHONPATH=str(RAIZ),
+            PORT=str(self.porta),
+            EXTRATOR_CACHE_MEMORIA="0",
+            EXTRATOR_CACHE_DISCO_MB="0",
+            EXTRATOR_LOG_TEMPOS="0",
+            EXTRATOR_RESULTADOS_DIR=self._pasta,
+            GUNICORN_BIND=f"127.0.0.1:{self.porta}",
+            GUNICORN_WORKER_CLASS=self.modo,
+            GUNICORN_ACCESSLOG="",
+            WEB_CONCURRENCY=str(self.workers),
+            GUNICORN_THREADS=str(self.threads),
+        )
+        alvo, comando_dev, rota_leve, _, _ = APPS[self.app]
+        if self.modo == "flask":
+            comando = comando_dev
+        else:
+            comando = [sys.executable, "-m", "gunicorn", "-c", str(RAIZ / "gunicorn.conf.py"), alvo]
+        # Log em arquivo: um pipe não lido enche e trava o servidor
+        log = os.path.join(self._pasta, "servidor.log")
+        with open(log, "w") as saida:
+            self._processo = subprocess.Popen(comando, cwd=RAIZ, env=ambiente, stdout=saida, stderr=subprocess.STDOUT)
+        url = f"http://127.0.0.1:{self.porta}{rota_leve}"
+        limite = time.monotonic() + 60
+        while time.monotonic() < limite:
+            if self._processo.poll() is not None:
+                with open(log, encoding="utf-8", errors="replace") as saida:
+                    ultima = (saida.read().strip().splitlines() or ["?"])[-1]
+                shutil.rmtree(self._pasta, ignore_errors=True)
+                raise RuntimeError(f"servidor saiu ao subir: {ultima}")
+            try:
+                urllib.request.urlopen(url, timeout=2).read()
+                return self
+            except (urllib.error.URLError, OSError):
+                time.sleep(0.2)
+        self.__exit__(None, None, None)
+        raise RuntimeError("servidor não respondeu em 60 s")
+
+    def __exit__(self, exc_type, exc, tb):
+        self._processo.terminate()
+        try:
+            self._processo.wait(timeout=30)
+        except subprocess.TimeoutExpired:
+            self._processo.kill()
+        shutil.rmtree(self._pasta, ignore_errors=True)
+
+
+def _cliente(url, corpo, tipo, fim, latencias, erros, timeout):
+    while time.monotonic() < fim:
+        pedido = urllib.request.Request(url, data=corpo, headers={"Content-Type": tipo} if tipo else {})
+        inicio = time.perf_counter()
+        try:
+            with urllib.request.urlopen(pedido, timeout=timeout) as resposta:
+                resposta.read()
+            latencias.append(time.perf_counter() - inicio)
+        except (urllib.error.URLError, OSError) as e:
+            erros.append(str(e))
+
+
+def _percentil(valores, p):
+    if not valores:
+        return float("nan")
+    ordenados = sorted(valores)
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p))]
+
+
+def medir_modo(app, modo, pdf, args):
+    """{leves: (latências, erros), pesados: (latências, erros)} de um modo."""
+    _, _, rota_leve, rota_pdf, campo = APPS[app]
+    corpo, tipo = _multipart(campo, "extrato.pdf", pdf)
+    with Servidor(app, modo, args.workers, args.threads) as servidor:
+        base = f"http://127.0.0.1:{servidor.porta}"
+        fim = time.monotonic() + args.duracao
+        medicao = {"leves": ([], []), "pesados": ([], [])}
+        clientes = [
+            threading.Thread(target=_cliente, args=(base + rota_pdf, corpo, tipo, fim, *medicao["pesados"],
+                                                    args.timeout))
+            for _ in range(args.pesados)
+        ] + [
+            threading.Thread(target=_cliente, args=(base + rota_leve, None, None, fim, *medicao["leves"],
+                                                    args.timeout))
+            for _ in range(args.leves)
+        ]
+        for cliente in clientes:
+            cliente.start()
+        for cliente in clientes:
+            cliente.join()
+    return medicao
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Teste de carga dos modos de servir o portal")
+    parser.add_argument("--app", choices=sorted(APPS), default="home.main")
+    parser.add_argument("--modos", nargs="+", choices=MODOS, default=["flask", "sync", "gthread"])
+    parser.add_argument("-d", "--duracao", type=float, default=20, help="segundos por modo (padrão: %(default)s)")
+    parser.add_argument("--pesados", type=int, default=2, help="clientes enviando PDF (padrão: %(default)s)")
+    parser.add_argument("--leves", type=int, default=4, help="clientes na rota leve (padrão: %(default)s)")
+    parser.add_argument("--workers", type=int, default=2, help="WEB_CONCURRENCY (padrão: %(default)s)")
+    parser.add_argument("--threads", type=int, default=4, help="GUNICORN_THREADS (padrão: %(default)s)")
+    parser.add_argument("--timeout", type=float, default=120, help="timeout de cada requisição em segundos")
+    parser.add_argument("--pdf", help="PDF enviado pelos clientes pesados (padrão: extrato sintético)")
+    parser.add_argument("--banco", default="Sicredi", help="banco do extrato sintético (padrão: %(default)s)")
+    parser.add_argument("-n", "--lancamentos", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    if args.pdf:
+        pdf = Path(args.pdf).read_bytes()
+    else:
+        pdf = gerar_pdf(args.banco, args.lancamentos)
+
+    print(f"{args.app}: {args.pesados} cliente(s) de PDF ({len(pdf) / 1024:.0f} KB), {args.leves} leve(s), "
+          f"{args.duracao:g} s por modo, {args.workers} worker(s)\n")
+    cabecalho = (f"{'modo':<10}{'leves/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'max ms':>9}"
+                 f"{'PDFs/s':>9}{'PDF p50 ms':>12}{'erros':>7}")
+    print(cabecalho)
+    print("-" * len(cabecalho))
+    for modo in args.modos:
+        try:
+            medicao = medir_modo(args.app, modo, pdf, args)
+        except RuntimeError as e:
+            print(f"{modo:<10}falhou: {e}")
+            continue
+        leves, erros_leves = medicao["leves"]
+        pesados, erros_pesados = medicao["pesados"]
+        print(f"{modo:<10}{len(leves) / args.duracao:>9.1f}"
+              f"{_percentil(leves, 0.5) * 1000:>9.0f}{_percentil(leves, 0.95) * 1000:>9.0f}"
+              f"{max(leves, default=float('nan')) * 1000:>9.0f}"
+              f"{len(pesados) / args.duracao:>9.2f}{_percentil(pesados, 0.5) * 1000:>12.0f}"
+              f"{len(erros_leves) + len(erros_pesados):>7}", flush=True)
+        for erro in sorted(set(erros_leves + erros_pesados))[:3]:
+            print(f"{'':<10}erro: {erro}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
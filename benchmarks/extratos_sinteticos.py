@@ -0,0 +1,522 @@
+"""
+Gerador de extratos sintéticos para os benchmarks dos parsers.
+
+Cada função recebe a quantidade de lançamentos e devolve o texto do extrato no
+layout do banco, como sai do read_pdf/read_pdf2: cabeçalho, lançamentos de
+crédito e débito (com descrições de uma ou mais linhas), saldos do dia e o
+cabeçalho repetido a cada página. Os valores são determinísticos (semente fixa),
+então o mesmo `n` sempre gera o mesmo texto.
+"""
+import random
+
+LANCAMENTOS_POR_PAGINA = 30
+
+_HISTORICOS_CREDITO = [
+    "PIX RECEBIDO", "TED RECEBIDA", "CREDITO COBRANCA", "DEPOSITO EM DINHEIRO",
+    "RECEBIMENTO CARTAO", "TRANSFERENCIA RECEBIDA",
+]
+_HISTORICOS_DEBITO = [
+    "PIX EMITIDO", "PAGAMENTO DE BOLETO", "TARIFA BANCARIA", "DEBITO AUTOMATICO",
+    "PAGAMENTO FORNECEDOR", "TRANSFERENCIA ENVIADA",
+]
+_NOMES = [
+    "MARIA DA SILVA", "JOAO PEREIRA LTDA", "COMERCIO DE ALIMENTOS SA", "ANA SOUZA",
+    "DISTRIBUIDORA CENTRAL EIRELI", "PEDRO ALVES ME", "CONSTRUTORA HORIZONTE LTDA",
+]
+_MESES_ABREV = ["jan", "fev", "mar", "abr", "mai", "jun", "jul", "ago", "set", "out", "nov", "dez"]
+_MESES_NOME = [
+    "Janeiro", "Fevereiro", "Março", "Abril", "Maio", "Junho", "Julho", "Agosto",
+    "Setembro", "Outubro", "Novembro", "Dezembro",
+]
+
+ANO = 2025
+MES = 4
+
+
+def formatar_valor(centavos):
+    """1234567 -> '12.345,67'"""
+    inteiro, resto = divmod(abs(centavos), 100)
+    return f"{inteiro:,}".replace(",", ".") + f",{resto:02d}"
+
+
+class _Lancamento:
+    def __init__(self, rng, indice):
+        self.indice = indice
+        self.dia = rng.randint(1, 28)
+        self.credito = rng.random() < 0.45
+        # Valores de centavos a dezenas de milhares, com alguns redondos (,00)
+        centavos = int(rng.lognormvariate(9, 1.6)) + 1
+        if rng.random() < 0.15:
+            centavos = max(centavos - centavos % 100, 100)
+        self.centavos = centavos
+        historicos = _HISTORICOS_CREDITO if self.credito else _HISTORICOS_DEBITO
+        self.historico = historicos[indice % len(historicos)]
+        self.nome = _NOMES[indice % len(_NOMES)]
+        self.documento = f"{100000 + indice * 37 % 900000:06d}"
+        self.duas_linhas = rng.random() < 0.5
+
+    @property
+    def valor(self):
+        return formatar_valor(self.centavos)
+
+    @property
+    def data(self):
+        return f"{self.dia:02d}/{MES:02d}/{ANO}"
+
+    @property
+    def dia_mes(self):
+        return f"{self.dia:02d}/{MES:02d}"
+
+
+def _lancamentos(n, semente=42):
+    rng = random.Random(semente)
+    lancamentos = [_Lancamento(rng, i) for i in range(n)]
+    lancamentos.sort(key=lambda lanc: lanc.dia)
+    return lancamentos
+
+
+def _por_dia(lancamentos):
+    dia = None
+    grupo = []
+    for lanc in lancamentos:
+        if lanc.dia != dia and grupo:
+            yield grupo
+            grupo = []
+        dia = lanc.dia
+        grupo.append(lanc)
+    if grupo:
+        yield grupo
+
+
+def _paginas(lancamentos, por_pagina=LANCAMENTOS_POR_PAGINA):
+    for inicio in range(0, len(lancamentos), por_pagina):
+        yield inicio // por_pagina, lancamentos[inicio:inicio + por_pagina]
+
+
+# ── Sicoob ───────────────────────────────────────────────────────────────────
+
+def sicoob1(n):
+    linhas = [
+        "PLATAFORMA DE SERVIÇOS FINANCEIROS DO SICOOB - SISBR",
+        "EXTRATO CONTA CORRENTE",
+        f"PERÍODO: 01/{MES:02d}/{ANO} - 30/{MES:02d}/{ANO}",
+        "DATA  HISTÓRICO  VALOR",
+        f"01/{MES:02d}", "SALDO ANTERIOR", "10.000,00C",
+    ]
+    for grupo in _por_dia(_lancamentos(n)):
+        for lanc in grupo:
+            linhas.append(lanc.dia_mes)
+            linhas.append(lanc.historico)
+            tipo = "C" if lanc.credito else "D"
+            if lanc.duas_linhas:
+                linhas += [lanc.valor, tipo]
+            else:
+                linhas.append(lanc.valor + tipo)
+            linhas += [lanc.nome, f"DOC.: {lanc.documento}"]
+        linhas += [grupo[0].dia_mes, "SALDO DO DIA", "12.345,67C"]
+    linhas += ["RESUMO", "SALDO EM C.CORRENTE 12.345,67C"]
+    return "\n".join(linhas)
+
+
+def sicoob2(n):
+    linhas = [f"30/{MES:02d}/{ANO} 10:15 Sicoob", "Extrato de conta corrente", f"Periodo: 01/{MES:02d}/{ANO} a 30/{MES:02d}/{ANO}"]
+    for pagina, lancamentos in _paginas(_lancamentos(n)):
+        if pagina:
+            linhas += [f"30/{MES:02d}/{ANO}, 10:15", "Sicoob | Extrato",
+                       "https://www.sicoob.com.br/sicoobnet/ib/#/home-extrato", "Data Histórico Valor"]
+        for grupo in _por_dia(lancamentos):
+            for lanc in grupo:
+                linhas += [lanc.dia_mes, lanc.historico]
+                if lanc.duas_linhas:
+                    linhas.append(lanc.nome)
+                linhas.append(f"R$ {lanc.valor}{'C' if lanc.credito else 'D'}")
+            linhas += ["SALDO DO DIA", "R$ 12.345,67C"]
+    return "\n".join(linhas)
+
+
+def sicoob3(n):
+    linhas = ["SICOOB", "EXTRATO CONTA CORRENTE", "DATA DOCUMENTO HISTÓRICO VALOR",
+              f"01/{MES:02d}/{ANO}", "SALDO ANTERIOR", "10.000,00C"]
+    for grupo in _por_dia(_lancamentos(n)):
+        for lanc in grupo:
+            linhas.append(lanc.data)
+            linhas.append("Pix" if lanc.duas_linhas else lanc.documento)
+            linhas += [lanc.historico, lanc.nome, f"{lanc.valor}{'C' if lanc.credito else 'D'}"]
+        linhas += ["SALDO DO DIA ===== >", "12.345,67C"]
+    linhas += ["RESUMO"]
+    return "\n".join(linhas)
+
+
+# ── Itaú ─────────────────────────────────────────────────────────────────────
+
+def itau(n):
+    linhas = ["Itaú Empresas", f"lançamentos período: 01/{MES:02d}/{ANO} até 30/{MES:02d}/{ANO}",
+              "data lançamentos valor (R$) saldo (R$)", "SALDO ANTERIOR 10.000,00"]
+    mes = _MESES_ABREV[MES - 1]
+    for grupo in _por_dia(_lancamentos(n)):
+        for lanc in grupo:
+            valor = lanc.valor if lanc.credito else f"-{lanc.valor}"
+            data = f"{lanc.dia:02d} / {mes}" if lanc.duas_linhas else f"{lanc.dia:02d}/{mes}"
+            linhas.append(f"{data} {lanc.historico} {lanc.nome} {valor}")
+        linhas.append(f"{grupo[0].dia:02d}/{mes} SALDO TOTAL DISPONÍVEL DIA 12.345,67")
+    linhas.append("saldo da conta corrente 12.345,67")
+    return "\n".join(linhas)
+
+
+def itau2(n):
+    linhas = ["dados gerais", "nome agência/conta", "extrato completo", "data horário descrição valor"]
+    for grupo in _por_dia(_lancamentos(n)):
+        linhas.append(grupo[0].data)
+        for lanc in grupo:
+            valor = f"R$ {lanc.valor}" if lanc.credito else f"- R$ {lanc.valor}"
+            linhas.append(f"{lanc.historico} {lanc.nome} {valor}")
+        linhas.append("saldo do dia R$ 12.345,67")
+    return "\n".join(linhas)
+
+
+def itau3(n):
+    linhas = [f"extrato mensal {_MESES_NOME[MES - 1].lower()} {ANO} 001|002",
+              "data descrição entradas R$ saídas R$ saldo R$"]
+    for grupo in _por_dia(_lancamentos(n)):
+        for posicao, lanc in enumerate(grupo):
+            valor = lanc.valor if lanc.credito else f"{lanc.valor}-"
+            texto = f"{lanc.historico} {lanc.nome} {valor}"
+            linhas.append(f"{lanc.dia_mes} {texto}" if posicao == 0 else texto)
+        linhas.append("SALDO APLIC AUT MAIS 1.000,00")
+    linhas.append("Saldo final 12.345,67")
+    return "\n".join(linhas)
+
+
+def itau4(n):
+    linhas = ["Extrato conta corrente", "Data Lançamentos Valor (R$) Saldo (R$)"]
+    for grupo in _por_dia(_lancamentos(n)):
+        for lanc in grupo:
+            linhas += [lanc.data, lanc.historico]
+            if lanc.duas_linhas:
+                linhas.append(lanc.nome)
+            linhas.append(lanc.valor if lanc.credito else f"-{lanc.valor}")
+        linhas += [grupo[0].data, "SALDO TOTAL DISPONÍVEL DIA", "12.345,67"]
+    linhas.append("Os saldos acima são baseados nas informações disponíveis")
+    return "\n".join(linhas)
+
+
+# ── Caixa ────────────────────────────────────────────────────────────────────
+
+def caixa(n):
+    linhas = ["Extrato por período", "DATA MOV. NR. DOC. HISTÓRICO VALOR SALDO"]
+    for grupo in _por_dia(_lancamentos(n)):
+        for lanc in grupo:
+            valor = f"{lanc.valor} C" if lanc.credito else f"-{lanc.valor} D"
+            linhas.append(f"{lanc.data} {lanc.documento} {lanc.historico} {valor} 12.345,67 C")
+        linhas.append(f"{grupo[0].data} 000000 SALDO DIA 0,00 C 12.345,67 C")
+    linhas.append("* 661 Saldo disponível")
+    return "\n".join(linhas)
+
+
+def caixa2(n):
+    linhas = [f"30/{MES:02d}/{ANO},10:15:00", "about:blank", "Extrato no período",
+              "Data", "Data Efetiva", "Documento", "Histórico", "Valor", "Saldo"]
+    for lanc in _lancamentos(n):
+        linhas += [lanc.data, f"{lanc.dia:02d}/{MES:02d} 10:30", lanc.documento, lanc.historico]
+        if lanc.duas_linhas:
+            linhas += [lanc.nome, f"E{lanc.documento}ABCDEFGHIJKLMN"]
+        sinal = "" if lanc.credito else "- "
+        linhas += [f"{sinal}R$\xa0{lanc.valor}", "R$\xa012.345,67 C"]
+    return "\n".join(linhas)
+
+
+# ── Outros bancos ────────────────────────────────────────────────────────────
+
+def inter(n):
+    linhas = ["Solicitado em: 30/04/2025", f"Período: 01/{MES:02d}/{ANO} a 30/{MES:02d}/{ANO}",
+              "Saldo total Saldo disponível Saldo bloqueado"]
+    for grupo in _por_dia(_lancamentos(n)):
+        linhas.append(f"{grupo[0].dia} de {_MESES_NOME[MES - 1]} de {ANO} Saldo do dia: R$ 12.345,67")
+        for lanc in grupo:
+            valor = f"R$ {lanc.valor}" if lanc.credito else f"-R$ {lanc.valor}"
+            linhas.append(f'{lanc.historico}: "{lanc.nome}" {valor} R$ 12.345,67')
+    linhas.append("Fale com a gente SAC: 0800 940 9999 Ouvidoria: 0800 940 7772")
+    return "\n".join(linhas)
+
+
+def nubank(n):
+    linhas = ["EMPRESA TESTE LTDA", "Movimentações"]
+    meses = ["JAN", "FEV", "MAR", "ABR", "MAI", "JUN", "JUL", "AGO", "SET", "OUT", "NOV", "DEZ"]
+    for pagina, lancamentos in _paginas(_lancamentos(n)):
+        if pagina:
+            linhas += ["Tem alguma dúvida? Mande uma mensagem para nosso time de atendimento",
+                       "Extrato gerado dia 30 de abril de 2025", "Ouvidoria 0800 887 0463",
+                       "Página 2", "CNPJ 00.000.000/0001-00", "Movimentações"]
+        for grupo in _por_dia(lancamentos):
+            data = f"{grupo[0].dia:02d} {meses[MES - 1]} {ANO}"
+            linhas.append(f"{data} Total de entradas + 1.234,56")
+            for lanc in grupo:
+                historico = "Transferência recebida pelo Pix" if lanc.credito else "Transferência enviada pelo Pix"
+                linhas.append(f"{historico} {lanc.nome} - {lanc.documento} {lanc.valor}")
+            linhas += ["Total de saídas - 100,00", "Saldo do dia 12.345,67"]
+    linhas.append("O saldo líquido corresponde")
+    return "\n".join(linhas)
+
+
+def bradesco(n):
+    linhas = ["Extrato Mensal / Por Período", "Agência | Conta", "EMPRESA TESTE LTDA | CNPJ: 12.345.678/0001-90",
+              "Data", "Lançamento", "Dcto.", "Crédito (R$)", "Débito (R$)", "Saldo (R$)",
+              "SALDO ANTERIOR", "10.000,00"]
+    for pagina, lancamentos in _paginas(_lancamentos(n)):
+        if pagina:
+            linhas += [f"Folha {pagina + 1}", "AGENCIA: 1234-5 CONTA: 12345-6",
+                       f"01/{MES:02d}/{ANO} - 30/{MES:02d}/{ANO}", "Data Lançamento Dcto. Crédito (R$) Débito (R$) Saldo (R$)"]
+        for grupo in _por_dia(lancamentos):
+            linhas.append(grupo[0].data)
+            for lanc in grupo:
+                linhas.append(lanc.historico)
+                if lanc.duas_linhas:
+                    linhas.append(f"DES: {lanc.nome}")
+                linhas.append(lanc.documento)
+                linhas.append(lanc.valor if lanc.credito else f"-{lanc.valor}")
+                linhas.append("12.345,67")
+    linhas += ["Os dados acima têm como base", "SALDO INVEST FÁCIL", "1.000,00"]
+    return "\n".join(linhas)
+
+
+def santander1(n):
+    linhas = ["Internet Banking Empresarial", "Agência: 1234 Conta: 13000123-4",
+              f"Período: 01/{MES:02d}/{ANO} a 30/{MES:02d}/{ANO}", "Data Histórico Valor Saldo"]
+    for lanc in _lancamentos(n):
+        if lanc.duas_linhas:
+            valor = lanc.valor if lanc.credito else f"-{lanc.valor}"
+            linhas.append(f"{lanc.data} {lanc.historico} {lanc.nome} {valor} 12.345,67")
+        else:
+            valor = f"R$ {lanc.valor}" if lanc.credito else f"- R$ {lanc.valor}"
+            linhas.append(f"{lanc.data} {lanc.historico} {lanc.nome} {valor}")
+    linhas.append("Central de Atendimento 4004-2125")
+    return "\n".join(linhas)
+
+
+def santander2(n):
+    linhas = ["EXTRATO CONSOLIDADO INTELIGENTE", f"{_MESES_NOME[MES - 1]}/{ANO}"] + [f"linha {i}" for i in range(10)]
+    linhas += ["Movimentação", f"Saldo em 31/{MES - 1:02d}", "10.000,00"]
+    for pagina, lancamentos in _paginas(_lancamentos(n)):
+        if pagina:
+            linhas += ["Extrato_PJ_A4_Inteligente"] + [f"cabecalho {i}" for i in range(9)]
+        for grupo in _por_dia(lancamentos):
+            linhas.append(grupo[0].dia_mes)
+            for lanc in grupo:
+                linhas.append(lanc.historico)
+                if lanc.duas_linhas:
+                    linhas.append(lanc.nome)
+                linhas.append(lanc.valor if lanc.credito else f"{lanc.valor}-")
+            linhas.append("12.345,67")
+    linhas += [f"Saldo em 30/{MES:02d}", "12.345,67"]
+    return "\n".join(linhas)
+
+
+def sicredi(n):
+    linhas = ["Sicredi Fone 0800 724 4770", "Cooperativa: 0101", "Conta Corrente: 12345-6",
+              "Extrato", "Data Descrição Documento Valor (R$) Saldo (R$)", "SALDO ANTERIOR 10.000,00"]
+    for pagina, lancamentos in _paginas(_lancamentos(n)):
+        if pagina:
+            linhas += ["Impresso em 30/04/2025", "Data", "Descrição", "Documento", "Valor (R$)", "Saldo (R$)"]
+        for lanc in lancamentos:
+            linhas.append(f"{lanc.data}{lanc.historico}")
+            linhas += [lanc.nome, lanc.documento]
+            valor = lanc.valor if lanc.credito else f"-{lanc.valor}"
+            if lanc.duas_linhas:
+                linhas.append(f"{valor} 12.345,67")
+            else:
+                linhas += [valor, "12.345,67"]
+    return "\n".join(linhas)
+
+
+def pagbank(n):
+    linhas = ["Extrato PagBank", "Data Descrição Valor"]
+    for grupo in _por_dia(_lancamentos(n)):
+        for lanc in grupo:
+            valor = f"R$ {lanc.valor}" if lanc.credito else f"-R$ {lanc.valor}"
+            linhas.append(f"{lanc.data} {lanc.historico} {lanc.nome} {valor}")
+        linhas.append(f"{grupo[0].data} Saldo do dia R$ 12.345,67")
+    return "\n".join(linhas)
+
+
+def stone(n):
+    linhas = ["Extrato de conta", "EMPRESA TESTE LTDA", "DATA", "TIPO", "DESCRIÇÃO", "VALOR", "SALDO", "CONTRAPARTE"]
+    for pagina, lancamentos in _paginas(_lancamentos(n)):
+        if pagina:
+            linhas += ["DATA", "TIPO", "DESCRIÇÃO", "VALOR", "SALDO", "CONTRAPARTE"]
+        for lanc in lancamentos:
+            ano_curto = lanc.data[:6] + lanc.data[8:] if lanc.duas_linhas else lanc.data
+            tipo = ("Crédito" if lanc.credito else "Débito") if lanc.indice % 3 else ("Entrada" if lanc.credito else "Saída")
+            valor = f"R$ {lanc.valor}" if lanc.credito else f"- R$ {lanc.valor}"
+            linhas += [ano_curto, tipo, lanc.historico, valor, "R$ 12.345,67", lanc.nome]
+    linhas += ["Informações do Comprovante", "rodapé"]
+    return "\n".join(linhas)
+
+
+def bancobrasil1(n):
+    linhas = ["Consultas - Extrato de conta corrente", f"Período: 01/{MES:02d}/{ANO} a 30/{MES:02d}/{ANO}",
+              f"01/{MES:02d}/{ANO}", "Saldo Anterior", "10.000,00 C"]
+    for grupo in _por_dia(_lancamentos(n)):
+        for lanc in grupo:
+            linhas += [lanc.data, lanc.historico, lanc.documento,
+                       f"{lanc.valor} {'C' if lanc.credito else 'D'}"]
+            if lanc.duas_linhas:
+                linhas.append(lanc.nome)
+        linhas += [grupo[0].data, "S A L D O", "12.345,67 C"]
+    return "\n".join(linhas)
+
+
+def bancobrasil2(n):
+    linhas = ["Extrato de Conta Corrente", "Cliente EMPRESA TESTE LTDA", "Dia Lote Documento Histórico Valor",
+              f"01/{MES:02d}/{ANO} 0000 Saldo Anterior 10.000,00 (+)"]
+    for pagina, lancamentos in _paginas(_lancamentos(n)):
+        if pagina:
+            linhas += ["Extrato de Conta Corrente", "Cliente EMPRESA TESTE LTDA", "Dia Lote Documento Histórico Valor"]
+        for lanc in lancamentos:
+            valor = lanc.valor.replace(",", "\t") if lanc.duas_linhas else lanc.valor
+            linhas.append(f"{lanc.data}  14024  {lanc.documento} {lanc.historico} {valor} {'(+)' if lanc.credito else '(-)'}")
+            if lanc.duas_linhas:
+                linhas.append(f"{lanc.dia_mes} 10:30 {lanc.nome}")
+    linhas.append(f"30/{MES:02d}/{ANO} S A L D O 12.345,67 (+)")
+    return "\n".join(linhas)
+
+
+def ifood(n):
+    linhas = ["Extrato da Conta Digital iFood", "Solicitado em 30/04/2025", "Data Movimentação Descrição da movimentação Valor"]
+    for grupo in _por_dia(_lancamentos(n)):
+        for lanc in grupo:
+            valor = f"R$ {lanc.valor}" if lanc.credito else f"-R$ {lanc.valor}"
+            if lanc.duas_linhas:
+                linhas += [f"{lanc.data} {lanc.historico}", f"{lanc.nome} {valor}"]
+            else:
+                linhas.append(f"{lanc.data} {lanc.historico} {lanc.nome} {valor}")
+        linhas.append("Saldo do dia R$ 12.345,67")
+    linhas.append("Em caso de dúvida fale com a gente")
+    return "\n".join(linhas)
+
+
+def asaas(n):
+    linhas = ["ASAAS Gestão Financeira Instituição de Pagamento S.A.", "Extrato gerado em 30/04/2025",
+              "Conta 12345-6", "Data", "Movimentações", "Valor", "Saldo inicial R$ 10.000,00"]
+    for lanc in _lancamentos(n):
+        valor = f"R$ {lanc.valor}" if lanc.credito else f"R$ -{lanc.valor}"
+        if lanc.duas_linhas:
+            linhas += [f"{lanc.data} {lanc.historico}", f"fatura nr. {lanc.documento} {lanc.nome} {valor}"]
+        else:
+            linhas.append(f"{lanc.data} {lanc.historico} {lanc.nome} {valor}")
+    linhas.append("Saldo final R$ 12.345,67")
+    return "\n".join(linhas)
+
+
+def cora(n):
+    linhas = ["Extrato", "Transações"]
+    for grupo in _por_dia(_lancamentos(n)):
+        linhas.append(f"{grupo[0].data} Saldo do dia R$ 12.345,67")
+        for lanc in grupo:
+            sinal = "+" if lanc.credito else "-"
+            linhas.append(f"{lanc.historico} {lanc.nome} {sinal} R$ {lanc.valor}")
+    linhas += ["Cora SCFI", "Ouvidoria 0800"]
+    return "\n".join(linhas)
+
+
+def safra(n):
+    linhas = ["Extrato", f"Período de 01/{MES:02d}/{ANO} a 30/{MES:02d}/{ANO}", "Data Lançamento Complemento Documento Valor (R$)"]
+    for pagina, lancamentos in _paginas(_lancamentos(n)):
+        if pagina:
+            linhas += ["Banco Safra S/A"] + [f"cabecalho {i}" for i in range(24)]
+        for lanc in lancamentos:
+            linhas += [lanc.dia_mes, lanc.historico]
+            if lanc.duas_linhas:
+                linhas.append(lanc.nome)
+            linhas.append(lanc.valor if lanc.credito else f"-{lanc.valor}")
+    return "\n".join(linhas)
+
+
+def infinitepay(n):
+    cabecalho = "Data Hora Tipo de transação Nome Detalhe Valor (R$)"
+    linhas = ["InfinitePay", cabecalho]
+    meses = ["Jan", "Fev", "Mar", "Abr", "Mai", "Jun", "Jul", "Ago", "Set", "Out", "Nov", "Dez"]
+    for dia, grupo in enumerate(_por_dia(_lancamentos(n))):
+        for posicao, lanc in enumerate(grupo):
+            valor = f"+{lanc.valor}" if lanc.credito else f"-{lanc.valor}"
+            texto = f"10:{lanc.indice % 60:02d} Pix {lanc.nome} {'Recebido' if lanc.credito else 'Enviado'} {valor}"
+            if posicao == 0:
+                data = f"{lanc.dia:02d} {meses[MES - 1]}, {ANO}" if dia % 2 else lanc.data
+                texto = f"{data} {texto}"
+            linhas.append(texto)
+        linhas.append("Saldo do dia R$ 12.345,67")
+    return "\n".join(linhas)
+
+
+def efi1(n):
+    linhas = ["Extrato", "DATA DESCRIÇÃO VALOR (R$)"]
+    for pagina, lancamentos in _paginas(_lancamentos(n)):
+        if pagina:
+            linhas += ["EFÍ S.A. - INSTITUIÇÃO DE PAGAMENTO"] + [f"cabecalho {i}" for i in range(13)]
+        for lanc in lancamentos:
+            historico = "Pix recebido" if lanc.credito else "Pix enviado"
+            linhas += [lanc.data, historico, lanc.nome, lanc.valor if lanc.credito else f"-{lanc.valor}"]
+        linhas += ["Saldo do dia", "12.345,67"]
+    return "\n".join(linhas)
+
+
+def efi2(n):
+    linhas = ["Extrato", "DATA DESCRIÇÃO VALOR (R$)"]
+    for pagina, lancamentos in _paginas(_lancamentos(n)):
+        if pagina:
+            linhas += ["Efí S.A. - Instituição de Pagamento"] + [f"cabecalho {i}" for i in range(13)]
+        for lanc in lancamentos:
+            linhas += [lanc.data, lanc.historico, lanc.nome, f"+{lanc.valor}" if lanc.credito else f"-{lanc.valor}"]
+        linhas.append("Saldo Diário 12.345,67")
+    return "\n".join(linhas)
+
+
+def mercadopago(n):
+    linhas = ["EXTRATO DE CONTA", "Data", "Descrição", "ID da operação", "Valor", "Saldo"]
+    for pagina, lancamentos in _paginas(_lancamentos(n)):
+        if pagina:
+            linhas += [f"{pagina + 1}/{pagina + 2}", "Data", "Descrição", "ID da operação", "Valor", "Saldo"]
+        for lanc in lancamentos:
+            data = f"{lanc.dia:02d}-{MES:02d}-{ANO}"
+            valor = f"R$ {lanc.valor}" if lanc.credito else f"R$ -{lanc.valor}"
+            if lanc.duas_linhas:
+                linhas += [f"{data} {lanc.historico}", lanc.nome, f"{lanc.documento}000 {valor} R$ 12.345,67"]
+            else:
+                linhas.append(f"{data} {lanc.historico} {lanc.nome} {lanc.documento}000 {valor} R$ 12.345,67")
+    return "\n".join(linhas)
+
+
+# Banco (nome usado pelo identificador e por get_processor) -> gerador
+GERADORES = {
+    "Sicoob1": sicoob1,
+    "Sicoob2": sicoob2,
+    "Sicoob3": sicoob3,
+    "Itaú": itau,
+    "Itaú2": itau2,
+    "Itaú3": itau3,
+    "Itaú4": itau4,
+    "Caixa": caixa,
+    "Caixa2": caixa2,
+    "Banco Inter": inter,
+    "Nubank": nubank,
+    "Bradesco": bradesco,
+    "Santander1": santander1,
+    "Santander2": santander2,
+    "Sicredi": sicredi,
+    "PagBank": pagbank,
+    "Stone": stone,
+    "Banco do Brasil1": bancobrasil1,
+    "Banco do Brasil2": bancobrasil2,
+    "iFood": ifood,
+    "Asaas": asaas,
+    "Cora": cora,
+    "Safra": safra,
+    "InfinitePay": infinitepay,
+    "Efi1": efi1,
+    "Efi2": efi2,
+    "Mercado Pago": mercadopago,
+}
+
+
+def gerar(banco, n):
+    """Texto sintético do extrato de `banco` com `n` lançamentos."""
+    return GERADORES[banco](n)
@@ -0,0 +1,90 @@
+"""
+Custo de importação (subida a frio) do servidor, medido com `python -X importtime`.
+
+    python benchmarks/importacao.py                     # home.main, melhor de 3
+    python benchmarks/importacao.py -m api_server -n 20
+    python benchmarks/importacao.py --limite 1.0        # falha se passar de 1 s
+    python benchmarks/importacao.py --proibidos pandas fitz
+
+Cada repetição roda num interpretador novo, então nada vem do cache de módulos;
+vale a repetição mais rápida. A tabela lista os módulos com maior tempo acumulado
+(o próprio módulo e tudo o que ele importou) que não são submódulos de outro da
+lista. As dependências pesadas (pandas, numpy, fitz, pdfplumber, lxml, openpyxl)
+devem ficar fora da subida: os blueprints e os parsers dos bancos as importam no
+primeiro uso. Com --limite ou --proibidos, termina com erro (código 1) se o tempo
+total passar do limite ou se algum módulo proibido for importado.
+"""
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+# Importadas só no primeiro uso; não devem aparecer na subida do servidor
+PESADOS = ("pandas", "numpy", "fitz", "pdfplumber", "lxml", "openpyxl")
+
+
+def medir_importacao(modulo):
+    """{módulo: (próprio µs, acumulado µs, profundidade)} de um interpretador novo."""
+    ambiente = dict(os.environ, PYTHONPATH=str(RAIZ))
+    saida = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        cwd=RAIZ, env=ambiente, capture_output=True, text=True, check=True,
+    ).stderr
+    medicao = {}
+    for linha in saida.splitlines():
+        if not linha.startswith("import time:") or "self [us]" in linha:
+            continue
+        proprio, acumulado, nome = linha[len("import time:"):].split("|")
+        profundidade = (len(nome) - len(nome.lstrip())) // 2
+        medicao[nome.strip()] = (int(proprio), int(acumulado), profundidade)
+    return medicao
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Tempo de importação do servidor")
+    parser.add_argument('-m', '--modulo', default="home.main", help="módulo a importar (padrão: %(default)s)")
+    parser.add_argument('-r', '--repeticoes', type=int, default=3)
+    parser.add_argument('-n', '--top', type=int, default=15, help="módulos listados (padrão: %(default)s)")
+    parser.add_argument('--limite', type=float, help="falha se o tempo total passar destes segundos")
+    parser.add_argument('--proibidos', nargs='*', metavar="MODULO",
+                        help=f"falha se algum destes for importado (sem nomes: {' '.join(PESADOS)})")
+    args = parser.parse_args(argv)
+
+    medicoes = [medir_importacao(args.modulo) for _ in range(max(1, args.repeticoes))]
+    medicao = min(medicoes, key=lambda m: m[args.modulo][1])
+    total = medicao[args.modulo][1] / 1e6
+
+    print(f"{args.modulo}: {total * 1000:.0f} ms ({len(medicao)} módulos, melhor de {len(medicoes)})\n")
+    cabecalho = f"{'módulo':<50}{'acumulado ms':>14}{'próprio ms':>12}"
+    print(cabecalho)
+    print("-" * len(cabecalho))
+    listados = []
+    for nome, (proprio, acumulado, _) in sorted(medicao.items(), key=lambda item: -item[1][1]):
+        if nome == args.modulo or any(nome.startswith(f"{pai}.") for pai in listados):
+            continue
+        listados.append(nome)
+        print(f"{nome:<50}{acumulado / 1000:>14.1f}{proprio / 1000:>12.1f}")
+        if len(listados) >= args.top:
+            break
+
+    falhas = []
+    if args.limite is not None and total > args.limite:
+        falhas.append(f"tempo total {total:.2f} s passou do limite de {args.limite:g} s")
+    if args.proibidos is not None:
+        for proibido in args.proibidos or PESADOS:
+            if any(nome == proibido or nome.startswith(f"{proibido}.") for nome in medicao):
+                falhas.append(f"{proibido} é importado na subida")
+
+    if falhas:
+        print()
+        for falha in falhas:
+            print(f"  {falha}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
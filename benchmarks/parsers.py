@@ -0,0 +1,163 @@
+"""
+Benchmark dos parsers dos bancos sobre extratos sintéticos (extratos_sinteticos.py).
+
+    python benchmarks/parsers.py                       # todos os bancos, 10, 1000 e 100000 lançamentos
+    python benchmarks/parsers.py -n 5000 Bradesco Stone
+    python benchmarks/parsers.py --salvar antes.json   # guarda as medições
+    python benchmarks/parsers.py --comparar antes.json --limite 20
+
+Cada parser roda `--repeticoes` vezes sobre o mesmo texto e vale o melhor tempo.
+"parser" é só o preprocess_text do banco (o custo por linha que muda de um parser
+para outro); "total" é o get_processor completo, como no servidor, incluindo a
+montagem das Transacao.
+
+A memória é medida numa execução à parte do get_processor com tracemalloc (que
+deixa o código bem mais lento, por isso fica fora dos tempos): "pico" é o máximo
+alocado durante o processamento e "retido" o que continua alocado no resultado,
+os dois descontando o texto do extrato, que já existia antes.
+
+Com --comparar, mostra a variação do parser e do pico em relação a uma execução
+salva antes de uma mudança; com --limite, termina com erro (código 1) se algum
+banco piorar mais que o percentual, para rodar antes do deploy. Tempos abaixo de
+1 ms não entram no limite: nessa escala a variação é ruído.
+"""
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from extratos_sinteticos import GERADORES, gerar  # noqa: E402
+from extrator_contajur.banco import get_processor  # noqa: E402
+
+ESCALAS = (10, 1000, 100000)
+# Abaixo disso a variação de tempo não conta para o --limite
+_TEMPO_MINIMO_LIMITE = 0.001
+_MB = 1024 * 1024
+
+
+def _melhor_tempo(funcao, texto, repeticoes):
+    melhor = float('inf')
+    resultado = None
+    for _ in range(repeticoes):
+        # Alguns parsers imprimem diagnóstico; não entra na medição do terminal
+        with contextlib.redirect_stdout(io.StringIO()):
+            inicio = time.perf_counter()
+            resultado = funcao(texto)
+            melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, resultado
+
+
+def _memoria(funcao, texto):
+    """(pico, retido) em bytes alocados por funcao(texto), medidos com tracemalloc."""
+    with contextlib.redirect_stdout(io.StringIO()):
+        tracemalloc.start()
+        try:
+            base = tracemalloc.get_traced_memory()[0]
+            resultado = funcao(texto)
+            atual, pico = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    del resultado
+    return pico - base, atual - base
+
+
+def medir_banco(banco, n, repeticoes, memoria=True):
+    """Tempos (s), memória (bytes), linhas e transações de um banco com `n` lançamentos."""
+    texto = gerar(banco, n)
+    processor = get_processor(banco)
+    preprocess = importlib.import_module(processor.__module__).preprocess_text
+    segundos, _ = _melhor_tempo(preprocess, texto, repeticoes)
+    total, resultado = _melhor_tempo(processor, texto, repeticoes)
+    medicao = {
+        'segundos': segundos,
+        'total': total,
+        'linhas': texto.count('\n') + 1,
+        'transacoes': len(resultado) if resultado is not None else 0,
+    }
+    if memoria:
+        medicao['pico'], medicao['retido'] = _memoria(processor, texto)
+    return medicao
+
+
+def _variacao(atual, anterior):
+    return (atual / anterior - 1) * 100 if anterior else 0.0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark dos parsers de extrato")
+    parser.add_argument('bancos', nargs='*', help="bancos a medir (padrão: todos)")
+    parser.add_argument('-n', '--lancamentos', type=int, nargs='+', default=list(ESCALAS),
+                        help="quantidades de lançamentos (padrão: %(default)s)")
+    parser.add_argument('-r', '--repeticoes', type=int, default=3)
+    parser.add_argument('--sem-memoria', action='store_true', help="não mede a memória (mais rápido)")
+    parser.add_argument('--salvar', help="grava as medições em JSON")
+    parser.add_argument('--comparar', help="JSON de uma execução anterior")
+    parser.add_argument('--limite', type=float,
+                        help="com --comparar, falha se o parser ou o pico piorar mais que este percentual")
+    args = parser.parse_args(argv)
+
+    bancos = args.bancos or list(GERADORES)
+    anteriores = {}
+    if args.comparar:
+        with open(args.comparar, encoding='utf-8') as f:
+            anteriores = json.load(f)
+
+    cabecalho = (f"{'banco':<18}{'lanç.':>8}{'linhas':>9}{'transações':>12}{'parser ms':>11}"
+                 f"{'µs/linha':>10}{'total ms':>10}")
+    if not args.sem_memoria:
+        cabecalho += f"{'pico MB':>9}{'retido MB':>11}"
+    if anteriores:
+        cabecalho += f"{'antes ms':>10}{'variação':>10}"
+        if not args.sem_memoria:
+            cabecalho += f"{'pico':>8}"
+    print(cabecalho)
+    print("-" * len(cabecalho))
+
+    medicoes = {}
+    regressoes = []
+    for banco in bancos:
+        for n in args.lancamentos:
+            medicao = medir_banco(banco, n, args.repeticoes, memoria=not args.sem_memoria)
+            medicoes.setdefault(banco, {})[str(n)] = medicao
+            ms = medicao['segundos'] * 1000
+            linha = (f"{banco:<18}{n:>8}{medicao['linhas']:>9}{medicao['transacoes']:>12}"
+                     f"{ms:>11.2f}{medicao['segundos'] * 1e6 / medicao['linhas']:>10.2f}"
+                     f"{medicao['total'] * 1000:>10.2f}")
+            if 'pico' in medicao:
+                linha += f"{medicao['pico'] / _MB:>9.2f}{medicao['retido'] / _MB:>11.2f}"
+
+            anterior = anteriores.get(banco, {}).get(str(n))
+            if anterior:
+                variacao = _variacao(medicao['segundos'], anterior['segundos'])
+                linha += f"{anterior['segundos'] * 1000:>10.2f}{variacao:>+9.0f}%"
+                if args.limite is not None and variacao > args.limite \
+                        and max(medicao['segundos'], anterior['segundos']) >= _TEMPO_MINIMO_LIMITE:
+                    regressoes.append(f"{banco} ({n}): parser {variacao:+.0f}%")
+                if 'pico' in medicao and anterior.get('pico'):
+                    variacao = _variacao(medicao['pico'], anterior['pico'])
+                    linha += f"{variacao:>+7.0f}%"
+                    if args.limite is not None and variacao > args.limite:
+                        regressoes.append(f"{banco} ({n}): pico de memória {variacao:+.0f}%")
+            print(linha, flush=True)
+
+    if args.salvar:
+        with open(args.salvar, 'w', encoding='utf-8') as f:
+            json.dump(medicoes, f, ensure_ascii=False, indent=2)
+
+    if regressoes:
+        print(f"\nPioraram mais de {args.limite:g}%:")
+        for regressao in regressoes:
+            print(f"  {regressao}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
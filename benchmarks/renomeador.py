@@ -0,0 +1,132 @@
+"""
+Benchmark do RenomeadorExtrato sobre extratos sintéticos (extratos_sinteticos.py).
+
+    python benchmarks/renomeador.py                    # todos os bancos, 10 e 5000 lançamentos
+    python benchmarks/renomeador.py -n 20000 Bradesco Sicredi
+    python benchmarks/renomeador.py --ref HEAD~1       # compara com o renomeador de outra revisão
+
+Mede o gerar_nome_arquivo de cada banco (melhor de `--repeticoes`) em µs por
+arquivo, em duas versões do texto: o extrato sintético como sai do gerador, que
+quase nunca tem o cliente e o período onde o renomeador procura (pior caso: as
+regras percorrem o texto inteiro sem achar), e o mesmo extrato com um cabeçalho
+no formato do banco (CABECALHOS), o caso comum. Com --ref, carrega o
+renomeador.py daquela revisão do git e mostra também os tempos dela e se os
+nomes gerados são iguais.
+"""
+import argparse
+import importlib.util
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(RAIZ))
+
+from extratos_sinteticos import GERADORES, gerar  # noqa: E402
+from extrator_contajur.auxiliares.renomeador import REGRAS_RENOMEADOR, RenomeadorExtrato  # noqa: E402
+
+ESCALAS = (10, 5000)
+
+# Início de extrato de cada banco com cliente e período onde as regras procuram
+CABECALHOS = {
+    "Sicoob1": "SICOOB\nCONTA: 28.904.844-3 / GUIMARAES E DUTRA SERVICOS MEDICOS LTDA\nPERÍODO: 01/04/2025 - 30/04/2025\n",
+    "Sicoob2": "Conta:\n27.520-4 / OUROTEC TECNOLOGIA LTDA.\nPeríodo:\n01/04/2025 - 30/04/2025\n",
+    "Sicoob3": "CONTA: 1.234-5 / COMERCIO XPTO ME\nPERÍODO: 01/03/2025 - 31/03/2025\n",
+    "Itaú": "dados gerais\nEMPRESA ITAU LTDA\nag 8119 cc 12345-6\nperíodo de 01/04/2025\n",
+    "Itaú2": "dados gerais\nEMPRESA ITAU LTDA\nag 1472 cc 98765-4\nPERÍODO 05/04/2025\n",
+    "Itaú3": "extrato mensal\nconta corrente\nagência 1234\nEMPRESA ITAU LTDA\ndez 2025\n",
+    "Itaú4": "Extrato\nCNPJ 06.938.834/0001-29\nBRASILIS JOIAS E GEMAS LTDA.\n"
+             "Lançamentos do período: 01/05/2025 até 31/05/2025\n",
+    "Caixa": "Cliente: BAR LANCH REST SABOR DE LAVRAS\nMês: Janeiro/2026\n",
+    "Banco Inter": "Inter\nFULANO DE TAL\nCPF\nPeríodo: 10/04/2025 a 10/05/2025\n",
+    "Nubank": "BELTRANO SILVA\nCPF\nAgência\n01 DE DEZEMBRO DE 2025 a 31 DE DEZEMBRO DE 2025 VALORES EM R$\n",
+    "Bradesco": "Bradesco\nExtrato\nAgência\nPeríodo 01/04/2025 a 30/04/2025\nExtrato Mensal / Por Período\n"
+                "BRASART COMERCIO LTDA | CNPJ: 043.998.514/0001-90\n",
+    "Santander1": "TEREZA GABRIELA FERREIRA GOMIDES 0933888 Agência: 3222 Conta: 130029819\n"
+                  "Períodos: 01/10/2025 a 31/10/2025\n",
+    "Santander2": "EXTRATO CONSOLIDADO\nNome\nFULANO SANTANDER\nResumo - janeiro/2026\n",
+    "Sicredi": "Sicredi Fone\nAssociado: JB BAR DA PRACA LTDA Cooperativa: 0101\n"
+               "Extrato (Período de 01/01/2025 a 31/01/2025)\n",
+    "PagBank": "290 - PagSeguro Internet S/A\nLOJA DO ZE\nPeriodo: 01/04/2025 a 30/04/2025\n",
+    "Stone": "Stone\nNome\nCLIENTE STONE LTDA\nPeríodo: de 01/10/2025 a 31/10/2025\n",
+    "Banco do Brasil1": "BB\nConta corrente\n7724-0JOAQUIM S F S ADV\nPeríodo do extrato 03 / 2025\n",
+    "Banco do Brasil2": "Extrato de Conta Corrente\nCliente MARIA JOSE\n",
+    "iFood": "Extrato da Conta Digital iFood PADARIA SOL LTDA\nConta\nPeríodo selecionado 01/04/2025 a 30/04/2025\n",
+    "Asaas": "MINHA EMPRESA LTDA\n\nCNPJ\nPeríodo 01 de abril de 2025 a 30 de abril de 2025\n",
+    "Cora": "EMPRESA CORA ME\nExtrato do período 01/04/2025 a 01/05/2025\n",
+    "Safra": "Banco Safra S/A\nJOSE COMERCIO LTDA\nAgência 1\nPeríodo de 01/05/2025 a 31/05/2025\n",
+    "InfinitePay": "TUMANOS STORE LTDA - CNPJ: 38.013.547/0001-02\n01/08/2025 - 31/08/2025\n",
+    "Efi1": "Efí S.A.\nOuvidoria: 0800\nCLIENTE EFI LTDA\nPeríodo 01/02/2025 - 28/02/2025\n",
+    "Efi2": "Efí S.A.\nNome: CLIENTE EFI DOIS\nFiltros aplicados\nPeríodo 01/02/2025\n",
+    "Mercado Pago": "EXTRATO DE CONTA\n12345678901\nEXTRATO DE CONTA\nLOJA MP LTDA\nPeriodo: 01-03-2025 al 31-03-2025\n",
+}
+_ARQUIVO = "extrator_contajur/auxiliares/renomeador.py"
+
+
+def renomeador_da_revisao(ref):
+    """RenomeadorExtrato do renomeador.py na revisão `ref` do git."""
+    fonte = subprocess.run(["git", "show", f"{ref}:{_ARQUIVO}"], cwd=RAIZ, check=True,
+                           capture_output=True, text=True).stdout
+    with tempfile.TemporaryDirectory() as pasta:
+        # Dentro do pacote, para os imports relativos (from .padroes ...) funcionarem
+        caminho = Path(pasta) / "renomeador_ref.py"
+        caminho.write_text(fonte, encoding="utf-8")
+        spec = importlib.util.spec_from_file_location("extrator_contajur.auxiliares._renomeador_ref", caminho)
+        modulo = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(modulo)
+    return modulo.RenomeadorExtrato()
+
+
+def _melhor_tempo(renomeador, texto, banco, repeticoes):
+    melhor, nome = float("inf"), None
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        nome = renomeador.gerar_nome_arquivo(texto, banco, "extrato", incluir_banco=True)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor, nome
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark do renomeador de extratos")
+    parser.add_argument("bancos", nargs="*", help="bancos a medir (padrão: todos com regras)")
+    parser.add_argument("-n", "--lancamentos", type=int, nargs="+", default=list(ESCALAS),
+                        help="quantidades de lançamentos (padrão: %(default)s)")
+    parser.add_argument("-r", "--repeticoes", type=int, default=20)
+    parser.add_argument("--ref", help="revisão do git para comparar (ex.: HEAD~1)")
+    args = parser.parse_args(argv)
+
+    bancos = args.bancos or [banco for banco in GERADORES if banco in REGRAS_RENOMEADOR]
+    renomeadores = [("", RenomeadorExtrato())]
+    if args.ref:
+        renomeadores.append((f"{args.ref} ", renomeador_da_revisao(args.ref)))
+
+    cabecalho = f"{'banco':<18}{'lanç.':>8}{'linhas':>9}"
+    for rotulo, _ in renomeadores:
+        cabecalho += f"{rotulo + 'µs':>16}{rotulo + 'µs c/ cab.':>22}"
+    print(cabecalho)
+    print("-" * len(cabecalho))
+
+    diferentes = 0
+    for banco in bancos:
+        for n in args.lancamentos:
+            sintetico = gerar(banco, n)
+            textos = (sintetico, CABECALHOS.get(banco, "") + sintetico)
+            linha = f"{banco:<18}{n:>8}{sintetico.count(chr(10)) + 1:>9}"
+            nomes = []
+            for _, renomeador in renomeadores:
+                for texto in textos:
+                    segundos, nome = _melhor_tempo(renomeador, texto, banco, args.repeticoes)
+                    linha += f"{segundos * 1e6:>{16 if texto is sintetico else 22}.1f}"
+                    nomes.append(nome)
+            if args.ref:
+                igual = nomes[:2] == nomes[2:]
+                diferentes += not igual
+                linha += f"  {'igual' if igual else 'DIFERENTE'}"
+            print(linha, flush=True)
+    return 1 if diferentes else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
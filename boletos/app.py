@@ -1,5 +1,4 @@
 from flask import Blueprint, request, send_file, render_template
-import pandas as pd
 import os
 import tempfile
 import logging
@@ -52,6 +51,8 @@ def upload_files():
     Inclui: 1) Correspondências entre CSVs baseado no valor com data e descrição do CSV1.
             2) Boletos sem correspondência no CSV1 com palavras-chave específicas.
     """
+    import pandas as pd
+
     tmp_csv1_path = None
     tmp_csv2_path = None
     tmp_report_path = None
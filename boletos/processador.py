@@ -2,6 +2,8 @@ import pandas as pd
 import re
 from typing import BinaryIO
 
+from extrator_contajur.auxiliares.transacao import Tipo, ler_csv_extrato
+
 
 def _clean_float(value) -> float:
     try:
@@ -14,11 +16,17 @@ def _clean_float(value) -> float:
         return 0.0
 
 
+def _centavos(value) -> int:
+    # Só para ler o CSV com ler_csv_extrato: a comparação é feita com _clean_float
+    return round(_clean_float(value) * 100)
+
+
 PALAVRAS_CHAVE_BOLETO = [
     'DÉB. TIT. COBRANÇA', 'DÉB.TIT.COB.EFETIV', 'DÉB.TIT.COMPE.EFETI',
     'SIPAG FORNECEDORES', 'PAGTO ELETRON', 'boleto', 'Boleto', 'BOLETO',
     'DÉB.PGTO.BOLETO INT'
 ]
+_BOLETO_RE = re.compile('|'.join(PALAVRAS_CHAVE_BOLETO), re.IGNORECASE)
 
 
 def processar_boletos(file1: BinaryIO, file2: BinaryIO) -> dict:
@@ -41,11 +49,11 @@ def processar_boletos(file1: BinaryIO, file2: BinaryIO) -> dict:
         content = f.read()
         return content
 
-    content1 = _read_bytes(file1)
-    try:
-        text1 = content1.decode('utf-8')
-    except UnicodeDecodeError:
-        text1 = content1.decode('latin1')
+    # (transação, valor) dos débitos do extrato; o valor é lido por _clean_float
+    debitos = [
+        (t, _clean_float(t.valor))
+        for t in ler_csv_extrato(_read_bytes(file1), _centavos) if t.tipo is Tipo.DEBITO
+    ]
 
     content2 = _read_bytes(file2)
     try:
@@ -54,8 +62,6 @@ def processar_boletos(file1: BinaryIO, file2: BinaryIO) -> dict:
         text2 = content2.decode('latin1')
 
     import io
-    df1 = pd.read_csv(io.StringIO(text1), header=None, sep=';', on_bad_lines='warn')
-
     try:
         df2 = pd.read_csv(io.StringIO(text2), skiprows=2, sep=';', on_bad_lines='skip')
     except pd.errors.ParserError:
@@ -64,43 +70,34 @@ def processar_boletos(file1: BinaryIO, file2: BinaryIO) -> dict:
     if 'Valor parcela' not in df2.columns:
         raise ValueError("Coluna 'Valor parcela' não encontrada no CSV2.")
 
-    df1_filtered = df1[df1.iloc[:, 3] == 'D'].copy()
-    df1_filtered['date'] = pd.to_datetime(df1_filtered.iloc[:, 0], format='%d/%m/%Y', errors='coerce')
-    df1_filtered['value'] = df1_filtered.iloc[:, 2].apply(_clean_float)
+    def _data(t):
+        return t.data_lancamento.strftime('%d/%m/%Y') if t.data_lancamento else 'Data Inválida'
 
-    matches_dict = dict(zip(
-        df1_filtered['value'],
-        zip(df1_filtered['date'], df1_filtered.iloc[:, 1])
-    ))
+    matches_dict = {valor: t for t, valor in debitos}
 
-    df2_filtered = df2[df2['Valor parcela'].apply(lambda v: _clean_float(v) != 0.0 or str(v).strip() == '0')].copy()
-    df2_filtered['value'] = df2_filtered['Valor parcela'].apply(_clean_float)
+    valores_boletos = [
+        _clean_float(v) for v in df2['Valor parcela']
+        if _clean_float(v) != 0.0 or str(v).strip() == '0'
+    ]
 
     correspondencias = []
-    for _, row in df2_filtered.iterrows():
-        value = row['value']
+    for value in valores_boletos:
         if value in matches_dict:
-            date, descricao = matches_dict[value]
+            t = matches_dict[value]
             correspondencias.append({
-                'data': date.strftime('%d/%m/%Y') if pd.notna(date) else 'Data Inválida',
-                'descricao': str(descricao),
+                'data': _data(t),
+                'descricao': t.descricao,
                 'valor': round(value, 2)
             })
 
-    df1_boletos = df1_filtered[
-        df1_filtered.iloc[:, 1].astype(str).str.contains(
-            '|'.join(PALAVRAS_CHAVE_BOLETO), case=False, na=False
-        )
-    ]
-    df2_values = set(df2_filtered['value'].values)
+    df2_values = set(valores_boletos)
 
     boletos_sem_correspondencia = []
-    for _, row in df1_boletos.iterrows():
-        value = row['value']
-        if value not in df2_values:
+    for t, value in debitos:
+        if _BOLETO_RE.search(t.descricao) and value not in df2_values:
             boletos_sem_correspondencia.append({
-                'data': row['date'].strftime('%d/%m/%Y') if pd.notna(row['date']) else 'Data Inválida',
-                'descricao': str(row.iloc[1]),
+                'data': _data(t),
+                'descricao': t.descricao,
                 'valor': round(value, 2)
             })
 
@@ -2,7 +2,6 @@ import io
 import zipfile
 from flask import Blueprint, request, send_file, render_template, jsonify
 from flask_cors import CORS
-from .processador import processar
 
 conciliacao_bp = Blueprint('conciliacao', __name__, url_prefix='/conciliacao')
 CORS(conciliacao_bp)
@@ -15,6 +14,8 @@ def index():
 
 @conciliacao_bp.route('/processar', methods=['POST'])
 def processar_endpoint():
+    from .processador import processar
+
     if 'extrato' not in request.files or 'base' not in request.files:
         return jsonify({'success': False, 'error': 'Envie os dois arquivos (extrato e base)'}), 400
 
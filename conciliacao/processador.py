@@ -8,12 +8,16 @@ Fluxo:
   4. gerar_excel()         → Excel com 5 abas (análise)
   5. gerar_csv_final()     → CSV extrato_pendente no formato extrator
 
-Formato padrão (dict):
-  { data, descricao, valor_str, valor_num, tipo }
+Formato padrão: Transacao (extrator_contajur.auxiliares.transacao)
+  (data, descricao, valor, tipo, centavos, data_lancamento)
+  com os centavos lidos por normalize_value, a regra própria da conciliação.
 """
 
 import re
 import io
+from extrator_contajur.auxiliares.transacao import (
+    Tipo, Transacao, formatar_centavos, ler_csv_extrato,
+)
 from openpyxl import Workbook
 from openpyxl.styles import PatternFill, Font, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
@@ -22,30 +26,22 @@ from openpyxl.utils import get_column_letter
 # Helpers de valor
 # ──────────────────────────────────────────────────────────────────────────────
 
-def normalize_value(s: str) -> float:
-    """'1.066,25' → 1066.25  |  '25.173' → 25173.0  |  '101' → 101.0"""
+def normalize_value(s: str) -> int:
+    """
+    Valor em centavos: '1.066,25' → 106625  |  '25.173' → 2517300  |  '101' → 10100
+    Sem vírgula, todo ponto é de milhar ('1234.56' → 12345600); o que não é número vale 0.
+    """
     s = s.strip().replace('\xa0', '').replace(' ', '')
     if not s:
-        return 0.0
+        return 0
     if ',' in s:
         s = s.replace('.', '').replace(',', '.')
     else:
         s = s.replace('.', '')
     try:
-        return float(s)
-    except ValueError:
-        return 0.0
-
-
-def format_value_br(f: float) -> str:
-    """1066.25 → '1.066,25'  |  25173.0 → '25.173'"""
-    f = abs(f)
-    cents = round(f * 100)
-    int_part = cents // 100
-    dec_part = cents % 100
-    if dec_part == 0:
-        return f"{int_part:,}".replace(",", ".")
-    return f"{int_part:,}".replace(",", ".") + f",{dec_part:02d}"
+        return round(float(s) * 100)
+    except (ValueError, OverflowError):
+        return 0
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -55,32 +51,12 @@ def format_value_br(f: float) -> str:
 DATE_RE = re.compile(r'^\d{2}/\d{2}/\d{4}$')
 
 
-def _make_row(data, descricao, valor_str, tipo) -> dict:
-    return {
-        'data':      data,
-        'descricao': descricao,
-        'valor_str': valor_str,
-        'valor_num': normalize_value(valor_str),
-        'tipo':      tipo,
-    }
-
-
-def parse_extrato(file_bytes: bytes) -> list[dict]:
+def parse_extrato(file_bytes: bytes) -> list[Transacao]:
     """CSV sem cabeçalho: Data;Descrição;Valor;Tipo"""
-    rows = []
-    text = file_bytes.decode('utf-8-sig', errors='replace')
-    for line in text.splitlines():
-        parts = line.strip().split(';')
-        if len(parts) < 4:
-            continue
-        data, desc, valor_str, tipo = parts[0], parts[1], parts[2], parts[3]
-        if not DATE_RE.match(data.strip()):
-            continue
-        tipo = tipo.strip().upper()
-        if tipo not in ('C', 'D'):
-            continue
-        rows.append(_make_row(data.strip(), desc.strip(), valor_str.strip(), tipo))
-    return rows
+    return [
+        t for t in ler_csv_extrato(file_bytes, normalize_value)
+        if DATE_RE.match(t.data) and isinstance(t.tipo, Tipo)
+    ]
 
 
 def _extract_desc(historico: str) -> str:
@@ -96,7 +72,7 @@ def _extract_desc(historico: str) -> str:
     return historico
 
 
-def parse_base_extrato(file_bytes: bytes) -> list[dict]:
+def parse_base_extrato(file_bytes: bytes) -> list[Transacao]:
     """Base contábil (Razão/Livro Caixa) → formato extrator."""
     rows = []
     text = file_bytes.decode('utf-8-sig', errors='replace')
@@ -130,10 +106,11 @@ def parse_base_extrato(file_bytes: bytes) -> list[dict]:
         else:
             continue
 
-        if normalize_value(valor_str) == 0:
+        centavos = normalize_value(valor_str)
+        if centavos == 0:
             continue
 
-        rows.append(_make_row(current_date, _extract_desc(historico), valor_str, tipo))
+        rows.append(Transacao.de_campos(current_date, _extract_desc(historico), valor_str, tipo, centavos))
 
     return rows
 
@@ -167,13 +144,15 @@ def name_match(desc_base: str, desc_extrato: str, min_words: int = 2) -> bool:
 # Conciliação
 # ──────────────────────────────────────────────────────────────────────────────
 
-def reconcile(extrato: list[dict], base: list[dict]):
+def reconcile(extrato: list[Transacao], base: list[Transacao]):
     """
     Retorna (conciliados, diferencas, so_extrato, so_base).
 
     Critérios (em ordem de prioridade):
       Conciliado : mesma data + mesmo tipo + mesmo valor
       Diferença  : mesma data + nome bate (valor diferente → mostra a diferença)
+
+    A diferença de cada par em `diferencas` é dada em centavos.
     """
     conciliados = []
     diferencas  = []
@@ -185,9 +164,9 @@ def reconcile(extrato: list[dict], base: list[dict]):
         for j, e in enumerate(extrato):
             if j in ext_used:
                 continue
-            if (b['data'] == e['data']
-                    and b['tipo'] != e['tipo']
-                    and abs(b['valor_num'] - e['valor_num']) < 0.02):
+            if (b.data == e.data
+                    and b.tipo != e.tipo
+                    and abs(b.centavos - e.centavos) < 2):
                 conciliados.append({'base': b, 'extrato': e})
                 base_used.add(i)
                 ext_used.add(j)
@@ -200,8 +179,8 @@ def reconcile(extrato: list[dict], base: list[dict]):
         for j, e in enumerate(extrato):
             if j in ext_used:
                 continue
-            if b['data'] == e['data'] and name_match(b['descricao'], e['descricao']):
-                diff = abs(e['valor_num'] - b['valor_num'])
+            if b.data == e.data and name_match(b.descricao, e.descricao):
+                diff = abs(e.centavos - b.centavos)
                 diferencas.append({'base': b, 'extrato': e, 'diferenca': diff})
                 base_used.add(i)
                 ext_used.add(j)
@@ -252,8 +231,8 @@ def _auto_width(ws):
         ws.column_dimensions[get_column_letter(col[0].column)].width = min(w + 4, 70)
 
 
-def _fmt(r: dict) -> list:
-    return [r['data'], r['descricao'], r['valor_str'], r['tipo']]
+def _fmt(r: Transacao) -> list:
+    return list(r.campos)
 
 
 def gerar_excel(conciliados, diferencas, so_extrato, so_base) -> io.BytesIO:
@@ -272,7 +251,7 @@ def gerar_excel(conciliados, diferencas, so_extrato, so_base) -> io.BytesIO:
     ws2 = wb.create_sheet('Diferenças de Valor')
     _header(ws2, _EXT_COLS + _BASE_COLS + ['Diferença'], _YELLOW)
     for d in diferencas:
-        ws2.append(_fmt(d['extrato']) + _fmt(d['base']) + [format_value_br(d['diferenca'])])
+        ws2.append(_fmt(d['extrato']) + _fmt(d['base']) + [formatar_centavos(d['diferenca'])])
         _style(ws2, _YELLOW)
     _auto_width(ws2)
 
@@ -297,7 +276,7 @@ def gerar_excel(conciliados, diferencas, so_extrato, so_base) -> io.BytesIO:
     _header(ws5, ['Categoria', 'Qtd', 'Total (Extrato)'], _GREY)
 
     def _tot(lst):
-        return format_value_br(sum(r['valor_num'] for r in lst))
+        return formatar_centavos(sum(r.centavos for r in lst))
 
     ws5.append(['Conciliados',         len(conciliados), _tot([c['extrato'] for c in conciliados])])
     ws5.append(['Diferenças de Valor', len(diferencas),  _tot([d['extrato'] for d in diferencas])])
@@ -315,7 +294,7 @@ def gerar_excel(conciliados, diferencas, so_extrato, so_base) -> io.BytesIO:
 # CSV final no formato extrator
 # ──────────────────────────────────────────────────────────────────────────────
 
-def gerar_csv_final(diferencas: list[dict], so_extrato: list[dict]) -> io.BytesIO:
+def gerar_csv_final(diferencas: list[dict], so_extrato: list[Transacao]) -> io.BytesIO:
     """
     Extrato pendente (Data;Descrição;Valor;Tipo sem cabeçalho):
     - Diferenças → valor líquido |extrato − base|
@@ -325,11 +304,11 @@ def gerar_csv_final(diferencas: list[dict], so_extrato: list[dict]) -> io.BytesI
     for d in diferencas:
         e    = d['extrato']
         diff = abs(d['diferenca'])
-        if diff < 0.01:
+        if diff == 0:
             continue
-        lines.append(f"{e['data']};{e['descricao']};{format_value_br(diff)};{e['tipo']}")
+        lines.append(f"{e.data};{e.descricao};{formatar_centavos(diff)};{e.tipo}")
     for e in so_extrato:
-        lines.append(f"{e['data']};{e['descricao']};{e['valor_str']};{e['tipo']}")
+        lines.append(f"{e.data};{e.descricao};{e.valor};{e.tipo}")
 
     buf = io.BytesIO('\n'.join(lines).encode('utf-8-sig'))
     buf.seek(0)
@@ -1,18 +1,10 @@
 from flask import Blueprint, request, jsonify, render_template, send_file
 import os
 import tempfile
-from .utils.pdf_reader import read_pdf_and_identify_model
-from .processadores.bling_processor import process_bling_pdf
-from .processadores.sgbr_processor import process_sgbr_pdf
-from .processadores.fechamento_processor import process_fechamento_pdf
-from .processadores.totais_processor import process_totais_pdf
-from .utils.excel_processor import remove_duplicatas_e_vazias_xls
 import io
 import logging
 import zipfile
 from datetime import datetime
-import pandas as pd
-import numpy as np
 
 logging.basicConfig(level=logging.ERROR)
 logger = logging.getLogger(__name__)
@@ -48,6 +40,15 @@ def conferencia():
 
 @conferencia_bp.route('/api/process-all', methods=['POST'])
 def process_all():
+    # Processadores importados no primeiro uso: dependem do pandas/numpy
+    import numpy as np
+    from .utils.pdf_reader import read_pdf_and_identify_model
+    from .processadores.bling_processor import process_bling_pdf
+    from .processadores.sgbr_processor import process_sgbr_pdf
+    from .processadores.fechamento_processor import process_fechamento_pdf
+    from .processadores.totais_processor import process_totais_pdf
+    from .utils.excel_processor import remove_duplicatas_e_vazias_xls
+
     tmp_pdf_path = None
     try:
         if 'pdf' not in request.files or 'excel' not in request.files:
@@ -63,7 +64,7 @@ def process_all():
 
         # --- 2. Processamento do PDF ---
         with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as tmp:
-            tmp.write(pdf_file.read())
+            pdf_file.save(tmp)  # copia o stream em blocos
             tmp_pdf_path = tmp.name
         
         modelo, texto_completo = read_pdf_and_identify_model(tmp_pdf_path)
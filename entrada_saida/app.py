@@ -1,6 +1,5 @@
 import os
 from flask import Blueprint, request, send_file, render_template
-import pandas as pd
 import tempfile
 import logging
 import zipfile
@@ -19,6 +18,7 @@ def processar_csv_entrada_saida(arquivo_csv):
     1. Remove linhas com valor 0,01 na coluna Valor
     2. Remove pares únicos de Entrada/Saída com mesmo valor
     """
+    import pandas as pd
     
     # Ler o CSV com encoding correto e separador ponto e vírgula
     try:
@@ -1,21 +1,30 @@
-from flask import Blueprint, request, jsonify, send_file, render_template
+from flask import Blueprint, request, jsonify, send_file, render_template, url_for
 from flask_cors import CORS
 from werkzeug.utils import secure_filename
+import copy
 import os
 import tempfile
-import concurrent.futures
-import io
-import zipfile
+import threading
+import time
 from pathlib import Path
-from .auxiliares.pdf_reader import validate_pdf, read_pdf
-from .auxiliares.pdf_reader2 import read_pdf2
-from .banco import get_processor
-from .auxiliares.xml_to_csv import xml_to_csv
+from .auxiliares.documento import DocumentoExtrato, banco_identificado
+from .auxiliares.processamento import PIPELINE_EXTRATOS, medir
+from .auxiliares.renomeador import RENOMEADOR
+from .auxiliares.resultados import ARMAZEM_RESULTADOS
+from .auxiliares.estado_compartilhado import ESTADO_COMPARTILHADO
+from .auxiliares.tempos import FAIXAS_MS, HISTOGRAMA_TEMPOS, tempos_pedidos
+from .auxiliares.upload import PDFEnviado
+from .banco import get_processor, BANKS_USING_PDF2
 
 # Configurar o Blueprint
 extrator_bp = Blueprint('extrator', __name__)
 CORS(extrator_bp)
 
+@extrator_bp.record_once
+def _iniciar_limpeza_resultados(state):
+    """Remove periodicamente os ZIPs expirados enquanto a aplicação estiver no ar"""
+    ARMAZEM_RESULTADOS.iniciar_limpeza()
+
 # Configurações
 UPLOAD_FOLDER = tempfile.gettempdir()
 ALLOWED_EXTENSIONS = {'pdf'}
@@ -24,80 +33,75 @@ def allowed_file(filename):
     """Verifica se o arquivo tem extensão permitida"""
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
-def validate_pdf_content(file_content):
+def nome_csv_resultado(resultado):
     """
-    Valida se o conteúdo do arquivo é realmente um PDF
+    Nome do CSV de um extrato dentro do ZIP: CLIENTE_BANCO_PERIODO.csv, ou
+    extrato_<nome do PDF>.csv quando o cliente e o período não foram achados
     """
-    try:
-        if file_content.startswith(b'%PDF-'):
-            return True
-        return False
-    except Exception:
-        return False
+    original = f"extrato_{resultado['filename'].rsplit('.', 1)[0]}"
+    if not (resultado.get('cliente') or resultado.get('periodo')):
+        return f"{original}.csv"
+    return RENOMEADOR.montar_nome(resultado['cliente'], resultado['bank'], resultado['periodo'], original,
+                                  incluir_banco=True)
 
-def process_single_pdf_flask(file_content, filename, bank, text):
+def ler_uploads(files):
     """
-    Processa um único PDF e retorna o resultado
+    Lê os PDFs enviados. Retorna (pdfs, erros): pdfs é a lista de PDFEnviado válidos
+    (feche cada um ao terminar) e erros os resultados dos arquivos recusados.
     """
-    try:
-        print(f"[EXTRATOR] {filename} → {bank}")
-        if not text or not bank:
-            return {
-                'filename': filename,
-                'success': False,
-                'error': "❌ Arquivo inválido ou banco não identificado."
-            }
+    results = []
+    pdfs = []
+    for file in files:
+        if file and file.filename != '':
+            try:
+                if not allowed_file(file.filename):
+                    results.append({
+                        'filename': file.filename,
+                        'success': False,
+                        'error': f"Arquivo '{file.filename}' não é um PDF válido (extensão)"
+                    })
+                    continue
+                
+                pdf = PDFEnviado.de_upload(file)
+                if not pdf.eh_pdf:
+                    pdf.fechar()
+                    results.append({
+                        'filename': file.filename,
+                        'success': False,
+                        'error': f"Arquivo '{file.filename}' não é um PDF válido (conteúdo)"
+                    })
+                    continue
 
-        processor = get_processor(bank)
-        result = processor(text)
-        
-        xml_data, txt_data = result
-        
-        if xml_data is None or txt_data is None:
-            return {
-                'filename': filename,
+                pdfs.append(pdf)
+            except Exception as e:
+                results.append({
+                    'filename': file.filename,
+                    'success': False,
+                    'error': f"Erro geral ao processar '{file.filename}': {str(e)}"
+                })
+        else:
+            results.append({
+                'filename': file.filename if file else 'Arquivo sem nome',
                 'success': False,
-                'error': "Nenhuma transação encontrada no arquivo."
-            }
-        
-        xml_data.seek(0)
-        csv_data = xml_to_csv(xml_data)
-        
-        return {
-            'filename': filename,
-            'success': True,
-            'csv_data': csv_data,
-            'error': None
-        }
+                'error': "Arquivo vazio ou inválido"
+            })
+    return pdfs, results
 
-    except Exception as e:
-        return {
-            'filename': filename,
-            'success': False,
-            'error': f"❌ Erro no processamento: {str(e)}"
-        }
+def fechar_uploads(pdfs):
+    for pdf in pdfs:
+        pdf.fechar()
 
-def create_zip_from_results(results):
+def guardar_resultado(zip_job, resultado, rota):
     """
-    Cria um arquivo ZIP contendo todos os CSVs gerados
+    Move o CSV do resultado para o ZIP do job (etapa 'zip'), guarda em resultado['csv']
+    o nome dele no ZIP e registra os tempos do arquivo
     """
-    zip_buffer = io.BytesIO()
-    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
-        for result in results:
-            if result['success'] and result.get('csv_data'):
-                csv_file_name = f"extrato_{result['filename'].rsplit('.', 1)[0]}.csv"
-                csv_data = result['csv_data']
-                if isinstance(csv_data, io.StringIO):
-                    data = csv_data.getvalue().encode('utf-8')
-                elif isinstance(csv_data, io.BytesIO):
-                    data = csv_data.getvalue()
-                else:
-                    data = csv_data
-                    if isinstance(data, str):
-                        data = data.encode('utf-8')
-                zip_file.writestr(csv_file_name, data)
-    zip_buffer.seek(0)
-    return zip_buffer
+    csv_arquivo = resultado.pop('csv_arquivo', None)
+    resultado['csv'] = None
+    if csv_arquivo:
+        with medir(resultado['tempos'], 'zip'):
+            resultado['csv'] = zip_job.mover_arquivo(nome_csv_resultado(resultado), csv_arquivo)
+    PIPELINE_EXTRATOS.concluir_resultado(rota, resultado)
 
 @extrator_bp.route('/extrator')
 def extrator():
@@ -114,6 +118,7 @@ def process_extracts():
     """
     Endpoint principal para processar extratos bancários
     Recebe múltiplos PDFs e retorna os CSVs processados
+    Com ?tempos=1, a resposta traz os tempos de cada etapa (ms) por arquivo e da requisição
     """
     try:
         if 'files' not in request.files:
@@ -132,137 +137,57 @@ def process_extracts():
                 'error': 'Nenhum arquivo selecionado'
             }), 400
         
-        file_data = []
-        for file in files:
-            if file and file.filename != '':
-                try:
-                    if not allowed_file(file.filename):
-                        file_data.append({
-                            'filename': file.filename,
-                            'bank': None,
-                            'text': None,
-                            'error': f"Arquivo '{file.filename}' não é um PDF válido (extensão)"
-                        })
-                        continue
-                    
-                    file_content = file.read()
-                    if not validate_pdf_content(file_content):
-                        file_data.append({
-                            'filename': file.filename,
-                            'bank': None,
-                            'text': None,
-                            'error': f"Arquivo '{file.filename}' não é um PDF válido (conteúdo)"
-                        })
-                        continue
-                    
-                    file.seek(0)
-                    try:
-                        text, identified_bank = read_pdf(file)
-                        if identified_bank.startswith("Erro") or identified_bank == "Banco não identificado":
-                            file_data.append({
-                                'filename': file.filename,
-                                'bank': None,
-                                'text': None,
-                                'error': f"Banco não identificado em '{file.filename}'"
-                            })
-                            continue
-                    except Exception as pdf_error:
-                        file_data.append({
-                            'filename': file.filename,
-                            'bank': None,
-                            'text': None,
-                            'error': f"Erro ao ler PDF '{file.filename}': {str(pdf_error)}"
-                        })
-                        continue
-
-                    if identified_bank in ['Asaas', 'Bradesco', 'Sicoob1', 'Sicoob2', 'Sicoob3', 'Stone', 'Sicredi', 'Itaú4',
-                                         'Banco do Brasil1', 'Safra', 'Santander2', 'Efi1', 'Efi2', 'Mercado Pago', 'Caixa2']:
-                        try:
-                            file.seek(0)
-                            text = read_pdf2(file)
-                        except Exception as pdf2_error:
-                            file_data.append({
-                                'filename': file.filename,
-                                'bank': None,
-                                'text': None,
-                                'error': f"Erro ao processar PDF '{file.filename}' com read_pdf2: {str(pdf2_error)}"
-                            })
-                            continue
-                    
-                    file_data.append({
-                        'filename': file.filename,
-                        'bank': identified_bank,
-                        'text': text,
-                        'error': None
-                    })
-                except Exception as e:
-                    file_data.append({
-                        'filename': file.filename,
-                        'bank': None,
-                        'text': None,
-                        'error': f"Erro geral ao processar '{file.filename}': {str(e)}"
-                    })
-            else:
-                file_data.append({
-                    'filename': file.filename if file else 'Arquivo sem nome',
-                    'bank': None,
-                    'text': None,
-                    'error': "Arquivo vazio ou inválido"
-                })
-        
-        results = []
-        valid_files = [f for f in file_data if f['bank'] is not None and f['text'] is not None]
-        
-        if valid_files:
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future_to_file = {
-                    executor.submit(process_single_pdf_flask, None, file_info['filename'], file_info['bank'], file_info['text']):
-                    file_info for file_info in valid_files
-                }
-                for future in concurrent.futures.as_completed(future_to_file):
-                    file_info = future_to_file[future]
-                    try:
-                        result = future.result()
-                        results.append(result)
-                    except Exception as e:
-                        results.append({
-                            'filename': file_info['filename'],
-                            'success': False,
-                            'error': f"❌ Erro inesperado: {str(e)}"
-                        })
+        incluir_tempos = tempos_pedidos(request.args.get('tempos'))
+        tempos_requisicao = {}
+        with medir(tempos_requisicao, 'upload'):
+            pdfs, results = ler_uploads(files)
         
-        for file_info in file_data:
-            if file_info['error']:
-                results.append({
-                    'filename': file_info['filename'],
-                    'success': False,
-                    'error': file_info['error']
-                })
+        # Abrir, identificar, extrair e converter cada PDF no pool de processos;
+        # cada CSV (arquivo temporário) vai para o ZIP do job assim que o arquivo termina
+        job_id = ARMAZEM_RESULTADOS.novo_job()
+        processados = []
+        try:
+            with medir(tempos_requisicao, 'processamento'), ARMAZEM_RESULTADOS.gravar(job_id) as zip_job:
+                for resultado in PIPELINE_EXTRATOS.processar_lote([(pdf.fonte, pdf.nome) for pdf in pdfs]):
+                    guardar_resultado(zip_job, resultado, 'process-extracts')
+                    processados.append(resultado)
+        finally:
+            fechar_uploads(pdfs)
+        results = processados + results
         
         successful_results = [r for r in results if r['success']]
-        sanitized_results = [{'filename': r['filename'], 'success': r['success'], 'error': r['error']} for r in results]
+        sanitized_results = [{'filename': r['filename'], 'success': r['success'], 'bank': r.get('bank'),
+                              'cliente': r.get('cliente'), 'periodo': r.get('periodo'), 'csv': r.get('csv'),
+                              'error': r['error']} for r in results]
+        extras = {}
+        if incluir_tempos:
+            for sanitizado, r in zip(sanitized_results, results):
+                sanitizado['tempos'] = r.get('tempos', {})
+            extras['tempos'] = tempos_requisicao
         
         if successful_results:
-            zip_buffer = create_zip_from_results(successful_results)
-            temp_zip_path = os.path.join(UPLOAD_FOLDER, 'extratos_temp.zip')
-            with open(temp_zip_path, 'wb') as f:
-                f.write(zip_buffer.getvalue())
             return jsonify({
                 'success': True,
                 'message': f'{len(successful_results)} de {len(files)} arquivo(s) processado(s) com sucesso',
                 'results': sanitized_results,
-                'download_url': '/api/download-zip',
+                'job_id': job_id,
+                'download_url': url_for('extrator.download_zip', job_id=job_id),
                 'total_files': len(files),
-                'successful_files': len(successful_results)
+                'successful_files': len(successful_results),
+                **extras
             })
         else:
             if len(files) == 1:
+                resultado_unico = {'filename': files[0].filename, 'success': False, 'error': results[0]['error'] if results else 'Banco não identificado'}
+                if incluir_tempos and results:
+                    resultado_unico['tempos'] = results[0].get('tempos', {})
                 return jsonify({
                     'success': False,
                     'message': 'Processamento Concluído',
-                    'results': [{'filename': files[0].filename, 'success': False, 'error': results[0]['error'] if results else 'Banco não identificado'}],
+                    'results': [resultado_unico],
                     'total_files': len(files),
-                    'successful_files': 0
+                    'successful_files': 0,
+                    **extras
                 }), 200
             else:
                 return jsonify({
@@ -270,7 +195,8 @@ def process_extracts():
                     'message': 'Nenhum arquivo foi processado com sucesso',
                     'results': sanitized_results,
                     'total_files': len(files),
-                    'successful_files': 0
+                    'successful_files': 0,
+                    **extras
                 }), 400
     except Exception as e:
         return jsonify({
@@ -279,15 +205,35 @@ def process_extracts():
             'error': f'Erro interno do servidor: {str(e)}'
         }), 500
 
+@extrator_bp.route('/api/tempos', methods=['GET'])
+def histograma_tempos():
+    """
+    Histograma dos tempos (ms) por banco e etapa dos arquivos processados desde que o
+    servidor subiu, somado entre todos os workers (escopo "servidor") ou, sem o estado
+    compartilhado ligado por home.metricas.instrumentar, só deste processo ("processo")
+    """
+    return jsonify({
+        'escopo': 'servidor' if ESTADO_COMPARTILHADO.ativo else 'processo',
+        'pid': os.getpid(),
+        'faixas_ms': list(FAIXAS_MS),
+        'bancos': HISTOGRAMA_TEMPOS.resumo(),
+    })
+
+@extrator_bp.route('/api/download-zip/<job_id>', methods=['GET'])
 @extrator_bp.route('/api/download-zip', methods=['GET'])
-def download_zip():
+def download_zip(job_id=None):
     """
-    Endpoint para download do arquivo ZIP com os CSVs
+    Endpoint para download do arquivo ZIP com os CSVs de um processamento
+    (job_id na URL ou no parâmetro ?job_id=, obrigatório: cada processamento
+    tem o próprio ZIP, o download_url da resposta de /api/process-extracts)
     """
+    job_id = job_id or request.args.get('job_id')
+    if not job_id:
+        return jsonify({'error': 'Informe o job_id do processamento (use o download_url da resposta)'}), 400
     try:
-        temp_zip_path = os.path.join(UPLOAD_FOLDER, 'extratos_temp.zip')
-        if not os.path.exists(temp_zip_path):
-            return jsonify({'error': 'Arquivo ZIP não encontrado'}), 404
+        temp_zip_path = ARMAZEM_RESULTADOS.caminho(job_id)
+        if temp_zip_path is None:
+            return jsonify({'error': 'Arquivo ZIP não encontrado ou expirado'}), 404
         return send_file(
             temp_zip_path,
             as_attachment=True,
@@ -297,10 +243,183 @@ def download_zip():
     except Exception as e:
         return jsonify({'error': f'Erro ao fazer download: {str(e)}'}), 500
 
+# ---------------------------------------------------------------------------
+# Jobs assíncronos
+# ---------------------------------------------------------------------------
+
+# Estado dos jobs deste processo, espelhado em disco pelo ARMAZEM_RESULTADOS para
+# que o status e o download funcionem em qualquer processo do servidor
+# { job_id: { "status": ..., "arquivos": [...], "download_url": ..., "erro": ... } }
+JOBS: dict[str, dict] = {}
+JOBS_LOCK = threading.Lock()
+# Threads dos jobs iniciados neste processo, para aguardar_jobs
+_THREADS_JOBS: set[threading.Thread] = set()
+
+
+@extrator_bp.route('/api/jobs/extratos', methods=['POST'])
+def criar_job_extratos():
+    """
+    Recebe os PDFs (campo files), inicia o processamento em background e retorna
+    o job_id na hora (202). O andamento é consultado em /api/jobs/extratos/<job_id>.
+    """
+    files = request.files.getlist('files')
+    if not files or all(file.filename == '' for file in files):
+        return jsonify({'success': False, 'error': 'Nenhum arquivo enviado'}), 400
+
+    pdfs, recusados = ler_uploads(files)
+    job_id = ARMAZEM_RESULTADOS.novo_job()
+    job = {
+        'job_id': job_id,
+        'status': 'na_fila',
+        'criado_em': time.time(),
+        'concluido_em': None,
+        'total_files': len(pdfs) + len(recusados),
+        'processed_files': len(recusados),
+        'successful_files': 0,
+        'arquivos': [
+            {'filename': pdf.nome, 'status': 'pendente', 'bank': None, 'cliente': None, 'periodo': None,
+             'csv': None, 'transacoes': 0, 'tempos': {}, 'error': None}
+            for pdf in pdfs
+        ] + [
+            {'filename': r['filename'], 'status': 'erro', 'bank': None, 'cliente': None, 'periodo': None,
+             'csv': None, 'transacoes': 0, 'tempos': {}, 'error': r['error']}
+            for r in recusados
+        ],
+        'download_url': None,
+        'erro': None,
+    }
+    _remover_jobs_expirados()
+    with JOBS_LOCK:
+        JOBS[job_id] = job
+    _publicar_job(job_id)
+
+    download_url = url_for('extrator.baixar_job_extratos', job_id=job_id)
+    thread = threading.Thread(
+        target=_executar_job_extratos,
+        args=(job_id, pdfs, download_url),
+        daemon=True,
+    )
+    thread.start()
+    with JOBS_LOCK:
+        _THREADS_JOBS.difference_update([t for t in _THREADS_JOBS if not t.is_alive()])
+        _THREADS_JOBS.add(thread)
+
+    return jsonify({
+        'success': True,
+        'job_id': job_id,
+        'status': 'na_fila',
+        'status_url': url_for('extrator.status_job_extratos', job_id=job_id),
+    }), 202
+
+
+@extrator_bp.route('/api/jobs/extratos/<job_id>', methods=['GET'])
+def status_job_extratos(job_id):
+    """Andamento do job: status geral e, por arquivo, status, banco, cliente, período, CSV no ZIP e tempos (ms)."""
+    job = _obter_job(job_id)
+    if job is None:
+        return jsonify({'error': 'Job não encontrado ou expirado'}), 404
+    return jsonify(job)
+
+
+@extrator_bp.route('/api/jobs/extratos/<job_id>/download', methods=['GET'])
+def baixar_job_extratos(job_id):
+    """ZIP com os CSVs do job, disponível quando o status é 'concluido'."""
+    job = _obter_job(job_id)
+    if job is None:
+        return jsonify({'error': 'Job não encontrado ou expirado'}), 404
+    if job['status'] != 'concluido':
+        return jsonify({'error': 'Job ainda em processamento', 'status': job['status']}), 409
+    caminho = ARMAZEM_RESULTADOS.caminho(job_id)
+    if caminho is None:
+        return jsonify({'error': 'Nenhum arquivo processado com sucesso'}), 404
+    return send_file(caminho, as_attachment=True, download_name='extratos.zip', mimetype='application/zip')
+
+
+def _obter_job(job_id):
+    with JOBS_LOCK:
+        job = JOBS.get(job_id)
+        if job is not None:
+            return copy.deepcopy(job)
+    return ARMAZEM_RESULTADOS.estado(job_id)
+
+
+def _publicar_job(job_id):
+    with JOBS_LOCK:
+        job = copy.deepcopy(JOBS.get(job_id))
+    if job is not None:
+        try:
+            ARMAZEM_RESULTADOS.salvar_estado(job_id, job)
+        except OSError as e:
+            print(f"[EXTRATOR] Falha ao gravar estado do job {job_id}: {e}")
+
+
+def aguardar_jobs(timeout):
+    """
+    Espera, por até `timeout` segundos, os jobs deste processo em andamento. Usado
+    ao encerrar o worker do servidor (gunicorn.conf.py), já que as threads dos jobs
+    são daemon e morreriam com ele. Retorna quantos jobs continuam rodando.
+    """
+    limite = time.monotonic() + timeout
+    with JOBS_LOCK:
+        threads = list(_THREADS_JOBS)
+    for thread in threads:
+        thread.join(max(0, limite - time.monotonic()))
+    return sum(thread.is_alive() for thread in threads)
+
+
+def _remover_jobs_expirados():
+    limite = time.time() - ARMAZEM_RESULTADOS.ttl
+    with JOBS_LOCK:
+        for job_id in [j for j, job in JOBS.items() if job['criado_em'] < limite]:
+            del JOBS[job_id]
+
+
+def _executar_job_extratos(job_id, pdfs, download_url):
+    """Processa os PDFs do job no pool, atualizando o estado a cada arquivo concluído."""
+    try:
+        with JOBS_LOCK:
+            JOBS[job_id]['status'] = 'processando'
+            for arquivo in JOBS[job_id]['arquivos'][:len(pdfs)]:
+                arquivo['status'] = 'processando'
+        _publicar_job(job_id)
+
+        with ARMAZEM_RESULTADOS.gravar(job_id) as zip_job:
+            for resultado in PIPELINE_EXTRATOS.processar_lote([(pdf.fonte, pdf.nome) for pdf in pdfs]):
+                guardar_resultado(zip_job, resultado, 'jobs')
+                with JOBS_LOCK:
+                    job = JOBS[job_id]
+                    job['arquivos'][resultado['indice']].update(
+                        status='concluido' if resultado['success'] else 'erro',
+                        bank=resultado['bank'],
+                        cliente=resultado['cliente'],
+                        periodo=resultado['periodo'],
+                        csv=resultado['csv'],
+                        transacoes=resultado['transacoes'],
+                        tempos=resultado['tempos'],
+                        error=resultado['error'],
+                    )
+                    job['processed_files'] += 1
+                    job['successful_files'] += 1 if resultado['success'] else 0
+                _publicar_job(job_id)
+
+        with JOBS_LOCK:
+            job = JOBS[job_id]
+            job['status'] = 'concluido'
+            job['concluido_em'] = time.time()
+            if job['successful_files']:
+                job['download_url'] = download_url
+    except Exception as e:
+        with JOBS_LOCK:
+            JOBS[job_id].update(status='erro', erro=str(e), concluido_em=time.time())
+    finally:
+        fechar_uploads(pdfs)
+    _publicar_job(job_id)
+
 @extrator_bp.route('/api/identify-bank', methods=['POST'])
 def identify_bank():
     """
     Endpoint para identificar apenas o banco de um PDF (útil para preview)
+    Com ?tempos=1, a resposta traz os tempos de cada etapa (ms)
     """
     try:
         if 'file' not in request.files:
@@ -315,37 +434,43 @@ def identify_bank():
                 'bank': None,
                 'error': 'Arquivo não é um PDF válido (extensão)'
             })
-        file_content = file.read()
-        if not validate_pdf_content(file_content):
-            return jsonify({
-                'success': False,
-                'filename': file.filename,
-                'bank': None,
-                'error': 'Arquivo não é um PDF válido (conteúdo)'
-            })
-        file.seek(0)
-        try:
-            text, identified_bank = read_pdf(file)
-            if identified_bank.startswith("Erro") or identified_bank == "Banco não identificado":
+        with PDFEnviado.de_upload(file) as pdf:
+            if not pdf.eh_pdf:
                 return jsonify({
                     'success': False,
                     'filename': file.filename,
                     'bank': None,
-                    'error': f"Banco não identificado: {identified_bank}"
+                    'error': 'Arquivo não é um PDF válido (conteúdo)'
+                })
+            try:
+                tempos = {}
+                extras = {'tempos': tempos} if tempos_pedidos(request.args.get('tempos')) else {}
+                identified_bank = PIPELINE_EXTRATOS.identificar(pdf.fonte, file.filename, tempos=tempos)
+                identificado = banco_identificado(identified_bank)
+                PIPELINE_EXTRATOS.concluir('identify-bank', file.filename,
+                                           identified_bank if identificado else None, tempos, sucesso=identificado)
+                if not identificado:
+                    return jsonify({
+                        'success': False,
+                        'filename': file.filename,
+                        'bank': None,
+                        'error': f"Banco não identificado: {identified_bank}",
+                        **extras
+                    })
+                return jsonify({
+                    'success': True,
+                    'filename': file.filename,
+                    'bank': identified_bank,
+                    'error': None,
+                    **extras
+                })
+            except Exception as e:
+                return jsonify({
+                    'success': False,
+                    'filename': file.filename,
+                    'bank': None,
+                    'error': f"Erro ao processar PDF: {str(e)}"
                 })
-            return jsonify({
-                'success': True,
-                'filename': file.filename,
-                'bank': identified_bank,
-                'error': None
-            })
-        except Exception as e:
-            return jsonify({
-                'success': False,
-                'filename': file.filename,
-                'bank': None,
-                'error': f"Erro ao processar PDF: {str(e)}"
-            })
     except Exception as e:
         return jsonify({'error': f'Erro interno do servidor: {str(e)}'}), 500
 
@@ -360,25 +485,21 @@ def debug_parser():
             return jsonify({'error': 'Nenhum arquivo enviado'}), 400
         file = request.files['file']
 
-        # 1. Identificar banco (pdfplumber)
-        file.seek(0)
-        text_plumber, identified_bank = read_pdf(file)
+        with DocumentoExtrato.de_arquivo(file) as documento:
+            # 1. Identificar banco
+            identified_bank = documento.identificar_banco()
 
-        result = {
-            'banco': identified_bank,
-            'texto_pdfplumber_primeiras_500': (text_plumber or '')[:500],
-        }
+            result = {
+                'banco': identified_bank,
+                'texto_pdfplumber_primeiras_500': documento.texto_pdfplumber[:500],
+            }
 
-        # 2. Re-ler com PyMuPDF se necessário
-        BANKS_PDF2 = {'Asaas', 'Bradesco', 'Sicoob1', 'Sicoob2', 'Sicoob3', 'Stone',
-                      'Sicredi', 'Itaú4', 'Banco do Brasil1', 'Safra', 'Santander2',
-                      'Efi1', 'Efi2', 'Mercado Pago', 'Caixa2'}
-        raw_text = text_plumber or ''
-        if identified_bank in BANKS_PDF2:
-            file.seek(0)
-            raw_text = read_pdf2(file)
-            result['texto_pymupdf_primeiras_500'] = raw_text[:500]
-            result['texto_pymupdf_linhas'] = raw_text.splitlines()[:80]
+            # 2. Texto no formato do parser (PyMuPDF quando necessário)
+            raw_text = documento.texto_pdfplumber
+            if identified_bank in BANKS_USING_PDF2:
+                raw_text = documento.texto_pymupdf
+                result['texto_pymupdf_primeiras_500'] = raw_text[:500]
+                result['texto_pymupdf_linhas'] = raw_text.splitlines()[:80]
 
         # 3. Rodar o parser
         try:
@@ -432,9 +553,10 @@ def debug_file():
             if file_content.startswith(b'%PDF-'):
                 file_info['pdf_signature'] = True
             file_info['first_bytes'] = file_content[:20].hex() if file_content else ''
-            file.seek(0)
             try:
-                text, identified_bank = read_pdf(file)
+                with DocumentoExtrato(file_content, file.filename) as documento:
+                    identified_bank = documento.identificar_banco()
+                    text = documento.texto_pdfplumber
                 file_info['read_pdf_success'] = True
                 file_info['identified_bank'] = identified_bank
                 file_info['text_length'] = len(text) if text else 0
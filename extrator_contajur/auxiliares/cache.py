@@ -0,0 +1,176 @@
+import hashlib
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+from .pastas import pasta_privada, pasta_temporaria
+from .upload import hash_fonte
+
+# Pasta do cache em disco (compartilhada entre os processos do servidor). Precisa ser
+# do usuário do servidor e fechada para os demais (0700); se não for, o disco fica desligado
+EXTRATOR_CACHE_DIR = os.getenv("EXTRATOR_CACHE_DIR") or pasta_temporaria("extrator_cache")
+# Quantidade de extratos mantidos em memória por processo
+EXTRATOR_CACHE_MEMORIA = int(os.getenv("EXTRATOR_CACHE_MEMORIA", "64"))
+# Tamanho máximo do cache em disco, em MB (0 desativa o disco)
+EXTRATOR_CACHE_DISCO_MB = int(os.getenv("EXTRATOR_CACHE_DISCO_MB", "512"))
+
+_PASTA_EXTRATOR = Path(__file__).resolve().parent.parent
+
+
+def _versao_parsers():
+    """
+    Digest do código que determina o resultado da extração (parsers, identificação,
+    leitura do PDF, registro de transação e renomeador). Qualquer alteração nesses arquivos
+    invalida o cache sem precisar lembrar de mudar uma versão manualmente.
+    """
+    digest = hashlib.sha256()
+    arquivos = sorted((_PASTA_EXTRATOR / "banco").glob("*.py")) + [
+        _PASTA_EXTRATOR / "auxiliares" / nome
+        for nome in ("documento.py", "identificador.py", "linhas.py", "padroes.py", "renomeador.py",
+                     "transacao.py", "utils.py")
+    ]
+    for arquivo in arquivos:
+        digest.update(arquivo.name.encode())
+        digest.update(arquivo.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+VERSAO_PARSERS = os.getenv("EXTRATOR_VERSAO_PARSERS") or _versao_parsers()
+
+
+class Extracao(NamedTuple):
+    """
+    Resultado guardado por PDF. `texto` e `transacoes` ficam None quando só o banco
+    foi identificado; `transacoes` vazia indica que o parser não achou lançamentos.
+    `cliente` e `periodo` são os do RENOMEADOR (None quando não foram achados).
+    """
+    banco: str
+    texto: Optional[str] = None
+    transacoes: Optional[list] = None
+    cliente: Optional[str] = None
+    periodo: Optional[str] = None
+
+
+class CacheExtratos:
+    """
+    Cache de extrações por SHA-256 do PDF + versão dos parsers: LRU em memória na
+    frente de um armazenamento em disco limitado por tamanho, em que os arquivos
+    menos usados recentemente são removidos primeiro. Os pickles só são lidos de
+    uma pasta privada do usuário do processo (ver pastas.pasta_privada).
+    """
+
+    def __init__(self, pasta=EXTRATOR_CACHE_DIR, max_memoria=EXTRATOR_CACHE_MEMORIA,
+                 max_disco_mb=EXTRATOR_CACHE_DISCO_MB, versao=VERSAO_PARSERS):
+        self.pasta = Path(pasta)
+        self.max_memoria = max_memoria
+        self.max_disco = max_disco_mb * 1024 * 1024
+        self.versao = versao
+        self._memoria = OrderedDict()
+        self._lock = threading.Lock()
+        self._pasta_conferida = False
+
+    def chave(self, conteudo):
+        """Chave do PDF (bytes ou caminho do arquivo)."""
+        return f"{hash_fonte(conteudo)}-{self.versao}"
+
+    def _disco(self):
+        """Se o cache em disco está ligado e a pasta é privada; senão, avisa uma vez e desliga o disco."""
+        if not self.max_disco:
+            return False
+        if not self._pasta_conferida:
+            try:
+                pasta_privada(self.pasta)
+            except OSError as e:
+                print(f"[EXTRATOR] Cache em disco desligado: {e}")
+                self.max_disco = 0
+                return False
+            self._pasta_conferida = True
+        return True
+
+    def _arquivos(self):
+        """Pickles do cache e temporários de gravações (inclusive de processos que caíram no meio)."""
+        yield from self.pasta.glob("*.pkl")
+        yield from self.pasta.glob("*.tmp")
+
+    def _arquivo(self, chave):
+        return self.pasta / f"{chave}.pkl"
+
+    def obter(self, chave):
+        """Retorna a Extracao guardada ou None."""
+        with self._lock:
+            entrada = self._memoria.get(chave)
+            if entrada is not None:
+                self._memoria.move_to_end(chave)
+                return entrada
+
+        if not self._disco():
+            return None
+        arquivo = self._arquivo(chave)
+        try:
+            with open(arquivo, 'rb') as f:
+                entrada = pickle.load(f)
+            os.utime(arquivo)  # marca como usado recentemente para a remoção
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return None
+        self._guardar_memoria(chave, entrada)
+        return entrada
+
+    def guardar(self, chave, entrada):
+        self._guardar_memoria(chave, entrada)
+        if not self._disco():
+            return
+        try:
+            arquivo = self._arquivo(chave)
+            temporario = arquivo.with_name(f"{arquivo.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(temporario, 'wb') as f:
+                pickle.dump(entrada, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporario, arquivo)
+        except OSError:
+            return
+        self._remover_excedente()
+
+    def _guardar_memoria(self, chave, entrada):
+        if self.max_memoria <= 0:
+            return
+        with self._lock:
+            self._memoria[chave] = entrada
+            self._memoria.move_to_end(chave)
+            while len(self._memoria) > self.max_memoria:
+                self._memoria.popitem(last=False)
+
+    def _remover_excedente(self):
+        """Remove os arquivos usados há mais tempo até o disco caber no limite."""
+        arquivos = []
+        total = 0
+        for arquivo in self._arquivos():
+            try:
+                info = arquivo.stat()
+            except OSError:
+                continue
+            arquivos.append((info.st_mtime, info.st_size, arquivo))
+            total += info.st_size
+        if total <= self.max_disco:
+            return
+        for _, tamanho, arquivo in sorted(arquivos):
+            try:
+                arquivo.unlink()
+            except OSError:
+                continue
+            total -= tamanho
+            if total <= self.max_disco:
+                break
+
+    def limpar(self):
+        with self._lock:
+            self._memoria.clear()
+        for arquivo in self._arquivos():
+            try:
+                arquivo.unlink()
+            except OSError:
+                pass
+
+
+CACHE_EXTRATOS = CacheExtratos()
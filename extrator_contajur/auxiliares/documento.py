@@ -0,0 +1,213 @@
+import io
+import logging
+import multiprocessing
+import os
+import time
+
+from .identificador import identificar_banco_por_paginas
+from .upload import eh_fonte_caminho
+from ..banco import BANKS_USING_PDF2
+
+# Em quantas partes, no máximo, as páginas de um único PDF grande são divididas entre
+# os processos do pool compartilhado do extrator (processamento.obter_pool; vazio =
+# EXTRATOR_WORKERS, 1 = em série). Só no processo do servidor, nunca dentro do pool
+EXTRATOR_WORKERS_PAGINAS = int(os.getenv("EXTRATOR_WORKERS_PAGINAS") or 0)
+# Número mínimo de páginas para a extração do texto ir para os processos. O PyMuPDF
+# extrai cerca de 1 ms por página e só compensa o custo de subir os processos
+# em documentos muito maiores que o pdfplumber (dezenas de ms por página)
+EXTRATOR_PAGINAS_PARALELO = int(os.getenv("EXTRATOR_PAGINAS_PARALELO", "32"))
+EXTRATOR_PAGINAS_PARALELO_PYMUPDF = int(os.getenv("EXTRATOR_PAGINAS_PARALELO_PYMUPDF", "1000"))
+# Mínimo de páginas de cada parte enviada aos processos
+_PAGINAS_POR_TAREFA = 8
+
+# Avisos da extração (o logging raiz de alguns sistemas só mostra erros)
+logger = logging.getLogger("extrator_contajur.documento")
+if logger.level == logging.NOTSET:
+    logger.setLevel(logging.INFO)
+
+
+def _juntar_paginas(paginas):
+    """Junta os textos das páginas no mesmo formato de read_pdf/read_pdf2."""
+    return "".join(pagina + "\n" for pagina in paginas if pagina)
+
+
+# fitz e pdfplumber são importados na primeira abertura de um PDF, não na subida do servidor
+
+def _abrir_fitz(conteudo):
+    import fitz  # PyMuPDF
+
+    if eh_fonte_caminho(conteudo):
+        return fitz.open(conteudo, filetype="pdf")
+    return fitz.open(stream=conteudo, filetype="pdf")
+
+
+def _abrir_plumber(conteudo):
+    import pdfplumber
+
+    return pdfplumber.open(conteudo if eh_fonte_caminho(conteudo) else io.BytesIO(conteudo))
+
+
+# ── Extração paralela das páginas ────────────────────────────────────────────
+
+def _extrair_paginas(conteudo, motor, inicio, fim):
+    """Texto das páginas [inicio, fim) pelo motor ("pymupdf" ou "pdfplumber"), num processo do pool."""
+    abrir = _abrir_fitz if motor == "pymupdf" else _abrir_plumber
+    documento = abrir(conteudo)
+    try:
+        if motor == "pymupdf":
+            return [documento[indice].get_text() or "" for indice in range(inicio, min(fim, documento.page_count))]
+        return [pagina.extract_text() or "" for pagina in documento.pages[inicio:fim]]
+    finally:
+        documento.close()
+
+
+def _partes(inicio, total, maximo):
+    """Divide as páginas [inicio, total) em até `maximo` intervalos seguidos de pelo menos _PAGINAS_POR_TAREFA."""
+    quantidade = min(maximo, (total - inicio) // _PAGINAS_POR_TAREFA)
+    if quantidade <= 0:
+        return []
+    tamanho = -(-(total - inicio) // quantidade)
+    return [(comeco, min(comeco + tamanho, total)) for comeco in range(inicio, total, tamanho)]
+
+
+class DocumentoExtrato:
+    """
+    PDF de extrato aberto uma única vez, a partir dos bytes ou do caminho do arquivo.
+
+    A identificação do banco lê o texto do PyMuPDF página a página, que é barato,
+    e para assim que o banco fica decidido. O texto completo que o parser precisa
+    (PyMuPDF ou pdfplumber) só é extraído quando pedido, e cada página é extraída
+    no máximo uma vez. Em PDFs grandes (EXTRATOR_PAGINAS_PARALELO*), as páginas que
+    faltam são divididas entre processos e juntadas na ordem original.
+    """
+
+    def __init__(self, conteudo, nome=None):
+        self.conteudo = conteudo
+        self.nome = nome
+        self._fitz = _abrir_fitz(conteudo)
+        self._plumber = None
+        self._paginas_fitz = []
+        self._paginas_plumber = []
+        self._banco = None
+
+    @classmethod
+    def de_arquivo(cls, file):
+        """Cria o documento a partir de um arquivo aberto (upload do Flask ou arquivo local)."""
+        if hasattr(file, 'seek'):
+            file.seek(0)
+        conteudo = file.read()
+        nome = getattr(file, 'filename', None) or getattr(file, 'name', None)
+        return cls(conteudo, nome)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+    def fechar(self):
+        self._fitz.close()
+        if self._plumber is not None:
+            self._plumber.close()
+            self._plumber = None
+
+    @property
+    def total_paginas(self):
+        return self._fitz.page_count
+
+    # ── Texto por página (extraído sob demanda e guardado) ──────────────────
+
+    def paginas_pymupdf(self):
+        """Gera o texto de cada página pelo PyMuPDF."""
+        for indice in range(self.total_paginas):
+            if indice == len(self._paginas_fitz):
+                self._paginas_fitz.append(self._fitz[indice].get_text() or "")
+            yield self._paginas_fitz[indice]
+
+    def paginas_pdfplumber(self):
+        """Gera o texto de cada página pelo pdfplumber."""
+        if self._plumber is None:
+            self._plumber = _abrir_plumber(self.conteudo)
+        for indice, pagina in enumerate(self._plumber.pages):
+            if indice == len(self._paginas_plumber):
+                self._paginas_plumber.append(pagina.extract_text() or "")
+            yield self._paginas_plumber[indice]
+
+    def _extrair_em_paralelo(self, motor, paginas):
+        """
+        Completa `paginas` (a lista já extraída do motor) nos processos do pool
+        compartilhado do extrator, quando o PDF é grande o bastante para compensar
+        abrir o documento em cada processo: as páginas que faltam viram até
+        EXTRATOR_WORKERS_PAGINAS partes seguidas, juntadas na ordem. O pool é o mesmo
+        dos arquivos, então o número de processos do servidor não cresce com as
+        requisições. Se o pool falhar, as páginas que faltarem são extraídas aqui
+        mesmo, em série; se uma parte passar do tempo limite de um arquivo, o pool é
+        reciclado (o processo dela está travado) e a extração falha.
+        Dentro de um processo de pool (o do PipelineExtratos ou o do lote), a extração
+        fica em série: os outros processos do pool já ocupam os núcleos.
+        """
+        if multiprocessing.parent_process() is not None:
+            return
+        from .processamento import EXTRATOR_TIMEOUT_ARQUIVO, EXTRATOR_WORKERS, obter_pool, reciclar_pool
+
+        total = self.total_paginas
+        minimo = EXTRATOR_PAGINAS_PARALELO_PYMUPDF if motor == "pymupdf" else EXTRATOR_PAGINAS_PARALELO
+        partes = _partes(len(paginas), total, EXTRATOR_WORKERS_PAGINAS or EXTRATOR_WORKERS)
+        if total < minimo or len(partes) < 2:
+            return
+        futuros = []
+        try:
+            pool = obter_pool()
+            futuros = [pool.submit(_extrair_paginas, self.conteudo, motor, inicio, fim) for inicio, fim in partes]
+            prazo = time.monotonic() + EXTRATOR_TIMEOUT_ARQUIVO if EXTRATOR_TIMEOUT_ARQUIVO else None
+            for futuro in futuros:
+                restante = None if prazo is None else max(0, prazo - time.monotonic())
+                paginas.extend(futuro.result(timeout=restante))
+        except TimeoutError:
+            reciclar_pool(pool)
+            raise TimeoutError(f"Tempo limite de {EXTRATOR_TIMEOUT_ARQUIVO:g}s excedido ao extrair as páginas")
+        except Exception as e:
+            logger.warning("[EXTRATOR] Extração paralela de %s falhou, seguindo em série: %s",
+                           self.nome or "PDF", e)
+            for futuro in futuros:
+                futuro.cancel()
+
+    @property
+    def texto_pymupdf(self):
+        """Texto completo pelo PyMuPDF (equivalente a read_pdf2)."""
+        self._extrair_em_paralelo("pymupdf", self._paginas_fitz)
+        return _juntar_paginas(self.paginas_pymupdf())
+
+    @property
+    def texto_pdfplumber(self):
+        """Texto completo pelo pdfplumber (equivalente a read_pdf)."""
+        self._extrair_em_paralelo("pdfplumber", self._paginas_plumber)
+        return _juntar_paginas(self.paginas_pdfplumber())
+
+    # ── Identificação e texto do parser ─────────────────────────────────────
+
+    def identificar_banco(self):
+        """
+        Identifica o banco do extrato lendo só as páginas necessárias.
+        Bancos cujo parser usa o texto do pdfplumber, ou PDFs não identificados pelo
+        PyMuPDF, são confirmados nas páginas do pdfplumber, que o parser vai precisar
+        de qualquer forma.
+        """
+        if self._banco is None:
+            banco = identificar_banco_por_paginas(self.paginas_pymupdf())
+            if banco not in BANKS_USING_PDF2:
+                banco = identificar_banco_por_paginas(self.paginas_pdfplumber())
+            self._banco = banco
+        return self._banco
+
+    def texto_para(self, banco):
+        """Retorna o texto no formato que o parser do banco espera."""
+        texto = self.texto_pymupdf if banco in BANKS_USING_PDF2 else self.texto_pdfplumber
+        if not texto.strip():
+            raise ValueError("Nenhum texto foi extraído do PDF.")
+        return texto
+
+
+def banco_identificado(banco):
+    """Indica se o retorno de identificar_banco corresponde a um banco reconhecido."""
+    return bool(banco) and not banco.startswith("Erro") and banco != "Banco não identificado"
@@ -0,0 +1,228 @@
+"""
+Estado de cada processo do servidor somado entre todos (métricas, histograma de tempos).
+
+Com o gunicorn, cada worker é um processo com os próprios contadores, e uma coleta
+atendida por um deles mostraria só a parte dele. Cada parte do estado é uma fonte
+registrada com fonte(nome, foto, juntar): foto() dá o valor deste processo em JSON
+e juntar(fotos) soma as fotos de vários processos no mesmo formato.
+
+Depois de ativar() (home.metricas.instrumentar), cada processo grava as fotos num
+arquivo só dele na pasta privada EXTRATOR_ESTADO_DIR: a cada
+EXTRATOR_ESTADO_INTERVALO segundos, antes de cada leitura e ao sair. ler(nome)
+junta os arquivos de todos os processos. Os arquivos de processos que já
+terminaram (workers reciclados pelo max_requests) são somados em acumulado.json,
+só nas fontes acumulativas; as que medem o momento (fila do pool) deixam de
+contar. Sem ativar(), ler() devolve só o processo atual.
+
+O gunicorn.conf.py chama limpar() ao subir o servidor: os contadores recomeçam do
+zero a cada início, como os de um processo só.
+"""
+import atexit
+import json
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from functools import reduce
+from pathlib import Path
+
+from .pastas import pasta_privada, pasta_temporaria
+
+try:
+    import fcntl
+except ImportError:  # Windows: sem trava, os arquivos de processos encerrados não são compactados
+    fcntl = None
+
+EXTRATOR_ESTADO_DIR = os.getenv("EXTRATOR_ESTADO_DIR") or pasta_temporaria("extrator_estado")
+EXTRATOR_ESTADO_INTERVALO = float(os.getenv("EXTRATOR_ESTADO_INTERVALO", "5"))
+
+_ACUMULADO = "acumulado.json"
+_TRAVA = ".trava"
+
+
+def somar(a, b):
+    """Soma dois números, ou duas listas de mesma forma posição a posição."""
+    if isinstance(a, list):
+        return [somar(x, y) for x, y in zip(a, b)]
+    return a + b
+
+
+def somar_fotos(fotos, vazio):
+    """Soma as fotos com somar(); `vazio` quando não há nenhuma."""
+    return reduce(somar, fotos) if fotos else vazio
+
+
+def juntar_series(fotos):
+    """Junta fotos no formato [[rótulos, valor], ...], somando os valores das mesmas séries."""
+    series = {}
+    for foto in fotos:
+        for rotulos, valor in foto:
+            chave = tuple(rotulos)
+            series[chave] = somar(series[chave], valor) if chave in series else valor
+    return [[list(chave), valor] for chave, valor in series.items()]
+
+
+def _vivo(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        # Existe, de outro usuário (o pid foi reaproveitado)
+        return True
+    return True
+
+
+class EstadoCompartilhado:
+    """Fotos do estado de cada processo numa pasta privada, juntadas na leitura."""
+
+    def __init__(self, pasta=EXTRATOR_ESTADO_DIR, intervalo=EXTRATOR_ESTADO_INTERVALO):
+        self.pasta = Path(pasta)
+        self.intervalo = intervalo
+        self.ativo = False
+        self._fontes = {}
+        self._pid = None
+        self._arquivo = None
+        self._lock = threading.Lock()
+        if hasattr(os, "register_at_fork"):
+            os.register_at_fork(after_in_child=self._apos_fork)
+
+    def _apos_fork(self):
+        # O lock pode ter sido copiado travado por outra thread do processo pai
+        self._lock = threading.Lock()
+
+    def fonte(self, nome, foto, juntar, acumulativa=True):
+        """
+        Registra uma parte do estado. `acumulativa` diz se a parte de um processo que
+        terminou continua somando (contadores) ou deixa de contar (valores do momento).
+        """
+        self._fontes[nome] = (foto, juntar, acumulativa)
+
+    def ativar(self):
+        """Liga o compartilhamento; se a pasta não for privada, avisa e fica só no processo."""
+        if self.ativo:
+            return True
+        try:
+            pasta_privada(self.pasta)
+        except OSError as e:
+            print(f"[EXTRATOR] Métricas só do processo que atender a coleta: {e}")
+            return False
+        self.ativo = True
+        atexit.register(self.gravar)
+        return True
+
+    def tocar(self):
+        """
+        Chamado a cada registro nas fontes: no primeiro de cada processo (inclusive de
+        um worker recém-criado pelo fork), cria o arquivo dele e a thread que o grava.
+        """
+        if self.ativo and self._pid != os.getpid():
+            self._iniciar()
+
+    def _iniciar(self):
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self._pid = os.getpid()
+            # O sufixo aleatório evita herdar o arquivo de um processo antigo com o mesmo pid
+            self._arquivo = self.pasta / f"{self._pid}-{uuid.uuid4().hex[:8]}.json"
+        threading.Thread(target=self._gravar_sempre, name="estado-compartilhado", daemon=True).start()
+
+    def _gravar_sempre(self):
+        pid = os.getpid()
+        while self._pid == pid:
+            time.sleep(self.intervalo)
+            self.gravar()
+
+    def gravar(self):
+        """Grava as fotos das fontes deste processo no arquivo dele."""
+        if not self.ativo or self._pid != os.getpid():
+            return
+        with self._lock:
+            fotos = {nome: foto() for nome, (foto, _, _) in self._fontes.items()}
+            temporario = self._arquivo.with_suffix(".tmp")
+            try:
+                temporario.write_text(json.dumps(fotos), encoding="utf-8")
+                os.replace(temporario, self._arquivo)
+            except OSError:
+                pass
+
+    def ler(self, nome):
+        """Valor da fonte `nome` somado entre os processos (só o deste, sem ativar())."""
+        foto, juntar, _ = self._fontes[nome]
+        if not self.ativo:
+            return juntar([foto()])
+        self.tocar()
+        self.gravar()
+        with self._trava():
+            self._compactar()
+            estados = self._estados()
+        return juntar([estado[nome] for estado in estados if nome in estado])
+
+    def limpar(self):
+        """Apaga os arquivos de todos os processos (ao subir o servidor)."""
+        try:
+            pasta_privada(self.pasta)
+        except OSError:
+            return
+        with self._trava():
+            for arquivo in self.pasta.iterdir():
+                if arquivo.name != _TRAVA:
+                    try:
+                        arquivo.unlink()
+                    except OSError:
+                        pass
+
+    @contextmanager
+    def _trava(self):
+        if fcntl is None:
+            yield
+            return
+        with open(self.pasta / _TRAVA, "a") as trava:
+            fcntl.flock(trava, fcntl.LOCK_EX)
+            yield
+
+    @staticmethod
+    def _carregar(arquivo):
+        try:
+            return json.loads(arquivo.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def _estados(self):
+        estados = [self._carregar(arquivo) for arquivo in self.pasta.glob("*.json")]
+        return [estado for estado in estados if estado]
+
+    def _compactar(self):
+        """Soma em acumulado.json os arquivos dos processos que terminaram e os apaga."""
+        if fcntl is None:
+            return
+        encerrados = []
+        for arquivo in self.pasta.iterdir():
+            pid = arquivo.name.split("-", 1)[0]
+            if pid.isdigit() and int(pid) != os.getpid() and not _vivo(int(pid)):
+                encerrados.append(arquivo)
+        if not encerrados:
+            return
+        acumulado = self._carregar(self.pasta / _ACUMULADO) or {}
+        for arquivo in encerrados:
+            if arquivo.suffix != ".json":
+                continue
+            for nome, foto in (self._carregar(arquivo) or {}).items():
+                fonte = self._fontes.get(nome)
+                if fonte is None or not fonte[2]:
+                    continue
+                juntar = fonte[1]
+                acumulado[nome] = juntar([acumulado[nome], foto]) if nome in acumulado else foto
+        temporario = self.pasta / f"{_ACUMULADO}.tmp"
+        temporario.write_text(json.dumps(acumulado), encoding="utf-8")
+        os.replace(temporario, self.pasta / _ACUMULADO)
+        for arquivo in encerrados:
+            try:
+                arquivo.unlink()
+            except OSError:
+                pass
+
+
+ESTADO_COMPARTILHADO = EstadoCompartilhado()
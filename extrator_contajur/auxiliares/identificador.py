@@ -1,115 +1,225 @@
 import re
+from typing import Callable, NamedTuple, Optional
+
+TEXTO_VAZIO = "Erro: Texto vazio ou ilegível"
+BANCO_NAO_IDENTIFICADO = "Banco não identificado"
+
+# Peso de cada marca encontrada na pontuação do banco. Marcas fortes são
+# exclusivas do banco (e-mail, razão social, cabeçalho do internet banking);
+# marcas fracas são genéricas (dígitos de agência/conta, nome do banco citado
+# em lançamentos) e podem aparecer em extratos de outros bancos.
+PESO_MARCA_FORTE = 1.0
+PESO_MARCA_FRACA = 0.3
+
+# Confiança a partir da qual o banco é considerado decidido
+CONFIANCA_DECIDIDA = 1.0
+
+
+def _refinar_banco_do_brasil(texto):
+    return "Banco do Brasil2" if texto.strip().split()[0].lower() == 'extrato' else "Banco do Brasil1"
+
+
+def _refinar_itau(texto):
+    linhas = texto.splitlines()
+    first_line = linhas[0].strip().lower()
+    if re.match(r"^\s*extrato\s+mensal", first_line):
+        return "Itaú3"
+    if 'dados gerais' in first_line:
+        for linha in linhas:
+            if re.match(r"^\d{2}/\d{2}/\d{4}$", linha.strip()):
+                return "Itaú2"
+    return "Itaú"
+
+
+class RegraBanco(NamedTuple):
+    """
+    Regra de identificação de um banco.
+    A regra vale quando qualquer uma das `marcas` e todas as de `exige` aparecem
+    no texto. `refinar` recebe o texto e escolhe a variante do layout.
+    """
+    banco: str
+    marcas: tuple
+    exige: tuple = ()
+    forte: bool = True
+    refinar: Optional[Callable[[str], str]] = None
+
+
+# Regras em ordem de prioridade: vence a primeira regra satisfeita.
+REGRAS_BANCOS = [
+    RegraBanco("Sicredi", ('Sicredi Fone', 'SicrediFone')),
+    RegraBanco("Itaú4", ('Fale Conosco: www.itau.com.br/empresas.', 'Lançamentos do período:',
+                         'Lançamentosdoperíodo:')),
+    RegraBanco("Banco Inter", ('Instituição: Banco Inter',)),
+    RegraBanco("Nubank", ('nubank.com.br/contatos#ouvidoria', 'ouvidoria@nubank.com.br')),
+    RegraBanco("Mercado Pago", ('www.mercadopago.com.br',)),
+    RegraBanco("Mercado Pago", ('Mercado Pago',), forte=False),
+    RegraBanco("Efi1", ('Efí S.A.',), exige=('Filtros aplicados',)),
+    RegraBanco("Efi2", ('Efí S.A.',), exige=('Filtros do',)),
+    RegraBanco("PagBank", ('PagSeguro Internet S/A', '290-PagSeguroInternetS/A')),
+    RegraBanco("Stone", ('meajuda@stone.com.br',)),
+    RegraBanco("Banco do Brasil", ('473-1',), forte=False, refinar=_refinar_banco_do_brasil),
+    RegraBanco("Santander1", ('Agência: 3472', 'Agência: 3222', 'Agência: 3503', 'Agência: 3156')),
+    RegraBanco("Santander2", ('EXTRATOCONSOLIDADOINTELIGENTE', 'EXTRATO CONSOLIDADO INTELIGENTE')),
+    RegraBanco("Santander2", ('EXTRATO CONSOLIDADO',), forte=False),
+    # Caixa2 (formato web) precisa vir antes da Caixa comum
+    RegraBanco("Caixa2", ('Pessoas com deficiência auditiva Alô CAIXA',)),
+    RegraBanco("Caixa", ('Sujeito a alteração até o final do expediente bancário',
+                         'Os lançamentos de extrato não estão disponíveis', 'SAC CAIXA')),
+    RegraBanco("iFood", ('Extrato da Conta Digital iFood',)),
+    RegraBanco("Asaas", ('ASAAS Gestão Financeira Instituição de Pagamento S.A.',)),
+    RegraBanco("Cora", ('Cora SCFI',)),
+    RegraBanco("Safra", ('Banco Safra S/A',)),
+    RegraBanco("InfinitePay", ('ajuda@infinitepay.io',)),
+    RegraBanco("Sicoob2", ('https://www.sicoob.com.br/sicoobnet/ib/#/home-extrato',)),
+    RegraBanco("Sicoob1", ('PLATAFORMA DE SERVIÇOS FINANCEIROS DO SICOOB – SISBR',
+                           'PLATAFORMA DE SERVIÇOS FINANCEIROS DO SICOOB - SISBR',
+                           'COOP.: 4108-4 / SICOOB CREDIMEPI')),
+    RegraBanco("Sicoob3", ('SICOOB - Sistema de Cooperativas de Crédito do Brasil',
+                           'SICOOB -Sistema de Cooperativas de Crédito do Brasil',
+                           'SISBR - SISTEMA DE INFORMÁTICA DO SICOOB')),
+    RegraBanco("Bradesco", ('00632',), forte=False),
+    RegraBanco("Itaú", ('8119', '1472', '3116', '1300'), forte=False, refinar=_refinar_itau),
+]
+
+
+class Identificacao(NamedTuple):
+    banco: str
+    confianca: float
+    pontuacao: dict
+
+
+def _regex_trie(literais):
+    """Monta uma única regex com as marcas organizadas em árvore de prefixos."""
+    arvore = {}
+    for literal in literais:
+        no = arvore
+        for caractere in literal:
+            no = no.setdefault(caractere, {})
+        no[''] = {}
+
+    def montar(no):
+        fim = '' in no
+        ramos = [re.escape(c) + montar(filho) for c, filho in sorted(no.items()) if c]
+        if not ramos:
+            return ''
+        if len(ramos) == 1 and not fim:
+            return ramos[0]
+        grupo = '(?:' + '|'.join(ramos) + ')'
+        return grupo + '?' if fim else grupo
+
+    return montar(arvore)
+
+
+class IdentificadorBancos:
+    """
+    Compila as marcas de todas as regras em um único autômato (regex em árvore de
+    prefixos), encontra todas as marcas do texto em uma só passada e resolve o banco
+    pela prioridade das regras.
+    """
+
+    def __init__(self, regras):
+        self.regras = list(regras)
+        literais = {m for regra in self.regras for m in regra.marcas + regra.exige}
+        self._padrao = re.compile(_regex_trie(literais))
+        # Marcas que são prefixo de outra: a regex só devolve a mais longa
+        # em cada posição, então as mais curtas são acrescentadas à parte.
+        self._prefixos = {
+            literal: [p for p in literais if p != literal and literal.startswith(p)]
+            for literal in literais
+        }
+
+    def encontrar_marcas(self, texto):
+        """Retorna o conjunto de marcas presentes no texto (uma passada, com sobreposição)."""
+        marcas = set()
+        pos = 0
+        buscar = self._padrao.search
+        while True:
+            match = buscar(texto, pos)
+            if not match:
+                return marcas
+            literal = match.group()
+            marcas.add(literal)
+            marcas.update(self._prefixos[literal])
+            pos = match.start() + 1
+
+    def pontuar(self, marcas):
+        """Pontuação de cada banco pelas marcas encontradas, limitada a 1.0."""
+        pontuacao = {}
+        for regra in self.regras:
+            if regra.exige and not all(m in marcas for m in regra.exige):
+                continue
+            achadas = sum(1 for m in regra.marcas if m in marcas)
+            if achadas:
+                peso = PESO_MARCA_FORTE if regra.forte else PESO_MARCA_FRACA
+                pontuacao[regra.banco] = min(1.0, pontuacao.get(regra.banco, 0.0) + achadas * peso)
+        return pontuacao
+
+    def resolver(self, marcas, obter_texto):
+        """
+        Escolhe o banco pela primeira regra satisfeita. `obter_texto` só é chamado
+        quando a regra vencedora precisa do texto para escolher a variante.
+        """
+        pontuacao = self.pontuar(marcas)
+        for regra in self.regras:
+            if regra.exige and not all(m in marcas for m in regra.exige):
+                continue
+            if any(m in marcas for m in regra.marcas):
+                banco = regra.refinar(obter_texto()) if regra.refinar else regra.banco
+                return Identificacao(banco, pontuacao[regra.banco], pontuacao)
+        return Identificacao(BANCO_NAO_IDENTIFICADO, 0.0, pontuacao)
+
+    def identificar(self, texto):
+        if not texto:
+            return Identificacao(TEXTO_VAZIO, 0.0, {})
+        return self.resolver(self.encontrar_marcas(texto), lambda: texto)
+
+
+IDENTIFICADOR = IdentificadorBancos(REGRAS_BANCOS)
+
+
+def identificar_banco_detalhado(text):
+    """
+    Identifica o banco e retorna Identificacao(banco, confianca, pontuacao), onde
+    `pontuacao` traz a pontuação de todos os bancos com alguma marca no texto.
+    """
+    return IDENTIFICADOR.identificar(text)
+
 
 def identificar_banco(text):
     """
     Identifica o banco a partir do texto extraído do PDF.
     Retorna o nome do banco ou 'Banco não identificado'.
     """
-    if not text:
-        return "Erro: Texto vazio ou ilegível"
-
-    linhas = text.splitlines()
-    if not linhas:
-        return "Erro: Texto vazio ou ilegível"
-    palavras = text.split()
-    
-    # Sicredi
-    if 'Sicredi Fone' in text or 'SicrediFone' in text:
-        return "Sicredi"
-    
-    # Itaú4
-    if 'Fale Conosco: www.itau.com.br/empresas.' in text or 'Lançamentos do período:' in text or 'Lançamentosdoperíodo:' in text:
-        return "Itaú4"
-    
-    # Banco Inter 
-    if 'Instituição: Banco Inter' in text:
-        return "Banco Inter"
-    
-    # Nubank
-    if 'nubank.com.br/contatos#ouvidoria' in text or 'ouvidoria@nubank.com.br' in text:
-        return "Nubank"
-    
-    # Mercado Pago
-    if 'www.mercadopago.com.br' in text or 'Mercado Pago' in text:
-        return "Mercado Pago"
-    
-    # Efi
-    if 'Efí S.A.' in text and 'Filtros aplicados' in text:
-        return "Efi1"
-
-    if 'Efí S.A.' in text and 'Filtros do' in text:
-        return "Efi2"
-    
-    # PagBank
-    if 'PagSeguro Internet S/A' in text or '290-PagSeguroInternetS/A' in text:
-        return "PagBank"
-        # Stone
-    if  'meajuda@stone.com.br' in text:
-        return "Stone"
-    
-        # Banco do Brasil (variações)
-    if '473-1' in text:
-        return "Banco do Brasil2" if text.strip().split()[0].lower() == 'extrato' else "Banco do Brasil1"
-    
-    # Santander
-    if 'Agência: 3472' in text or 'Agência: 3222' in text or 'Agência: 3503' in  text or 'Agência: 3156' in  text:
-        return "Santander1"
-
-    if 'EXTRATOCONSOLIDADOINTELIGENTE' in text or 'EXTRATO CONSOLIDADO INTELIGENTE' in  text or 'EXTRATO CONSOLIDADO' in text:
-        return "Santander2"
-    
-    # Caixa2 (formato web – identificar antes do Caixa comum)
-    if 'Pessoas com deficiência auditiva Alô CAIXA' in text:
-        return "Caixa2"
-
-    # Caixa
-    if 'Sujeito a alteração até o final do expediente bancário' in text or 'Os lançamentos de extrato não estão disponíveis' in text or 'SAC CAIXA' in text:
-        return "Caixa"
-    
-        # iFood
-    if 'Extrato da Conta Digital iFood' in text:
-        return "iFood"
-    
-    # Asaas
-    if 'ASAAS Gestão Financeira Instituição de Pagamento S.A.' in text:
-        return "Asaas"
-    
-    # Cora
-    if 'Cora SCFI' in text:
-        return "Cora"
-    
-    # Safra
-    if 'Banco Safra S/A' in text:
-        return "Safra"
-    
-    # InfinitePay
-    if 'ajuda@infinitepay.io' in text:
-        return "InfinitePay"
-    
-    # Sicoob (variações)
-    if "https://www.sicoob.com.br/sicoobnet/ib/#/home-extrato" in text:
-        return "Sicoob2"
-    
-    if 'PLATAFORMA DE SERVIÇOS FINANCEIROS DO SICOOB – SISBR' in text or 'PLATAFORMA DE SERVIÇOS FINANCEIROS DO SICOOB - SISBR' in text or 'COOP.: 4108-4 / SICOOB CREDIMEPI' in text:
-        return "Sicoob1"
-    
-    if 'SICOOB - Sistema de Cooperativas de Crédito do Brasil' in text or 'SICOOB -Sistema de Cooperativas de Crédito do Brasil' in text or 'SISBR - SISTEMA DE INFORMÁTICA DO SICOOB' in  text:
-        return "Sicoob3"
-
-    # Bradesco
-    if '00632' in text:
-        return "Bradesco"
-
-    # Itaú (variações)
-
-    if '8119' in text or '1472' in text or '3116' in text or '1300' in text:
-        first_line = linhas[0].strip().lower()
-        if re.match(r"^\s*extrato\s+mensal", first_line):
-            return "Itaú3"
-        if 'dados gerais' in first_line:
-            for linha in linhas:
-                if re.match(r"^\d{2}/\d{2}/\d{4}$", linha.strip()):
-                    return "Itaú2"
-        return "Itaú"
-
-    return "Banco não identificado"
\ No newline at end of file
+    return IDENTIFICADOR.identificar(text).banco
+
+
+# Total de páginas lidas antes de aceitar um resultado de baixa confiança
+PAGINAS_CONFIRMACAO = 3
+
+
+def identificar_banco_por_paginas(paginas, paginas_confirmacao=PAGINAS_CONFIRMACAO):
+    """
+    Identifica o banco lendo as páginas uma a uma (iterável com o texto de cada página).
+    Cada página é varrida uma única vez e as marcas vão se acumulando. Para assim que
+    o banco fica decidido, normalmente já na primeira página. Resultados de baixa
+    confiança são confirmados com até `paginas_confirmacao` páginas e, sem nenhuma
+    marca encontrada, as páginas seguintes continuam sendo lidas.
+    Retorna o mesmo que identificar_banco.
+    """
+    partes = []
+    marcas = set()
+    tem_texto = False
+    banco = TEXTO_VAZIO
+    for numero, pagina in enumerate(paginas, start=1):
+        if pagina:
+            partes.append(pagina + "\n")
+            marcas |= IDENTIFICADOR.encontrar_marcas(pagina)
+            tem_texto = tem_texto or bool(pagina.strip())
+        if not tem_texto:
+            continue
+        banco, confianca, _ = IDENTIFICADOR.resolver(marcas, lambda: "".join(partes))
+        if banco == BANCO_NAO_IDENTIFICADO:
+            continue
+        if confianca >= CONFIANCA_DECIDIDA or numero >= paginas_confirmacao:
+            break
+    return banco
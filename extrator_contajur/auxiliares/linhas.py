@@ -0,0 +1,90 @@
+"""
+Leitura do texto do extrato linha a linha, sem montar listas intermediárias.
+
+`linhas(text)` gera as linhas sem espaços nas pontas, pulando as vazias: o mesmo
+que [l.strip() for l in text.splitlines() if l.strip()], uma linha de cada vez.
+`Tokenizador` classifica cada linha pelos padrões do layout (cabeçalho/rodapé,
+data, valor, marcador de tipo ou texto livre) e o parser vira uma máquina de
+estados sobre essa sequência, guardando só a transação em andamento.
+"""
+import re
+from enum import Enum
+from typing import NamedTuple, Optional
+
+# Tamanho aproximado, em caracteres, de cada bloco do texto quebrado em linhas
+_BLOCO = 1 << 16
+
+
+def linhas(text):
+    """Gera as linhas não vazias de `text`, já sem espaços nas pontas."""
+    # splitlines por blocos terminados em '\n': mesmo resultado que no texto
+    # inteiro (o corte nunca separa um '\r\n'), com uma lista pequena por vez
+    inicio = 0
+    tamanho = len(text)
+    while inicio < tamanho:
+        fim = text.find('\n', inicio + _BLOCO)
+        fim = tamanho if fim < 0 else fim + 1
+        for linha in text[inicio:fim].splitlines():
+            linha = linha.strip()
+            if linha:
+                yield linha
+        inicio = fim
+
+
+class Classe(Enum):
+    """Classificação de uma linha do extrato."""
+    CABECALHO = "cabecalho"   # cabeçalho, rodapé ou marcador de seção
+    DATA = "data"
+    VALOR = "valor"
+    TIPO = "tipo"             # marcador de crédito/débito em linha própria
+    TEXTO = "texto"           # descrição, documento, contraparte...
+
+
+class Linha(NamedTuple):
+    classe: Classe
+    texto: str
+    # Resultado do padrão que classificou a linha (para ler os grupos); None em TEXTO
+    match: Optional[re.Match] = None
+
+
+class Tokenizador:
+    """
+    Classifica as linhas de um layout. Cada padrão compilado é aplicado com
+    search (ancore com ^ quando precisar), nesta ordem: cabecalho, data, valor,
+    tipo. A primeira classe que casar vale; sem nenhuma, a linha é TEXTO.
+    Criado uma vez no módulo do banco e chamado com o texto de cada extrato.
+    """
+
+    def __init__(self, cabecalho=None, data=None, valor=None, tipo=None):
+        self._buscas = tuple(
+            padrao.search if padrao is not None else None
+            for padrao in (cabecalho, data, valor, tipo)
+        )
+
+    def __call__(self, text):
+        """Gera um Linha para cada linha não vazia de `text`."""
+        # Desenrolado de propósito: roda uma vez por linha do extrato
+        cabecalho, data, valor, tipo = self._buscas
+        CABECALHO, DATA, VALOR, TIPO, TEXTO = Classe
+        for texto in linhas(text):
+            if cabecalho is not None:
+                m = cabecalho(texto)
+                if m:
+                    yield Linha(CABECALHO, texto, m)
+                    continue
+            if data is not None:
+                m = data(texto)
+                if m:
+                    yield Linha(DATA, texto, m)
+                    continue
+            if valor is not None:
+                m = valor(texto)
+                if m:
+                    yield Linha(VALOR, texto, m)
+                    continue
+            if tipo is not None:
+                m = tipo(texto)
+                if m:
+                    yield Linha(TIPO, texto, m)
+                    continue
+            yield Linha(TEXTO, texto, None)
@@ -0,0 +1,64 @@
+"""
+Padrões de expressão regular compartilhados pelos parsers dos bancos.
+
+Tudo é compilado uma única vez, na importação, e os parsers usam os objetos
+compilados nos laços por linha. Os fragmentos em texto (DATA, VALOR, MESES_ABREV,
+CNPJ) servem para montar os padrões próprios de cada layout, que ficam como
+constantes no módulo do banco.
+"""
+import re
+
+# ── Fragmentos ───────────────────────────────────────────────────────────────
+
+# Data brasileira completa: 31/12/2025
+DATA = r'\d{2}/\d{2}/\d{4}'
+# Valor no formato brasileiro, sem sinal: 1.234,56 / 0,99
+VALOR = r'\d{1,3}(?:\.\d{3})*,\d{2}'
+# Meses abreviados em minúsculas (usar com re.IGNORECASE)
+MESES_ABREV = 'jan|fev|mar|abr|mai|jun|jul|ago|set|out|nov|dez'
+# CNPJ formatado: 12.345.678/0001-90
+CNPJ = r'\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2}'
+
+# ── Datas ────────────────────────────────────────────────────────────────────
+
+DATA_BR = re.compile(DATA)
+DATA_BR_INICIO = re.compile(rf'^{DATA}')
+# Linha só com a data (grupo 1)
+DATA_BR_LINHA = re.compile(rf'^({DATA})$')
+# Aceita ano com 2 ou 4 dígitos (31/12/25 ou 31/12/2025)
+DATA_BR_ANO_CURTO_INICIO = re.compile(r'^\d{2}/\d{2}/\d{2,4}')
+# Linha só com dia/mês: 31/12
+DIA_MES_LINHA = re.compile(r'^\d{2}/\d{2}$')
+
+# Abreviação do mês -> número (chaves em minúsculas)
+MESES = {
+    "jan": "01", "fev": "02", "mar": "03", "abr": "04", "mai": "05", "jun": "06",
+    "jul": "07", "ago": "08", "set": "09", "out": "10", "nov": "11", "dez": "12",
+}
+
+# ── Valores ──────────────────────────────────────────────────────────────────
+
+VALOR_BR = re.compile(VALOR)
+VALOR_BR_COM_SINAL = re.compile(rf'-?{VALOR}')
+# Linha só com o valor, com sinal + ou - opcional (grupo 1)
+VALOR_BR_LINHA = re.compile(rf'^([+-]?{VALOR})$')
+
+# ── Documentos e cabeçalhos ──────────────────────────────────────────────────
+
+CNPJ_BR = re.compile(CNPJ)
+# "Conta 12345-6" nos cabeçalhos dos extratos digitais
+CONTA_COM_DIGITO = re.compile(r'Conta\s+\d+-\d')
+
+# ── Normalização de linhas ───────────────────────────────────────────────────
+
+_TAB_ENTRE_DIGITOS = re.compile(r'(\d)\t(\d)')
+
+
+def normalizar_linha(linha):
+    """
+    Corrige a tabulação que alguns PDFs põem no lugar da vírgula dos valores
+    (1.055\\t00 -> 1.055,00) e reduz qualquer sequência de espaços a um só.
+    """
+    if '\t' in linha:
+        linha = _TAB_ENTRE_DIGITOS.sub(r'\1,\2', linha)
+    return ' '.join(linha.split())
@@ -0,0 +1,36 @@
+"""
+Pastas de trabalho do servidor compartilhadas entre os processos (cache, métricas,
+uploads, resultados).
+
+Ficam na pasta temporária do sistema, que qualquer usuário da máquina pode
+escrever: o uid vai no nome e, antes de usar uma pasta, pasta_privada confere
+que ela é do usuário do processo e fechada para os demais. Sem isso, outro
+usuário que criasse a pasta antes poderia plantar arquivos nela (um pickle no
+cache executaria código no servidor).
+"""
+import os
+import stat
+import tempfile
+
+
+def pasta_temporaria(nome):
+    """Caminho padrão da pasta `nome` na pasta temporária, com o uid do processo no nome."""
+    if not hasattr(os, 'getuid'):
+        return os.path.join(tempfile.gettempdir(), nome)
+    return os.path.join(tempfile.gettempdir(), f"{nome}-{os.getuid()}")
+
+
+def pasta_privada(caminho):
+    """
+    Cria a pasta (0700) se preciso e retorna o caminho. Levanta PermissionError se ela
+    não é uma pasta de verdade (um link, por exemplo), é de outro usuário ou tem
+    permissão para o grupo ou os demais.
+    """
+    os.makedirs(caminho, mode=0o700, exist_ok=True)
+    info = os.lstat(caminho)
+    if not stat.S_ISDIR(info.st_mode):
+        raise PermissionError(f"{caminho} não é uma pasta")
+    if hasattr(os, 'getuid') and (info.st_uid != os.getuid() or info.st_mode & 0o077):
+        raise PermissionError(
+            f"A pasta {caminho} precisa ser do usuário do processo e sem acesso para os demais (0700)")
+    return caminho
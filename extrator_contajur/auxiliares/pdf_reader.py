@@ -1,5 +1,5 @@
 from pathlib import Path
-import pdfplumber
+from .documento import DocumentoExtrato
 from .identificador import identificar_banco
 
 def validate_pdf(file):
@@ -29,12 +29,8 @@ def read_pdf(file):
         return None, "Arquivo não é um PDF válido"
     
     try:
-        text = ""
-        with pdfplumber.open(file) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
+        with DocumentoExtrato.de_arquivo(file) as documento:
+            text = documento.texto_pdfplumber
         
         if not text.strip():
             return None, "Nenhum texto extraído do PDF"
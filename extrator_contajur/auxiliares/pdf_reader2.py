@@ -1,5 +1,5 @@
 from pathlib import Path
-import fitz  # PyMuPDF
+from .documento import DocumentoExtrato
 
 def validate_pdf(file):
     """
@@ -29,23 +29,14 @@ def read_pdf2(file):
     if not validate_pdf(file):
         raise ValueError("O arquivo fornecido não é um PDF válido.")
     
-    text = ""
     try:
-        # Garantir que estamos no início do arquivo
-        if hasattr(file, 'seek'):
-            file.seek(0)
-            
-        file_content = file.read()
-        
+        # de_arquivo volta ao início do arquivo antes de ler
+        with DocumentoExtrato.de_arquivo(file) as documento:
+            text = documento.texto_pymupdf
+
         # Reset do ponteiro se possível
         if hasattr(file, 'seek'):
             file.seek(0)
-            
-        with fitz.open(stream=file_content, filetype="pdf") as pdf:
-            for page in pdf:
-                page_text = page.get_text()
-                if page_text:
-                    text += page_text + "\n"
                     
         if not text.strip():
             raise ValueError("Nenhum texto foi extraído do PDF.")
@@ -0,0 +1,481 @@
+import concurrent.futures
+import multiprocessing
+import os
+import signal
+import threading
+import time
+import weakref
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+
+from .cache import CACHE_EXTRATOS, Extracao
+from .documento import DocumentoExtrato, banco_identificado
+from .renomeador import RENOMEADOR
+from .resultados import ARMAZEM_RESULTADOS
+from .tempos import registrar_tempos
+from .utils import ResultadoExtrato
+from ..banco import get_processor
+
+# Processos usados para processar os PDFs (0 = processa no próprio processo, em série).
+# Cada processo do servidor tem o próprio pool: o padrão divide as CPUs entre os
+# WEB_CONCURRENCY processos do gunicorn (o gunicorn.conf.py já o define assim)
+EXTRATOR_WORKERS = int(
+    os.getenv("EXTRATOR_WORKERS")
+    or max(1, (os.cpu_count() or 1) // max(1, int(os.getenv("WEB_CONCURRENCY") or 1)))
+)
+# Tempo máximo, em segundos, de processamento de cada PDF
+EXTRATOR_TIMEOUT_ARQUIVO = float(os.getenv("EXTRATOR_TIMEOUT_ARQUIVO", "120"))
+# Segundos além do tempo limite até um arquivo do pool ser dado como esgotado pelo
+# processo principal, e intervalo entre as conferências desses prazos
+_FOLGA_PRAZO = 5
+_INTERVALO_PRAZOS = 1
+
+
+class TempoEsgotado(BaseException):
+    """Fora da hierarquia de Exception para não ser capturada pelos tratamentos do pipeline."""
+
+
+def _tempo_esgotado(signum, frame):
+    raise TempoEsgotado()
+
+
+@contextmanager
+def tempo_limite(timeout):
+    """
+    Interrompe o bloco com TempoEsgotado depois de `timeout` segundos (SIGALRM).
+    Sem efeito sem timeout, onde o sinal não existe ou fora da thread principal.
+    """
+    if not timeout or not hasattr(signal, 'SIGALRM') \
+            or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+    anterior = signal.signal(signal.SIGALRM, _tempo_esgotado)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, anterior)
+
+
+@contextmanager
+def medir(tempos, etapa):
+    """Soma em tempos[etapa] a duração do bloco, em milissegundos."""
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        if tempos is not None:
+            tempos[etapa] = round(tempos.get(etapa, 0.0) + (time.perf_counter() - inicio) * 1000, 1)
+
+
+class ErroLeituraPDF(Exception):
+    """Falha ao abrir o PDF, identificar o banco ou extrair o texto."""
+
+
+class ErroParser(Exception):
+    """Falha no parser do banco."""
+
+
+def _extracao_completa(entrada):
+    """Se a entrada do cache dispensa abrir o PDF (o preview só guarda o banco)."""
+    return entrada is not None and (entrada.transacoes is not None or not banco_identificado(entrada.banco))
+
+
+def _resultado(filename, bank=None, csv_arquivo=None, error=None, transacoes=0, tempos=None,
+               cliente=None, periodo=None):
+    return {
+        'filename': filename,
+        'success': error is None,
+        'bank': bank,
+        'cliente': cliente,
+        'periodo': periodo,
+        'csv_arquivo': csv_arquivo,
+        'transacoes': transacoes,
+        'tempos': tempos or {},
+        'error': error,
+    }
+
+
+def _cliente_e_periodo(texto, bank, filename):
+    """RENOMEADOR.identificar; uma falha nele não derruba a extração."""
+    try:
+        return RENOMEADOR.identificar(texto, bank)
+    except Exception as e:
+        print(f"[EXTRATOR] {filename}: cliente e período não identificados ({e})")
+        return None, None
+
+
+def _gravar_csv(transacoes):
+    """
+    Escreve o CSV das transações, linha a linha, num arquivo temporário da pasta
+    dos resultados e retorna o caminho. O CSV não passa inteiro pela memória nem
+    pelo pool de processos: quem monta o ZIP copia o arquivo em blocos.
+    """
+    with ARMAZEM_RESULTADOS.arquivo_temporario(".csv") as arquivo:
+        try:
+            ResultadoExtrato(transacoes).gravar_csv(arquivo)
+        except BaseException:
+            arquivo.close()
+            os.remove(arquivo.name)
+            raise
+    return arquivo.name
+
+
+class PipelineExtratos:
+    """
+    Processamento de extratos em PDF, o mesmo para todas as entradas (extrator,
+    api_server, api_externa, extrator_d e o processador em lote): cache, abertura,
+    identificação do banco, texto (PyMuPDF para os bancos de BANKS_USING_PDF2),
+    parser, cliente e período (RENOMEADOR) e CSV, com a duração de cada etapa.
+
+    cache:   CacheExtratos consultado antes de abrir o PDF (None processa sempre)
+    workers: processos do pool em processar_lote (0 = em série, no próprio processo)
+    timeout: tempo limite, em segundos, de cada PDF em processar_lote
+    pool:    função que retorna o ProcessPoolExecutor (padrão: obter_pool). No pool,
+             cada processo roda o PIPELINE_EXTRATOS dele, configurado pelas mesmas
+             variáveis de ambiente
+    ganchos: funções chamadas por concluir() ao fim de cada arquivo, com
+             (rota, filename, banco, tempos, sucesso, transacoes)
+    """
+
+    def __init__(self, cache=CACHE_EXTRATOS, workers=EXTRATOR_WORKERS, timeout=EXTRATOR_TIMEOUT_ARQUIVO,
+                 pool=None, ganchos=()):
+        self.cache = cache
+        self.workers = workers
+        self.timeout = timeout
+        self.pool = pool
+        self.ganchos = list(ganchos)
+
+    # ── Ganchos ──────────────────────────────────────────────────────────────
+
+    def ao_concluir(self, gancho):
+        """Registra um gancho de concluir(); pode ser usado como decorador."""
+        self.ganchos.append(gancho)
+        return gancho
+
+    def concluir(self, rota, filename, banco, tempos, sucesso=True, transacoes=0):
+        """Fim de um arquivo, depois das etapas da própria rota (zip, json): chama os ganchos."""
+        for gancho in self.ganchos:
+            gancho(rota, filename, banco, tempos, sucesso, transacoes)
+
+    def concluir_resultado(self, rota, resultado):
+        """concluir() a partir de um resultado de processar ou processar_lote."""
+        self.concluir(
+            rota, resultado['filename'], resultado.get('bank'), resultado.get('tempos') or {},
+            sucesso=resultado['success'], transacoes=resultado.get('transacoes', 0),
+        )
+
+    # ── Etapas ───────────────────────────────────────────────────────────────
+
+    def _consultar_cache(self, conteudo, tempos):
+        """(chave, entrada do cache ou None)"""
+        if self.cache is None:
+            return None, None
+        with medir(tempos, 'cache'):
+            chave = self.cache.chave(conteudo)
+            return chave, self.cache.obter(chave)
+
+    def _guardar_cache(self, chave, entrada):
+        if self.cache is not None:
+            self.cache.guardar(chave, entrada)
+
+    def identificar(self, conteudo, filename=None, tempos=None):
+        """
+        Identifica o banco do PDF, reaproveitando o cache quando o mesmo PDF já foi visto.
+        `tempos` recebe a duração das etapas (cache, abertura, identificacao), como em extrair.
+        """
+        chave, entrada = self._consultar_cache(conteudo, tempos)
+        if entrada is not None:
+            return entrada.banco
+        try:
+            with medir(tempos, 'abertura'):
+                documento = DocumentoExtrato(conteudo, filename)
+            with documento:
+                with medir(tempos, 'identificacao'):
+                    bank = documento.identificar_banco()
+        except Exception as e:
+            raise ErroLeituraPDF(str(e)) from e
+        self._guardar_cache(chave, Extracao(bank))
+        return bank
+
+    def extrair(self, conteudo, filename=None, tempos=None):
+        """
+        Identifica o banco, extrai o texto, roda o parser e acha o cliente e o período,
+        com cache por conteúdo. Retorna Extracao(banco, texto, transacoes, cliente, periodo);
+        para banco não identificado, os demais campos ficam None. Levanta ErroLeituraPDF
+        ou ErroParser. Se `tempos` for um dicionário, recebe a duração de cada etapa em ms
+        (cache, abertura, identificacao, texto, parser, renomeador).
+        """
+        chave, entrada = self._consultar_cache(conteudo, tempos)
+        if _extracao_completa(entrada):
+            return entrada
+
+        try:
+            with medir(tempos, 'abertura'):
+                documento = DocumentoExtrato(conteudo, filename)
+            with documento:
+                with medir(tempos, 'identificacao'):
+                    bank = documento.identificar_banco()
+                if not banco_identificado(bank):
+                    entrada = Extracao(bank)
+                    self._guardar_cache(chave, entrada)
+                    return entrada
+                with medir(tempos, 'texto'):
+                    text = documento.texto_para(bank)
+        except Exception as e:
+            raise ErroLeituraPDF(str(e)) from e
+
+        print(f"[EXTRATOR] {filename} → {bank}")
+        try:
+            with medir(tempos, 'parser'):
+                resultado = get_processor(bank)(text)
+        except Exception as e:
+            raise ErroParser(str(e)) from e
+
+        with medir(tempos, 'renomeador'):
+            cliente, periodo = _cliente_e_periodo(text, bank, filename)
+        entrada = Extracao(bank, text, resultado.transacoes if resultado is not None else [], cliente, periodo)
+        self._guardar_cache(chave, entrada)
+        return entrada
+
+    def _processar(self, conteudo, filename, tempos):
+        try:
+            extracao = self.extrair(conteudo, filename, tempos=tempos)
+        except ErroLeituraPDF as e:
+            return _resultado(filename, error=f"Erro ao ler PDF '{filename}': {str(e)}", tempos=tempos)
+        except ErroParser as e:
+            return _resultado(filename, error=f"❌ Erro no processamento: {str(e)}", tempos=tempos)
+
+        bank, transacoes = extracao.banco, extracao.transacoes
+        if not banco_identificado(bank):
+            return _resultado(filename, error=f"Banco não identificado em '{filename}'", tempos=tempos)
+        identificacao = {'cliente': extracao.cliente, 'periodo': extracao.periodo}
+        if not transacoes:
+            return _resultado(filename, bank, error="Nenhuma transação encontrada no arquivo.", tempos=tempos,
+                              **identificacao)
+        try:
+            with medir(tempos, 'csv'):
+                csv_arquivo = _gravar_csv(transacoes)
+        except Exception as e:
+            return _resultado(filename, bank, error=f"❌ Erro no processamento: {str(e)}", tempos=tempos,
+                              **identificacao)
+        return _resultado(filename, bank, csv_arquivo, transacoes=len(transacoes), tempos=tempos, **identificacao)
+
+    def _processar_medido(self, conteudo, filename):
+        tempos = {}
+        with medir(tempos, 'total'):
+            resultado = self._processar(conteudo, filename, tempos)
+        return resultado
+
+    def processar(self, conteudo, filename, timeout=None):
+        """
+        Pipeline completo de um PDF no próprio processo: extrair e gerar o CSV.
+        Retorna um dicionário com filename, success, bank, cliente e periodo (do
+        RENOMEADOR, None quando não achados), csv_arquivo (caminho do CSV temporário,
+        que quem recebe deve mover para o ZIP ou remover), transacoes, tempos (ms por
+        etapa) e error; erros viram resultado, nunca exceção.
+
+        `conteudo` são os bytes do PDF ou o caminho do arquivo. Com `timeout`, o
+        processamento é interrompido por SIGALRM onde o sinal existe.
+        """
+        try:
+            with tempo_limite(timeout):
+                return self._processar_medido(conteudo, filename)
+        except TempoEsgotado:
+            return _resultado(filename, error=f"Tempo limite de {timeout:g}s excedido ao processar '{filename}'")
+
+    def processar_lote(self, arquivos, timeout=None):
+        """
+        Processa vários PDFs no pool de processos e gera cada resultado (ver processar)
+        assim que o arquivo termina, sem esperar os demais. Cada resultado traz também
+        `indice`, a posição do arquivo em `arquivos`.
+
+        `arquivos` é uma lista de (conteudo, filename), com os bytes do PDF ou o caminho
+        do arquivo (PDFs grandes vão ao pool só pelo caminho). O tempo limite (padrão:
+        self.timeout) vale por arquivo: cada processo interrompe o próprio arquivo e,
+        como garantia, um arquivo que não volta em até duas vezes o tempo limite mais
+        _FOLGA_PRAZO segundos, contados de quando começou a rodar, é dado como esgotado.
+        O processo dele está travado (em código C, onde o SIGALRM não chega): o pool é
+        reciclado (reciclar_pool) e os arquivos que estavam nele, deste e dos outros
+        lotes, são reenviados ao pool novo.
+
+        Um lote com um arquivo só (fora os do cache) roda no próprio processo, como
+        processar: as páginas de um PDF grande são então divididas entre os processos
+        do pool (DocumentoExtrato), em vez de ficarem num processo só.
+        """
+        timeout = self.timeout if timeout is None else timeout
+
+        def _com_indice(indice, resultado):
+            resultado['indice'] = indice
+            return resultado
+
+        if self.workers <= 0:
+            for indice, (conteudo, filename) in enumerate(arquivos):
+                yield _com_indice(indice, self.processar(conteudo, filename, timeout))
+            return
+
+        # PDFs já processados saem do cache sem passar pelo pool
+        arquivos_pool = []
+        for indice, (conteudo, filename) in enumerate(arquivos):
+            if self.cache is not None and _extracao_completa(self.cache.obter(self.cache.chave(conteudo))):
+                yield _com_indice(indice, self._processar_medido(conteudo, filename))
+            else:
+                arquivos_pool.append((indice, conteudo, filename))
+        if not arquivos_pool:
+            return
+        if len(arquivos_pool) == 1:
+            indice, conteudo, filename = arquivos_pool[0]
+            yield _com_indice(indice, self.processar(conteudo, filename, timeout))
+            return
+
+        obter = self.pool or obter_pool
+        futuros = {}  # futuro → (indice, conteudo, filename, pool)
+        pendentes = set()
+
+        def enviar(indice, conteudo, filename):
+            try:
+                futuro, pool = _enviar_ao_pool(obter, conteudo, filename, timeout)
+            except Exception as e:
+                return _com_indice(indice, _resultado(filename, error=f"❌ Erro inesperado: {str(e)}"))
+            futuros[futuro] = (indice, conteudo, filename, pool)
+            pendentes.add(futuro)
+            return None
+
+        for indice, conteudo, filename in arquivos_pool:
+            erro = enviar(indice, conteudo, filename)
+            if erro is not None:
+                yield erro
+
+        # O prazo de cada arquivo conta de quando ele começa a rodar: o pool é
+        # compartilhado, e os arquivos de outras requisições na frente não contam.
+        # "Rodando" inclui o arquivo que o executor já pôs na fila dos processos (um
+        # além do número de processos), que ainda pode esperar um arquivo inteiro
+        # terminar: daí o dobro do tempo limite
+        inicios = {}
+        while pendentes:
+            prontos, _ = concurrent.futures.wait(
+                pendentes, timeout=_INTERVALO_PRAZOS if timeout else None,
+                return_when=concurrent.futures.FIRST_COMPLETED)
+            for futuro in prontos:
+                pendentes.discard(futuro)
+                indice, conteudo, filename, pool = futuros.pop(futuro)
+                inicios.pop(futuro, None)
+                try:
+                    yield _com_indice(indice, futuro.result())
+                except Exception as e:
+                    if isinstance(e, BrokenProcessPool):
+                        if pool in _POOLS_RECICLADOS:
+                            # Pool reciclado por um arquivo travado (deste lote ou de
+                            # outro): este arquivo não tem culpa e vai para o pool novo
+                            erro = enviar(indice, conteudo, filename)
+                            if erro is not None:
+                                yield erro
+                            continue
+                        _descartar_pool(pool)
+                    yield _com_indice(indice, _resultado(filename, error=f"❌ Erro inesperado: {str(e)}"))
+            if not timeout:
+                continue
+            agora = time.monotonic()
+            for futuro in list(pendentes):
+                if not futuro.running():
+                    continue
+                if agora - inicios.setdefault(futuro, agora) > 2 * timeout + _FOLGA_PRAZO:
+                    # O processo não respondeu ao SIGALRM (travado em código C): o
+                    # arquivo falha e o pool é reciclado para não perder o processo
+                    pendentes.discard(futuro)
+                    inicios.pop(futuro)
+                    indice, _, filename, pool = futuros.pop(futuro)
+                    reciclar_pool(pool)
+                    yield _com_indice(indice, _resultado(
+                        filename, error=f"Tempo limite de {timeout:g}s excedido ao processar '{filename}'"))
+
+
+# Pipeline usado por todas as rotas; cada arquivo concluído entra nos logs e no histograma de tempos
+PIPELINE_EXTRATOS = PipelineExtratos(ganchos=[registrar_tempos])
+
+
+def processar_pdf(conteudo, filename, timeout=None):
+    """PIPELINE_EXTRATOS.processar; função de módulo para poder ser enviada ao pool de processos."""
+    return PIPELINE_EXTRATOS.processar(conteudo, filename, timeout)
+
+
+# ── Pool de processos ────────────────────────────────────────────────────────
+
+_pool = None
+_pool_lock = threading.Lock()
+# Pools encerrados por reciclar_pool: as falhas das tarefas deles não são dos arquivos
+_POOLS_RECICLADOS = weakref.WeakSet()
+# Arquivos enviados ao pool e ainda não concluídos (fila + em execução), para as métricas
+_tarefas_pendentes = 0
+_tarefas_lock = threading.Lock()
+
+
+def tarefas_pendentes():
+    """Arquivos deste processo do servidor aguardando ou em execução no pool."""
+    return _tarefas_pendentes
+
+
+def _tarefa_concluida(futuro):
+    global _tarefas_pendentes
+    with _tarefas_lock:
+        _tarefas_pendentes -= 1
+
+
+def _enviar_ao_pool(obter, conteudo, filename, timeout):
+    """
+    Envia o arquivo ao pool de obter() e retorna (futuro, pool). Se outra requisição
+    acabou de descartar o pool (quebrado ou encerrado), tenta uma vez num novo.
+    """
+    global _tarefas_pendentes
+    pool = obter()
+    try:
+        futuro = pool.submit(processar_pdf, conteudo, filename, timeout)
+    except (RuntimeError, BrokenProcessPool):
+        _descartar_pool(pool)
+        pool = obter()
+        futuro = pool.submit(processar_pdf, conteudo, filename, timeout)
+    with _tarefas_lock:
+        _tarefas_pendentes += 1
+    # Chamado também quando o futuro é cancelado ou o pool quebra
+    futuro.add_done_callback(_tarefa_concluida)
+    return futuro, pool
+
+
+def obter_pool():
+    """Pool de processos compartilhado, criado no primeiro uso."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn: fork de um servidor com várias threads pode herdar locks travados
+            _pool = concurrent.futures.ProcessPoolExecutor(
+                max_workers=max(1, EXTRATOR_WORKERS),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def reciclar_pool(pool):
+    """
+    Mata os processos de um pool com um processo travado e o descarta; o próximo
+    obter_pool cria outro. Um ProcessPoolExecutor não permite encerrar um processo
+    só. As tarefas que estavam nele recebem BrokenProcessPool, e processar_lote
+    reenvia os arquivos (pool em _POOLS_RECICLADOS) em vez de dar erro.
+    """
+    _POOLS_RECICLADOS.add(pool)
+    for processo in list((pool._processes or {}).values()):
+        processo.kill()
+    _descartar_pool(pool)
+
+
+def _descartar_pool(pool):
+    """
+    Esquece um pool quebrado ou encerrado; o próximo obter_pool cria outro. Os
+    processos não são terminados: num pool ainda ativo, as tarefas das outras
+    requisições terminam normalmente.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False)
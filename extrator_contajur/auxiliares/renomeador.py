@@ -1,6 +1,432 @@
 # extrator_contajur/auxiliares/renomeador.py
+"""
+Nome padronizado do CSV de um extrato: CLIENTE_BANCO_PERIODO.csv.
+
+Cliente e período de cada banco são descritos em REGRAS_RENOMEADOR: para cada
+campo, uma sequência de RegraCampo (linha fixa, linha depois de uma âncora ou
+busca no texto), compiladas na importação. As regras são avaliadas primeiro nas
+CABECALHO_LINHAS primeiras linhas do texto, divididas uma vez só; o que não é
+achado ali é procurado no texto inteiro. Por isso o renomeador também funciona
+só com o texto da primeira página.
+"""
 import re
-from datetime import datetime
+from typing import Callable, NamedTuple, Optional
+
+from .padroes import CNPJ, DATA, MESES, MESES_ABREV
+
+# Linhas do início do texto em que cliente e período são procurados primeiro
+CABECALHO_LINHAS = 80
+
+CLIENTE_PADRAO = "CLIENTE_NAO_IDENTIFICADO"
+PERIODO_PADRAO = "SEM_PERIODO"
+
+
+def _numero_mes(nome, padrao=None):
+    """'Janeiro', 'jan', 'MARÇO', 'marco' -> '01', '03'...; `padrao` se não for um mês."""
+    return MESES.get(nome[:3].lower(), padrao)
+
+
+# ── Valores a partir do match ────────────────────────────────────────────────
+
+def _grupo(m):
+    return m.group(1)
+
+
+def _intervalo(m):
+    """Duas datas (grupos 1 e 2) -> 01-04-2025_30-04-2025."""
+    return f"{m.group(1).replace('/', '-')}_{m.group(2).replace('/', '-')}"
+
+
+def _intervalo_partes(m):
+    """Seis grupos (dia, mês, ano, dia, mês, ano) -> 01-05-2025_31-05-2025."""
+    return f"{m.group(1)}-{m.group(2)}-{m.group(3)}_{m.group(4)}-{m.group(5)}-{m.group(6)}"
+
+
+def _intervalo_extenso(m):
+    """'01 de abril de 2025 a 30 de abril de 2025' (seis grupos) -> 01-04-2025_30-04-2025."""
+    return (f"{m.group(1)}-{_numero_mes(m.group(2), '01')}-{m.group(3)}"
+            f"_{m.group(4)}-{_numero_mes(m.group(5), '12')}-{m.group(6)}")
+
+
+def _mes_ano(m):
+    """Mês por extenso ou abreviado e ano; o _formatar_periodo converte para 01-2026."""
+    return f"{m.group(1)} {m.group(2)}"
+
+
+class RegraCampo(NamedTuple):
+    """
+    Onde está o cliente ou o período no texto do extrato.
+
+    - `linha`: a linha desse índice, entre as não vazias (ou entre todas, com
+      brutas=True);
+    - `ancora`: a linha `deslocamento` posições depois da primeira linha em que a
+      âncora aparece e a regra dá valor (com ultima=True, da última);
+    - nenhum dos dois: `padrao` no texto.
+    Na linha escolhida, `padrao` (se houver) é procurado e `valor` monta o campo a
+    partir do match; sem padrao, vale a linha. Valor vazio ou que casa com
+    `rejeitar` não vale. `funcao` substitui tudo isso: recebe o _TextoExtrato e
+    devolve o valor. Regras com texto_inteiro=True não rodam só no cabeçalho.
+    """
+    padrao: Optional[re.Pattern] = None
+    linha: Optional[int] = None
+    ancora: Optional[re.Pattern] = None
+    deslocamento: int = 1
+    brutas: bool = False
+    ultima: bool = False
+    rejeitar: Optional[re.Pattern] = None
+    valor: Callable = _grupo
+    funcao: Optional[Callable] = None
+    texto_inteiro: bool = False
+
+
+class RegrasNome(NamedTuple):
+    """Regras de cliente e de período de um banco; vale a primeira que der valor."""
+    cliente: tuple
+    periodo: tuple
+
+
+class _TextoExtrato:
+    """Texto (ou cabeçalho) do extrato; as linhas são divididas uma vez só, na primeira regra que as usar."""
+
+    __slots__ = ('texto', '_linhas', '_nao_vazias', '_juntas')
+
+    def __init__(self, texto):
+        self.texto = texto
+        self._linhas = None
+        self._nao_vazias = None
+        self._juntas = {}
+
+    @property
+    def linhas(self):
+        if self._linhas is None:
+            self._linhas = self.texto.splitlines()
+        return self._linhas
+
+    @property
+    def nao_vazias(self):
+        if self._nao_vazias is None:
+            self._nao_vazias = [linha.strip() for linha in self.linhas if linha.strip()]
+        return self._nao_vazias
+
+    def juntas(self, brutas):
+        """As linhas (todas ou só as não vazias) unidas por '\\n', para buscar a âncora de uma vez."""
+        if brutas not in self._juntas:
+            self._juntas[brutas] = '\n'.join(self.linhas if brutas else self.nao_vazias)
+        return self._juntas[brutas]
+
+    @classmethod
+    def cabecalho(cls, texto, linhas=CABECALHO_LINHAS):
+        """As `linhas` primeiras linhas, sem dividir o resto do texto; None se o texto é todo cabeçalho."""
+        fim = -1
+        for _ in range(linhas):
+            fim = texto.find('\n', fim + 1)
+            if fim < 0:
+                return None
+        return cls(texto[:fim])
+
+
+def _extrair(regra, alvo):
+    if regra.padrao is None:
+        valor = alvo
+    else:
+        m = regra.padrao.search(alvo)
+        if not m:
+            return None
+        valor = regra.valor(m)
+    valor = valor.strip() if valor else valor
+    if not valor or (regra.rejeitar is not None and regra.rejeitar.search(valor)):
+        return None
+    return valor
+
+
+def _avaliar(regra, texto):
+    if regra.funcao is not None:
+        return regra.funcao(texto)
+    if regra.linha is None and regra.ancora is None:
+        return _extrair(regra, texto.texto)
+    linhas = texto.linhas if regra.brutas else texto.nao_vazias
+    if regra.linha is not None:
+        return _extrair(regra, linhas[regra.linha].strip()) if regra.linha < len(linhas) else None
+    indices = _linhas_com_ancora(regra.ancora, texto.juntas(regra.brutas), linhas)
+    if regra.ultima:
+        indices = reversed(list(indices))
+    for indice in indices:
+        alvo = indice + regra.deslocamento
+        if 0 <= alvo < len(linhas):
+            valor = _extrair(regra, linhas[alvo].strip())
+            if valor:
+                return valor
+    return None
+
+
+def _linhas_com_ancora(ancora, juntas, linhas):
+    """
+    Índices das linhas em que a âncora aparece, em ordem. Uma busca no texto das
+    linhas juntas acha a próxima candidata; ela é conferida na própria linha,
+    porque o match no texto junto pode passar da quebra (\s+, [^/]...).
+    """
+    indice = inicio = 0
+    while True:
+        m = ancora.search(juntas, inicio)
+        if not m:
+            return
+        indice += juntas.count('\n', inicio, m.start())
+        if ancora.search(linhas[indice]):
+            yield indice
+        inicio = juntas.find('\n', m.start()) + 1
+        if not inicio:
+            return
+        indice += 1
+
+
+def _campo(regras, cabecalho, texto):
+    """Valor da primeira regra que der valor: no cabeçalho e, se nenhuma der, no texto inteiro."""
+    if cabecalho is not None:
+        for regra in regras:
+            if not regra.texto_inteiro:
+                valor = _avaliar(regra, cabecalho)
+                if valor:
+                    return valor
+    for regra in regras:
+        if cabecalho is not None and not regra.texto_inteiro and _linha_no_cabecalho(regra, cabecalho):
+            continue  # mesma linha do cabeçalho, mesmo resultado: não divide o texto inteiro à toa
+        valor = _avaliar(regra, texto)
+        if valor:
+            return valor
+    return None
+
+
+def _linha_no_cabecalho(regra, cabecalho):
+    """A regra é de linha fixa e essa linha já está no cabeçalho."""
+    return regra.linha is not None and regra.linha < len(cabecalho.linhas if regra.brutas else cabecalho.nao_vazias)
+
+
+# ── Regras que olham o texto inteiro ─────────────────────────────────────────
+
+_DATA_BR = re.compile(DATA)
+_PERIODO_DO_EXTRATO = re.compile(r'Período do extrato\s+(\d{2})\s*/\s*(\d{4})')
+
+
+def _primeira_e_ultima_data(texto):
+    datas = _DATA_BR.findall(texto.texto)
+    if len(datas) >= 2:
+        return f"{datas[0].replace('/', '-')}_{datas[-1].replace('/', '-')}"
+    return None
+
+
+def _duas_ultimas_datas(texto):
+    datas = _DATA_BR.findall(texto.texto)
+    if len(datas) >= 2:
+        return f"{datas[-2].replace('/', '-')}_{datas[-1].replace('/', '-')}"
+    return None
+
+
+def _periodo_banco_do_brasil1(texto):
+    """'Período do extrato 03 / 2025': do dia 1 do mês até a última data do extrato."""
+    m = _PERIODO_DO_EXTRATO.search(texto.texto)
+    if not m:
+        return None
+    mes, ano = m.groups()
+    datas = _DATA_BR.findall(texto.texto)
+    if not datas:
+        return f"{mes}-{ano}"
+    return f"01-{mes}-{ano}_{datas[-1].replace('/', '-')}"
+
+
+# ── Regras por banco ─────────────────────────────────────────────────────────
+
+def _busca(padrao, flags=0, **campos):
+    return RegraCampo(padrao=re.compile(padrao, flags), **campos)
+
+
+def _ancora(padrao, flags=0):
+    """Âncora de linha: MULTILINE para ^ e $ valerem também nas linhas juntas (ver _linhas_com_ancora)."""
+    return re.compile(padrao, flags | re.MULTILINE)
+
+
+def _intervalo_no_texto(prefixo, separador=r'\s+a\s+', flags=0):
+    """Período 'prefixo 01/04/2025 a 30/04/2025' em qualquer lugar do texto."""
+    return _busca(rf'{prefixo}({DATA}){separador}({DATA})', flags, valor=_intervalo)
+
+
+_I = re.IGNORECASE
+_PALAVRAS_ITAU4 = re.compile(r'SALDO|LIMITE|AGÊNCIA|CONTA', _I)
+
+_SICOOB1 = RegrasNome(
+    # "CONTA: 28.904.844-3 / GUIMARAES E DUTRA SERVICOS MEDICOS LTDA"
+    cliente=(_busca(r'CONTA:\s*[\d\.\-]+\s*/\s*(.+)'),),
+    # "PERÍODO: 01/04/2025 - 30/04/2025"
+    periodo=(_intervalo_no_texto(r'PERÍODO:\s*', r'\s*-\s*'),),
+)
+
+_ITAU = RegrasNome(
+    # Nome na linha acima da que tem agência e conta ("ag" e "cc")
+    cliente=(RegraCampo(ancora=_ancora(r'^(?=.*ag)(?=.*cc)', _I), deslocamento=-1, brutas=True, ultima=True),),
+    periodo=(RegraCampo(ancora=_ancora('período', _I), deslocamento=0, brutas=True, ultima=True,
+                        padrao=re.compile(f'({DATA})')),),
+)
+
+# Banco -> regras de cliente e período. Bancos fora daqui mantêm o nome original do PDF.
+REGRAS_RENOMEADOR = {
+    "Sicoob1": _SICOOB1,
+    "Sicoob2": RegrasNome(
+        # "Conta:" e, na linha seguinte, "27.520-4 / OUROTEC TECNOLOGIA LTDA."
+        cliente=(RegraCampo(ancora=_ancora(r'^conta:$', _I), ultima=True, padrao=re.compile(r'^[^/]*/([^/]*)')),),
+        # "Período:" e, na linha seguinte, "01/04/2025 - 30/04/2025"
+        periodo=(RegraCampo(ancora=_ancora(r'^per[ií]odo:$', _I), ultima=True,
+                            padrao=re.compile(rf'({DATA})\s*-\s*({DATA})'), valor=_intervalo),),
+    ),
+    "Sicoob3": _SICOOB1,
+    "Itaú": _ITAU,
+    "Itaú2": _ITAU,
+    "Itaú3": RegrasNome(
+        cliente=(RegraCampo(linha=3),),
+        # "dez 2025"
+        periodo=(_busca(rf'\b({MESES_ABREV})\s+(\d{{4}})\b', _I, valor=_mes_ano),),
+    ),
+    "Itaú4": RegrasNome(
+        cliente=(
+            # Nome depois da linha "CNPJ 06.938.834/0001-29"...
+            RegraCampo(ancora=_ancora(rf'CNPJ\s+{CNPJ}'), rejeitar=_PALAVRAS_ITAU4),
+            # ...ou antes da linha só com o CNPJ
+            RegraCampo(ancora=_ancora(rf'^{CNPJ}$'), deslocamento=-1,
+                       rejeitar=re.compile(r'SALDO|LIMITE|AGÊNCIA|CONTA|EXTRATO', _I)),
+        ),
+        # "Lançamentos do período: 01/05/2025 até 31/05/2025"
+        periodo=(_intervalo_no_texto(r'[Ll]ançamentos\s+(?:do\s+)?período:\s*', r'\s+até\s+'),),
+    ),
+    "Caixa": RegrasNome(
+        # "Cliente: BAR LANCH REST SABOR DE LAVRAS"
+        cliente=(_busca(r'Cliente:\s*(.+)', _I),),
+        # "Mês: Janeiro/2026"
+        periodo=(_busca(r'Mês:\s*([A-Za-zçÇ]+)[\s/]*(\d{4})', _I, valor=_mes_ano),),
+    ),
+    "Banco Inter": RegrasNome(
+        cliente=(RegraCampo(linha=1),),
+        # "Período: 10/04/2025 a 10/05/2025", na quarta linha
+        periodo=(RegraCampo(linha=3, padrao=re.compile(rf'Período:\s*({DATA})\s+a\s+({DATA})'), valor=_intervalo),),
+    ),
+    "Nubank": RegrasNome(
+        cliente=(RegraCampo(linha=0),),
+        # "01 DE DEZEMBRO DE 2025 a 31 DE DEZEMBRO DE 2025 VALORES EM R$", na quarta linha
+        periodo=(RegraCampo(linha=3, padrao=re.compile(
+            r'(\d{2})\s+DE\s+(\w+)\s+DE\s+(\d{4})\s+a\s+(\d{2})\s+DE\s+(\w+)\s+DE\s+(\d{4})', _I),
+            valor=_intervalo_extenso),),
+    ),
+    "Bradesco": RegrasNome(
+        # Linha depois de "Extrato Mensal / Por Período": "BRASART COMERCIO LTDA | CNPJ: ..."
+        cliente=(RegraCampo(ancora=_ancora(re.escape('Extrato Mensal / Por Período')),
+                            padrao=re.compile(r'^([^|]*)')),),
+        periodo=(
+            # Duas datas na quarta linha do texto
+            RegraCampo(linha=3, brutas=True, padrao=re.compile(rf'({DATA}).*?({DATA})'), valor=_intervalo),
+            # Se o leitor de PDF bagunçar a linha, as duas primeiras datas seguidas do texto
+            _busca(rf'({DATA})\s+({DATA})', valor=_intervalo, texto_inteiro=True),
+        ),
+    ),
+    "Santander1": RegrasNome(
+        # "TEREZA GABRIELA FERREIRA GOMIDES 0933888 Agência: 3222 Conta: 130029819"
+        cliente=(_busca(r'^(.+?)(?:\s+\d+)?\s+Agência:', re.MULTILINE | _I),),
+        # "Períodos: 01/10/2025 a 31/10/2025"
+        periodo=(_intervalo_no_texto(r'Períodos?:\s*', flags=_I),),
+    ),
+    "Santander2": RegrasNome(
+        # "Nome" e o cliente na linha seguinte
+        cliente=(RegraCampo(ancora=_ancora(r'^nome$', _I), ultima=True,
+                            rejeitar=re.compile(r'^(?:agência|agencia|conta)$', _I)),),
+        # "Resumo - janeiro/2026"
+        periodo=(RegraCampo(ancora=_ancora('resumo -', _I), deslocamento=0, ultima=True,
+                            padrao=re.compile(r'Resumo\s*-\s*([A-Za-zçÇ]+)[/ -]*(\d{4})', _I), valor=_mes_ano),),
+    ),
+    "Sicredi": RegrasNome(
+        # "Associado: JB BAR DA PRACA LTDA" (às vezes com "Cooperativa:" na mesma linha)
+        cliente=(_busca(r'Associado:\s*([^\n]+)', _I, valor=lambda m: m.group(1).split('Cooperativa:')[0]),),
+        # "Extrato (Período de 01/01/2025 a 31/01/2025)"
+        periodo=(_intervalo_no_texto(r'Período(?: de)?\s+', flags=_I),),
+    ),
+    "PagBank": RegrasNome(
+        # Segunda linha, depois de "290 - PagSeguro Internet S/A"
+        cliente=(RegraCampo(linha=1),),
+        # "Periodo: 01/04/2025 a 30/04/2025"
+        periodo=(_intervalo_no_texto(r'Periodo:\s*', flags=_I),),
+    ),
+    "Stone": RegrasNome(
+        # "Nome" ou "Titular" e o cliente na linha seguinte
+        cliente=(RegraCampo(ancora=_ancora(r'^(?:Nome|Titular)$')),),
+        # "Período: de 01/10/2025 a 31/10/2025"
+        periodo=(_intervalo_no_texto(r'Período:\s*(?:de\s+)?', r'\s+(?:a|até)\s+', _I),),
+    ),
+    "Banco do Brasil1": RegrasNome(
+        # "Conta corrente" e, na linha seguinte, "7724-0JOAQUIM S F S ADV"
+        cliente=(RegraCampo(ancora=_ancora(r'^Conta corrente$'), padrao=re.compile(r'^\d+-\d(.+)')),),
+        periodo=(RegraCampo(funcao=_periodo_banco_do_brasil1, texto_inteiro=True),),
+    ),
+    "Banco do Brasil2": RegrasNome(
+        # Segunda linha, depois de "Extrato de Conta Corrente"
+        cliente=(RegraCampo(linha=1, brutas=True, padrao=re.compile(r'(.*)'),
+                            valor=lambda m: m.group(1).replace('Cliente', '')),),
+        periodo=(RegraCampo(funcao=_duas_ultimas_datas, texto_inteiro=True),),
+    ),
+    "iFood": RegrasNome(
+        cliente=(RegraCampo(linha=0, brutas=True, padrao=re.compile(r'Extrato da Conta Digital iFood\s+(.+)')),),
+        periodo=(
+            _intervalo_no_texto(r'Período selecionado\s+'),
+            RegraCampo(funcao=_primeira_e_ultima_data, texto_inteiro=True),
+        ),
+    ),
+    "Asaas": RegrasNome(
+        cliente=(RegraCampo(linha=0, brutas=True),),
+        # "Período 01 de abril de 2025 a 30 de abril de 2025", na terceira linha
+        periodo=(RegraCampo(linha=2, padrao=re.compile(
+            r'Período\s+(\d{2})\s+de\s+(\w+)\s+de\s+(\d{4})\s+a\s+(\d{2})\s+de\s+(\w+)\s+de\s+(\d{4})', _I),
+            valor=_intervalo_extenso),),
+    ),
+    "Cora": RegrasNome(
+        cliente=(RegraCampo(linha=0),),
+        # "Extrato do período 01/04/2025 a 01/05/2025"
+        periodo=(_intervalo_no_texto(r'Extrato do período\s+', flags=_I),),
+    ),
+    "Safra": RegrasNome(
+        cliente=(RegraCampo(linha=1, brutas=True),),
+        # "Período de 01/05/2025 a 31/05/2025", na quarta linha
+        periodo=(RegraCampo(linha=3, brutas=True, padrao=re.compile(
+            r'(\d{2})/(\d{2})/(\d{4})\s+a\s+(\d{2})/(\d{2})/(\d{4})'), valor=_intervalo_partes),),
+    ),
+    "InfinitePay": RegrasNome(
+        # "TUMANOS STORE LTDA - CNPJ: 38.013.547/0001-02"
+        cliente=(RegraCampo(linha=0, padrao=re.compile(r'^(.+?)\s*-\s*CNPJ:')),),
+        # "01/08/2025 - 31/08/2025"
+        periodo=(_intervalo_no_texto('', r'\s*-\s*'),),
+    ),
+    "Efi1": RegrasNome(
+        # Linha depois da "Ouvidoria: ..."
+        cliente=(RegraCampo(ancora=_ancora('Ouvidoria:')),),
+        periodo=(_intervalo_no_texto(r'Período\s+', r'\s*-\s*', _I),),
+    ),
+    "Efi2": RegrasNome(
+        cliente=(_busca(r'(?:Nome|Titular)[:\s]+([\w\s]+)', _I),),
+        periodo=(_busca(rf'Filtros aplicados.*?({DATA})', _I | re.DOTALL),),
+    ),
+    "Mercado Pago": RegrasNome(
+        # Linha depois de "EXTRATO DE CONTA", se não for CPF/CNPJ
+        cliente=(RegraCampo(ancora=_ancora('EXTRATO DE CONTA', _I), rejeitar=re.compile(r'\d{11}|\d{14}|CPF|CNPJ')),),
+        # "Periodo: 01-03-2025 al 31-03-2025" ou "De 01-03-2025 al 31-03-2025"
+        periodo=(_busca(r'(?:De\s+|Periodo:\s*|Período:\s*)(\d{2}[-/]\d{2}[-/]\d{4})\s+al?\s+(\d{2}[-/]\d{2}[-/]\d{4})',
+                        _I, valor=_intervalo),),
+    ),
+}
+
+# ── Formatação ───────────────────────────────────────────────────────────────
+
+_NAO_PALAVRA = re.compile(r'[^\w\s-]')
+_ESPACOS = re.compile(r'\s+')
+_INTERVALO_COM_HIFEN = re.compile(r'^\d{2}-\d{2}-\d{4}\s*-\s*\d{2}-\d{2}-\d{4}$')
+_HIFEN = re.compile(r'\s*-\s*')
+_ANO_MES = re.compile(r'(\d{4})-(\d{2})')
+_MES_ANO = re.compile(
+    r'(jan(?:eiro)?|fev(?:ereiro)?|mar(?:ço|co)?|abr(?:il)?|mai(?:o)?|jun(?:ho)?|jul(?:ho)?|ago(?:sto)?'
+    r'|set(?:embro)?|out(?:ubro)?|nov(?:embro)?|dez(?:embro)?)\s*(?:de\s*)?(\d{4})'
+)
 
 
 class RenomeadorExtrato:
@@ -8,926 +434,89 @@ class RenomeadorExtrato:
     Classe para extrair informações de cliente e período dos extratos
     e gerar nomes padronizados para os arquivos.
     """
-    
-    def __init__(self):
-        # Mapeamento de funções de extração por banco
-        self.extractors = {
-            "Sicoob1": self._extract_sicoob1,
-            "Sicoob2": self._extract_sicoob2,
-            "Sicoob3": self._extract_sicoob3,
-            "Itaú": self._extract_itau,
-            "Itaú2": self._extract_itau2,
-            "Itaú3": self._extract_itau3,
-            "Itaú4": self._extract_itau4,
-            "Caixa": self._extract_caixa,
-            "Banco Inter": self._extract_inter,
-            "Nubank": self._extract_nubank,
-            "Bradesco": self._extract_bradesco,
-            "Santander1": self._extract_santander1,
-            "Santander2": self._extract_santander2,
-            "Sicredi": self._extract_sicredi,
-            "PagBank": self._extract_pagbank,
-            "Stone": self._extract_stone,
-            "Banco do Brasil1": self._extract_bb1,
-            "Banco do Brasil2": self._extract_bb2,
-            "iFood": self._extract_ifood,
-            "Asaas": self._extract_asaas,
-            "Cora": self._extract_cora,
-            "Safra": self._extract_safra,
-            "InfinitePay": self._extract_infinitepay,
-            "Efi1": self._extract_efi1,
-            "Efi2": self._extract_efi2,
-            "Mercado Pago": self._extract_mercadopago,
-        }
-    
+
+    def __init__(self, regras=None):
+        self.regras = REGRAS_RENOMEADOR if regras is None else regras
+
     def gerar_nome_arquivo(self, texto, banco_identificado, nome_original="extrato", incluir_banco=False):
         """
         Gera o nome do arquivo no formato: CLIENTE_BANCO_PERIODO.csv (se incluir_banco=True)
         ou CLIENTE_PERIODO.csv (padrão anterior).
         Ex: JOAO_SILVA_BRADESCO_01-2024.csv
         """
-        extractor = self.extractors.get(banco_identificado)
-
-        if not extractor:
+        if banco_identificado not in self.regras:
             return f"{nome_original}.csv"
 
         try:
-            cliente, periodo = extractor(texto)
+            cliente, periodo = self.identificar(texto, banco_identificado)
+            return self.montar_nome(cliente, banco_identificado, periodo, nome_original, incluir_banco)
 
-            if not cliente:
-                cliente = "CLIENTE_NAO_IDENTIFICADO"
-            if not periodo:
-                periodo = "SEM_PERIODO"
+        except Exception as e:
+            print(f"Erro ao extrair informações: {e}")
+            return f"{nome_original}.csv"
 
-            cliente = self._limpar_nome(cliente)
-            periodo = self._formatar_periodo(periodo)
+    def identificar(self, texto, banco):
+        """
+        (cliente, período) do extrato: o cliente como está no texto e o período já
+        formatado (01-2024, 01-04-2025_30-04-2025). None no que não achar, e nos
+        dois para bancos sem regras.
+        """
+        if banco not in self.regras or not texto:
+            return None, None
+        cliente, periodo = self.extrair(texto, banco)
+        return cliente, self._formatar_periodo(periodo) if periodo else None
 
-            if incluir_banco:
-                banco = self._limpar_nome(banco_identificado)
-                return f"{cliente}_{banco}_{periodo}.csv"
+    def montar_nome(self, cliente, banco, periodo, nome_original="extrato", incluir_banco=False):
+        """Nome do CSV a partir do que identificar() achou; bancos sem regras mantêm o nome original."""
+        if banco not in self.regras:
+            return f"{nome_original}.csv"
 
-            return f"{cliente}_{periodo}.csv"
+        cliente = self._limpar_nome(cliente or CLIENTE_PADRAO)
+        periodo = periodo or PERIODO_PADRAO
+
+        if incluir_banco:
+            return f"{cliente}_{self._limpar_nome(banco)}_{periodo}.csv"
+
+        return f"{cliente}_{periodo}.csv"
+
+    def extrair(self, texto, banco):
+        """(cliente, período) do extrato pelas regras do banco; None no que não achar."""
+        regras = self.regras[banco]
+        cabecalho = _TextoExtrato.cabecalho(texto)
+        inteiro = _TextoExtrato(texto)
+        return _campo(regras.cliente, cabecalho, inteiro), _campo(regras.periodo, cabecalho, inteiro)
 
-        except Exception as e:
-            print(f"Erro ao extrair informações: {e}")
-            return f"{nome_original}.csv"
-     
     def _limpar_nome(self, nome):
         """Remove caracteres especiais e formata o nome"""
         # Remover pontuação, manter apenas letras, números e espaços
-        nome = re.sub(r'[^\w\s-]', '', nome)
-        # Substituir espaços por underscore
-        nome = re.sub(r'\s+', '_', nome.strip())
-        # Converter para maiúsculas
-        nome = nome.upper()
+        nome = _NAO_PALAVRA.sub('', nome)
+        # Substituir espaços por underscore e converter para maiúsculas
+        nome = _ESPACOS.sub('_', nome.strip()).upper()
         # Limitar tamanho
         return nome[:50]
-    
+
     def _formatar_periodo(self, periodo):
         """
         Formata o período extraído para o padrão MM-YYYY ou DD-MM-YYYY_DD-MM-YYYY
         Remove barras e caracteres inválidos para nomes de arquivo
         """
         # Remover barras que causam problema no Windows
-        periodo = periodo.replace('/', '-')
-        
-        # Remover espaços extras
-        periodo = periodo.strip()
-        
-        # Se já está no formato correto, retornar
-        if re.match(r'^\d{2}-\d{2}-\d{4}\s*-\s*\d{2}-\d{2}-\d{4}$', periodo):
-            # Remover espaços ao redor do hífen separador
-            periodo = re.sub(r'\s*-\s*', '_', periodo)
-            return periodo
-        
-        # Tentar diversos padrões
-        patterns = [
-            (r'(\d{2})/(\d{4})', r'\1-\2'),  # 01/2024 -> 01-2024
-            (r'(\d{2})/(\d{2})/(\d{4})', lambda m: f"{m.group(1)}-{m.group(2)}-{m.group(3)}"),  # 01/01/2024 -> 01-01-2024
-            (r'(\d{4})-(\d{2})', r'\2-\1'),  # 2024-01 -> 01-2024
-            (r'(janeiro|jan)\s*(?:de\s*)?(\d{4})', lambda m: f"01-{m.group(2)}"),
-            (r'(fevereiro|fev)\s*(?:de\s*)?(\d{4})', lambda m: f"02-{m.group(2)}"),
-            (r'(março|mar)\s*(?:de\s*)?(\d{4})', lambda m: f"03-{m.group(2)}"),
-            (r'(abril|abr)\s*(?:de\s*)?(\d{4})', lambda m: f"04-{m.group(2)}"),
-            (r'(maio|mai)\s*(?:de\s*)?(\d{4})', lambda m: f"05-{m.group(2)}"),
-            (r'(junho|jun)\s*(?:de\s*)?(\d{4})', lambda m: f"06-{m.group(2)}"),
-            (r'(julho|jul)\s*(?:de\s*)?(\d{4})', lambda m: f"07-{m.group(2)}"),
-            (r'(agosto|ago)\s*(?:de\s*)?(\d{4})', lambda m: f"08-{m.group(2)}"),
-            (r'(setembro|set)\s*(?:de\s*)?(\d{4})', lambda m: f"09-{m.group(2)}"),
-            (r'(outubro|out)\s*(?:de\s*)?(\d{4})', lambda m: f"10-{m.group(2)}"),
-            (r'(novembro|nov)\s*(?:de\s*)?(\d{4})', lambda m: f"11-{m.group(2)}"),
-            (r'(dezembro|dez)\s*(?:de\s*)?(\d{4})', lambda m: f"12-{m.group(2)}"),
-        ]
-        
+        periodo = periodo.replace('/', '-').strip()
+
+        if _INTERVALO_COM_HIFEN.match(periodo):
+            return _HIFEN.sub('_', periodo)
+
         periodo_lower = periodo.lower()
-        for pattern, replacement in patterns:
-            match = re.search(pattern, periodo_lower, re.IGNORECASE)
-            if match:
-                if callable(replacement):
-                    return replacement(match)
-                else:
-                    return re.sub(pattern, replacement, periodo_lower, flags=re.IGNORECASE)
-        
+        if _ANO_MES.search(periodo_lower):
+            return _ANO_MES.sub(r'\2-\1', periodo_lower)  # 2024-01 -> 01-2024
+
+        # "janeiro de 2026", "jan 2026", "Março/2025" -> 01-2026, 03-2025
+        m = _MES_ANO.search(periodo_lower)
+        if m:
+            return f"{_numero_mes(m.group(1))}-{m.group(2)}"
+
         return periodo
-    # ==================== EXTRACTORS POR BANCO ====================
-    
-    def _extract_ifood(self, texto):
-        """Extrai nome e período do iFood"""
-        cliente = None
-        periodo = None
-        
-        linhas = texto.splitlines()
-        
-        # Nome está na primeira linha após "Extrato da Conta Digital iFood"
-        if len(linhas) >= 1:
-            primeira_linha = linhas[0].strip()
-            match = re.search(r'Extrato da Conta Digital iFood\s+(.+)', primeira_linha)
-            if match:
-                cliente = match.group(1).strip()
-        
-        # Período: procurar linha com "Período selecionado"
-        # Ex: "Período selecionado 01/04/2025 a 30/04/2025"
-        match_periodo = re.search(
-            r'Período selecionado\s+(\d{2}/\d{2}/\d{4})\s+a\s+(\d{2}/\d{2}/\d{4})',
-            texto
-        )
-        if match_periodo:
-            data_inicio = match_periodo.group(1).replace('/', '-')
-            data_fim = match_periodo.group(2).replace('/', '-')
-            periodo = f"{data_inicio}_{data_fim}"
-        else:
-            # Se não encontrar datas válidas, pegar datas do texto
-            datas = re.findall(r'\d{2}/\d{2}/\d{4}', texto)
-            # Filtrar datas válidas (não --/--/----)
-            datas_validas = [d for d in datas if not d.startswith('--')]
-            if len(datas_validas) >= 2:
-                data_inicio = datas_validas[0].replace('/', '-')
-                data_fim = datas_validas[-1].replace('/', '-')
-                periodo = f"{data_inicio}_{data_fim}"
-            else:
-                # Se não achar nenhuma data válida, usar X
-                periodo = "SEM_PERIODO"
-        
-        return cliente, periodo
-    
-    def _extract_safra(self, texto):
-        """Extrai nome e período do Safra"""
-        cliente = None
-        periodo = None
-        
-        linhas = texto.splitlines()
-        
-        # Nome está na segunda linha
-        if len(linhas) >= 2:
-            cliente = linhas[1].strip()
-        
-        # Período está na quarta linha
-        if len(linhas) >= 4:
-            linha_periodo = linhas[3].strip()
-            # Extrair as duas datas (ex: "Período de 01/05/2025 a 31/05/2025")
-            match = re.search(r'(\d{2})/(\d{2})/(\d{4})\s+a\s+(\d{2})/(\d{2})/(\d{4})', linha_periodo)
-            if match:
-                # Já formatar sem barras
-                periodo = f"{match.group(1)}-{match.group(2)}-{match.group(3)}_{match.group(4)}-{match.group(5)}-{match.group(6)}"
-        
-        return cliente, periodo
-
-    def _extract_asaas(self, texto):
-        """Extrai nome e período do Asaas"""
-        cliente = None
-        periodo = None
-        
-        linhas = texto.splitlines()
-        
-        # Nome está na primeira linha
-        if len(linhas) >= 1:
-            cliente = linhas[0].strip()
-        
-        # Período está na terceira linha (pulando linhas vazias)
-        linhas_nao_vazias = [l.strip() for l in linhas if l.strip()]
-        
-        if len(linhas_nao_vazias) >= 3:
-            linha_periodo = linhas_nao_vazias[2]
-            match = re.search(r'Período\s+(\d{2})\s+de\s+(\w+)\s+de\s+(\d{4})\s+a\s+(\d{2})\s+de\s+(\w+)\s+de\s+(\d{4})', linha_periodo, re.IGNORECASE)
-            if match:
-                dia_inicio = match.group(1)
-                mes_inicio = match.group(2)
-                ano_inicio = match.group(3)
-                dia_fim = match.group(4)
-                mes_fim = match.group(5)
-                ano_fim = match.group(6)
-                
-                # Converter mês por extenso para número
-                meses = {
-                    'janeiro': '01', 'fevereiro': '02', 'março': '03', 'abril': '04',
-                    'maio': '05', 'junho': '06', 'julho': '07', 'agosto': '08',
-                    'setembro': '09', 'outubro': '10', 'novembro': '11', 'dezembro': '12'
-                }
-                
-                mes_inicio_num = meses.get(mes_inicio.lower(), '01')
-                mes_fim_num = meses.get(mes_fim.lower(), '12')
-                
-                # Já formatar sem barras, usando underscore como separador
-                periodo = f"{dia_inicio}-{mes_inicio_num}-{ano_inicio}_{dia_fim}-{mes_fim_num}-{ano_fim}"
-        
-        return cliente, periodo
-    
-    def _extract_sicoob1(self, texto):
-        """Extrai nome e período do Sicoob1"""
-        cliente = None
-        periodo = None
-        
-        # Procurar linha com "CONTA:"
-        # Ex: "CONTA: 28.904.844-3 / GUIMARAES E DUTRA SERVICOS MEDICOS LTDA"
-        match_cliente = re.search(r'CONTA:\s*[\d\.\-]+\s*/\s*(.+)', texto)
-        if match_cliente:
-            cliente = match_cliente.group(1).strip()
-        
-        # Procurar linha com "PERÍODO:"
-        # Ex: "PERÍODO: 01/04/2025 - 30/04/2025"
-        match_periodo = re.search(
-            r'PERÍODO:\s*(\d{2}/\d{2}/\d{4})\s*-\s*(\d{2}/\d{2}/\d{4})',
-            texto
-        )
-        if match_periodo:
-            data_inicio = match_periodo.group(1).replace('/', '-')
-            data_fim = match_periodo.group(2).replace('/', '-')
-            periodo = f"{data_inicio}_{data_fim}"
-        
-        return cliente, periodo
-
-    def _extract_sicredi(self, texto):
-            """Extrai nome e período do Sicredi"""
-            cliente = None
-            periodo = None
-            
-            # 1. Extrair o Nome
-            # O Regex [^\n]+ pega tudo que vem após "Associado:" até a próxima quebra de linha
-            # Ex: "Associado: JB BAR DA PRACA LTDA"
-            match_cliente = re.search(r'Associado:\s*([^\n]+)', texto, re.IGNORECASE)
-            if match_cliente:
-                cliente = match_cliente.group(1).strip()
-                # Limpeza caso o leitor de PDF junte as linhas e traga a "Cooperativa:" na mesma string
-                cliente = cliente.split('Cooperativa:')[0].strip()
-                
-            # 2. Extrair o Período
-            # Usa (?: de)? para aceitar tanto "Período 01/01..." quanto "Período de 01/01..."
-            # Ex: "Extrato (Período de 01/01/2025 a 31/01/2025)"
-            match_periodo = re.search(
-                r'Período(?: de)?\s+(\d{2}/\d{2}/\d{4})\s+a\s+(\d{2}/\d{2}/\d{4})', 
-                texto, 
-                re.IGNORECASE
-            )
-            
-            if match_periodo:
-                data_inicio = match_periodo.group(1).replace('/', '-')
-                data_fim = match_periodo.group(2).replace('/', '-')
-                periodo = f"{data_inicio}_{data_fim}"
-                
-            return cliente, periodo
-
-    def _extract_itau4(self, texto):
-        """Extrai nome e período do Itaú4"""
-        cliente = None
-        periodo = None
-        
-        linhas = texto.splitlines()
-        linhas_nao_vazias = [l.strip() for l in linhas if l.strip()]
-        
-        # Procurar por CNPJ para pegar o nome
-        for i, linha in enumerate(linhas_nao_vazias):
-            # Padrão 1: Nome está após a linha do CNPJ
-            if re.search(r'CNPJ\s+\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2}', linha):
-                if i + 1 < len(linhas_nao_vazias):
-                    possivel_nome = linhas_nao_vazias[i + 1]
-                    # Verificar se não é uma palavra-chave
-                    if not any(palavra in possivel_nome.upper() for palavra in ['SALDO', 'LIMITE', 'AGÊNCIA', 'CONTA']):
-                        cliente = possivel_nome
-                        break
-            
-            # Padrão 2: CNPJ vem depois do nome
-            # Ex: "BRASILIS JOIAS E GEMAS LTDA." seguido de "06.938.834/0001-29"
-            if re.match(r'^\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2}$', linha):
-                if i > 0:
-                    possivel_nome = linhas_nao_vazias[i - 1]
-                    # Verificar se não é uma palavra-chave
-                    if not any(palavra in possivel_nome.upper() for palavra in ['SALDO', 'LIMITE', 'AGÊNCIA', 'CONTA', 'EXTRATO']):
-                        cliente = possivel_nome
-                        break
-        
-        # Procurar período
-        # Ex: "Lançamentos do período: 01/05/2025 até 31/05/2025"
-        # ou "lançamentos período: 01/04/2025 até 30/04/2025"
-        match_periodo = re.search(
-            r'[Ll]ançamentos\s+(?:do\s+)?período:\s*(\d{2}/\d{2}/\d{4})\s+até\s+(\d{2}/\d{2}/\d{4})',
-            texto
-        )
-        if match_periodo:
-            data_inicio = match_periodo.group(1).replace('/', '-')
-            data_fim = match_periodo.group(2).replace('/', '-')
-            periodo = f"{data_inicio}_{data_fim}"
-        
-        return cliente, periodo
-    
-    def _extract_inter(self, texto):
-        """Extrai nome e período do Inter"""
-        cliente = None
-        periodo = None
-        
-        linhas = texto.splitlines()
-        linhas_nao_vazias = [l.strip() for l in linhas if l.strip()]
-        
-        # Nome está na segunda linha (não vazia)
-        if len(linhas_nao_vazias) >= 2:
-            cliente = linhas_nao_vazias[1]
-        
-        # Período está na quarta linha (não vazia)
-        # Ex: "Período: 10/04/2025 a 10/05/2025"
-        if len(linhas_nao_vazias) >= 4:
-            linha_periodo = linhas_nao_vazias[3]
-            match = re.search(r'Período:\s*(\d{2}/\d{2}/\d{4})\s+a\s+(\d{2}/\d{2}/\d{4})', linha_periodo)
-            if match:
-                data_inicio = match.group(1).replace('/', '-')
-                data_fim = match.group(2).replace('/', '-')
-                periodo = f"{data_inicio}_{data_fim}"
-        
-        return cliente, periodo
-
-    def _extract_nubank(self, texto):
-        """Extrai nome e período do Nubank"""
-        cliente = None
-        periodo = None
-        
-        linhas = texto.splitlines()
-        linhas_nao_vazias = [l.strip() for l in linhas if l.strip()]
-        
-        # Nome está na primeira linha (não vazia)
-        if len(linhas_nao_vazias) >= 1:
-            cliente = linhas_nao_vazias[0]
-        
-        # Período está na quarta linha (não vazia)
-        # Ex: "01 DE DEZEMBRO DE 2025 a 31 DE DEZEMBRO DE 2025 VALORES EM R$"
-        if len(linhas_nao_vazias) >= 4:
-            linha_periodo = linhas_nao_vazias[3]
-            # Extrair datas por extenso
-            match = re.search(
-                r'(\d{2})\s+DE\s+(\w+)\s+DE\s+(\d{4})\s+a\s+(\d{2})\s+DE\s+(\w+)\s+DE\s+(\d{4})',
-                linha_periodo,
-                re.IGNORECASE
-            )
-            if match:
-                dia_inicio = match.group(1)
-                mes_inicio = match.group(2)
-                ano_inicio = match.group(3)
-                dia_fim = match.group(4)
-                mes_fim = match.group(5)
-                ano_fim = match.group(6)
-                
-                # Converter mês por extenso para número
-                meses = {
-                    'janeiro': '01', 'fevereiro': '02', 'março': '03', 'abril': '04',
-                    'maio': '05', 'junho': '06', 'julho': '07', 'agosto': '08',
-                    'setembro': '09', 'outubro': '10', 'novembro': '11', 'dezembro': '12'
-                }
-                
-                mes_inicio_num = meses.get(mes_inicio.lower(), '01')
-                mes_fim_num = meses.get(mes_fim.lower(), '12')
-                
-                periodo = f"{dia_inicio}-{mes_inicio_num}-{ano_inicio}_{dia_fim}-{mes_fim_num}-{ano_fim}"
-        
-        return cliente, periodo
-    
-    def _extract_pagbank(self, texto):
-        """Extrai nome e período do PagBank"""
-        cliente = None
-        periodo = None
-        
-        # Procurar nome
-        match_cliente = re.search(r'(?:Nome|Titular)[:\s]+([\w\s]+)', texto, re.IGNORECASE)
-        if match_cliente:
-            cliente = match_cliente.group(1).strip()
-        
-        # Procurar período
-        match_periodo = re.search(r'Extrato de\s+(\d{2}/\d{2}/\d{4})', texto, re.IGNORECASE)
-        if match_periodo:
-            periodo = match_periodo.group(1)
-        
-        return cliente, periodo
-    
-    def _extract_bb2(self, texto):
-        """Extrai nome e período do Banco do Brasil 2"""
-        cliente = None
-        periodo = None
-        
-        linhas = texto.splitlines()
-        
-        # Nome está na segunda linha (após "Extrato de Conta Corrente")
-        if len(linhas) >= 2:
-            linha_cliente = linhas[1].strip()
-            # Remover "Cliente" se vier no início
-            cliente = linha_cliente.replace('Cliente', '').strip()
-        
-        # Período: pegar a penúltima data e a última data do texto
-        datas = re.findall(r'\d{2}/\d{2}/\d{4}', texto)
-        
-        if len(datas) >= 2:
-            # Penúltima data como início
-            data_inicio = datas[-2]
-            # Última data como fim
-            data_fim = datas[-1]
-            
-            # Formatar sem barras
-            data_inicio_fmt = data_inicio.replace('/', '-')
-            data_fim_fmt = data_fim.replace('/', '-')
-            periodo = f"{data_inicio_fmt}_{data_fim_fmt}"
-        
-        return cliente, periodo
-
-    def _extract_bb1(self, texto):
-        """Extrai nome e período do Banco do Brasil 1"""
-        cliente = None
-        periodo = None
-        
-        linhas = texto.splitlines()
-        linhas_nao_vazias = [l.strip() for l in linhas if l.strip()]
-        
-        # Procurar linha com "Conta corrente"
-        # O nome vem na linha seguinte após o número da conta
-        for i, linha in enumerate(linhas_nao_vazias):
-            if linha == 'Conta corrente':
-                # Próxima linha tem número-nome (ex: "7724-0JOAQUIM S F S ADV")
-                if i + 1 < len(linhas_nao_vazias):
-                    linha_conta = linhas_nao_vazias[i + 1]
-                    # Extrair nome após o número da conta
-                    # Padrão: XXXX-XNOME (sem espaço)
-                    match = re.search(r'^\d+-\d(.+)', linha_conta)
-                    if match:
-                        cliente = match.group(1).strip()
-                    break
-        
-        # Procurar linha com "Período do extrato"
-        # Ex: "Período do extrato 03 / 2025"
-        match_periodo = re.search(r'Período do extrato\s+(\d{2})\s*/\s*(\d{4})', texto)
-        
-        if match_periodo:
-            mes = match_periodo.group(1)
-            ano = match_periodo.group(2)
-            data_inicio = f"01-{mes}-{ano}"
-            
-            # Última data do texto como fim
-            datas = re.findall(r'(\d{2})/(\d{2})/(\d{4})', texto)
-            if datas:
-                # Pegar última data e formatar
-                ultima_data = datas[-1]
-                data_fim = f"{ultima_data[0]}-{ultima_data[1]}-{ultima_data[2]}"
-                periodo = f"{data_inicio}_{data_fim}"
-            else:
-                # Se não achar data final, usar só mês/ano
-                periodo = f"{mes}-{ano}"
-        
-        return cliente, periodo
-
-    def _extract_mercadopago(self, texto):
-        """Extrai nome e período do Mercado Pago"""
-        cliente = None
-        periodo = None
-        
-        linhas = texto.splitlines()
-        linhas_nao_vazias = [l.strip() for l in linhas if l.strip()]
-        
-        # Nome está após "EXTRATO DE CONTA"
-        # Geralmente é a segunda linha não vazia
-        for i, linha in enumerate(linhas_nao_vazias):
-            if 'EXTRATO DE CONTA' in linha.upper():
-                if i + 1 < len(linhas_nao_vazias):
-                    possivel_nome = linhas_nao_vazias[i + 1]
-                    # Verificar se não é CPF/CNPJ
-                    if not re.search(r'\d{11}|\d{14}|CPF|CNPJ', possivel_nome):
-                        cliente = possivel_nome
-                        break
-        
-        # Período está em "Periodo:" ou "Período:"
-        # Ex: "De 01-03-2025 al 31-03-2025" ou "Periodo: 01-03-2025 al 31-03-2025"
-        match_periodo = re.search(
-            r'(?:De\s+|Periodo:\s*|Período:\s*)(\d{2}[-/]\d{2}[-/]\d{4})\s+al?\s+(\d{2}[-/]\d{2}[-/]\d{4})',
-            texto,
-            re.IGNORECASE
-        )
-        if match_periodo:
-            data_inicio = match_periodo.group(1).replace('/', '-')
-            data_fim = match_periodo.group(2).replace('/', '-')
-            periodo = f"{data_inicio}_{data_fim}"
-        
-        return cliente, periodo
-
-    def _extract_infinitepay(self, texto):
-        """Extrai nome e período do InfinitePay"""
-        cliente = None
-        periodo = None
-        
-        linhas = texto.splitlines()
-        linhas_nao_vazias = [l.strip() for l in linhas if l.strip()]
-        
-        # Nome está na primeira linha antes do CNPJ
-        # Ex: "TUMANOS STORE LTDA - CNPJ: 38.013.547/0001-02"
-        if len(linhas_nao_vazias) >= 1:
-            primeira_linha = linhas_nao_vazias[0]
-            match = re.search(r'^(.+?)\s*-\s*CNPJ:', primeira_linha)
-            if match:
-                cliente = match.group(1).strip()
-        
-        # Período: procurar padrão de datas
-        # Ex: "01/08/2025 - 31/08/2025"
-        match_periodo = re.search(
-            r'(\d{2}/\d{2}/\d{4})\s*-\s*(\d{2}/\d{2}/\d{4})',
-            texto
-        )
-        if match_periodo:
-            data_inicio = match_periodo.group(1).replace('/', '-')
-            data_fim = match_periodo.group(2).replace('/', '-')
-            periodo = f"{data_inicio}_{data_fim}"
-        
-        return cliente, periodo 
-    
-    def _extract_pagbank(self, texto):
-        """Extrai nome e período do PagBank"""
-        cliente = None
-        periodo = None
-        
-        linhas = texto.splitlines()
-        linhas_nao_vazias = [l.strip() for l in linhas if l.strip()]
-        
-        # Nome está na segunda linha (após "290 - PagSeguro Internet S/A")
-        if len(linhas_nao_vazias) >= 2:
-            cliente = linhas_nao_vazias[1]
-        
-        # Período está na linha "Periodo:"
-        # Ex: "Periodo: 01/04/2025 a 30/04/2025"
-        match_periodo = re.search(
-            r'Periodo:\s*(\d{2}/\d{2}/\d{4})\s+a\s+(\d{2}/\d{2}/\d{4})',
-            texto,
-            re.IGNORECASE
-        )
-        if match_periodo:
-            data_inicio = match_periodo.group(1).replace('/', '-')
-            data_fim = match_periodo.group(2).replace('/', '-')
-            periodo = f"{data_inicio}_{data_fim}"
-        
-        return cliente, periodo
-
-    def _extract_cora(self, texto):
-        """Extrai nome e período do Cora"""
-        cliente = None
-        periodo = None
-        
-        linhas = texto.splitlines()
-        linhas_nao_vazias = [l.strip() for l in linhas if l.strip()]
-        
-        # Nome está na primeira linha
-        if len(linhas_nao_vazias) >= 1:
-            cliente = linhas_nao_vazias[0]
-        
-        # Período está em "Extrato do período"
-        # Ex: "Extrato do período 01/04/2025 a 01/05/2025"
-        match_periodo = re.search(
-            r'Extrato do período\s+(\d{2}/\d{2}/\d{4})\s+a\s+(\d{2}/\d{2}/\d{4})',
-            texto,
-            re.IGNORECASE
-        )
-        if match_periodo:
-            data_inicio = match_periodo.group(1).replace('/', '-')
-            data_fim = match_periodo.group(2).replace('/', '-')
-            periodo = f"{data_inicio}_{data_fim}"
-        
-        return cliente, periodo
-
-    def _extract_stone(self, texto):
-        """Extrai nome e período do Stone"""
-        cliente = None
-        periodo = None
-        
-        linhas = texto.splitlines()
-        linhas_nao_vazias = [l.strip() for l in linhas if l.strip()]
-        
-        # Procurar por "Nome" para pegar o cliente
-        # A próxima linha terá o nome
-        for i, linha in enumerate(linhas_nao_vazias):
-            if linha == 'Nome' or linha == 'Titular':
-                if i + 1 < len(linhas_nao_vazias):
-                    cliente = linhas_nao_vazias[i + 1]
-                    break
-        
-        # Período: procurar padrão "Período:" ou "Período  "
-        # Ex: "Período: de 01/10/2025 a 31/10/2025"
-        # ou "Período  01/04/2025 até 30/04/2025"
-        match_periodo = re.search(
-            r'Período:\s*(?:de\s+)?(\d{2}/\d{2}/\d{4})\s+(?:a|até)\s+(\d{2}/\d{2}/\d{4})',
-            texto,
-            re.IGNORECASE
-        )
-        if match_periodo:
-            data_inicio = match_periodo.group(1).replace('/', '-')
-            data_fim = match_periodo.group(2).replace('/', '-')
-            periodo = f"{data_inicio}_{data_fim}"
-        
-        return cliente, periodo
-        
-    def _extract_santander1(self, texto):
-            """Extrai nome e período do Santander1"""
-            cliente = None
-            periodo = None
-            
-            # Procurar o nome do cliente.
-            # Padrão: Pega tudo no início da linha até chegar em "Agência:", ignorando possíveis números no meio
-            # Ex: "TEREZA GABRIELA FERREIRA GOMIDES 0933888 Agência: 3222 Conta: 130029819"
-            match_cliente = re.search(r'^(.+?)(?:\s+\d+)?\s+Agência:', texto, re.MULTILINE | re.IGNORECASE)
-            if match_cliente:
-                cliente = match_cliente.group(1).strip()
-                
-            # Procurar o período
-            # Ex: "Períodos: 01/10/2025 a 31/10/2025"
-            match_periodo = re.search(
-                r'Períodos?:\s*(\d{2}/\d{2}/\d{4})\s+a\s+(\d{2}/\d{2}/\d{4})', 
-                texto, 
-                re.IGNORECASE
-            )
-            
-            if match_periodo:
-                data_inicio = match_periodo.group(1).replace('/', '-')
-                data_fim = match_periodo.group(2).replace('/', '-')
-                periodo = f"{data_inicio}_{data_fim}"
-                
-            return cliente, periodo
-    
-    def _extract_caixa(self, texto):
-        """Extrai nome e período da Caixa"""
-        cliente = None
-        periodo = None
-        
-        # Procurar nome do cliente
-        # Ex: "Cliente: BAR LANCH REST SABOR DE LAVRAS"
-        match_cliente = re.search(r'Cliente:\s*(.+)', texto, re.IGNORECASE)
-        if match_cliente:
-            cliente = match_cliente.group(1).strip()
-            
-        # Procurar o mês
-        # Ex: "Mês: Janeiro/2026"
-        match_mes = re.search(r'Mês:\s*([A-Za-zçÇ]+)[\s/]*(\d{4})', texto, re.IGNORECASE)
-        if match_mes:
-            mes = match_mes.group(1).strip()
-            ano = match_mes.group(2).strip()
-            # Retorna no formato "Janeiro 2026" para o _formatar_periodo converter para "01-2026"
-            periodo = f"{mes} {ano}"
-            
-        return cliente, periodo
-    
-    def _extract_efi1(self, texto):
-        """Extrai nome e período do Efi2"""
-        cliente = None
-        periodo = None
-        
-        linhas = texto.splitlines()
-        # Removemos linhas vazias para garantir que a próxima linha seja de fato o nome
-        linhas_nao_vazias = [l.strip() for l in linhas if l.strip()]
-        
-        # 1. Procurar o cliente (linha após a Ouvidoria)
-        for i, linha in enumerate(linhas_nao_vazias):
-            if 'Ouvidoria:' in linha:
-                # O nome do cliente estará na linha imediatamente abaixo
-                if i + 1 < len(linhas_nao_vazias):
-                    cliente = linhas_nao_vazias[i + 1]
-                break # Para a busca após encontrar
-                
-        # 2. Procurar o período
-        # Procura a palavra "Período" seguida pelas datas (mesmo que haja quebra de linha entre elas)
-        match_periodo = re.search(
-            r'Período\s+(\d{2}/\d{2}/\d{4})\s*-\s*(\d{2}/\d{2}/\d{4})', 
-            texto, 
-            re.IGNORECASE
-        )
-        
-        if match_periodo:
-            data_inicio = match_periodo.group(1).replace('/', '-')
-            data_fim = match_periodo.group(2).replace('/', '-')
-            periodo = f"{data_inicio}_{data_fim}"
-            
-        return cliente, periodo
-    
-    def _extract_itau3(self, texto):
-        """Extrai nome e período do Itaú3"""
-        cliente = None
-        periodo = None
-        
-        linhas = texto.splitlines()
-        # Limpar linhas em branco para garantir que a contagem seja exata
-        linhas_nao_vazias = [l.strip() for l in linhas if l.strip()]
-        
-        # 1. Extrair o nome (Quarta linha, que corresponde ao índice 3)
-        if len(linhas_nao_vazias) >= 4:
-            cliente = linhas_nao_vazias[3]
-            
-        # 2. Extrair o período (Ex: "dez 2025")
-        # Busca o mês abreviado seguido do ano (com \b para garantir que são palavras isoladas)
-        match_periodo = re.search(
-            r'\b(jan|fev|mar|abr|mai|jun|jul|ago|set|out|nov|dez)\s+(\d{4})\b', 
-            texto, 
-            re.IGNORECASE
-        )
-        
-        if match_periodo:
-            mes = match_periodo.group(1).lower()
-            ano = match_periodo.group(2)
-            # Retorna "dez 2025". Sua função _formatar_periodo vai capturar isso
-            # na regra (r'(dezembro|dez)\s*(?:de\s*)?(\d{4})') e transformar em "12-2025"
-            periodo = f"{mes} {ano}"
-            
-        return cliente, periodo
-    
-    def _extract_santander2(self, texto):
-        """Extrai nome e período do Santander2"""
-        cliente = None
-        periodo = None
-        
-        linhas = texto.splitlines()
-        linhas_nao_vazias = [l.strip() for l in linhas if l.strip()]
-        
-        for i, linha in enumerate(linhas_nao_vazias):
-            # 1. Procurar a linha que contém "Resumo -" para pegar o período
-            # Ex: "Resumo - janeiro/2026"
-            if 'resumo -' in linha.lower():
-                match_periodo = re.search(r'Resumo\s*-\s*([A-Za-zçÇ]+)[/ -]*(\d{4})', linha, re.IGNORECASE)
-                if match_periodo:
-                    mes = match_periodo.group(1)
-                    ano = match_periodo.group(2)
-                    # Passamos com espaço (ex: "janeiro 2026") para o _formatar_periodo converter para 01-2026
-                    periodo = f"{mes} {ano}"
-            
-            # 2. Procurar a linha "Nome" para pegar o cliente na linha seguinte
-            if linha.lower() == 'nome':
-                if i + 1 < len(linhas_nao_vazias):
-                    possivel_nome = linhas_nao_vazias[i + 1]
-                    # Checagem de segurança para não pegar outra palavra-chave se o nome vier vazio
-                    if possivel_nome.lower() not in ['agência', 'agencia', 'conta']:
-                        cliente = possivel_nome
-                        
-        return cliente, periodo
-    
-    def _extract_bradesco(self, texto):
-            """Extrai nome e período do Bradesco"""
-            cliente = None
-            periodo = None
-            
-            # Usamos o texto original (com linhas vazias) para garantir a posição exata
-            linhas = texto.splitlines()
-            linhas_nao_vazias = [l.strip() for l in linhas if l.strip()]
-            
-            # 1. Extrair o Período (Sempre na 4ª linha do texto bruto)
-            if len(linhas) >= 4:
-                # Índice 3 equivale à 4ª linha
-                linha_periodo = linhas[3] 
-                
-                # Busca duas datas no formato DD/MM/YYYY separadas por qualquer espaço ou caractere
-                match_periodo = re.search(r'(\d{2}/\d{2}/\d{4}).*?(\d{2}/\d{2}/\d{4})', linha_periodo)
-                
-                # Fallback: Se por acaso o leitor de PDF bagunçar a linha 4, ele procura as datas no texto todo
-                if not match_periodo:
-                    match_periodo = re.search(r'(\d{2}/\d{2}/\d{4})\s+(\d{2}/\d{2}/\d{4})', texto)
-                    
-                if match_periodo:
-                    data_inicio = match_periodo.group(1).replace('/', '-')
-                    data_fim = match_periodo.group(2).replace('/', '-')
-                    periodo = f"{data_inicio}_{data_fim}"
-                    
-            # 2. Extrair o Nome
-            # Procuramos a linha "Extrato Mensal / Por Período" e pegamos o cliente na linha seguinte
-            for i, linha in enumerate(linhas_nao_vazias):
-                if 'Extrato Mensal / Por Período' in linha:
-                    if i + 1 < len(linhas_nao_vazias):
-                        linha_nome_cnpj = linhas_nao_vazias[i + 1]
-                        # Ex: "BRASART COMERCIO LTDA | CNPJ: 043.998.514/0001-90"
-                        partes = linha_nome_cnpj.split('|')
-                        if partes:
-                            cliente = partes[0].strip()
-                    break # Encontrou, pode parar de procurar
-                    
-            return cliente, periodo
-
-    def _extract_sicoob2(self, texto):
-        """Extrai nome e período do Sicoob2"""
-        cliente = None
-        periodo = None
-        
-        linhas = texto.splitlines()
-        linhas_nao_vazias = [l.strip() for l in linhas if l.strip()]
-        
-        for i, linha in enumerate(linhas_nao_vazias):
-            # 1. Extrair o Nome (linha após "Conta:")
-            if linha.lower() == 'conta:':
-                if i + 1 < len(linhas_nao_vazias):
-                    linha_conta = linhas_nao_vazias[i + 1]
-                    # Ex: "27.520-4 / OUROTEC TECNOLOGIA LTDA."
-                    # Dividimos pela barra e pegamos a segunda parte
-                    partes = linha_conta.split('/')
-                    if len(partes) > 1:
-                        cliente = partes[1].strip()
-            
-            # 2. Extrair o Período (linha após "Periodo:" ou "Período:")
-            if linha.lower() in ['periodo:', 'período:']:
-                if i + 1 < len(linhas_nao_vazias):
-                    linha_periodo = linhas_nao_vazias[i + 1]
-                    # Ex: "01/04/2025 - 30/04/2025"
-                    match_periodo = re.search(r'(\d{2}/\d{2}/\d{4})\s*-\s*(\d{2}/\d{2}/\d{4})', linha_periodo)
-                    if match_periodo:
-                        data_inicio = match_periodo.group(1).replace('/', '-')
-                        data_fim = match_periodo.group(2).replace('/', '-')
-                        periodo = f"{data_inicio}_{data_fim}"
-                        
-        return cliente, periodo
-    
-    
-    
-
-    def _extract_sicoob3(self, texto):
-        """Extrai nome e período do Sicoob3"""
-        return self._extract_sicoob1(texto)  # Mesmo padrão
-    
-    def _extract_itau(self, texto):
-        """Extrai nome e período do Itaú"""
-        cliente = None
-        periodo = None
-        
-        linhas = texto.splitlines()
-        for linha in linhas:
-            # Nome do cliente
-            if 'ag' in linha.lower() and 'cc' in linha.lower():
-                # Linha acima geralmente tem o nome
-                idx = linhas.index(linha)
-                if idx > 0:
-                    cliente = linhas[idx - 1].strip()
-            
-            # Período
-            if 'período' in linha.lower():
-                match = re.search(r'(\d{2}/\d{2}/\d{4})', linha)
-                if match:
-                    periodo = match.group(1)
-        
-        return cliente, periodo
-    
-    def _extract_itau2(self, texto):
-        """Extrai nome e período do Itaú2"""
-        return self._extract_itau(texto)
-        return self._extract_itau(texto)
-    
-
-        return self._extract_santander1(texto)
-
-    def _extract_efi2(self, texto):
-        """Extrai nome e período do Efi2"""
-        cliente = None
-        periodo = None
-        
-        # Procurar nome
-        match_cliente = re.search(r'(?:Nome|Titular)[:\s]+([\w\s]+)', texto, re.IGNORECASE)
-        if match_cliente:
-            cliente = match_cliente.group(1).strip()
-        
-        # Procurar período com "Filtros aplicados"
-        match_periodo = re.search(r'Filtros aplicados.*?(\d{2}/\d{2}/\d{4})', texto, re.IGNORECASE | re.DOTALL)
-        if match_periodo:
-            periodo = match_periodo.group(1)
-        
-        return cliente, periodo
-    
-    
-        """Extrai nome e período do Efi2"""
-        cliente = None
-        periodo = None
-        
-        # Procurar nome
-        match_cliente = re.search(r'(?:Nome|Titular)[:\s]+([\w\s]+)', texto, re.IGNORECASE)
-        if match_cliente:
-            cliente = match_cliente.group(1).strip()
-        
-        # Procurar período com "Filtros do"
-        match_periodo = re.search(r'Filtros do.*?(\d{2}/\d{2}/\d{4})', texto, re.IGNORECASE | re.DOTALL)
-        if match_periodo:
-            periodo = match_periodo.group(1)
-        
-        return cliente, periodo
-    
-  
-        """Extrai nome e período do Mercado Pago"""
-        cliente = None
-        periodo = None
-        
-        # Procurar nome
-        match_cliente = re.search(r'(?:Nome|Conta)[:\s]+([\w\s]+)', texto, re.IGNORECASE)
-        if match_cliente:
-            cliente = match_cliente.group(1).strip()
-        
-        # Procurar período
-        match_periodo = re.search(r'Período[:\s]+(\d{2}/\d{2}/\d{4})', texto, re.IGNORECASE)
-        if match_periodo:
-            periodo = match_periodo.group(1)
-        
-        return cliente, periodo
\ No newline at end of file
+
+
+# Renomeador usado pelo pipeline de extratos (cliente e período de cada extrato) e pelo lote
+RENOMEADOR = RenomeadorExtrato()
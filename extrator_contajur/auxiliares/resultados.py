@@ -0,0 +1,190 @@
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+import uuid
+import zipfile
+
+from .pastas import pasta_privada, pasta_temporaria
+
+# Pasta privada dos ZIPs de resultado (compartilhada entre processos do servidor)
+EXTRATOR_RESULTADOS_DIR = os.getenv("EXTRATOR_RESULTADOS_DIR") or pasta_temporaria("extrator_resultados")
+# Tempo, em segundos, que um ZIP fica disponível para download
+EXTRATOR_RESULTADOS_TTL = int(os.getenv("EXTRATOR_RESULTADOS_TTL", "3600"))
+
+_JOB_ID_RE = re.compile(r'^[0-9a-f]{32}$')
+
+
+class ZipEmGravacao:
+    """ZIP de um job sendo gravado direto em disco, entrada por entrada."""
+
+    def __init__(self, caminho_parcial):
+        self._zip = zipfile.ZipFile(caminho_parcial, "w", zipfile.ZIP_DEFLATED)
+        self._nomes = set()
+        self.entradas = 0
+
+    def _nome_livre(self, nome):
+        """Nomes repetidos recebem sufixo (_2, _3...)."""
+        base, ext = os.path.splitext(nome)
+        contador = 1
+        while nome in self._nomes:
+            contador += 1
+            nome = f"{base}_{contador}{ext}"
+        self._nomes.add(nome)
+        return nome
+
+    def adicionar(self, nome, dados):
+        """Grava uma entrada a partir dos bytes (ou texto)."""
+        if isinstance(dados, str):
+            dados = dados.encode('utf-8')
+        self._zip.writestr(self._nome_livre(nome), dados)
+        self.entradas += 1
+
+    def mover_arquivo(self, nome, caminho):
+        """
+        Grava uma entrada copiando o arquivo em blocos, sem carregá-lo inteiro na
+        memória, e remove o arquivo em seguida. Retorna o nome da entrada no ZIP.
+        """
+        try:
+            nome = self._nome_livre(nome)
+            self._zip.write(caminho, nome)
+            self.entradas += 1
+            return nome
+        finally:
+            try:
+                os.remove(caminho)
+            except OSError:
+                pass
+
+    def fechar(self):
+        self._zip.close()
+
+
+class ArmazemResultados:
+    """
+    ZIPs de resultado por job. Cada job grava o próprio arquivo (<job_id>.zip) e
+    os arquivos expiram após `ttl` segundos, removidos por uma thread de limpeza.
+    O estado fica só no disco, então qualquer processo do servidor serve o download.
+    """
+
+    def __init__(self, pasta=EXTRATOR_RESULTADOS_DIR, ttl=EXTRATOR_RESULTADOS_TTL):
+        self.pasta = pasta
+        self.ttl = ttl
+        self._limpeza = None
+        self._lock = threading.Lock()
+
+    def novo_job(self):
+        return uuid.uuid4().hex
+
+    def _valido(self, job_id, extensao):
+        """Caminho do arquivo do job se o id é válido e o arquivo existe e não expirou."""
+        if not job_id or not _JOB_ID_RE.match(job_id):
+            return None
+        try:
+            # Numa pasta que não é privada, o arquivo pode ter sido plantado por outro usuário
+            caminho = os.path.join(pasta_privada(self.pasta), f"{job_id}{extensao}")
+            if time.time() - os.path.getmtime(caminho) > self.ttl:
+                return None
+        except OSError:
+            return None
+        return caminho
+
+    def caminho(self, job_id):
+        """Caminho do ZIP do job, ou None se o job não existe, expirou ou o id é inválido."""
+        return self._valido(job_id, ".zip")
+
+    def salvar_estado(self, job_id, estado):
+        """Grava o estado (JSON) de um job assíncrono, para qualquer processo consultar."""
+        caminho = os.path.join(pasta_privada(self.pasta), f"{job_id}.json")
+        temporario = f"{caminho}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(temporario, 'w', encoding='utf-8') as f:
+            json.dump(estado, f, ensure_ascii=False)
+        os.replace(temporario, caminho)
+
+    def estado(self, job_id):
+        """Estado gravado do job, ou None."""
+        caminho = self._valido(job_id, ".json")
+        if caminho is None:
+            return None
+        try:
+            with open(caminho, encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def arquivo_temporario(self, sufixo=""):
+        """
+        Arquivo binário aberto para escrita na pasta dos resultados, visível para
+        todos os processos do servidor. Quem o recebe remove; os esquecidos são
+        apagados com os ZIPs expirados.
+        """
+        return tempfile.NamedTemporaryFile('wb', dir=pasta_privada(self.pasta), suffix=sufixo, delete=False)
+
+    def gravar(self, job_id):
+        """
+        Abre o ZIP do job para gravação. Use como gerenciador de contexto: o arquivo
+        só passa a ser servido ao sair do bloco sem erro e com ao menos uma entrada.
+        """
+        return _GravacaoJob(self, job_id)
+
+    def limpar_expirados(self):
+        """Remove ZIPs, estados de job e gravações abandonadas mais antigos que o TTL."""
+        limite = time.time() - self.ttl
+        try:
+            nomes = os.listdir(pasta_privada(self.pasta))
+        except OSError:
+            return 0
+        removidos = 0
+        for nome in nomes:
+            caminho = os.path.join(self.pasta, nome)
+            try:
+                if os.path.getmtime(caminho) < limite:
+                    os.remove(caminho)
+                    removidos += 1
+            except OSError:
+                continue
+        return removidos
+
+    def iniciar_limpeza(self, intervalo=None):
+        """Inicia (uma vez) a thread que remove os ZIPs expirados periodicamente."""
+        with self._lock:
+            if self._limpeza is not None:
+                return
+            intervalo = intervalo or max(30, min(self.ttl, 300))
+
+            def _loop():
+                while True:
+                    time.sleep(intervalo)
+                    self.limpar_expirados()
+
+            self._limpeza = threading.Thread(target=_loop, name="limpeza-resultados", daemon=True)
+            self._limpeza.start()
+
+
+class _GravacaoJob:
+    def __init__(self, armazem, job_id):
+        self.armazem = armazem
+        self.job_id = job_id
+        self.caminho = os.path.join(armazem.pasta, f"{job_id}.zip")
+        self._parcial = self.caminho + ".parcial"
+        self.zip = None
+
+    def __enter__(self):
+        pasta_privada(self.armazem.pasta)
+        self.zip = ZipEmGravacao(self._parcial)
+        return self.zip
+
+    def __exit__(self, exc_type, exc, tb):
+        self.zip.fechar()
+        if exc_type is None and self.zip.entradas:
+            os.replace(self._parcial, self.caminho)
+        else:
+            try:
+                os.remove(self._parcial)
+            except OSError:
+                pass
+
+
+ARMAZEM_RESULTADOS = ArmazemResultados()
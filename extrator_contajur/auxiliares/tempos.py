@@ -0,0 +1,161 @@
+"""
+Tempos das etapas do processamento de extratos (ver processamento.medir).
+
+registrar_tempos é gancho do PIPELINE_EXTRATOS (processamento): cada arquivo
+concluído gera uma linha de log em JSON (logger
+"extrator_contajur.tempos") e entra no histograma por banco e etapa, servido em
+/api/tempos e /metrics. O histograma é somado entre os workers do servidor pelo
+estado compartilhado (estado_compartilhado). As etapas são as chaves do dicionário `tempos`
+dos resultados: cache, abertura, identificacao, texto, parser, csv, zip, json, total.
+"""
+import bisect
+import json
+import logging
+import os
+import sys
+import threading
+
+from .estado_compartilhado import ESTADO_COMPARTILHADO
+
+# Limites superiores (ms) das faixas do histograma; o que passar do último cai em "+inf"
+FAIXAS_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+# "0" desliga a linha de log por arquivo (o histograma continua)
+EXTRATOR_LOG_TEMPOS = os.getenv("EXTRATOR_LOG_TEMPOS", "1") != "0"
+
+BANCO_NAO_IDENTIFICADO = "nao_identificado"
+
+logger = logging.getLogger("extrator_contajur.tempos")
+if not logger.handlers:
+    # Handler próprio: os módulos dos outros sistemas configuram o logging raiz só para erros
+    _handler = logging.StreamHandler(sys.stderr)
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+def tempos_pedidos(valor):
+    """Se o parâmetro `tempos` da requisição pede os tempos na resposta (1, true, sim)."""
+    return (valor or "").strip().lower() in ("1", "true", "sim")
+
+
+def _juntar_tempos(fotos):
+    """Soma as fotos de HistogramaTempos.foto() de vários processos."""
+    dados, arquivos = {}, {}
+    for foto in fotos:
+        for banco, por_etapa in foto['dados'].items():
+            juntos = dados.setdefault(banco, {})
+            for etapa, valores in por_etapa.items():
+                atual = juntos.get(etapa)
+                if atual is None:
+                    juntos[etapa] = dict(valores, faixas=list(valores['faixas']))
+                    continue
+                atual['contagem'] += valores['contagem']
+                atual['soma_ms'] += valores['soma_ms']
+                atual['max_ms'] = max(atual['max_ms'], valores['max_ms'])
+                atual['faixas'] = [a + b for a, b in zip(atual['faixas'], valores['faixas'])]
+        for banco, sucesso, total in foto['arquivos']:
+            arquivos[banco, sucesso] = arquivos.get((banco, sucesso), 0) + total
+    return {'dados': dados, 'arquivos': [[banco, sucesso, total] for (banco, sucesso), total in arquivos.items()]}
+
+
+class HistogramaTempos:
+    """
+    Contagem, soma, máximo e faixas de duração por banco e etapa, e o número de
+    arquivos por banco e resultado (sucesso ou erro). Com `nome`, entra no estado
+    compartilhado (estado_compartilhado) e resumo() e arquivos() somam todos os
+    processos do servidor.
+    """
+
+    def __init__(self, faixas=FAIXAS_MS, nome=None):
+        self.faixas = tuple(faixas)
+        self.nome = nome
+        self._dados = {}
+        self._arquivos = {}
+        self._lock = threading.Lock()
+        if nome:
+            ESTADO_COMPARTILHADO.fonte(nome, self.foto, _juntar_tempos)
+
+    def registrar(self, banco, tempos, sucesso=True):
+        """Soma ao histograma os tempos (ms por etapa) de um arquivo."""
+        banco = banco or BANCO_NAO_IDENTIFICADO
+        if self.nome:
+            ESTADO_COMPARTILHADO.tocar()
+        with self._lock:
+            self._arquivos[banco, sucesso] = self._arquivos.get((banco, sucesso), 0) + 1
+            por_etapa = self._dados.setdefault(banco, {})
+            for etapa, ms in tempos.items():
+                dados = por_etapa.get(etapa)
+                if dados is None:
+                    dados = por_etapa[etapa] = {
+                        'contagem': 0, 'soma_ms': 0.0, 'max_ms': 0.0,
+                        'faixas': [0] * (len(self.faixas) + 1),
+                    }
+                dados['contagem'] += 1
+                dados['soma_ms'] += ms
+                dados['max_ms'] = max(dados['max_ms'], ms)
+                dados['faixas'][bisect.bisect_left(self.faixas, ms)] += 1
+
+    def foto(self):
+        """Dados deste processo em JSON: {'dados': {banco: {etapa: {...}}}, 'arquivos': [[banco, sucesso, n]]}."""
+        with self._lock:
+            return {
+                'dados': {
+                    banco: {etapa: dict(dados, faixas=list(dados['faixas'])) for etapa, dados in por_etapa.items()}
+                    for banco, por_etapa in self._dados.items()
+                },
+                'arquivos': [[banco, sucesso, total] for (banco, sucesso), total in self._arquivos.items()],
+            }
+
+    def _atual(self):
+        return ESTADO_COMPARTILHADO.ler(self.nome) if self.nome else self.foto()
+
+    def resumo(self):
+        """
+        {banco: {etapa: {contagem, soma_ms, media_ms, max_ms, faixas}}}, em que faixas[i]
+        conta as durações até self.faixas[i] ms (e acima da faixa anterior); o último
+        item conta as que passaram do maior limite.
+        """
+        return {
+            banco: {
+                etapa: {
+                    'contagem': dados['contagem'],
+                    'soma_ms': round(dados['soma_ms'], 1),
+                    'media_ms': round(dados['soma_ms'] / dados['contagem'], 1),
+                    'max_ms': dados['max_ms'],
+                    'faixas': dados['faixas'],
+                }
+                for etapa, dados in por_etapa.items()
+            }
+            for banco, por_etapa in self._atual()['dados'].items()
+        }
+
+    def arquivos(self):
+        """{(banco, sucesso): quantidade de arquivos}"""
+        return {(banco, sucesso): total for banco, sucesso, total in self._atual()['arquivos']}
+
+    def limpar(self):
+        """Zera os dados deste processo (os já gravados pelos outros continuam)."""
+        with self._lock:
+            self._dados.clear()
+            self._arquivos.clear()
+
+
+HISTOGRAMA_TEMPOS = HistogramaTempos(nome="tempos")
+
+
+def registrar_tempos(rota, filename, banco, tempos, sucesso=True, transacoes=0):
+    """Registra os tempos de um arquivo no histograma e na linha de log estruturada."""
+    banco = banco or BANCO_NAO_IDENTIFICADO
+    HISTOGRAMA_TEMPOS.registrar(banco, tempos, sucesso)
+    if EXTRATOR_LOG_TEMPOS:
+        logger.info(json.dumps({
+            'evento': 'extrato_tempos',
+            'rota': rota,
+            'arquivo': filename,
+            'banco': banco,
+            'sucesso': sucesso,
+            'transacoes': transacoes,
+            'tempos': tempos,
+        }, ensure_ascii=False))
+
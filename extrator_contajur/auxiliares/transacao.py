@@ -0,0 +1,203 @@
+import csv
+import io
+import logging
+import math
+import re
+from datetime import date
+from enum import Enum
+from typing import NamedTuple, Optional, Union
+
+logger = logging.getLogger("extrator_contajur.transacao")
+
+
+class Tipo(str, Enum):
+    """Natureza do lançamento no extrato."""
+    CREDITO = "C"
+    DEBITO = "D"
+
+    def __str__(self):
+        return self.value
+
+    def __format__(self, spec):
+        return format(self.value, spec)
+
+    @classmethod
+    def de_texto(cls, texto):
+        """'C'/'D' (com espaços ou minúsculas) → Tipo; qualquer outro valor → None."""
+        try:
+            return cls(str(texto).strip().upper())
+        except ValueError:
+            return None
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Valores
+# ──────────────────────────────────────────────────────────────────────────────
+
+_NAO_NUMERICO = re.compile(r'[^\d,.]')
+
+
+def valor_para_centavos(valor) -> Optional[int]:
+    """
+    Converte um valor monetário para centavos (int). Retorna None se não for um valor.
+
+    '1.066,25' → 106625  |  'R$ 1.234,56' → 123456  |  '25.173' → 2517300
+    '1234.56'  → 123456  |  '1,234.56'    → 123456  |  '12.0'   → 1200
+    Números (int/float) são arredondados para o centavo.
+
+    Com vírgula e ponto, o último separador é o decimal. Só com ponto, o ponto é
+    decimal quando seguido de 1 ou 2 dígitos e de milhar nos demais casos, que é
+    como os parsers escrevem valores redondos ('1.234' para 1.234,00).
+    """
+    if valor is None or isinstance(valor, bool):
+        return None
+    if isinstance(valor, (int, float)):
+        if isinstance(valor, float) and not math.isfinite(valor):
+            return None
+        return round(valor * 100)
+
+    s = str(valor).strip()
+    negativo = s.startswith('-')
+    s = _NAO_NUMERICO.sub('', s)
+    if not s:
+        return None
+
+    virgula, ponto = s.rfind(','), s.rfind('.')
+    if virgula >= 0 and ponto >= 0:
+        milhar, decimal = ('.', ',') if virgula > ponto else (',', '.')
+        s = s.replace(milhar, '').replace(decimal, '.')
+    elif virgula >= 0:
+        s = s.replace(',', '.')
+    elif s.count('.') != 1 or len(s) - ponto - 1 not in (1, 2):
+        s = s.replace('.', '')
+
+    inteiro, _, fracao = s.partition('.')
+    if not (inteiro or fracao) or not (inteiro + fracao).isdigit():
+        return None
+    centavos = int(inteiro or '0') * 100
+    if fracao:
+        # Arredonda pelo terceiro dígito, como round(float, 2)
+        centavos += int(fracao[:2].ljust(2, '0'))
+        if len(fracao) > 2 and fracao[2] >= '5':
+            centavos += 1
+    return -centavos if negativo else centavos
+
+
+def formatar_centavos(centavos: int) -> str:
+    """106625 → '1.066,25'  |  2517300 → '25.173' (sem sinal, no formato dos parsers)."""
+    inteiro, decimal = divmod(abs(centavos), 100)
+    texto = f"{inteiro:,}".replace(",", ".")
+    return texto if decimal == 0 else f"{texto},{decimal:02d}"
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Datas
+# ──────────────────────────────────────────────────────────────────────────────
+
+_DATA_RE = re.compile(r'(\d{2})/(\d{2})/(\d{4})$')
+
+
+def texto_para_data(texto) -> Optional[date]:
+    """'31/01/2025' → date(2025, 1, 31); formatos diferentes ou datas inválidas → None."""
+    match = _DATA_RE.match(texto.strip()) if texto else None
+    if not match:
+        return None
+    dia, mes, ano = map(int, match.groups())
+    try:
+        return date(ano, mes, dia)
+    except ValueError:
+        return None
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Transação
+# ──────────────────────────────────────────────────────────────────────────────
+
+def _texto(valor):
+    return "" if valor is None else str(valor).strip()
+
+
+def _descricao(valor):
+    """Descrição em uma única linha."""
+    texto = "" if valor is None else str(valor)
+    return texto.replace("\r\n", "\n").replace("\r", "\n").replace("\n", " ").strip()
+
+
+class Transacao(NamedTuple):
+    """
+    Lançamento de extrato. Os quatro primeiros campos são o texto como saiu do
+    parser (e como vai para o CSV); `centavos` e `data_lancamento` são os mesmos
+    valores já convertidos, para quem precisa comparar ou somar.
+    """
+    data: str
+    descricao: str
+    valor: str
+    tipo: Union[Tipo, str]
+    centavos: int
+    data_lancamento: Optional[date]
+
+    @classmethod
+    def de_campos(cls, data, descricao, valor, tipo, centavos=None):
+        """
+        Monta a transação normalizando o texto e convertendo valor, data e tipo uma única vez.
+        `centavos` já convertidos dispensam valor_para_centavos; sem eles, um valor que não
+        é número levanta ValueError.
+        """
+        data = _texto(data)
+        valor = _texto(valor)
+        tipo = _texto(tipo)
+        if centavos is None:
+            centavos = valor_para_centavos(valor)
+            if centavos is None:
+                raise ValueError(f"Valor inválido na transação de {data or 'data vazia'}: {valor!r}")
+        return cls(
+            data,
+            _descricao(descricao),
+            valor,
+            Tipo.de_texto(tipo) or tipo,
+            centavos,
+            texto_para_data(data),
+        )
+
+    @property
+    def campos(self):
+        """(Data, Descrição, Valor, Tipo) como texto, na ordem do CSV do extrator."""
+        return self.data, self.descricao, self.valor, str(self.tipo)
+
+
+def de_linhas(linhas, conversor=valor_para_centavos) -> list:
+    """
+    Transacao de cada linha (Data, Descrição, Valor, Tipo), com os centavos dados por
+    `conversor`. As linhas cujo valor o conversor não lê (None) são descartadas com um
+    aviso no log, em vez de entrarem como R$ 0,00.
+    """
+    transacoes = []
+    for data, descricao, valor, tipo in linhas:
+        centavos = conversor(_texto(valor))
+        if centavos is None:
+            logger.warning("[EXTRATOR] Transação de %s descartada, valor inválido: %r", data, valor)
+            continue
+        transacoes.append(Transacao.de_campos(data, descricao, valor, tipo, centavos))
+    return transacoes
+
+
+def de_dicts(dicionarios) -> list:
+    """Converte os dicionários emitidos pelos parsers ("Data", "Descrição", "Valor", "Tipo") com de_linhas."""
+    return de_linhas(
+        (d.get("Data"), d.get("Descrição"), d.get("Valor"), d.get("Tipo")) for d in dicionarios
+    )
+
+
+def ler_csv_extrato(conteudo: bytes, conversor=valor_para_centavos) -> list:
+    """
+    Lê o CSV do extrator (Data;Descrição;Valor;Tipo, sem cabeçalho) e retorna a lista
+    de Transacao (ver de_linhas). Linhas com menos de quatro colunas são ignoradas.
+    """
+    try:
+        texto = conteudo.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        texto = conteudo.decode('latin-1')
+    return de_linhas(
+        (linha[:4] for linha in csv.reader(io.StringIO(texto), delimiter=';') if len(linha) >= 4),
+        conversor,
+    )
@@ -0,0 +1,158 @@
+import hashlib
+import io
+import os
+import shutil
+import tempfile
+
+from flask import Request
+
+from .pastas import pasta_privada, pasta_temporaria
+
+# Uploads até este tamanho ficam em memória; os maiores vão para um arquivo temporário
+UPLOAD_LIMITE_MEMORIA = int(os.getenv("UPLOAD_LIMITE_MEMORIA_MB", "2")) * 1024 * 1024
+# Pasta privada dos arquivos temporários de upload (os processos do pool abrem pelo caminho)
+UPLOAD_DIR = os.getenv("UPLOAD_DIR") or pasta_temporaria("uploads_pdf")
+
+ASSINATURA_PDF = b'%PDF-'
+TAMANHO_BLOCO = 1024 * 1024
+
+
+def _tamanho(stream):
+    posicao = stream.tell()
+    stream.seek(0, os.SEEK_END)
+    tamanho = stream.tell()
+    stream.seek(posicao)
+    return tamanho
+
+
+def eh_fonte_caminho(fonte):
+    """Se a fonte de um PDF é um caminho (str/PathLike) em vez dos bytes."""
+    return isinstance(fonte, (str, os.PathLike))
+
+
+def hash_fonte(fonte):
+    """SHA-256 do PDF, lendo o arquivo em blocos quando a fonte é um caminho."""
+    if not eh_fonte_caminho(fonte):
+        return hashlib.sha256(fonte).hexdigest()
+    digest = hashlib.sha256()
+    with open(fonte, 'rb') as f:
+        for bloco in iter(lambda: f.read(TAMANHO_BLOCO), b''):
+            digest.update(bloco)
+    return digest.hexdigest()
+
+
+def _remover(caminho):
+    try:
+        os.remove(caminho)
+    except OSError:
+        pass
+
+
+class RequisicaoUpload(Request):
+    """
+    Request do Flask (app.request_class) que grava os uploads de uma requisição maior
+    que UPLOAD_LIMITE_MEMORIA direto num arquivo de UPLOAD_DIR, em vez do temporário
+    sem nome do Werkzeug: PDFEnviado.de_upload adota esse arquivo pelo caminho, sem
+    copiar o upload de novo. Os arquivos que nenhum PDFEnviado adotou são apagados
+    no fim da requisição.
+    """
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        if total_content_length is not None and total_content_length <= UPLOAD_LIMITE_MEMORIA:
+            return io.BytesIO()
+        descritor, caminho = tempfile.mkstemp(dir=pasta_privada(UPLOAD_DIR), suffix=".pdf")
+        arquivo = open(descritor, 'w+b')
+        arquivo.caminho_upload = caminho
+        self.__dict__.setdefault('_uploads_em_disco', []).append(arquivo)
+        return arquivo
+
+    def close(self):
+        super().close()
+        for arquivo in self.__dict__.pop('_uploads_em_disco', ()):
+            if not getattr(arquivo, 'adotado', False):
+                _remover(arquivo.caminho_upload)
+
+
+def abrir_fonte(fonte):
+    """Arquivo binário para leitura da fonte, sem copiar os bytes."""
+    if eh_fonte_caminho(fonte):
+        return open(fonte, 'rb')
+    return io.BytesIO(fonte)
+
+
+class PDFEnviado:
+    """
+    Upload de PDF lido uma única vez.
+
+    O cabeçalho é conferido com uma espiada nos primeiros bytes do stream, sem ler o
+    arquivo inteiro. Uploads pequenos ficam em memória (`fonte` são os bytes); os
+    maiores ficam num arquivo temporário (`fonte` é o caminho), que pdfplumber,
+    PyMuPDF, OCR e os processos do pool abrem direto do disco: o próprio arquivo em
+    que o RequisicaoUpload gravou o upload ou, sem ele, uma cópia em blocos.
+    Use como gerenciador de contexto (ou chame fechar) para remover o temporário;
+    ele sobrevive à requisição (jobs em background).
+    """
+
+    def __init__(self, nome, fonte, tamanho, eh_pdf, temporario=False):
+        self.nome = nome
+        self.fonte = fonte
+        self.tamanho = tamanho
+        self.eh_pdf = eh_pdf
+        self._temporario = temporario
+
+    @classmethod
+    def de_upload(cls, file, limite_memoria=None, exigir_pdf=True):
+        """
+        Cria a partir de um upload do Flask (FileStorage) ou de um arquivo binário aberto.
+        Com `exigir_pdf`, um arquivo sem a assinatura %PDF- não é lido (fonte None).
+        """
+        stream = getattr(file, 'stream', file)
+        nome = getattr(file, 'filename', None) or getattr(file, 'name', None)
+        limite = UPLOAD_LIMITE_MEMORIA if limite_memoria is None else limite_memoria
+
+        stream.seek(0)
+        eh_pdf = stream.read(len(ASSINATURA_PDF)) == ASSINATURA_PDF
+        stream.seek(0)
+        tamanho = _tamanho(stream)
+        if exigir_pdf and not eh_pdf:
+            return cls(nome, None, tamanho, eh_pdf)
+
+        if tamanho <= limite:
+            return cls(nome, stream.read(), tamanho, eh_pdf)
+
+        caminho = getattr(stream, 'caminho_upload', None)
+        if caminho is not None:
+            # Já está em disco (RequisicaoUpload): o arquivo passa a ser deste PDFEnviado
+            stream.flush()
+            stream.adotado = True
+            return cls(nome, caminho, tamanho, eh_pdf, temporario=True)
+
+        with tempfile.NamedTemporaryFile(dir=pasta_privada(UPLOAD_DIR), suffix=".pdf", delete=False) as tmp:
+            shutil.copyfileobj(stream, tmp, TAMANHO_BLOCO)
+        return cls(nome, tmp.name, tamanho, eh_pdf, temporario=True)
+
+    @property
+    def em_disco(self):
+        return self._temporario
+
+    def abrir(self):
+        """Arquivo binário para leitura (ver abrir_fonte)."""
+        return abrir_fonte(self.fonte)
+
+    def ler_bytes(self):
+        """Conteúdo completo em memória, para as bibliotecas que só aceitam bytes."""
+        if not eh_fonte_caminho(self.fonte):
+            return self.fonte
+        with open(self.fonte, 'rb') as f:
+            return f.read()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+    def fechar(self):
+        if self._temporario:
+            _remover(self.fonte)
+            self._temporario = False
@@ -1,7 +1,12 @@
+import csv
+import io
+import os
 from io import BytesIO
 from xml.etree.ElementTree import Element, SubElement, tostring
 from xml.dom import minidom
 
+from .transacao import de_dicts
+
 def create_xml(data):
     """
     Cria um arquivo XML a partir dos dados extraídos e retorna o XML como BytesIO.
@@ -12,16 +17,16 @@ def create_xml(data):
         trans_elem = SubElement(root, "Transaction")
         
         date_elem = SubElement(trans_elem, "Data")
-        date_elem.text = transaction["Data"]
+        date_elem.text = transaction.data
         
         desc_elem = SubElement(trans_elem, "Descrição")
-        desc_elem.text = transaction["Descrição"]
+        desc_elem.text = transaction.descricao
         
         value_elem = SubElement(trans_elem, "Valor")
-        value_elem.text = transaction["Valor"]
+        value_elem.text = transaction.valor
         
         type_elem = SubElement(trans_elem, "Tipo")
-        type_elem.text = transaction["Tipo"]
+        type_elem.text = str(transaction.tipo)
     
     rough_string = tostring(root, 'utf-8')
     reparsed = minidom.parseString(rough_string)
@@ -37,13 +42,15 @@ def create_txt(data):
     """
     Cria um arquivo TXT a partir dos dados extraídos e retorna o TXT como BytesIO.
     """
-    txt_content = ""
-    for transaction in data:
-        txt_content += f"Data: {transaction['Data']}\n"
-        txt_content += f"Descrição: {transaction['Descrição']}\n"
-        txt_content += f"Valor: {transaction['Valor']}\n"
-        txt_content += f"Tipo: {transaction['Tipo']}\n"
-        txt_content += "-" * 50 + "\n"
+    separador = "-" * 50 + "\n"
+    txt_content = "".join(
+        f"Data: {transaction.data}\n"
+        f"Descrição: {transaction.descricao}\n"
+        f"Valor: {transaction.valor}\n"
+        f"Tipo: {transaction.tipo}\n"
+        + separador
+        for transaction in data
+    )
     
     output = BytesIO()
     output.write(txt_content.encode('utf-8'))
@@ -51,20 +58,70 @@ def create_txt(data):
     
     return output
 
+def csv_rows(data):
+    """Gera as linhas (Data, Descrição, Valor, Tipo) do CSV a partir das transações."""
+    for transaction in data:
+        yield transaction.campos
+
+def write_csv(data, destino):
+    """
+    Escreve as transações como CSV sem cabeçalho, separado por ponto e vírgula, em um
+    arquivo binário já aberto. Mesmo formato que xml_to_csv gerava (UTF-8 com BOM).
+    """
+    texto = io.TextIOWrapper(destino, encoding='utf-8-sig', newline='', write_through=True)
+    try:
+        writer = csv.writer(texto, delimiter=';', lineterminator=os.linesep)
+        writer.writerows(csv_rows(data))
+    finally:
+        texto.detach()
+
+class ResultadoExtrato:
+    """
+    Transações (Transacao) extraídas de um extrato.
+    CSV e JSON são gerados direto das transações; XML e TXT só quando pedidos.
+    """
+
+    def __init__(self, transacoes):
+        self.transacoes = transacoes
+
+    def __len__(self):
+        return len(self.transacoes)
+
+    def csv(self):
+        """CSV (bytes) no formato do extrator: Data;Descrição;Valor;Tipo, sem cabeçalho."""
+        output = BytesIO()
+        write_csv(self.transacoes, output)
+        return output.getvalue()
+
+    def gravar_csv(self, destino):
+        """Escreve o CSV linha a linha em um arquivo binário aberto, sem montar os bytes inteiros."""
+        write_csv(self.transacoes, destino)
+
+    def para_json(self):
+        """Lista de dicionários com as chaves usadas pelas APIs (data, descricao, valor, tipo)."""
+        return [
+            {'data': data, 'descricao': descricao, 'valor': valor, 'tipo': tipo}
+            for data, descricao, valor, tipo in csv_rows(self.transacoes)
+        ]
+
+    def xml(self):
+        return create_xml(self.transacoes)
+
+    def txt(self):
+        return create_txt(self.transacoes)
+
 def process_transactions(text, preprocess_func, extract_func):
     """
-    Processa o texto extraído de um extrato bancário e retorna XML e TXT.
+    Processa o texto extraído de um extrato bancário.
     Args:
         text (str): Texto extraído do extrato.
         preprocess_func (callable): Função de pré-processamento específica do banco.
         extract_func (callable): Função de extração de transações específica do banco.
     Returns:
-        tuple: (xml_data, txt_data) ou (None, None, None) se não houver transações.
+        ResultadoExtrato ou None se não houver transações.
     """
     transactions = preprocess_func(text)
-    data = extract_func(transactions)
+    data = de_dicts(extract_func(transactions) or ())
     if not data:
-        return None, None
-    xml_data = create_xml(data)
-    txt_data = create_txt(data)
-    return xml_data, txt_data
\ No newline at end of file
+        return None
+    return ResultadoExtrato(data)
@@ -1,59 +1,70 @@
-from .sicoob import process as process_sicoob
-from .sicoob2 import process as process_sicoob2
-from .sicoob3 import process as process_sicoob3
-from .itau import process as process_itau
-from .itau2 import process as process_itau2
-from .itau3 import process as process_itau3
-from .itau4 import process as process_itau4
-from .caixa import process as process_caixa
-from .caixa2 import process as process_caixa2
-from .inter import process as process_inter
-from .nubank import process as process_nubank
-from .bradesco import process as process_bradesco
-from .santander1 import process as process_santander1
-from .santander2 import process as process_santander2
-from .sicredi import process as process_sicredi
-from .pagbank import process as process_pagbank
-from .stone import process as process_stone
-from .bancobrasil1 import process as process_bancobrasil1
-from .bancobrasil2 import process as process_bancobrasil2
-from .ifood import process as process_ifood
-from .asaas import process as process_asaas
-from .cora import process as process_cora
-from .safra import process as process_safra
-from .infinitepay import process as process_infinitepay
-from .efi1 import process as process_efi1
-from .efi2 import process as process_efi2
-from .mercadopago import process as process_mercadopago
+import importlib
+from collections.abc import Mapping
 
-BANK_PROCESSORS = {
-    "Sicoob1": process_sicoob,
-    "Sicoob2": process_sicoob2,
-    "Sicoob3": process_sicoob3,
-    "Itaú": process_itau,
-    "Itaú2": process_itau2,
-    "Itaú3": process_itau3,
-    "Itaú4": process_itau4,
-    "Caixa": process_caixa,
-    "Caixa2": process_caixa2,
-    "Banco Inter": process_inter,
-    "Nubank": process_nubank,
-    "Bradesco": process_bradesco,
-    "Santander1": process_santander1,
-    "Santander2": process_santander2,
-    "Sicredi": process_sicredi,
-    "PagBank": process_pagbank,
-    "Stone": process_stone,
-    "Banco do Brasil1": process_bancobrasil1,
-    "Banco do Brasil2": process_bancobrasil2,
-    "iFood": process_ifood,
-    "Asaas": process_asaas,
-    "Cora": process_cora,
-    "Safra": process_safra,
-    "InfinitePay": process_infinitepay,
-    "Efi1": process_efi1,
-    "Efi2": process_efi2,
-    "Mercado Pago": process_mercadopago
+# Banco -> módulo do parser neste pacote
+MODULOS_BANCOS = {
+    "Sicoob1": "sicoob",
+    "Sicoob2": "sicoob2",
+    "Sicoob3": "sicoob3",
+    "Itaú": "itau",
+    "Itaú2": "itau2",
+    "Itaú3": "itau3",
+    "Itaú4": "itau4",
+    "Caixa": "caixa",
+    "Caixa2": "caixa2",
+    "Banco Inter": "inter",
+    "Nubank": "nubank",
+    "Bradesco": "bradesco",
+    "Santander1": "santander1",
+    "Santander2": "santander2",
+    "Sicredi": "sicredi",
+    "PagBank": "pagbank",
+    "Stone": "stone",
+    "Banco do Brasil1": "bancobrasil1",
+    "Banco do Brasil2": "bancobrasil2",
+    "iFood": "ifood",
+    "Asaas": "asaas",
+    "Cora": "cora",
+    "Safra": "safra",
+    "InfinitePay": "infinitepay",
+    "Efi1": "efi1",
+    "Efi2": "efi2",
+    "Mercado Pago": "mercadopago",
+}
+
+
+class ProcessadoresBancos(Mapping):
+    """
+    Banco -> função process do parser. O módulo de cada banco só é importado na
+    primeira vez que o banco é pedido (o servidor sobe sem carregar os 27 parsers)
+    e a função fica guardada para os próximos pedidos.
+    """
+
+    def __init__(self, modulos):
+        self._modulos = modulos
+        self._carregados = {}
+
+    def __getitem__(self, banco):
+        processor = self._carregados.get(banco)
+        if processor is None:
+            modulo = importlib.import_module(f".{self._modulos[banco]}", __name__)
+            processor = self._carregados[banco] = modulo.process
+        return processor
+
+    def __iter__(self):
+        return iter(self._modulos)
+
+    def __len__(self):
+        return len(self._modulos)
+
+
+BANK_PROCESSORS = ProcessadoresBancos(MODULOS_BANCOS)
+
+# Bancos cujo parser espera o texto extraído pelo PyMuPDF (read_pdf2);
+# os demais usam o texto do pdfplumber (read_pdf).
+BANKS_USING_PDF2 = {
+    'Asaas', 'Bradesco', 'Sicoob1', 'Sicoob2', 'Sicoob3', 'Stone', 'Sicredi', 'Itaú4',
+    'Banco do Brasil1', 'Safra', 'Santander2', 'Efi1', 'Efi2', 'Mercado Pago', 'Caixa2'
 }
 
 def get_processor(bank):
@@ -1,6 +1,60 @@
 import re
+from ..auxiliares.padroes import CONTA_COM_DIGITO, DATA_BR_LINHA as DATA_RE, VALOR, normalizar_linha
 from ..auxiliares.utils import process_transactions 
 
+# R$ ou R$ - seguido de valor
+VALOR_RE = re.compile(rf'R\$\s*-?{VALOR}')
+
+PREFIXOS_IGNORAR = (
+    "Data",
+    "Movimentações",
+    "Valor",
+    "ASAAS Gestão Financeira Instituição de Pagamento S.A.",
+    "CNPJ:"
+)
+
+TRECHOS_IGNORAR = (
+    "GERAR SAUDE E BEM ESTAR",
+    "Período",
+    "Extrato gerado em",
+    "Saldo inicial",
+    "Saldo final"
+)
+
+
+def _montar_transacao(transacao_atual):
+    """
+    Junta as linhas acumuladas de uma transação e devolve o dicionário com Data,
+    Descrição, Valor e Tipo, ou None se faltar data, valor ou descrição.
+    """
+    transacao_unificada = ' '.join(transacao_atual)
+    partes = transacao_unificada.split()
+    if not partes or not DATA_RE.match(partes[0]):
+        return None
+    valor_match = VALOR_RE.search(transacao_unificada)
+    if not valor_match:
+        return None
+    data = partes[0]
+    valor_str = valor_match.group(0)
+    tipo = 'D' if 'R$ -' in valor_str else 'C'
+    valor = valor_str.replace('R$', '').replace('-', '').strip()
+    if valor.endswith(",00"):
+        valor = valor[:-3]
+    elif valor.endswith("0"):
+        valor = valor[:-1]
+
+    transacao_sem_data = ' '.join(partes[1:])
+    descricao = transacao_sem_data.replace(valor_str, '').strip()
+
+    if descricao and valor:
+        return {
+            "Data": data,
+            "Descrição": descricao,
+            "Valor": valor,
+            "Tipo": tipo
+        }
+    return None
+
 def preprocess_text(text):
     """
     Pré-processa o texto do extrato ASAAS, extraindo e formatando todas as transações.
@@ -11,21 +65,21 @@ def preprocess_text(text):
     """
     # Dividir o texto em linhas
     linhas = text.splitlines()
+    # Primeira posição de cada linha, para achar a linha seguinte sem varrer a lista
+    posicoes = {}
+    for indice, linha in enumerate(linhas):
+        posicoes.setdefault(linha, indice)
     transactions = []
     transacao_atual = []
     processar_transacoes = False
-    date_pattern = re.compile(r'^\d{2}/\d{2}/\d{4}$')  # DD/MM/YYYY
-    value_pattern = re.compile(r'R\$\s*-?\d{1,3}(?:\.\d{3})*,\d{2}')  # R$ ou R$ - seguido de valor
     
     for linha in linhas:
         linha = linha.strip()
         if not linha:
             continue
         
-        # Corrigir tabulações nos valores (ex.: 1.055\t00 -> 1.055,00)
-        linha = re.sub(r'(\d)\t(\d)', r'\1,\2', linha)
-        # Normalizar espaços
-        linha = re.sub(r'\s+', ' ', linha).strip()
+        # Corrigir tabulações nos valores (ex.: 1.055\t00 -> 1.055,00) e normalizar espaços
+        linha = normalizar_linha(linha)
         
         # Verificar se encontramos a linha com "Valor" para começar o processamento
         if "Valor" == linha:
@@ -37,109 +91,38 @@ def preprocess_text(text):
             continue
         
         # Ignorar linhas que começam com palavras específicas
-        if any(linha.startswith(phrase) for phrase in [
-            "Data",
-            "Movimentações",
-            "Valor",
-            "ASAAS Gestão Financeira Instituição de Pagamento S.A.",
-            "CNPJ:"
-        ]):
+        if linha.startswith(PREFIXOS_IGNORAR):
             continue
         
         # Ignorar cabeçalhos, rodapés, saldos e linhas com "Conta" seguido de número com hífen
-        if any(phrase in linha for phrase in [
-            "GERAR SAUDE E BEM ESTAR",
-            "Período",
-            "Extrato gerado em",
-            "Saldo inicial",
-            "Saldo final"
-        ]) or re.search(r'Conta\s+\d+-\d', linha):
+        if any(phrase in linha for phrase in TRECHOS_IGNORAR) or CONTA_COM_DIGITO.search(linha):
             continue
         
         # Adicionar linha à transação atual
         transacao_atual.append(linha)
         
         # Verificar se a linha contém um valor (indica fim da transação)
-        if value_pattern.search(linha):
-            transacao_unificada = ' '.join(transacao_atual)
-            partes = transacao_unificada.split()
-            if partes and date_pattern.match(partes[0]):
-                data = partes[0]
-                valor_match = value_pattern.search(transacao_unificada)
-                valor_str = valor_match.group(0)
-                tipo = 'D' if 'R$ -' in valor_str else 'C'
-                valor = valor_str.replace('R$', '').replace('-', '').strip()
-                if valor.endswith(",00"):
-                    valor = valor[:-3]
-                elif valor.endswith("0"):
-                    valor = valor[:-1]
-                
-                transacao_sem_data = ' '.join(partes[1:])
-                descricao = transacao_sem_data.replace(valor_str, '').strip()
-                
-                if descricao and valor:
-                    transactions.append({
-                        "Data": data,
-                        "Descrição": descricao,
-                        "Valor": valor,
-                        "Tipo": tipo
-                    })
+        if VALOR_RE.search(linha):
+            transacao = _montar_transacao(transacao_atual)
+            if transacao:
+                transactions.append(transacao)
             transacao_atual = []
         
         # Se a próxima linha for uma data, resetar transacao_atual
-        elif transacao_atual and len(linhas) > linhas.index(linha) + 1:
-            proxima_linha = linhas[linhas.index(linha) + 1].strip()
-            if date_pattern.match(proxima_linha):
-                transacao_unificada = ' '.join(transacao_atual)
-                partes = transacao_unificada.split()
-                if partes and date_pattern.match(partes[0]) and value_pattern.search(transacao_unificada):
-                    data = partes[0]
-                    valor_match = value_pattern.search(transacao_unificada)
-                    valor_str = valor_match.group(0)
-                    tipo = 'D' if 'R$ -' in valor_str else 'C'
-                    valor = valor_str.replace('R$', '').replace('-', '').strip()
-                    if valor.endswith(",00"):
-                        valor = valor[:-3]
-                    elif valor.endswith("0"):
-                        valor = valor[:-1]
-                    
-                    transacao_sem_data = ' '.join(partes[1:])
-                    descricao = transacao_sem_data.replace(valor_str, '').strip()
-                    
-                    if descricao and valor:
-                        transactions.append({
-                            "Data": data,
-                            "Descrição": descricao,
-                            "Valor": valor,
-                            "Tipo": tipo
-                        })
+        elif transacao_atual:
+            posicao = posicoes.get(linha)
+            if posicao is not None and len(linhas) > posicao + 1 \
+                    and DATA_RE.match(linhas[posicao + 1].strip()):
+                transacao = _montar_transacao(transacao_atual)
+                if transacao:
+                    transactions.append(transacao)
                 transacao_atual = []
     
     # Processar a última transação, se houver
     if transacao_atual:
-        transacao_unificada = ' '.join(transacao_atual)
-        partes = transacao_unificada.split()
-        if partes and date_pattern.match(partes[0]) and value_pattern.search(transacao_unificada):
-            data = partes[0]
-            valor_match = value_pattern.search(transacao_unificada)
-            valor_str = valor_match.group(0)
-            tipo = 'D' if 'R$ -' in valor_str else 'C'
-            valor = valor_str.replace('R$', '').replace('-', '').strip()
-            if valor.endswith(",00"):
-                valor = valor[:-3]
-            elif valor.endswith("0"):
-                valor = valor[:-1]
-            
-            transacao_sem_data = ' '.join(partes[1:])
-            descricao = transacao_sem_data.replace(valor_str, '').strip()
-            
-            if descricao and valor:
-                transactions.append({
-                    "Data": data,
-                    "Descrição": descricao,
-                    "Valor": valor,
-                    "Tipo": tipo
-                })
+        transacao = _montar_transacao(transacao_atual)
+        if transacao:
+            transactions.append(transacao)
     
     return transactions
 
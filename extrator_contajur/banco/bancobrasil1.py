@@ -1,4 +1,4 @@
-import re
+from ..auxiliares.padroes import DATA_BR, VALOR_BR
 from ..auxiliares.utils import process_transactions 
 
 def preprocess_text(text):
@@ -9,12 +9,11 @@ def preprocess_text(text):
     Remove transações duplicadas (mesma data, descrição, valor e tipo).
     """
     # Dividir o texto em transações com base no padrão de data (DD/MM/YYYY)
-    date_pattern = re.compile(r'\d{2}/\d{2}/\d{4}')
     transactions = []
 
     # Dividir o texto em partes com base nas datas
-    parts = date_pattern.split(text)
-    dates = date_pattern.findall(text)
+    parts = DATA_BR.split(text)
+    dates = DATA_BR.findall(text)
     
     # Associar cada parte à sua data correspondente
     for date, part in zip(dates, parts[1:]):  # Ignorar a primeira parte (antes da primeira data)
@@ -29,12 +28,11 @@ def preprocess_text(text):
             continue
         
         # Encontrar o primeiro valor monetário e seu tipo
-        value_pattern = re.compile(r'\d{1,3}(?:\.\d{3})*,\d{2}')
         valor = None
         tipo = None
         idx_valor = -1
         for i, parte in enumerate(partes):
-            if value_pattern.match(parte):
+            if VALOR_BR.match(parte):
                 valor = parte
                 idx_valor = i
                 if i + 1 < len(partes):
@@ -50,7 +48,7 @@ def preprocess_text(text):
         idx_fim = idx_valor + 2  # Após o valor e tipo
         # Verificar se há um segundo valor monetário seguido de tipo
         for i in range(idx_valor + 2, len(partes)):
-            if value_pattern.match(partes[i]):
+            if VALOR_BR.match(partes[i]):
                 idx_fim = i + 2  # Pular o segundo valor e seu tipo
                 break
         desc_final = ' '.join(partes[idx_fim:]).strip()
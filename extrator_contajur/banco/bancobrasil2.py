@@ -1,6 +1,14 @@
 import re
+from ..auxiliares.padroes import DATA_BR, DATA_BR_ANO_CURTO_INICIO as DATA_RE, VALOR_BR, normalizar_linha
 from ..auxiliares.utils import process_transactions  
 
+# Marcadores de cabeçalho
+PADRAO_CABECALHO_1 = "Dia Lote Documento Histórico Valor"
+PADRAO_CABECALHO_2 = "Dia Histórico Valor"
+
+SALDO_RE = re.compile(r'saldo anterior|s a l d o|total aplicações', re.IGNORECASE)
+INDESEJADO_RE = re.compile(r'saldo anterior|s a l d o|total aplicações|limite ouro empresarial', re.IGNORECASE)
+
 def preprocess_text(text):
     """
     Pré-processa o texto do extrato para extrair transações, ignorando cabeçalho e rodapé.
@@ -14,25 +22,18 @@ def preprocess_text(text):
     transacao_atual = []
     encontrou_marcador_inicio = False
     ignorar_ate_data = False
-    date_pattern = re.compile(r'^\d{2}/\d{2}/\d{2,4}')  # Aceita DD/MM/YY e DD/MM/YYYY
-    
-    # Marcadores de cabeçalho
-    PADRAO_CABECALHO_1 = "Dia Lote Documento Histórico Valor"
-    PADRAO_CABECALHO_2 = "Dia Histórico Valor"
 
     for linha in linhas:
         linha = linha.strip()
         if not linha:
             continue
         
-        # Corrigir tabulações nos valores (ex.: 2.865\t91 -> 2.865,91)
-        linha = re.sub(r'(\d)\t(\d)', r'\1,\2', linha)
-        # Normalizar espaços
-        linha = re.sub(r'\s+', ' ', linha).strip()
+        # Corrigir tabulações nos valores (ex.: 2.865\t91 -> 2.865,91) e normalizar espaços
+        linha = normalizar_linha(linha)
         
         # Verificar se está ignorando até encontrar uma data (geralmente depois de um cabeçalho de nova página)
         if ignorar_ate_data:
-            if date_pattern.match(linha):
+            if DATA_RE.match(linha):
                 ignorar_ate_data = False
             else:
                 continue
@@ -52,11 +53,11 @@ def preprocess_text(text):
             continue
         
         # Ignorar linhas com "S A L D O" ou "Saldo Anterior" ou "Total Aplicações"
-        if re.search(r'saldo anterior|s a l d o|total aplicações', linha, re.IGNORECASE):
+        if SALDO_RE.search(linha):
             continue
         
         # Verificar se a linha começa com uma data
-        if date_pattern.match(linha):
+        if DATA_RE.match(linha):
             # Processar a transação acumulada, se existir
             if transacao_atual:
                 transacao_unificada = ' '.join(transacao_atual)
@@ -75,8 +76,7 @@ def preprocess_text(text):
             transactions.append(dicionario)
     
     # Filtrar linhas indesejadas nos dicionários (segurança)
-    padrao_indesejado = re.compile(r'saldo anterior|s a l d o|total aplicações|limite ouro empresarial', re.IGNORECASE)
-    transactions = [t for t in transactions if not padrao_indesejado.search(t['Descrição'])]
+    transactions = [t for t in transactions if not INDESEJADO_RE.search(t['Descrição'])]
     
     return transactions
 
@@ -88,12 +88,8 @@ def extrair_dicionario(transacao):
     if len(partes) < 4:  # Precisa ter pelo menos data, descrição (mínimo 1), valor e tipo
         return None
     
-    # Padrões Regex
-    date_pattern = re.compile(r'^\d{2}/\d{2}/\d{2,4}')
-    value_pattern = re.compile(r'(\d{1,3}(?:\.\d{3})*,\d{2})')
-    
     # 1. Extrair a data
-    if not date_pattern.match(partes[0]):
+    if not DATA_RE.match(partes[0]):
         return None
     
     data = partes[0]
@@ -103,9 +99,9 @@ def extrair_dicionario(transacao):
         data = data[:6] + '20' + data[6:]
     elif len(data) > 10 and data.count('/') == 2:
          # Tenta isolar DD/MM/YYYY de lixos anexados
-         match_date_full = re.search(r'(\d{2}/\d{2}/\d{4})', data)
+         match_date_full = DATA_BR.search(data)
          if match_date_full:
-             data = match_date_full.group(1)
+             data = match_date_full.group(0)
              # Reconstroi as partes para incluir o lixo na descrição
              resto = partes[0].replace(data, '').strip()
              partes.pop(0)
@@ -119,10 +115,10 @@ def extrair_dicionario(transacao):
     idx_valor = -1
     
     for i, parte in enumerate(partes):
-        match = value_pattern.match(parte)
+        match = VALOR_BR.match(parte)
         if match:
             # Encontrou o valor. Verifica o tipo na próxima parte.
-            valor = match.group(1)
+            valor = match.group(0)
             idx_valor = i
             
             # O tipo é a parte seguinte (ex: (+), (-))
@@ -1,7 +1,48 @@
 import re
 # A importação abaixo é relativa à estrutura do seu projeto
+from ..auxiliares.padroes import CNPJ, DATA_BR
 from ..auxiliares.utils import process_transactions 
 
+# Palavras-chave para filtrar linhas irrelevantes
+PALAVRAS_IGNORAR = ('Folha', 'Nome do usuário', 'Data da operação', 'Os dados acima')
+
+# Palavras a serem removidas da descrição, na ordem em que são aplicadas
+# (remover uma pode juntar as partes de outra, ex.: "Crédito Dcto. (R$)")
+REMOVER_DESCRICAO = [
+    r'\bDcto\.\s*',              # Corresponde a "Dcto." com possíveis espaços
+    r'\bCrédito\s*\(R\$\)\s*',   # Corresponde a "Crédito (R$)" com espaços
+    r'\bDébito\s*\(R\$\)\s*',    # Corresponde a "Débito (R$)" com espaços
+    r'\bSaldo\s*\(R\$\)\s*',     # Corresponde a "Saldo (R$)" com espaços
+    r'\bÚltimos\s*Lançamentos\b',
+    r'\bData\b',
+    r'\bLançamento\b'
+]
+# Busca única por qualquer uma delas: a maioria das linhas não tem nenhuma
+REMOVER_DESCRICAO_RE = re.compile('|'.join(REMOVER_DESCRICAO), re.IGNORECASE)
+REMOVER_DESCRICAO = [re.compile(padrao, re.IGNORECASE) for padrao in REMOVER_DESCRICAO]
+
+# Cabeçalhos/rodapés genéricos
+IGNORAR_RE = re.compile(
+    rf'CNPJ:\s*{CNPJ}'                                  # CNPJ
+    r'|AGENCIA:\s*\d{4}-\d'                              # Agência
+    r'|CONTA:\s*\d+-\d'                                  # Conta
+    r'|\d{2}/\d{2}/\d{4}\s*-\s*\d{2}/\d{2}/\d{4}'        # Período (ex.: 01/04/2025 - 30/04/2025)
+)
+
+# Informações de empresa/CNPJ no início da linha
+LIMPEZA_CABECALHO_RE = re.compile(rf'^.*?CNPJ:\s*{CNPJ}\s*\|?\s*')
+
+# Valores monetários
+VALOR_MONETARIO_RE = re.compile(r'^-?\d+\.\d{3},\d{2}$|^-?\d+,\d{2}$')
+
+
+def _limpar_descricao(texto):
+    if REMOVER_DESCRICAO_RE.search(texto):
+        for padrao in REMOVER_DESCRICAO:
+            texto = padrao.sub('', texto)
+    return ' '.join(texto.split())
+
+
 def preprocess_text(text):
     """
     Pré-processa o texto do extrato do Bradesco para dividir transações, ignorando cabeçalho e rodapé.
@@ -12,37 +53,6 @@ def preprocess_text(text):
     """
     lines = [line.strip() for line in text.splitlines() if line.strip()]
     
-    # Palavras-chave para filtrar linhas irrelevantes
-    palavras_ignorar = [
-        'Folha', 'Nome do usuário',
-        'Data da operação', 'Os dados acima'
-    ]
-    
-    # Palavras a serem removidas da descrição
-    palavras_remover_descricao = [
-        r'\bDcto\.\s*',              # Corresponde a "Dcto." com possíveis espaços
-        r'\bCrédito\s*\(R\$\)\s*',   # Corresponde a "Crédito (R$)" com espaços
-        r'\bDébito\s*\(R\$\)\s*',    # Corresponde a "Débito (R$)" com espaços
-        r'\bSaldo\s*\(R\$\)\s*',     # Corresponde a "Saldo (R$)" com espaços
-        r'\bÚltimos\s*Lançamentos\b',
-        r'\bData\b',
-        r'\bLançamento\b'
-    ]
-    
-    # Padrões regex para identificar cabeçalhos/rodapés genéricos
-    padroes_ignorar = [
-        r'CNPJ:\s*\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2}',  # CNPJ
-        r'AGENCIA:\s*\d{4}-\d',                      # Agência
-        r'CONTA:\s*\d+-\d',                          # Conta
-        r'\d{2}/\d{2}/\d{4}\s*-\s*\d{2}/\d{2}/\d{4}' # Período (ex.: 01/04/2025 - 30/04/2025)
-    ]
-    
-    # Padrão para limpar informações de empresa/CNPJ no início da linha
-    padrao_limpeza_cabecalho = r'^.*?CNPJ:\s*\d{2}\.\d{3}\.\d{3}/\d{4}-\d{2}\s*\|?\s*'
-    
-    # Padrão para valores monetários
-    padrao_valor_monetario = r'^-?\d+\.\d{3},\d{2}$|^-?\d+,\d{2}$'
-    
     transactions = []
     i = 0
     found_saldo_anterior = False
@@ -54,7 +64,7 @@ def preprocess_text(text):
         linha = lines[i].strip()
         
         # Ignorar linhas vazias ou que contenham palavras-chave irrelevantes
-        if not linha or any(palavra in linha for palavra in palavras_ignorar):
+        if not linha or any(palavra in linha for palavra in PALAVRAS_IGNORAR):
             i += 1
             continue
         
@@ -66,12 +76,12 @@ def preprocess_text(text):
         # Parar ao encontrar "SALDO INVEST FÁCIL" e a próxima linha for um valor monetário
         if 'SALDO INVEST FÁCIL' in linha and i + 1 < len(lines):
             proxima_linha = lines[i + 1].strip()
-            if re.match(padrao_valor_monetario, proxima_linha):
+            if VALOR_MONETARIO_RE.match(proxima_linha):
                 break
         
         # Limpar informações de cabeçalho (ex.: "NOME DA EMPRESA | CNPJ: ...")
-        linha_limpa = re.sub(padrao_limpeza_cabecalho, '', linha).strip()
-        if not linha_limpa or any(re.search(padrao, linha_limpa) for padrao in padroes_ignorar):
+        linha_limpa = LIMPEZA_CABECALHO_RE.sub('', linha).strip()
+        if not linha_limpa or IGNORAR_RE.search(linha_limpa):
             i += 1
             continue
         
@@ -84,14 +94,11 @@ def preprocess_text(text):
         # Após encontrar "SALDO ANTERIOR", processar as linhas
         if found_saldo_anterior:
             # Verificar se a linha é uma data (formato DD/MM/YYYY)
-            if re.match(r'\d{2}/\d{2}/\d{4}', linha_limpa):
+            if DATA_BR.match(linha_limpa):
                 # Se já existe uma transação acumulada com pelo menos uma descrição e um valor monetário
                 if current_transacao and found_first_value:
                     # A descrição é tudo até o primeiro valor monetário
-                    descricao = ' '.join(current_transacao[:-1]).strip()
-                    for palavra in palavras_remover_descricao:
-                        descricao = re.sub(palavra, '', descricao, flags=re.IGNORECASE)
-                    descricao = ' '.join(descricao.split())
+                    descricao = _limpar_descricao(' '.join(current_transacao[:-1]))
                     valor = current_transacao[-1].replace("-", "").strip()
                     tipo = "D" if current_transacao[-1].startswith("-") else "C"
                     if descricao and not 'Total' in descricao:
@@ -107,7 +114,7 @@ def preprocess_text(text):
                 found_first_value = False
             elif current_data:  # Linhas de transação
                 # Verificar se a linha é um valor numérico (crédito, débito ou saldo)
-                if re.match(padrao_valor_monetario, linha_limpa):
+                if VALOR_MONETARIO_RE.match(linha_limpa):
                     if found_first_value:
                         # Se já encontramos o primeiro valor monetário, ignorar o segundo (saldo)
                         current_transacao = []  # Reinicia para a próxima transação
@@ -118,10 +125,7 @@ def preprocess_text(text):
                         found_first_value = True
                         # Processar a transação imediatamente
                         if current_transacao:
-                            descricao = ' '.join(current_transacao[:-1]).strip()
-                            for palavra in palavras_remover_descricao:
-                                descricao = re.sub(palavra, '', descricao, flags=re.IGNORECASE)
-                            descricao = ' '.join(descricao.split())
+                            descricao = _limpar_descricao(' '.join(current_transacao[:-1]))
                             valor = current_transacao[-1].replace("-", "").strip()
                             tipo = "D" if current_transacao[-1].startswith("-") else "C"
                             if descricao and not 'Total' in descricao:
@@ -135,10 +139,7 @@ def preprocess_text(text):
                             found_first_value = False
                 else:
                     # Acumular tudo que não é valor monetário como parte da descrição
-                    linha_descricao = linha_limpa
-                    for palavra in palavras_remover_descricao:
-                        linha_descricao = re.sub(palavra, '', linha_descricao, flags=re.IGNORECASE)
-                    linha_descricao = ' '.join(linha_descricao.split())
+                    linha_descricao = _limpar_descricao(linha_limpa)
                     if linha_descricao:
                         current_transacao.append(linha_descricao)
         
@@ -147,10 +148,7 @@ def preprocess_text(text):
     # Adicionar a última transação, se houver
     if current_transacao and found_first_value and current_data:
         # A descrição é tudo até o primeiro valor monetário
-        descricao = ' '.join(current_transacao[:-1]).strip()
-        for palavra in palavras_remover_descricao:
-            descricao = re.sub(palavra, '', descricao, flags=re.IGNORECASE)
-        descricao = ' '.join(descricao.split())
+        descricao = _limpar_descricao(' '.join(current_transacao[:-1]))
         valor = current_transacao[-1].replace("-", "").strip()
         tipo = "D" if current_transacao[-1].startswith("-") else "C"
         if descricao and not 'Total' in descricao:
@@ -1,6 +1,10 @@
 import re
+from ..auxiliares.padroes import DATA_BR_INICIO, VALOR
 from ..auxiliares.utils import process_transactions
 
+# Valor seguido do tipo: -1.012,29 D
+VALOR_TIPO_RE = re.compile(rf"(-?{VALOR})\s+[CD]")
+
 def preprocess_text(text):
     """
     Pré-processa o texto do extrato da Caixa para dividir transações, ignorando cabeçalho e rodapé.
@@ -25,9 +29,6 @@ def preprocess_text(text):
     
     transaction_lines = lines[start_index:end_index]
     
-    date_pattern = r"^\d{2}/\d{2}/\d{4}"
-    value_pattern = r"(-?\d{1,3}(?:\.\d{3})*,\d{2})\s+[CD]"
-    
     transactions = []
     
     for line in transaction_lines:
@@ -35,10 +36,12 @@ def preprocess_text(text):
         if "SALDO DIA" in line or "Saldo" in line or not line:
             continue
         
-        date_match = re.match(date_pattern, line)
-        value_matches = list(re.finditer(value_pattern, line))
+        date_match = DATA_BR_INICIO.match(line)
+        if not date_match:
+            continue
+        value_matches = list(VALOR_TIPO_RE.finditer(line))
         
-        if date_match and value_matches:
+        if value_matches:
             date = date_match.group(0)
             value = value_matches[0].group(1)
             tipo = value_matches[0].group(0)[-1]  # 'C' ou 'D'
@@ -13,10 +13,16 @@ Estrutura de cada transação (cada campo em linha separada):
 """
 
 import re
+from ..auxiliares.linhas import Classe, Tokenizador
+from ..auxiliares.padroes import DATA, DATA_BR_LINHA
 from ..auxiliares.utils import process_transactions
 
 # Linha só com data: DD/MM/YYYY (sem mais nada)
-DATE_ONLY_RE  = re.compile(r'^(\d{2}/\d{2}/\d{4})$')
+DATE_ONLY_RE  = DATA_BR_LINHA
+# Timestamp de impressão com vírgula: DD/MM/YYYY,HH:MM:SS
+TIMESTAMP_RE  = re.compile(rf'^{DATA},')
+# Fragmento de CNPJ quebrado em linhas: 1-3 dígitos
+FRAGMENTO_RE  = re.compile(r'^\d{1,3}$')
 # Data efetiva isolada: DD/MM HH:MM
 EFF_DATE_RE   = re.compile(r'^\d{2}/\d{2}\s+\d{2}:\d{2}$')
 # Número de documento: 4-8 dígitos isolados (ex: 021440, 000033)
@@ -36,16 +42,17 @@ SKIP_RE = re.compile(
     re.IGNORECASE
 )
 
+# Linhas descartadas antes de qualquer outra verificação
+IGNORAR_RE = re.compile(
+    rf'(?i:{SKIP_RE.pattern})|{TIMESTAMP_RE.pattern}|{SALDO_LINE_RE.pattern}|{ECODE_RE.pattern}'
+)
+
+TOKENIZADOR = Tokenizador(cabecalho=IGNORAR_RE, data=DATE_ONLY_RE, valor=VALUE_LINE_RE)
 
-def preprocess_text(text):
-    lines = [l.strip() for l in text.splitlines() if l.strip()]
 
+def preprocess_text(text):
     print("\n" + "="*60)
-    print(f"[CAIXA2 DEBUG] Total de linhas: {len(lines)}")
     print("[CAIXA2 DEBUG] Primeiras 60 linhas:")
-    for i, l in enumerate(lines[:60], 1):
-        print(f"  {i:>3}: {repr(l)}")
-    print("="*60)
 
     transactions  = []
     current_date  = None
@@ -53,56 +60,52 @@ def preprocess_text(text):
     expect_eff    = False   # acabou de ver data, espera DD/MM HH:MM
     expect_docnum = False   # acabou de ver data efetiva, espera docnum
     in_trans      = False   # dentro de transação, acumulando descrição
-
-    for line in lines:
-
-        # ── Cabeçalhos / rodapés / linhas fixas ──────────────────────────
-        if SKIP_RE.match(line):
-            continue
-
-        # ── Timestamp de impressão com vírgula (DD/MM/YYYY,HH:MM:SS) ─────
-        if re.match(r'^\d{2}/\d{2}/\d{4},', line):
-            continue
-
-        # ── Linha de saldo (R$\xa0X,XX C|D) ──────────────────────────────
-        if SALDO_LINE_RE.match(line):
-            continue
-
-        # ── E-code / chave Pix ────────────────────────────────────────────
-        if ECODE_RE.match(line):
+    total_linhas  = 0
+
+    for linha in TOKENIZADOR(text):
+        line = linha.texto
+        total_linhas += 1
+        if total_linhas <= 60:
+            print(f"  {total_linhas:>3}: {repr(line)}")
+            if total_linhas == 60:
+                print("="*60)
+
+        # ── Cabeçalhos / rodapés / linhas fixas, timestamp de impressão,
+        #    linha de saldo (R$\xa0X,XX C|D) e e-code / chave Pix ───────────
+        if linha.classe is Classe.CABECALHO:
             continue
 
         # ── Fragmento de CNPJ (1-3 dígitos) quando NÃO esperamos docnum ──
-        if re.match(r'^\d{1,3}$', line) and not expect_docnum:
+        if linha.classe is Classe.TEXTO and FRAGMENTO_RE.match(line) and not expect_docnum:
             continue
 
         # ── Linha só com data (DD/MM/YYYY) ───────────────────────────────
-        m = DATE_ONLY_RE.match(line)
-        if m:
-            current_date  = m.group(1)
+        if linha.classe is Classe.DATA:
+            current_date  = linha.match.group(1)
             expect_eff    = True
             expect_docnum = False
             in_trans      = False
             desc_parts    = []
             continue
 
-        # ── Data efetiva (DD/MM HH:MM) ────────────────────────────────────
-        if EFF_DATE_RE.match(line):
-            if expect_eff:
-                expect_eff    = False
-                expect_docnum = True
-            continue
-
-        # ── Número de documento ───────────────────────────────────────────
-        if DOCNUM_RE.match(line) and expect_docnum:
-            expect_docnum = False
-            in_trans      = True
-            desc_parts    = []
-            continue
+        if linha.classe is Classe.TEXTO:
+            # ── Data efetiva (DD/MM HH:MM) ────────────────────────────────
+            if EFF_DATE_RE.match(line):
+                if expect_eff:
+                    expect_eff    = False
+                    expect_docnum = True
+                continue
+
+            # ── Número de documento ───────────────────────────────────────
+            if DOCNUM_RE.match(line) and expect_docnum:
+                expect_docnum = False
+                in_trans      = True
+                desc_parts    = []
+                continue
 
         # ── Linha de valor ────────────────────────────────────────────────
-        mv = VALUE_LINE_RE.match(line)
-        if mv and in_trans and current_date:
+        if linha.classe is Classe.VALOR and in_trans and current_date:
+            mv = linha.match
             is_debit = mv.group(1) is not None
             valor    = mv.group(2)
             if valor.endswith(',00'):
@@ -123,6 +126,9 @@ def preprocess_text(text):
         if in_trans and len(line) > 1:
             desc_parts.append(line)
 
+    if total_linhas < 60:
+        print("="*60)
+    print(f"[CAIXA2 DEBUG] Total de linhas: {total_linhas}")
     print(f"[CAIXA2 DEBUG] Transações encontradas: {len(transactions)}")
     return transactions
 
@@ -1,6 +1,10 @@
 import re
+from ..auxiliares.padroes import DATA_BR_INICIO, VALOR
 from ..auxiliares.utils import process_transactions  
 
+# Valor com sinal: + R$ 1.012,29 / - R$ 50,00
+VALOR_RE = re.compile(rf'[+-]\s*R\$\s*{VALOR}')
+
 def preprocess_text(text):
     """
     Processa o texto do extrato Cora, extraindo e formatando transações.
@@ -11,8 +15,6 @@ def preprocess_text(text):
     transacoes = []
     ultima_data = None
     encontrou_transacoes = False
-    date_pattern = re.compile(r'^\d{2}/\d{2}/\d{4}')
-    value_pattern = re.compile(r'[+-]\s*R\$\s*\d{1,3}(?:\.\d{3})*,\d{2}')
     
     for linha in linhas:
         linha = linha.strip()
@@ -28,17 +30,17 @@ def preprocess_text(text):
             continue
         
         # Verificar se a linha começa com uma data
-        if date_pattern.match(linha):
+        if DATA_BR_INICIO.match(linha):
             # Atualizar a última data válida
             ultima_data = linha.split()[0]
             continue
         
         # Verificar se é uma transação (contém + R$ ou - R$)
-        if value_pattern.search(linha):
+        if VALOR_RE.search(linha):
             if not ultima_data:
                 continue  # Ignorar transações sem data associada
             # Extrair valor
-            valor_match = value_pattern.search(linha)
+            valor_match = VALOR_RE.search(linha)
             valor_str = valor_match.group(0)
             # Determinar tipo
             tipo = 'C' if '+ R$' in valor_str else 'D'
@@ -1,4 +1,4 @@
-import re
+from ..auxiliares.padroes import DATA_BR_LINHA, VALOR_BR_LINHA
 from ..auxiliares.utils import process_transactions
 
 def preprocess_text(text):
@@ -12,8 +12,6 @@ def preprocess_text(text):
     transacao_atual = []
     data_atual = None
     
-    data_pattern = re.compile(r'^\d{2}/\d{2}/\d{4}$')
-    valor_pattern = re.compile(r'^([+-]?\d{1,3}(?:\.\d{3})*,\d{2})$')
     
     for linha in linhas:
         if ignorar_proximas > 0:
@@ -39,13 +37,13 @@ def preprocess_text(text):
 
         # Processa a transação
         # Se for uma data, inicia uma nova transação
-        if data_pattern.match(linha):
+        if DATA_BR_LINHA.match(linha):
             data_atual = linha
             transacao_atual = []
             continue
         
         # Se for um valor, finaliza a transação
-        valor_match = valor_pattern.match(linha)
+        valor_match = VALOR_BR_LINHA.match(linha)
         if valor_match:
             valor = valor_match.group(1)
             valor_formatado = valor.replace('-', '').replace('+', '')
@@ -1,6 +1,66 @@
 import re
+from ..auxiliares.padroes import CONTA_COM_DIGITO, DATA_BR_INICIO as DATA_RE, VALOR, normalizar_linha
 from ..auxiliares.utils import process_transactions
 
+# R$ ou -R$ seguido de valor
+VALOR_RE = re.compile(rf'(-?R\$\s*{VALOR})')
+
+TRECHOS_IGNORAR = (
+    "Extrato da Conta Digital iFood",
+    "Solicitado em",
+    "CNPJ",
+    "Período selecionado",
+    "Saldo disponível",
+    "IFOOD.COM AGENCIA",
+    "Em caso de dúvida",
+    "Saldo do dia",
+    "segunda a sexta",
+)
+
+
+def _montar_transacao(transacao_atual):
+    """
+    Junta as linhas acumuladas de uma transação e devolve o dicionário com Data,
+    Descrição, Valor e Tipo, ou None se faltar data, valor ou descrição.
+    """
+    transacao_unificada = ' '.join(transacao_atual)
+    
+    # Extrair data
+    partes = transacao_unificada.split()
+    if not partes or not DATA_RE.match(partes[0]):
+        return None
+    data = partes[0]
+    
+    # Extrair valor
+    valor_match = VALOR_RE.search(transacao_unificada)
+    if not valor_match:
+        return None
+    valor_str = valor_match.group(1)
+    
+    # Determinar tipo
+    tipo = 'D' if valor_str.startswith('-R$') else 'C'
+    
+    # Formatando valor
+    valor = valor_str.replace('R$', '').replace('-', '').strip()
+    if valor.endswith(",00"):
+        valor = valor[:-3]
+    elif valor.endswith("0"):
+        valor = valor[:-1]
+    
+    # Extrair descrição
+    transacao_sem_data = ' '.join(partes[1:])
+    descricao = transacao_sem_data.replace(valor_str, '').strip()
+    
+    # Criar dicionário da transação
+    if descricao and valor:
+        return {
+            "Data": data,
+            "Descrição": descricao,
+            "Valor": valor,
+            "Tipo": tipo
+        }
+    return None
+
 def preprocess_text(text):
     """
     Pré-processa o texto do extrato iFood, extraindo e formatando todas as transações.
@@ -13,22 +73,18 @@ def preprocess_text(text):
     transacao_atual = []
     encontrou_marcador_inicio = False
     ignorar_ate_data = False
-    date_pattern = re.compile(r'^\d{2}/\d{2}/\d{4}')  # DD/MM/YYYY
-    value_pattern = re.compile(r'(-?R\$\s*\d{1,3}(?:\.\d{3})*,\d{2})')  # R$ ou -R$ seguido de valor
     
     for linha in linhas:
         linha = linha.strip()
         if not linha:
             continue
         
-        # Corrigir tabulações nos valores (ex.: 1.055\t00 -> 1.055,00)
-        linha = re.sub(r'(\d)\t(\d)', r'\1,\2', linha)
-        # Normalizar espaços
-        linha = re.sub(r'\s+', ' ', linha).strip()
+        # Corrigir tabulações nos valores (ex.: 1.055\t00 -> 1.055,00) e normalizar espaços
+        linha = normalizar_linha(linha)
         
         # Verificar se está ignorando até encontrar uma data
         if ignorar_ate_data:
-            if date_pattern.match(linha):
+            if DATA_RE.match(linha):
                 ignorar_ate_data = False
             else:
                 continue
@@ -43,61 +99,16 @@ def preprocess_text(text):
             continue
         
         # Ignorar cabeçalhos, rodapés, saldos e linhas com "Conta" seguido de número com hífen
-        if any(phrase in linha for phrase in [
-            "Extrato da Conta Digital iFood",
-            "Solicitado em",
-            "CNPJ",
-            "Período selecionado",
-            "Saldo disponível",
-            "IFOOD.COM AGENCIA",
-            "Em caso de dúvida",
-            "Saldo do dia",
-            "segunda a sexta",
-        ]) or re.search(r'Conta\s+\d+-\d', linha):
+        if any(phrase in linha for phrase in TRECHOS_IGNORAR) or CONTA_COM_DIGITO.search(linha):
             continue
             
         # Verificar se a linha começa com uma data
-        if date_pattern.match(linha):
+        if DATA_RE.match(linha):
             # Processar a transação acumulada, se existir
             if transacao_atual:
-                transacao_unificada = ' '.join(transacao_atual)
-                
-                # Extrair data
-                partes = transacao_unificada.split()
-                if not partes or not date_pattern.match(partes[0]):
-                    transacao_atual = [linha]
-                    continue
-                data = partes[0]
-                
-                # Extrair valor
-                valor_match = value_pattern.search(transacao_unificada)
-                if not valor_match:
-                    transacao_atual = [linha]
-                    continue
-                valor_str = valor_match.group(1)
-                
-                # Determinar tipo
-                tipo = 'D' if valor_str.startswith('-R$') else 'C'
-                
-                # Formatando valor
-                valor = valor_str.replace('R$', '').replace('-', '').strip()
-                if valor.endswith(",00"):
-                    valor = valor[:-3]
-                elif valor.endswith("0"):
-                    valor = valor[:-1]
-                
-                # Extrair descrição
-                transacao_sem_data = ' '.join(partes[1:])
-                descricao = transacao_sem_data.replace(valor_str, '').strip()
-                
-                # Criar dicionário da transação
-                if descricao and valor:
-                    transactions.append({
-                        "Data": data,
-                        "Descrição": descricao,
-                        "Valor": valor,
-                        "Tipo": tipo
-                    })
+                transacao = _montar_transacao(transacao_atual)
+                if transacao:
+                    transactions.append(transacao)
             
             transacao_atual = [linha]
         else:
@@ -105,42 +116,9 @@ def preprocess_text(text):
     
     # Processar a última transação
     if transacao_atual:
-        transacao_unificada = ' '.join(transacao_atual)
-        
-        # Extrair data
-        partes = transacao_unificada.split()
-        if not partes or not date_pattern.match(partes[0]):
-            return transactions
-        data = partes[0]
-        
-        # Extrair valor
-        valor_match = value_pattern.search(transacao_unificada)
-        if not valor_match:
-            return transactions
-        valor_str = valor_match.group(1)
-        
-        # Determinar tipo
-        tipo = 'D' if valor_str.startswith('-R$') else 'C'
-        
-        # Formatando valor
-        valor = valor_str.replace('R$', '').replace('-', '').strip()
-        if valor.endswith(",00"):
-            valor = valor[:-3]
-        elif valor.endswith("0"):
-            valor = valor[:-1]
-        
-        # Extrair descrição
-        transacao_sem_data = ' '.join(partes[1:])
-        descricao = transacao_sem_data.replace(valor_str, '').strip()
-        
-        # Criar dicionário da transação
-        if descricao and valor:
-            transactions.append({
-                "Data": data,
-                "Descrição": descricao,
-                "Valor": valor,
-                "Tipo": tipo
-            })
+        transacao = _montar_transacao(transacao_atual)
+        if transacao:
+            transactions.append(transacao)
     
     return transactions
 
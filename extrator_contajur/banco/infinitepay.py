@@ -1,6 +1,30 @@
 import re
 from ..auxiliares.utils import process_transactions
 
+HEADER_TEXT = "Data Hora Tipo de transação Nome Detalhe Valor (R$)"
+SALDO_PATTERN = re.compile(r'^Saldo do dia\s+(?:R\$\s+)?[+-]?[\d,.]+$')
+FOOTER_START_PATTERN = re.compile(r'^A Central de Ajuda está disponível.*')
+
+MONTH_MAP = {
+    'Jan': '01', 'Fev': '02', 'Mar': '03', 'Abr': '04',
+    'Mai': '05', 'Jun': '06', 'Jul': '07', 'Ago': '08',
+    'Set': '09', 'Out': '10', 'Nov': '11', 'Dez': '12'
+}
+
+VALUE_REGEX = r'([+-]\d{1,3}(?:\.\d{3})*(?:,\d{2}))$'
+
+DATE_TRANSACTION_PATTERN = re.compile(
+    r'^(\d{2}/\d{2}/\d{4})\s+(\d{2}:\d{2})\s+(.*)\s+' + VALUE_REGEX
+)
+
+DATE_MONTH_TRANSACTION_PATTERN = re.compile(
+    r'^(\d{2})\s+([A-Z][a-z]{2}),?\s+(\d{4})\s+(\d{2}:\d{2})\s+(.*)\s+' + VALUE_REGEX
+)
+
+TIME_TRANSACTION_PATTERN = re.compile(
+    r'^(\d{2}:\d{2})\s+(.*)\s+' + VALUE_REGEX
+)
+
 def preprocess_text(text):
     """
     Pré-processa o texto do extrato InfinitePay (Cloudwalk) para extrair transações.
@@ -11,30 +35,6 @@ def preprocess_text(text):
     current_date = None
     pending_transaction = None
     
-    HEADER_TEXT = "Data Hora Tipo de transação Nome Detalhe Valor (R$)"
-    SALDO_PATTERN = re.compile(r'^Saldo do dia\s+(?:R\$\s+)?[+-]?[\d,.]+$')
-    FOOTER_START_PATTERN = re.compile(r'^A Central de Ajuda está disponível.*')
-    
-    MONTH_MAP = {
-        'Jan': '01', 'Fev': '02', 'Mar': '03', 'Abr': '04',
-        'Mai': '05', 'Jun': '06', 'Jul': '07', 'Ago': '08',
-        'Set': '09', 'Out': '10', 'Nov': '11', 'Dez': '12'
-    }
-    
-    VALUE_REGEX = r'([+-]\d{1,3}(?:\.\d{3})*(?:,\d{2}))$'
-    
-    DATE_TRANSACTION_PATTERN = re.compile(
-        r'^(\d{2}/\d{2}/\d{4})\s+(\d{2}:\d{2})\s+(.*)\s+' + VALUE_REGEX
-    )
-    
-    DATE_MONTH_TRANSACTION_PATTERN = re.compile(
-        r'^(\d{2})\s+([A-Z][a-z]{2}),?\s+(\d{4})\s+(\d{2}:\d{2})\s+(.*)\s+' + VALUE_REGEX
-    )
-    
-    TIME_TRANSACTION_PATTERN = re.compile(
-        r'^(\d{2}:\d{2})\s+(.*)\s+' + VALUE_REGEX
-    )
-    
     def normalize_date(day, month, year):
         month_num = MONTH_MAP.get(month, month)
         return f"{day}/{month_num}/{year}"
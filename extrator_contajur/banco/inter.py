@@ -1,6 +1,21 @@
 import re
+from ..auxiliares.padroes import VALOR
 from ..auxiliares.utils import process_transactions 
 
+# Mapa de meses para conversão de data (incluindo tratamento de acentuação no 'março' se for necessário)
+MESES = {
+    "janeiro": "01", "fevereiro": "02", "março": "03", "abril": "04", "maio": "05", "junho": "06",
+    "julho": "07", "agosto": "08", "setembro": "09", "outubro": "10", "novembro": "11", "dezembro": "12",
+    "marco": "03" # Adicionado para garantir o parse se o PDF extrair "Março" sem acento
+}
+
+# "5 de março de 2025"
+DATA_RE = re.compile(r"^(\d{1,2}) de ([A-Za-zç]+) de (\d{4})", re.IGNORECASE)
+VALOR_RE = re.compile(rf"([-]?R\$\s*{VALOR})")
+
+RODAPE = ("Fale com a gente", "SAC:", "Ouvidoria", "Deficiência de fala")
+SALDOS_CABECALHO = ("Saldo do dia", "Saldo por transação", "Solicitado em", "CPF/CNPJ", "Período", "Saldo total", "Saldo disponível", "Saldo bloqueado")
+
 def preprocess_text(text):
     """
     Pré-processa o texto do extrato do Banco Inter para extrair transações, ignorando cabeçalho e rodapé.
@@ -9,26 +24,16 @@ def preprocess_text(text):
     """
     lines = [line.strip() for line in text.splitlines() if line.strip()]
     
-    # Mapa de meses para conversão de data (incluindo tratamento de acentuação no 'março' se for necessário)
-    month_map = {
-        "janeiro": "01", "fevereiro": "02", "março": "03", "abril": "04", "maio": "05", "junho": "06",
-        "julho": "07", "agosto": "08", "setembro": "09", "outubro": "10", "novembro": "11", "dezembro": "12",
-        "marco": "03" # Adicionado para garantir o parse se o PDF extrair "Março" sem acento
-    }
-    
-    date_pattern = r"^(\d{1,2}) de ([A-Za-zç]+) de (\d{4})"
-    value_pattern = r"([-]?R\$\s*\d{1,3}(?:\.\d{3})*,\d{2})"
-    
     transactions = []
     current_date = None
     
     for line in lines:
         # Ignorar linhas de rodapé
-        if "Fale com a gente" in line or "SAC:" in line or "Ouvidoria" in line or "Deficiência de fala" in line:
+        if any(trecho in line for trecho in RODAPE):
             continue
         
         # Verificar se a linha é uma data
-        date_match = re.match(date_pattern, line, re.IGNORECASE)
+        date_match = DATA_RE.match(line)
         if date_match:
             day = date_match.group(1).zfill(2)  # Garantir dois dígitos
             month_name = date_match.group(2).lower()
@@ -37,19 +42,19 @@ def preprocess_text(text):
             if month_name == "março":
                 month_name = "marco"
             
-            month = month_map.get(month_name, "01")
+            month = MESES.get(month_name, "01")
             year = date_match.group(3)
             current_date = f"{day}/{month}/{year}"
             continue
         
         # Ignorar linhas de saldo ou cabeçalho
-        if any(keyword in line for keyword in ["Saldo do dia", "Saldo por transação", "Solicitado em", "CPF/CNPJ", "Período", "Saldo total", "Saldo disponível", "Saldo bloqueado"]):
+        if any(keyword in line for keyword in SALDOS_CABECALHO):
             continue
         
         # Processar linhas de transação
-        value_matches = list(re.finditer(value_pattern, line))
-        if value_matches and current_date:
-            value = value_matches[0].group(1)
+        value_match = VALOR_RE.search(line) if current_date else None
+        if value_match:
+            value = value_match.group(1)
             tipo = "D" if value.startswith("-") else "C"
             valor = value.replace("-", "").replace("R$", "").replace(" ", "").strip()
             
@@ -59,7 +64,7 @@ def preprocess_text(text):
             
             # Extrair descrição (tipo de transação + identificador)
             desc_start = 0
-            desc_end = value_matches[0].start()
+            desc_end = value_match.start()
             description = line[desc_start:desc_end].strip()
             
             # NOVO: Se a descrição for vazia, preencher com "-"
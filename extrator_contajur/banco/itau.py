@@ -1,6 +1,13 @@
 import re
+from ..auxiliares.padroes import MESES, MESES_ABREV, VALOR
 from ..auxiliares.utils import process_transactions
 
+PERIODO_RE = re.compile(r"lançamentos período: \d{2}/\d{2}/(\d{4}) até \d{2}/\d{2}/\d{4}")
+# Data no início da linha, seguida de espaço: "01 / abr " (grupo 1 é a data)
+DATA_RE = re.compile(rf"^(\d{{2}}\s*/\s*(?:{MESES_ABREV}))\s", re.IGNORECASE)
+DIA_MES_RE = re.compile(rf"(\d{{2}})/({MESES_ABREV})", re.IGNORECASE)
+VALOR_RE = re.compile(rf"-?{VALOR}")
+
 def preprocess_text(text):
     """
     Pré-processa o texto do Itaú para dividir transações, ignorando cabeçalho e rodapé.
@@ -12,14 +19,10 @@ def preprocess_text(text):
         Converte datas no formato DD/mes para DD/MM.
         Ex.: 01/abr -> 01/04, 31/mar -> 31/03
         """
-        month_map = {
-            "jan": "01", "fev": "02", "mar": "03", "abr": "04", "mai": "05", "jun": "06",
-            "jul": "07", "ago": "08", "set": "09", "out": "10", "nov": "11", "dez": "12"
-        }
-        match = re.match(r"(\d{2})/(jan|fev|mar|abr|mai|jun|jul|ago|set|out|nov|dez)", date_str, re.IGNORECASE)
+        match = DIA_MES_RE.match(date_str)
         if match:
             day = match.group(1)
-            month = month_map[match.group(2).lower()]
+            month = MESES[match.group(2).lower()]
             return f"{day}/{month}"
         return date_str
 
@@ -28,7 +31,7 @@ def preprocess_text(text):
     # Extrair o ano do período (ex.: "lançamentos período: 01/04/2025 até 30/04/2025")
     year = None
     for line in lines:
-        period_match = re.search(r"lançamentos período: \d{2}/\d{2}/(\d{4}) até \d{2}/\d{2}/\d{4}", line)
+        period_match = PERIODO_RE.search(line)
         if period_match:
             year = period_match.group(1)
             break
@@ -52,27 +55,24 @@ def preprocess_text(text):
     
     transaction_lines = lines[start_index:end_index]
     
-    date_pattern = r"^\d{2}\s*/\s*(?:jan|fev|mar|abr|mai|jun|jul|ago|set|out|nov|dez)\s"
-    value_pattern = r"-?\d{1,3}(?:\.\d{3})*,\d{2}"
-    
     transactions = []
     
     for line in transaction_lines:
         if "SALDO TOTAL DISPON" in line:
             continue
             
-        if re.match(date_pattern, line, re.IGNORECASE):
-            date_match = re.match(r"(\d{2}\s*/\s*(?:jan|fev|mar|abr|mai|jun|jul|ago|set|out|nov|dez))", line, re.IGNORECASE)
-            value_matches = list(re.finditer(value_pattern, line))
+        date_match = DATA_RE.match(line)
+        if date_match:
+            value_match = VALOR_RE.search(line)
             
-            if date_match and value_matches:
+            if value_match:
                 date = date_match.group(1).replace(" ", "")
                 date = convert_date_format(date)
                 # Adicionar o ano ao formato DD/MM/YYYY
                 date_with_year = f"{date}/{year}"
-                value = value_matches[0].group()
-                desc_start = date_match.end()
-                desc_end = value_matches[0].start()
+                value = value_match.group()
+                desc_start = date_match.end(1)
+                desc_end = value_match.start()
                 description = line[desc_start:desc_end].strip()
                 
                 tipo = "D" if value.startswith("-") else "C"
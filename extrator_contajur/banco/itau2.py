@@ -1,5 +1,13 @@
 import re
+from ..auxiliares.padroes import DATA_BR_LINHA, VALOR
 from ..auxiliares.utils import process_transactions 
+
+VALOR_RE = re.compile(rf"([-]?\s*R\$\s*{VALOR}\s*)$")  # Captura "- R$" ou "R$"
+# Ícones da fonte do internet banking que vêm junto com a descrição
+ICONES_RE = re.compile(r"[]")
+
+CABECALHO = ("dados gerais", "nome agência/conta", "data horário", "extrato completo")
+SALDOS = ("saldo total dispon", "saldo do dia")
  
 def preprocess_text(text):
     """
@@ -10,30 +18,28 @@ def preprocess_text(text):
     """
     lines = [line.strip() for line in text.splitlines() if line.strip()]
     
-    date_pattern = r"^(\d{2}/\d{2}/\d{4})$"
-    value_pattern = r"([-]?\s*R\$\s*\d{1,3}(?:\.\d{3})*,\d{2}\s*)$"  # Captura "- R$" ou "R$"
-    
     transactions = []
     current_date = None
     
     for line in lines:
         # Ignorar linhas de cabeçalho
-        if any(keyword in line.lower() for keyword in ["dados gerais", "nome agência/conta", "data horário", "extrato completo"]):
+        line_lower = line.lower()
+        if any(keyword in line_lower for keyword in CABECALHO):
             continue
         
         # Verificar se a linha é uma data
-        date_match = re.match(date_pattern, line)
+        date_match = DATA_BR_LINHA.match(line)
         if date_match:
             current_date = date_match.group(1)
             continue
         
         # Ignorar linhas de saldo
-        if any(keyword in line.lower() for keyword in ["saldo total dispon", "saldo do dia"]):
+        if any(keyword in line_lower for keyword in SALDOS):
             continue
         
         # Processar linhas de transação
-        value_match = re.search(value_pattern, line)
-        if value_match and current_date:
+        value_match = VALOR_RE.search(line) if current_date else None
+        if value_match:
             value = value_match.group(1).strip()
             tipo = "D" if "-" in value else "C"
             valor = value.replace("-", "").replace("R$", "").replace(" ", "").strip()
@@ -43,7 +49,7 @@ def preprocess_text(text):
                 valor = valor[:-3]
             
             # Extrair descrição (remover ícones e valor)
-            description = re.sub(r"[]", "", line).replace(value, "").strip()
+            description = ICONES_RE.sub("", line).replace(value, "").strip()
             
             transactions.append({
                 "Data": current_date,
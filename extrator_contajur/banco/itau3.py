@@ -1,6 +1,16 @@
 import re
 from ..auxiliares.utils import process_transactions  
 
+# Padrões regex
+DATA_RE = re.compile(r"^\d{2}/\d{2}\s+.*?(?:\s+\d{1,3}(?:\.\d{3})*(?:,\d{2})?(?:-)?)?(?:\s+\d{1,3}(?:\.\d{3})*(?:,\d{2})?(?:-)?)?(?:\s+\d{1,3}(?:\.\d{3})*(?:,\d{2})?)?$", re.MULTILINE)
+VALOR_RE = re.compile(r"^(?!\d{2}/\d{2}\s+).*?(?:\s+\d{1,3}(?:\.\d{3})*(?:,\d{2})?(?:-)?)(?:\s+\d{1,3}(?:\.\d{3})*(?:,\d{2})?(?:-)?)?$", re.MULTILINE)
+ANO_RE = re.compile(r"extrato mensal.*?(\d{4})\s+\d{3}\|\d{3}", re.IGNORECASE)
+PREFIXO_RE = re.compile(r"^(.*?=\s*poupança automática\s+)(.*?)$", re.IGNORECASE)
+FIM_MOVIMENTACOES_RE = re.compile(r"Saldo final|Saldo em C/C", re.IGNORECASE)
+SALDO_APLIC_RE = re.compile(r"SALDO APLIC AUT MAIS", re.IGNORECASE)
+CABECALHO_RE = re.compile(r"data\s+descrição\s+entradas\s+R\$\s+saídas\s+R\$\s+saldo\s+R\$", re.IGNORECASE)
+MONETARIO_RE = re.compile(r"(\d{1,3}(?:\.\d{3})*(?:,\d{2}))(?:-)?")  # Captura primeiro valor monetário
+
 def preprocess_text(text):
     """
     Pré-processa o texto do extrato do Itaú3 (AM AUTO PECAS ACESS LTDA ME) para extrair transações.
@@ -12,16 +22,6 @@ def preprocess_text(text):
     # Normalizar texto: remover espaços extras e caracteres especiais
     lines = [line.strip() for line in text.splitlines() if line.strip()]
     
-    # Padrões regex
-    date_pattern = re.compile(r"^\d{2}/\d{2}\s+.*?(?:\s+\d{1,3}(?:\.\d{3})*(?:,\d{2})?(?:-)?)?(?:\s+\d{1,3}(?:\.\d{3})*(?:,\d{2})?(?:-)?)?(?:\s+\d{1,3}(?:\.\d{3})*(?:,\d{2})?)?$", re.MULTILINE)
-    value_pattern = re.compile(r"^(?!\d{2}/\d{2}\s+).*?(?:\s+\d{1,3}(?:\.\d{3})*(?:,\d{2})?(?:-)?)(?:\s+\d{1,3}(?:\.\d{3})*(?:,\d{2})?(?:-)?)?$", re.MULTILINE)
-    year_pattern = re.compile(r"extrato mensal.*?(\d{4})\s+\d{3}\|\d{3}", re.IGNORECASE)
-    prefix_pattern = re.compile(r"^(.*?=\s*poupança automática\s+)(.*?)$", re.IGNORECASE)
-    saldo_final_pattern = re.compile(r"Saldo final", re.IGNORECASE)
-    saldo_aplic_pattern = re.compile(r"SALDO APLIC AUT MAIS", re.IGNORECASE)
-    saldo_cc_pattern = re.compile(r"Saldo em C/C", re.IGNORECASE)
-    monetary_pattern = re.compile(r"(\d{1,3}(?:\.\d{3})*(?:,\d{2}))(?:-)?")  # Captura primeiro valor monetário
-
     transactions = []
     current_date = None
     year = None
@@ -30,13 +30,13 @@ def preprocess_text(text):
     for line in lines:
         # Extrair ano do cabeçalho
         if not year:
-            year_match = year_pattern.search(line)
+            year_match = ANO_RE.search(line)
             if year_match:
                 year = year_match.group(1)
                 continue
 
         # Para de capturar transações se encontrar "Saldo final" ou "Saldo em C/C"
-        if saldo_final_pattern.search(line) or saldo_cc_pattern.search(line):
+        if FIM_MOVIMENTACOES_RE.search(line):
             capture_transactions = False
             continue
 
@@ -46,24 +46,24 @@ def preprocess_text(text):
             continue
 
         # Verificar se a linha é o cabeçalho da tabela de movimentações
-        if re.search(r"data\s+descrição\s+entradas\s+R\$\s+saídas\s+R\$\s+saldo\s+R\$", line, re.IGNORECASE):
+        if CABECALHO_RE.search(line):
             capture_transactions = True
             continue
 
         # Captura transações dentro da seção de movimentações
         if capture_transactions:
             # Ignorar linhas com "SALDO APLIC AUT MAIS"
-            if saldo_aplic_pattern.search(line):
+            if SALDO_APLIC_RE.search(line):
                 continue
 
             # Remover prefixos como "P = poupança automática"
             cleaned_line = line.strip()
-            prefix_match = prefix_pattern.search(cleaned_line)
+            prefix_match = PREFIXO_RE.search(cleaned_line)
             if prefix_match:
                 cleaned_line = prefix_match.group(2).strip()
 
             # Verificar se a linha contém uma data (DD/MM)
-            if date_pattern.match(line):
+            if DATA_RE.match(line):
                 current_date = line[:5]  # Extrai a data (ex.: "05/03")
                 if year:
                     full_date = f"{current_date}/{year}"  # Adiciona o ano (ex.: "05/03/2025")
@@ -72,15 +72,15 @@ def preprocess_text(text):
                 # Substitui a data original pela data completa
                 formatted_line = f"{full_date} {line[5:].strip()}"
                 # Extrair o primeiro valor monetário
-                value_match = monetary_pattern.search(formatted_line)
+                value_match = MONETARIO_RE.search(formatted_line)
                 if value_match:
                     value = value_match.group(1)
                     # Determinar tipo (C ou D)
                     tipo = "D" if formatted_line.endswith("-") else "C"
                     # Remover o valor e o sufixo "-" da descrição
-                    description = re.sub(monetary_pattern, "", line[5:]).replace("-", "").strip()
+                    description = MONETARIO_RE.sub("", line[5:]).replace("-", "").strip()
                     # Remover segundo valor monetário, se presente
-                    description = re.sub(monetary_pattern, "", description).strip()
+                    description = MONETARIO_RE.sub("", description).strip()
                     # Ajustar valor: remover ",00" se for número inteiro
                     if value.endswith(",00"):
                         value = value[:-3]
@@ -96,17 +96,17 @@ def preprocess_text(text):
                         "Tipo": tipo
                     })
             # Captura linhas sem data, mas com valores monetários
-            elif value_pattern.match(cleaned_line) and current_date:
+            elif VALOR_RE.match(cleaned_line) and current_date:
                 # Extrair o primeiro valor monetário
-                value_match = monetary_pattern.search(cleaned_line)
+                value_match = MONETARIO_RE.search(cleaned_line)
                 if value_match:
                     value = value_match.group(1)
                     # Determinar tipo (C ou D)
                     tipo = "D" if cleaned_line.endswith("-") else "C"
                     # Remover o valor e o sufixo "-" da descrição
-                    description = re.sub(monetary_pattern, "", cleaned_line).replace("-", "").strip()
+                    description = MONETARIO_RE.sub("", cleaned_line).replace("-", "").strip()
                     # Remover segundo valor monetário, se presente
-                    description = re.sub(monetary_pattern, "", description).strip()
+                    description = MONETARIO_RE.sub("", description).strip()
                     # Ajustar valor: remover ",00" se for número inteiro
                     if value.endswith(",00"):
                         value = value[:-3]
@@ -1,7 +1,40 @@
 import re
-# Remova ou ajuste este import conforme a estrutura real do seu projeto
+from ..auxiliares.padroes import DATA_BR_LINHA, VALOR
 from ..auxiliares.utils import process_transactions 
 
+# Padrão para identificar o valor no formato monetário (ex: 123.456,78 ou -123.456,78)
+# A âncora '$' garante que o valor seja o ÚLTIMO item na sua linha.
+VALOR_RE = re.compile(rf"([-]?{VALOR})$")
+
+def _montar_transacao(current_transaction):
+    """
+    Monta a transação a partir do bloco de linhas: a data é a primeira linha, o valor
+    a última e a descrição as linhas do meio. Retorna None se o bloco não tiver valor.
+    """
+    data = current_transaction[0]
+    value_line = current_transaction[-1]
+    value_match = VALOR_RE.search(value_line)
+    if not value_match:
+        return None
+
+    value_with_signal = value_match.group(1)
+    valor = value_with_signal.replace("-", "").strip()
+    
+    # Tipo: 'C' para valores sem sinal negativo, 'D' para valores negativos
+    tipo = "C" if "-" not in value_with_signal else "D"
+    
+    # Combina todas as linhas intermediárias como descrição (1: penúltima linha),
+    # limpando o valor restante da linha de descrição se ele ainda estiver lá
+    descricao_parts = [VALOR_RE.sub("", desc_line).strip() for desc_line in current_transaction[1:-1]]
+    descricao = " ".join(descricao_parts).strip()
+    
+    return {
+        "Data": data,
+        "Descrição": descricao if descricao else "DESCRICAO VAZIA",
+        "Valor": valor,
+        "Tipo": tipo
+    }
+
 def preprocess_text(text):
     """
     Pré-processa o texto do extrato bancário para extrair transações.
@@ -17,12 +50,6 @@ def preprocess_text(text):
 
     lines = [line.strip() for line in text.splitlines() if line.strip()]
     
-    # --- Padrões de Regex ---
-    date_pattern = r"^\d{2}/\d{2}/\d{4}$"  # Data no formato DD/MM/YYYY
-    # Padrão para identificar o valor no formato monetário (ex: 123.456,78 ou -123.456,78)
-    # A âncora '$' garante que o valor seja o ÚLTIMO item na sua linha.
-    value_pattern = r"([-]?\d{1,3}(?:\.\d{3})*,\d{2})$" 
-    
     transactions = []
     start_processing = False
     current_transaction = []
@@ -42,71 +69,24 @@ def preprocess_text(text):
             continue
         
         # Verifica se a linha começa com uma data
-        if re.match(date_pattern, line):
+        if DATA_BR_LINHA.match(line):
             # Se encontramos uma nova data, processamos a transação anterior (se houver)
-            if current_transaction:
-                if len(current_transaction) >= 2:
-                    data = current_transaction[0]
-                    value_line = current_transaction[-1]
-                    value_match = re.search(value_pattern, value_line)
-                    
-                    if value_match:
-                        value_with_signal = value_match.group(1)
-                        valor = value_with_signal.replace("-", "").strip()
-                        
-                        # Tipo: 'C' para valores sem sinal negativo, 'D' para valores negativos
-                        tipo = "C" if "-" not in value_with_signal else "D"
-                        
-                        # Combina todas as linhas intermediárias como descrição (1: penúltima linha)
-                        # Remove a linha do valor (current_transaction[-1])
-                        descricao_lines = current_transaction[1:-1]
-                        
-                        # Limpa o valor restante da linha de descrição se ele ainda estiver lá
-                        descricao_parts = []
-                        for desc_line in descricao_lines:
-                             descricao_parts.append(re.sub(value_pattern, "", desc_line).strip())
-                             
-                        # Junta as partes da descrição com um espaço
-                        descricao = " ".join(descricao_parts).strip()
-                        
-                        transactions.append({
-                            "Data": data,
-                            "Descrição": descricao if descricao else "DESCRICAO VAZIA",
-                            "Valor": valor,
-                            "Tipo": tipo
-                        })
+            if len(current_transaction) >= 2:
+                transacao = _montar_transacao(current_transaction)
+                if transacao:
+                    transactions.append(transacao)
                         
             # Inicia uma nova transação
             current_transaction = [line]
-        elif start_processing:
+        else:
             # Adiciona a linha à transação atual
             current_transaction.append(line)
     
     # Processa a última transação, se houver
-    if current_transaction and len(current_transaction) >= 2:
-        data = current_transaction[0]
-        value_line = current_transaction[-1]
-        value_match = re.search(value_pattern, value_line)
-        
-        if value_match:
-            value_with_signal = value_match.group(1)
-            valor = value_with_signal.replace("-", "").strip()
-            tipo = "C" if "-" not in value_with_signal else "D"
-            
-            # Combina as linhas intermediárias como descrição
-            descricao_lines = current_transaction[1:-1]
-            descricao_parts = []
-            for desc_line in descricao_lines:
-                 descricao_parts.append(re.sub(value_pattern, "", desc_line).strip())
-                 
-            descricao = " ".join(descricao_parts).strip()
-            
-            transactions.append({
-                "Data": data,
-                "Descrição": descricao if descricao else "DESCRICAO VAZIA",
-                "Valor": valor,
-                "Tipo": tipo
-            })
+    if len(current_transaction) >= 2:
+        transacao = _montar_transacao(current_transaction)
+        if transacao:
+            transactions.append(transacao)
 
     # --- FILTRAGEM DE TRANSAÇÕES (EXCLUIR SALDOS) ---
     
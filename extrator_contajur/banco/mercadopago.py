@@ -1,6 +1,15 @@
 import re
 from ..auxiliares.utils import process_transactions
 
+# Linhas a ignorar (case-insensitive)
+LINHAS_IGNORAR = {'data', 'descrição', 'id da operação', 'valor', 'saldo'}
+# Dia/mês soltos (xx/xx), repetidos pelo PDF ao lado da data completa
+DIA_MES_RE = re.compile(r'^\d{1,2}/\d{1,2}$')
+# Padrão para identificar linhas de data (dd-mm-aaaa)
+DATA_RE = re.compile(r'^\d{1,2}-\d{1,2}-\d{4}')
+# Padrão para identificar valores monetários (R$ seguido de número, com ou sem -)
+VALOR_RE = re.compile(r'R\$ -?[\d,.]+')
+
 def preprocess_text(text):
     """
     Pré-processa o texto do extrato para extrair transações, ignorando cabeçalho e rodapé.
@@ -25,26 +34,18 @@ def preprocess_text(text):
     # Pega as linhas a partir da linha seguinte à que contém "saldo"
     linhas_filtradas = linhas[indice_saldo + 1:]
     
-    # Lista de linhas a ignorar (case-insensitive)
-    linhas_ignorar = {'data', 'descrição', 'id da operação', 'valor', 'saldo'}
-    
     # Filtra as linhas, ignorando as especificadas e as que seguem o padrão xx/xx
     linhas_finais = []
     for linha in linhas_filtradas:
-        linha_limpa = linha.strip().lower()
-        if (linha_limpa not in linhas_ignorar and 
-            not re.match(r'^\d{1,2}/\d{1,2}$', linha.strip(), re.IGNORECASE)):
-            linhas_finais.append(linha.strip())
-    
-    # Padrão para identificar linhas de data (dd-mm-aaaa)
-    padrao_data = re.compile(r'^\d{1,2}-\d{1,2}-\d{4}')
+        if linha.lower() not in LINHAS_IGNORAR and not DIA_MES_RE.match(linha):
+            linhas_finais.append(linha)
     
     # Lista para armazenar as transações concatenadas
     transacoes = []
     transacao_atual = []
     
     for linha in linhas_finais:
-        if padrao_data.match(linha):
+        if DATA_RE.match(linha):
             if transacao_atual:
                 transacoes.append(' '.join(transacao_atual))
                 transacao_atual = []
@@ -57,9 +58,6 @@ def preprocess_text(text):
     # Lista para armazenar os dicionários das transações
     lista_transacoes = []
     
-    # Padrão para identificar valores monetários (R$ seguido de número, com ou sem -)
-    padrao_valor = re.compile(r'R\$ -?[\d,.]+')
-    
     for transacao in transacoes:
         # Divide a transação em partes
         partes = transacao.split()
@@ -68,10 +66,10 @@ def preprocess_text(text):
         data = partes[0].replace('-', '/')
         
         # Encontra todos os valores monetários na transação
-        valores = padrao_valor.findall(transacao)
-        if not valores:
+        valor_match = VALOR_RE.search(transacao)
+        if not valor_match:
             continue  # Pula transações sem valores válidos
-        valor = valores[0]  # Pega o primeiro valor
+        valor = valor_match.group()  # Pega o primeiro valor
         
         # Determina o tipo (D para débito, C para crédito)
         tipo = 'D' if valor.startswith('R$ -') else 'C'
@@ -83,7 +81,7 @@ def preprocess_text(text):
             valor_limpo = valor_limpo[:-3]
         
         # A descrição é tudo entre a data e o primeiro valor
-        indice_valor = transacao.find(valores[0])
+        indice_valor = transacao.find(valor)
         descricao = transacao[len(partes[0]):indice_valor].strip()
         
         # Cria o dicionário da transação
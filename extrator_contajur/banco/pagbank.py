@@ -1,6 +1,12 @@
 import re
+from ..auxiliares.padroes import DATA
 from ..auxiliares.utils import process_transactions 
 
+# Data no início da linha seguida de espaço (grupo 1)
+DATA_RE = re.compile(rf"^({DATA})\s+")
+# Padrão para capturar valores (débito ou crédito)
+VALOR_RE = re.compile(r"(-\s*)?R\$\s*([\d.,]+)")
+
 def preprocess_text(text):
     """
     Pré-processa o texto do extrato do PagBank, mantendo centavos separados por vírgula
@@ -8,24 +14,20 @@ def preprocess_text(text):
     """
     lines = [line.strip() for line in text.splitlines() if line.strip()]
     transactions = []
-    date_pattern = r"\d{2}/\d{2}/\d{4}"
 
     for line in lines:
-        if "saldo do dia" in line.lower() or "saldododia" in line.lower():
-            continue
-
-        if not re.match(rf"^{date_pattern}", line):
+        line_lower = line.lower()
+        if "saldo do dia" in line_lower or "saldododia" in line_lower:
             continue
 
-        date_match = re.match(rf"^({date_pattern})\s+", line)
+        date_match = DATA_RE.match(line)
         if not date_match:
             continue
 
         data = date_match.group(1)
         resto = line[len(data):].strip()
 
-        # Padrão para capturar valores (débito ou crédito)
-        valor_match = re.search(r"(-\s*)?R\$\s*([\d.,]+)", resto)
+        valor_match = VALOR_RE.search(resto)
         if not valor_match:
             continue
 
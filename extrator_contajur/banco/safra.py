@@ -1,15 +1,18 @@
 import re
+from ..auxiliares.padroes import DIA_MES_LINHA
 from ..auxiliares.utils import process_transactions
 
+PERIODO_RE = re.compile(r'Período de \d{2}/\d{2}/(\d{4}) a \d{2}/\d{2}/\d{4}')
+VALOR_RE = re.compile(r"[-]?\d{1,3}(?:\.\d{3})*,\d{1,2}")
+
 def preprocess_text(text):
   
     lines = [line.strip() for line in text.splitlines() if line.strip()]
     
     # Extrair o ano do período
     ano = None
-    periodo_pattern = re.compile(r'Período de \d{2}/\d{2}/(\d{4}) a \d{2}/\d{2}/\d{4}')
     for line in lines:
-        match = periodo_pattern.search(line)
+        match = PERIODO_RE.search(line)
         if match:
             ano = match.group(1)
             break
@@ -31,9 +34,6 @@ def preprocess_text(text):
             transaction_lines.append(lines[i])
             i += 1
     
-    date_pattern = r"^\d{2}/\d{2}$"
-    value_pattern = r"[-]?\d{1,3}(?:\.\d{3})*,\d{1,2}"
-    
     transactions = []
     transacao_atual = []
     
@@ -41,7 +41,7 @@ def preprocess_text(text):
         """Processa uma transação e adiciona ao resultado, se válida."""
         if not transacao or len(transacao) < 2:
             return
-        value_match = re.search(value_pattern, transacao[-1])
+        value_match = VALOR_RE.search(transacao[-1])
         if not value_match:
             return
         data = f"{transacao[0]}/{ano}" if ano else transacao[0]
@@ -80,7 +80,7 @@ def preprocess_text(text):
     
     for line in transaction_lines:
         # Verifica se a linha é uma data (início de nova transação)
-        date_match = re.match(date_pattern, line)
+        date_match = DIA_MES_LINHA.match(line)
         if date_match:
             # Processa a transação anterior, se houver
             process_transaction(transacao_atual)
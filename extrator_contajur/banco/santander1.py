@@ -1,6 +1,23 @@
 import re
 from ..auxiliares.utils import process_transactions
 
+SKIP_KEYWORDS = {
+    "Aplicativo Santander", "Internet Banking Empresarial",
+    "Agência:", "Conta:", "Período", "Data/Hora:", "Saldo disponível",
+    "Saldo de ContaMax", "Entenda a composição", "Central de Atendimento",
+    "SAC", "Ouvidoria", "Data Histórico", "Saldo do dia", "Saldo anterior", "SALDO ANTERIOR",
+    "4004-2125", "0800",
+}
+
+# Ancora em: data  ...descrição...  [- ][R$ ]valor  [saldo]
+PADRAO_LANCAMENTO = re.compile(
+    r'^(\d{2}/\d{2}/\d{4})\s+'          # G1 – data
+    r'(.+?)\s+'                           # G2 – descrição
+    r'(-\s*)?(?:R\$\s*)?'                 # G3 – sinal e prefixo R$ opcionais
+    r'(\d{1,3}(?:\.\d{3})*,\d{2})'       # G4 – valor absoluto
+    r'(?:\s+[-]?\d{1,3}(?:\.\d{3})*,\d{2})?$'  # saldo opcional (formato 1)
+)
+
 
 def preprocess_text(text):
     """
@@ -11,29 +28,12 @@ def preprocess_text(text):
     """
     lines = [line.strip() for line in text.splitlines() if line.strip()]
 
-    SKIP_KEYWORDS = {
-        "Aplicativo Santander", "Internet Banking Empresarial",
-        "Agência:", "Conta:", "Período", "Data/Hora:", "Saldo disponível",
-        "Saldo de ContaMax", "Entenda a composição", "Central de Atendimento",
-        "SAC", "Ouvidoria", "Data Histórico", "Saldo do dia", "Saldo anterior", "SALDO ANTERIOR",
-        "4004-2125", "0800",
-    }
-
-    # Ancora em: data  ...descrição...  [- ][R$ ]valor  [saldo]
-    pattern = re.compile(
-        r'^(\d{2}/\d{2}/\d{4})\s+'          # G1 – data
-        r'(.+?)\s+'                           # G2 – descrição
-        r'(-\s*)?(?:R\$\s*)?'                 # G3 – sinal e prefixo R$ opcionais
-        r'(\d{1,3}(?:\.\d{3})*,\d{2})'       # G4 – valor absoluto
-        r'(?:\s+[-]?\d{1,3}(?:\.\d{3})*,\d{2})?$'  # saldo opcional (formato 1)
-    )
-
     transactions = []
     for line in lines:
         if any(kw in line for kw in SKIP_KEYWORDS):
             continue
 
-        m = pattern.match(line)
+        m = PADRAO_LANCAMENTO.match(line)
         if not m:
             continue
 
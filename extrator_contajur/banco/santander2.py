@@ -1,6 +1,28 @@
 import re
 from ..auxiliares.utils import process_transactions
 
+# Mês/ano na segunda linha (ex.: Janeiro/2023 ou 01/2023)
+MES_ANO_RE = re.compile(r'(\w+)/(\d{4})')
+DATA_RE = re.compile(r'^\d{2}/\d{2}(/\d{2,4})?$')
+VALOR_RE = re.compile(r'^-?\d{1,3}(\.\d{3})*,\d{2}-?$')
+
+
+def _remover_blocos(linhas, marcador, tamanho):
+    """
+    Remove cada linha que contém `marcador` (em minúsculas) junto com as linhas
+    seguintes, `tamanho` linhas no total, numa única passada.
+    """
+    restantes = []
+    i = 0
+    while i < len(linhas):
+        if marcador in linhas[i].lower():
+            i += tamanho
+        else:
+            restantes.append(linhas[i])
+            i += 1
+    return restantes
+
+
 def preprocess_text(text):
     """
     Pré-processa o texto do extrato do Santander para dividir transações.
@@ -13,7 +35,7 @@ def preprocess_text(text):
     ano = None
     if len(linhas) >= 2:
         segunda_linha = linhas[1]
-        match = re.search(r'(\w+)/(\d{4})', segunda_linha)
+        match = MES_ANO_RE.search(segunda_linha)
         if match:
             ano = match.group(2)
         else:
@@ -21,20 +43,10 @@ def preprocess_text(text):
             return []
     
     # Primeiro filtro: Remover "EXTRATO CONSOLIDADO INTELIGENTE" e as 11 linhas seguintes
-    i = 0
-    while i < len(linhas):
-        if 'extrato consolidado inteligente' in linhas[i].lower():
-            del linhas[i:i+12]  # Remove a linha atual e as 11 seguintes
-        else:
-            i += 1
+    linhas = _remover_blocos(linhas, 'extrato consolidado inteligente', 12)
     
     # Segundo filtro: Remover "Extrato_PJ_A4_Inteligente" e as 9 linhas seguintes
-    i = 0
-    while i < len(linhas):
-        if 'extrato_pj_a4_inteligente' in linhas[i].lower():
-            del linhas[i:i+10]  # Remove a linha atual e as 9 seguintes
-        else:
-            i += 1
+    linhas = _remover_blocos(linhas, 'extrato_pj_a4_inteligente', 10)
     
     # Terceiro filtro: Encontrar as posições das ocorrências de "saldo em"
     primeira_ocorrencia = -1
@@ -57,16 +69,13 @@ def preprocess_text(text):
     linhas_filtradas = linhas[primeira_ocorrencia + 2:segunda_ocorrencia]
     
     # Quarto filtro: Processar transações
-    padrao_data = r'^\d{2}/\d{2}(/\d{2,4})?$'
-    padrao_valor = r'^-?\d{1,3}(\.\d{3})*,\d{2}-?$'
-    
     transactions = []
     i = 0
     data_atual = None
     
     while i < len(linhas_filtradas):
         # Verificar se a linha é uma data
-        data_match = re.match(padrao_data, linhas_filtradas[i].strip())
+        data_match = DATA_RE.match(linhas_filtradas[i].strip())
         if data_match:
             # Extrair a data e completar com o ano
             data = data_match.group(0)
@@ -83,15 +92,15 @@ def preprocess_text(text):
             while i < len(linhas_filtradas):
                 linha = linhas_filtradas[i].strip()
                 # Se encontrar uma nova data, parar a transação atual
-                if re.match(padrao_data, linha):
+                if DATA_RE.match(linha):
                     break
                 # Verificar se a linha contém um valor monetário
-                if re.match(padrao_valor, linha):
+                if VALOR_RE.match(linha):
                     if not valor:  # Considerar apenas o primeiro valor monetário
                         valor = linha
                     i += 1
                     # Continuar até encontrar uma nova data ou fim das linhas
-                    while i < len(linhas_filtradas) and re.match(padrao_valor, linhas_filtradas[i].strip()):
+                    while i < len(linhas_filtradas) and VALOR_RE.match(linhas_filtradas[i].strip()):
                         i += 1  # Ignorar valores monetários adicionais
                     break
                 transacao.append(linha)
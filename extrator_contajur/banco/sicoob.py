@@ -1,67 +1,83 @@
 import re
+from ..auxiliares.linhas import Classe, Tokenizador
+from ..auxiliares.padroes import VALOR
 from ..auxiliares.utils import process_transactions
 
+PERIODO_RE = re.compile(r"PERÍODO:\s*\d{2}/\d{2}/(\d{4})\s*-\s*\d{2}/\d{2}/\d{4}")
+DATA_RE = re.compile(r"^(\d{2}/\d{2})\s*$")
+VALOR_RE = re.compile(rf"^({VALOR})([CD])?")
+TIPO_RE = re.compile(r"^[CD]$")
+
+TOKENIZADOR = Tokenizador(data=DATA_RE, valor=VALOR_RE, tipo=TIPO_RE)
+
+SALDOS = ("SALDO DO DIA", "SALDO ANTERIOR", "SALDO BLOQ")
+
 def preprocess_text(text):
     """
     Pré-processa o texto do Sicoob no formato estruturado do PyMuPDF.
     Extrai todas as informações necessárias e retorna os dados no formato final.
+
+    Lê as linhas uma vez: as transações começam depois do cabeçalho da tabela e
+    terminam em "RESUMO"/"SALDO EM C.CORRENTE". Sem o cabeçalho, valem desde a
+    primeira linha; por isso o que for lido antes dele é descartado ao encontrá-lo.
     """
-    lines = [line.strip() for line in text.splitlines() if line.strip()]
-    
-    # Extrair o ano do período (ex.: PERÍODO: 01/04/2025 - 30/04/2025)
+    # Ano do período (ex.: PERÍODO: 01/04/2025 - 30/04/2025), aplicado no fim
     year = None
-    period_pattern = r"PERÍODO:\s*\d{2}/\d{2}/(\d{4})\s*-\s*\d{2}/\d{2}/\d{4}"
-    for line in lines:
-        match = re.search(period_pattern, line)
-        if match:
-            year = match.group(1)
-            break
-    
-    # Identificar início e fim das transações
-    start_index = 0
-    for i, line in enumerate(lines):
-        if "DATA  HISTÓRICO  VALOR" in line:
-            start_index = i + 1
-            break
-    
-    end_index = len(lines)
-    for i, line in enumerate(lines[start_index:], start=start_index):
-        if "RESUMO" in line or "SALDO EM C.CORRENTE" in line:
-            end_index = i
-            break
-    
-    transaction_lines = lines[start_index:end_index]
-    
-    # Processar as transações
+    inicio_encontrado = False
+    encerrado = False
+
     data = []
-    date_pattern = r"^(\d{2}/\d{2})\s*$"
-    value_pattern = r"(\d{1,3}(?:\.\d{3})*,\d{2})([CD])?"
-    type_pattern = r"^[CD]$"
-    doc_pattern = r"DOC\.:"
-    
     current_transaction = []
     in_transaction = False
-    
-    for line in transaction_lines:
-        if re.match(date_pattern, line):
+
+    for linha in TOKENIZADOR(text):
+        line = linha.texto
+        if year is None:
+            match = PERIODO_RE.search(line)
+            if match:
+                year = match.group(1)
+
+        # Identificar início e fim das transações
+        if not inicio_encontrado and "DATA  HISTÓRICO  VALOR" in line:
+            inicio_encontrado = True
+            encerrado = False
+            data = []
+            current_transaction = []
+            in_transaction = False
+            continue
+
+        if encerrado:
+            if inicio_encontrado and year is not None:
+                break
+            continue
+
+        if "RESUMO" in line or "SALDO EM C.CORRENTE" in line:
+            encerrado = True
+            # Processar última transação se existir
+            if in_transaction and current_transaction:
+                processed = _process_single_transaction(current_transaction)
+                if processed:
+                    data.append(processed)
+            current_transaction = []
+            in_transaction = False
+            continue
+
+        # Processar as transações
+        if linha.classe is Classe.DATA:
             # Processar transação anterior se existir
             if in_transaction and current_transaction:
-                transaction_text = "\n".join(current_transaction)
-                processed = _process_single_transaction(transaction_text, year, date_pattern, 
-                                                      value_pattern, type_pattern, doc_pattern)
+                processed = _process_single_transaction(current_transaction)
                 if processed:
                     data.append(processed)
             
             # Começar nova transação
-            current_transaction = [line]
+            current_transaction = [linha]
             in_transaction = True
         elif in_transaction:
-            current_transaction.append(line)
-            if "DOC.:" in line or "SALDO DO DIA" in line or "SALDO ANTERIOR" in line or "SALDO BLOQ" in line:
+            current_transaction.append(linha)
+            if "DOC.:" in line or any(s in line for s in SALDOS):
                 # Finalizar transação atual
-                transaction_text = "\n".join(current_transaction)
-                processed = _process_single_transaction(transaction_text, year, date_pattern,
-                                                       value_pattern, type_pattern, doc_pattern)
+                processed = _process_single_transaction(current_transaction)
                 if processed:
                     data.append(processed)
                 in_transaction = False
@@ -69,29 +85,27 @@ def preprocess_text(text):
     
     # Processar última transação se existir
     if in_transaction and current_transaction:
-        transaction_text = "\n".join(current_transaction)
-        processed = _process_single_transaction(transaction_text, year, date_pattern,
-                                              value_pattern, type_pattern, doc_pattern)
+        processed = _process_single_transaction(current_transaction)
         if processed:
             data.append(processed)
+
+    if year:
+        for transacao in data:
+            transacao["Data"] = f"{transacao['Data']}/{year}"
     
     return data
 
-def _process_single_transaction(transaction, year, date_pattern, value_pattern, type_pattern, doc_pattern):
-    """Função auxiliar para processar uma única transação"""
-    lines = transaction.split("\n")
-    
+def _process_single_transaction(lines):
+    """
+    Função auxiliar para processar uma única transação (Linha do tokenizador, a
+    primeira com a data). A Data sai sem o ano, que preprocess_text completa.
+    """
     # Ignorar transações de saldo
-    if any(s in transaction for s in ["SALDO DO DIA", "SALDO ANTERIOR", "SALDO BLOQ"]):
+    if any(s in linha.texto for linha in lines for s in SALDOS):
         return None
     
     # Extrair data
-    date_match = re.match(date_pattern, lines[0])
-    if not date_match:
-        return None
-    date = date_match.group(1)
-    if year:
-        date = f"{date}/{year}"
+    date = lines[0].match.group(1)
     
     # Extrair valor e tipo
     value = None
@@ -99,14 +113,13 @@ def _process_single_transaction(transaction, year, date_pattern, value_pattern,
     value_line_index = None
     type_line_index = None
     
-    for i, line in enumerate(lines[1:], start=1):
-        value_match = re.match(value_pattern, line.strip())
-        if value_match:
-            value = value_match.group(1)
+    for i, linha in enumerate(lines[1:], start=1):
+        if linha.classe is Classe.VALOR:
+            value = linha.match.group(1)
             value_line_index = i
-            transaction_type = value_match.group(2)
-            if not transaction_type and i + 1 < len(lines) and re.match(type_pattern, lines[i + 1].strip()):
-                transaction_type = lines[i + 1].strip()
+            transaction_type = linha.match.group(2)
+            if not transaction_type and i + 1 < len(lines) and lines[i + 1].classe is Classe.TIPO:
+                transaction_type = lines[i + 1].texto
                 type_line_index = i + 1
             break
     
@@ -117,19 +130,17 @@ def _process_single_transaction(transaction, year, date_pattern, value_pattern,
         value = value[:-3]
     
     # Extrair descrição até o DOC.:
-    doc_match = re.search(doc_pattern, transaction)
-    if not doc_match:
+    if not any("DOC.:" in linha.texto for linha in lines):
         return None
     
     # Construir descrição, excluindo linhas de valor e tipo
     description_lines = []
-    for i, line in enumerate(lines[1:], start=1):
+    for i, linha in enumerate(lines[1:], start=1):
         if i == value_line_index or i == type_line_index:
             continue
-        if "DOC.:" in line:
-            description_lines.append(line)
+        description_lines.append(linha.texto)
+        if "DOC.:" in linha.texto:
             break
-        description_lines.append(line)
     
     description = " ".join(description_lines).strip()
     
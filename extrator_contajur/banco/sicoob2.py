@@ -1,6 +1,10 @@
 import re
+from ..auxiliares.padroes import DATA_BR, DIA_MES_LINHA, VALOR
 from ..auxiliares.utils import process_transactions
 
+VALOR_RE = re.compile(rf"R\$\s*({VALOR})([CD])")
+SALDOS = ("SALDO DO DIA", "SALDO ANTERIOR", "SALDO BLOQUEADO")
+
 def preprocess_text(text):
     """
     Pré-processa o texto do Sicoob no novo formato, extraindo todas as informações necessárias.
@@ -31,13 +35,12 @@ def preprocess_text(text):
         palavras = lines[0].split()
         if palavras:
             first_word = palavras[0]
-            date_pattern = r"(\d{2}/\d{2}/\d{4})"
-            match = re.match(date_pattern, first_word)
+            match = DATA_BR.match(first_word)
             if match:
-                year = match.group(1).split('/')[2]
+                year = match.group(0).split('/')[2]
             else:
                 for line in lines:
-                    match = re.search(r"\d{2}/\d{2}/\d{4}", line)
+                    match = DATA_BR.search(line)
                     if match:
                         year = match.group(0).split('/')[2]
                         break
@@ -48,35 +51,29 @@ def preprocess_text(text):
     # Identificar blocos de transações por data
     raw_transactions = []
     current_transaction = []
-    date_pattern = r"^\d{2}/\d{2}$"
-    saldo_keywords = ["SALDO DO DIA", "SALDO ANTERIOR", "SALDO BLOQUEADO"]
     
     for line in lines:
-        if re.match(date_pattern, line):
+        if DIA_MES_LINHA.match(line):
             if current_transaction:
-                raw_transactions.append({"raw": "\n".join(current_transaction)})
+                raw_transactions.append(current_transaction)
             current_transaction = [line]
-        elif any(keyword in line for keyword in saldo_keywords):
+        elif any(keyword in line for keyword in SALDOS):
             if current_transaction:
                 if len(current_transaction) > 1:
-                    raw_transactions.append({"raw": "\n".join(current_transaction)})
+                    raw_transactions.append(current_transaction)
             current_transaction = [line]
         elif current_transaction:
             current_transaction.append(line)
     
     if current_transaction:
-        raw_transactions.append({"raw": "\n".join(current_transaction)})
+        raw_transactions.append(current_transaction)
     
     # Processar as transações brutas para extrair os dados formatados
     data = []
-    value_pattern = r"R\$\s*(\d{1,3}(?:\.\d{3})*,\d{2})([CD])"
     
-    for transaction_dict in raw_transactions:
-        transaction = transaction_dict["raw"]
-        lines = transaction.split("\n")
-        
+    for lines in raw_transactions:
         # Ignorar blocos que são apenas de saldo
-        if any(s in transaction for s in ["SALDO DO DIA", "SALDO ANTERIOR", "SALDO BLOQUEADO"]):
+        if any(s in line for line in lines for s in SALDOS):
             continue
         
         # Extrair data
@@ -90,7 +87,7 @@ def preprocess_text(text):
         transaction_type = None
         
         for line in lines[1:]:
-            value_match = re.search(value_pattern, line)
+            value_match = VALOR_RE.search(line)
             if value_match:
                 value = value_match.group(1)
                 transaction_type = value_match.group(2)
@@ -1,6 +1,11 @@
 import re
+from ..auxiliares.padroes import DATA, VALOR
 from ..auxiliares.utils import process_transactions
 
+DATA_RE = re.compile(rf"^({DATA})\s*$")
+VALOR_RE = re.compile(rf"({VALOR})([CD])")
+DOCUMENTO_RE = re.compile(r"^\d+$|Pix")  # Documento pode ser número ou "Pix"
+
 def preprocess_text(text):
     """
     Pré-processa o texto do extrato Sicoob no formato fornecido.
@@ -25,21 +30,17 @@ def preprocess_text(text):
     
     # Processar as transações
     data = []
-    date_pattern = r"^(\d{2}/\d{2}/\d{4})\s*$"
-    value_pattern = r"(\d{1,3}(?:\.\d{3})*,\d{2})([CD])"
-    doc_pattern = r"^\d+$|Pix"  # Documento pode ser número ou "Pix"
     
     current_transaction = []
     current_date = None
     
     for i, line in enumerate(transaction_lines):
         # Nova data indica início de uma nova transação ou grupo de transações
-        date_match = re.match(date_pattern, line)
+        date_match = DATA_RE.match(line)
         if date_match:
             # Processar transação anterior
             if current_transaction:
-                transaction_text = "\n".join(current_transaction)
-                processed = _process_single_transaction(transaction_text, date_pattern, value_pattern, doc_pattern)
+                processed = _process_single_transaction(current_transaction)
                 if processed:
                     data.append(processed)
                 current_transaction = []
@@ -52,8 +53,7 @@ def preprocess_text(text):
             # Verificar se é "SALDO DO DIA" para finalizar a transação atual
             if "SALDO DO DIA" in line:
                 if current_transaction:
-                    transaction_text = "\n".join(current_transaction)
-                    processed = _process_single_transaction(transaction_text, date_pattern, value_pattern, doc_pattern)
+                    processed = _process_single_transaction(current_transaction)
                     if processed:
                         data.append(processed)
                 current_transaction = []
@@ -62,19 +62,16 @@ def preprocess_text(text):
     
     # Processar última transação, se houver
     if current_transaction and current_date:
-        transaction_text = "\n".join(current_transaction)
-        processed = _process_single_transaction(transaction_text, date_pattern, value_pattern, doc_pattern)
+        processed = _process_single_transaction(current_transaction)
         if processed:
             data.append(processed)
     
     return data
 
-def _process_single_transaction(transaction, date_pattern, value_pattern, doc_pattern):
-    """Função auxiliar para processar uma única transação"""
-    lines = transaction.split("\n")
-    
+def _process_single_transaction(lines):
+    """Função auxiliar para processar uma única transação (lista de linhas, a primeira com a data)"""
     # Ignorar transações que são apenas saldos
-    if any(s in transaction for s in ["SALDO ANTERIOR", "SALDO BLOQUEADO"]):
+    if any(s in line for line in lines for s in ("SALDO ANTERIOR", "SALDO BLOQUEADO")):
         return None
     
     # Remover "SALDO DO DIA ===== >" e a linha seguinte, se presentes
@@ -93,7 +90,7 @@ def _process_single_transaction(transaction, date_pattern, value_pattern, doc_pa
         return None
     
     # Extrair data
-    date_match = re.match(date_pattern, cleaned_lines[0])
+    date_match = DATA_RE.match(cleaned_lines[0])
     if not date_match:
         return None
     date = date_match.group(1)
@@ -104,7 +101,7 @@ def _process_single_transaction(transaction, date_pattern, value_pattern, doc_pa
     value_line_index = None
     
     for i, line in enumerate(cleaned_lines[1:], start=1):
-        value_match = re.match(value_pattern, line.strip())
+        value_match = VALOR_RE.match(line.strip())
         if value_match:
             value = value_match.group(1)
             transaction_type = value_match.group(2)
@@ -124,9 +121,9 @@ def _process_single_transaction(transaction, date_pattern, value_pattern, doc_pa
     for i, line in enumerate(cleaned_lines[1:], start=1):
         if i == value_line_index:
             continue
-        if re.match(date_pattern, line):
+        if DATA_RE.match(line):
             break
-        if not doc_number and re.match(doc_pattern, line.strip()):
+        if not doc_number and DOCUMENTO_RE.match(line.strip()):
             doc_number = line.strip()
             continue
         description_lines.append(line.strip())  # Incluir todas as linhas restantes como descrição
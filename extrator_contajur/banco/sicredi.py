@@ -1,9 +1,10 @@
 import re
+from ..auxiliares.padroes import DATA_BR_INICIO, VALOR, VALOR_BR_COM_SINAL
 from ..auxiliares.utils import process_transactions
 
-DATE_RE  = re.compile(r'^\d{2}/\d{2}/\d{4}')
-VALUE_RE = re.compile(r'^-?\d{1,3}(?:\.\d{3})*,\d{2}')
-ALL_VALUES_RE = re.compile(r'-?\d{1,3}(?:\.\d{3})*,\d{2}')
+DATE_RE  = DATA_BR_INICIO
+VALUE_RE = re.compile(rf'^-?{VALOR}')
+ALL_VALUES_RE = VALOR_BR_COM_SINAL
 
 SKIP_RE = re.compile(
     r'^(Data\b|Descrição|Documento|Valor\s*\(R\$\)|Saldo\s*\(R\$\)|SALDO'
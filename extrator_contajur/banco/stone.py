@@ -1,128 +1,121 @@
 import re
+from ..auxiliares.linhas import Classe, Tokenizador
+from ..auxiliares.padroes import VALOR
 from ..auxiliares.utils import process_transactions 
 
+# Padrão de data flexível (DD/MM/YY ou DD/MM/YYYY)
+DATA_RE = re.compile(r"^\d{2}/\d{2}/\d{2,4}$")
+
+# Padrão de valor: aceita o formato brasileiro com ou sem R$ e sinal de menos, 
+# além de espaços opcionais (ex: - R$ 10.000,00).
+VALOR_RE = re.compile(rf"^-?\s*R?\s*\$?\s*{VALOR}$")
+
+# Mapeamento para suportar os dois formatos (antigo e novo)
+TIPOS = {
+    "Débito": 'D',
+    "Crédito": 'C',
+    "Saída": 'D',
+    "Entrada": 'C',
+}
+
+TOKENIZADOR = Tokenizador(
+    cabecalho=re.compile(r"DATA|CONTRAPARTE|Informações do Comprovante"),
+    data=DATA_RE,
+    valor=VALOR_RE,
+    tipo=re.compile(rf"^(?:{'|'.join(TIPOS)})$"),
+)
+
+# Estados da leitura de uma transação
+ESPERA_TIPO = "tipo"
+DESCRICAO = "descricao"
+
+def _apos_contraparte(linhas):
+    """
+    Descarta a primeira linha com "CONTRAPARTE" e tudo acima (cabeçalho inicial).
+    Se ela não existir, mantém todas as linhas: só o cabeçalho fica guardado até
+    encontrá-la.
+    """
+    antes = []
+    for linha in linhas:
+        if antes is None:
+            yield linha
+        elif linha.classe is Classe.CABECALHO and "CONTRAPARTE" in linha.texto:
+            antes = None
+        else:
+            antes.append(linha)
+    if antes:
+        yield from antes
+
 def preprocess_text(text):
     """
     Pré-processa o texto do extrato da Stone para dividir transações, ignorando cabeçalho e rodapé.
     Suporta os formatos 'Crédito/Débito' e 'Entrada/Saída'.
     Mantém valores no formato brasileiro (ex.: 1.012,29), removendo "R$".
+
+    Máquina de estados sobre as linhas: data -> tipo (linha seguinte) -> descrição
+    até o valor; depois ignora saldo e contraparte até a próxima data.
     """
-    # Dividir o texto em linhas
-    linhas = [linha.strip() for linha in text.splitlines() if linha.strip()]
-    
-    # 1. IDENTIFICAR O FIM DO CABEÇALHO INICIAL
-    # Identificar a primeira linha que contém "CONTRAPARTE"
-    indice_contraparte = None
-    for i, linha in enumerate(linhas):
-        if "CONTRAPARTE" in linha:
-            indice_contraparte = i
-            break
-    
-    # Se encontrar "CONTRAPARTE", ignorar essa linha e tudo acima
-    if indice_contraparte is not None:
-        linhas_filtradas = linhas[indice_contraparte + 1:]
-    else:
-        linhas_filtradas = linhas  # Se não encontrar, mantém todas as linhas
-    
-    # 2. APLICAR LIMPEZAS INTERMEDIÁRIAS (Cabeçalhos Repetidos e Rodapé)
-    linhas_intermediarias = []
-    i = 0
-    while i < len(linhas_filtradas):
-        linha = linhas_filtradas[i]
-        
-        # Ignorar a linha com "DATA" (novo e antigo cabeçalho) e as 5 linhas seguintes.
-        # Ambas as estruturas de cabeçalho da tabela (DATA...CONTRAPARTE) ocupam 6 linhas.
-        if "DATA" in linha:
-            i += 6  # Pular a linha atual e as próximas 5
-            continue
-        
-        # Ignorar a linha com "Informações do Comprovante" e tudo abaixo
-        if "Informações do Comprovante" in linha:
-            break
-        
-        linhas_intermediarias.append(linha)
-        i += 1
-    
-    # 3. PROCESSAR TRANSAÇÕES E SEPARAR EM VARIÁVEIS
-    
-    # Padrão de data flexível (DD/MM/YY ou DD/MM/YYYY)
-    date_pattern = r"^\d{2}/\d{2}/\d{2,4}$"
-    
-    # Padrão de valor: aceita o formato brasileiro com ou sem R$ e sinal de menos, 
-    # além de espaços opcionais (ex: - R$ 10.000,00).
-    value_pattern = r"^-?\s*R?\s*\$?\s*\d{1,3}(?:\.\d{3})*,\d{2}$" 
-    
-    # Mapeamento para suportar os dois formatos (antigo e novo)
-    type_mapping = {
-        "Débito": 'D',
-        "Crédito": 'C',
-        "Saída": 'D',
-        "Entrada": 'C',
-    }
-    type_keywords = list(type_mapping.keys())
-    
     transactions = []
-    i = 0
-    while i < len(linhas_intermediarias):
-        linha = linhas_intermediarias[i]
-        
-        # Verificar se é uma data (início de uma transação)
-        if re.match(date_pattern, linha):
-            data = linha
-            i += 1
-            
-            # Verificar o tipo (próxima linha) e usar o mapeamento
-            if i < len(linhas_intermediarias) and linhas_intermediarias[i] in type_keywords:
-                tipo = type_mapping[linhas_intermediarias[i]] # Usa o mapeamento
-                i += 1
-            else:
-                continue  # Se não encontrar o tipo, pular para próxima data
-            
-            # Coletar a descrição até encontrar o valor
-            descricao = []
-            valor = None
-            while i < len(linhas_intermediarias):
-                linha_atual = linhas_intermediarias[i]
-                
-                # Verificar se é um valor monetário (novo e antigo formato)
-                if re.match(value_pattern, linha_atual.strip()):
-                    valor_raw = linha_atual.strip()
-                    i += 1
-                    
-                    # LIMPEZA DO VALOR: remover "R$", espaços, '$' e o sinal de menos.
-                    # O tipo (C/D) já define a direção da transação.
-                    valor_limpo = valor_raw.replace("R$", "").replace("$", "").replace(" ", "").replace("-", "")
-                    valor = valor_limpo.strip()
-                    break
-                
-                # Se não é um valor, é parte da descrição
-                descricao.append(linha_atual)
-                i += 1
-            
-            # Se encontrou o valor, formar a transação
-            if valor:
-                # Juntar a descrição em uma única string
-                descricao_texto = " ".join(descricao).strip() if descricao else ""
-                
-                valor_ajustado = valor
-                
-                # Remover ",00" se for um número inteiro (mantendo a lógica original)
-                if valor_ajustado.endswith(",00"):
-                    valor_ajustado = valor_ajustado[:-3]
-                
-                transactions.append({
-                    "Data": data,
-                    "Descrição": descricao_texto,
-                    "Valor": valor_ajustado,
-                    "Tipo": tipo
-                })
-            
+    estado = None  # None: procurando data; ESPERA_TIPO; DESCRICAO
+    pular = 0
+    data = tipo = None
+    descricao = []
+
+    for linha in _apos_contraparte(TOKENIZADOR(text)):
+        texto = linha.texto
+
+        # Cabeçalhos repetidos e rodapé
+        if pular:
+            pular -= 1
+            continue
+        if linha.classe is Classe.CABECALHO:
+            # Ignorar a linha com "DATA" (novo e antigo cabeçalho) e as 5 linhas seguintes.
+            # Ambas as estruturas de cabeçalho da tabela (DATA...CONTRAPARTE) ocupam 6 linhas.
+            if "DATA" in texto:
+                pular = 5
+                continue
+            # Ignorar a linha com "Informações do Comprovante" e tudo abaixo
+            if "Informações do Comprovante" in texto:
+                break
+
+        if estado == DESCRICAO:
+            # Coletar a descrição até encontrar o valor (novo e antigo formato)
+            if linha.classe is not Classe.VALOR:
+                descricao.append(texto)
+                continue
+
+            # LIMPEZA DO VALOR: remover "R$", espaços, '$' e o sinal de menos.
+            # O tipo (C/D) já define a direção da transação.
+            valor = texto.replace("R$", "").replace("$", "").replace(" ", "").replace("-", "").strip()
+
+            # Remover ",00" se for um número inteiro (mantendo a lógica original)
+            if valor.endswith(",00"):
+                valor = valor[:-3]
+
+            transactions.append({
+                "Data": data,
+                "Descrição": " ".join(descricao).strip(),
+                "Valor": valor,
+                "Tipo": tipo
+            })
             # Pular até a próxima data (ignorar saldo e contraparte)
-            while i < len(linhas_intermediarias) and not re.match(date_pattern, linhas_intermediarias[i]):
-                i += 1
-        else:
-            i += 1
-    
+            estado = None
+            continue
+
+        if estado == ESPERA_TIPO:
+            # O tipo vem na linha seguinte à data; sem ele, a linha é examinada como nova data
+            estado = None
+            if linha.classe is Classe.TIPO:
+                tipo = TIPOS[texto]
+                descricao = []
+                estado = DESCRICAO
+                continue
+
+        # Uma data inicia a transação
+        if linha.classe is Classe.DATA:
+            data = texto
+            estado = ESPERA_TIPO
+
     return transactions
 
 def extract_transactions(transactions):
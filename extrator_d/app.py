@@ -1,48 +1,41 @@
-import io
 from flask import Blueprint, request, send_file, render_template, jsonify
 from flask_cors import CORS
 
-from extrator_contajur.auxiliares.pdf_reader import read_pdf
-from extrator_contajur.auxiliares.pdf_reader2 import read_pdf2
-from extrator_contajur.banco import get_processor
-from extrator_contajur.auxiliares.xml_to_csv import xml_to_csv
-from .processador import processar
+from extrator_contajur.auxiliares.documento import banco_identificado
+from extrator_contajur.auxiliares.processamento import PIPELINE_EXTRATOS, ErroParser
+from extrator_contajur.auxiliares.upload import PDFEnviado
 
 extrator_d_bp = Blueprint("extrator_d", __name__, url_prefix="/extrator-d")
 CORS(extrator_d_bp)
 
-BANKS_USING_PDF2 = {
-    'Asaas', 'Bradesco', 'Sicoob1', 'Sicoob2', 'Sicoob3', 'Stone', 'Sicredi', 'Itaú4',
-    'Banco do Brasil1', 'Safra', 'Santander2', 'Efi1', 'Efi2', 'Mercado Pago', 'Caixa2'
-}
+# Rota nos ganchos do pipeline (logs e histograma de tempos)
+ROTA_EXTRATOS = "extrator-d"
 
 
-def _pdf_to_csv_bytes(file) -> tuple[bytes, str]:
-    """Converte PDF de extrato em bytes CSV. Retorna (csv_bytes, banco)."""
-    text, bank = read_pdf(file)
-    if not text or bank.startswith("Erro") or bank == "Banco não identificado":
-        raise ValueError(f"Banco não identificado: {bank}")
-
-    if bank in BANKS_USING_PDF2:
-        file.seek(0)
-        text = read_pdf2(file)
-
-    processor = get_processor(bank)
-    xml_data, _ = processor(text)
-    if xml_data is None:
-        raise ValueError("Nenhuma transação encontrada no PDF.")
-
-    xml_data.seek(0)
-    csv_data = xml_to_csv(xml_data)
-
-    if isinstance(csv_data, io.StringIO):
-        csv_bytes = csv_data.getvalue().encode("utf-8")
-    elif isinstance(csv_data, io.BytesIO):
-        csv_bytes = csv_data.getvalue()
+def _pdf_to_transacoes(file) -> tuple[list, str]:
+    """Extrai as transações de um PDF de extrato. Retorna (transacoes, banco)."""
+    tempos = {}
+    bank, transacoes, erro = None, None, None
+    try:
+        with PDFEnviado.de_upload(file, exigir_pdf=False) as pdf:
+            extracao = PIPELINE_EXTRATOS.extrair(pdf.fonte, file.filename, tempos=tempos)
+            bank, transacoes = extracao.banco, extracao.transacoes
+    except ErroParser as e:
+        erro = f"Erro no processamento: {e}"
+    except Exception as e:
+        erro = f"Erro ao ler PDF: {e}"
     else:
-        csv_bytes = csv_data if isinstance(csv_data, bytes) else csv_data.encode("utf-8")
+        if not banco_identificado(bank):
+            erro = f"Banco não identificado: {bank}"
+        elif not transacoes:
+            erro = "Nenhuma transação encontrada no PDF."
 
-    return csv_bytes, bank
+    identificado = bank is not None and banco_identificado(bank)
+    PIPELINE_EXTRATOS.concluir(ROTA_EXTRATOS, file.filename, bank if identificado else None, tempos,
+                               sucesso=erro is None, transacoes=len(transacoes or []))
+    if erro:
+        raise ValueError(erro)
+    return transacoes, bank
 
 
 @extrator_d_bp.route("/")
@@ -58,6 +51,8 @@ def upload():
         nome[]:  lista de nomes para busca
         cpf[]:   lista de CPFs/6 dígitos para busca (mesma ordem dos nomes)
     """
+    from .processador import processar
+
     files = request.files.getlist("files[]")
     if not files or all(f.filename == "" for f in files):
         return jsonify({"success": False, "error": "Nenhum arquivo enviado (campo: files[])"}), 400
@@ -72,7 +67,8 @@ def upload():
     buscas = [{"nome": n, "cpf": c} for n, c in zip(nomes, cpfs) if n.strip() or c.strip()]
 
     try:
-        csv_parts = []
+        transacoes = []
+        arquivos_ok = 0
         erros = []
         for file in files:
             if not file or file.filename == "":
@@ -81,21 +77,19 @@ def upload():
                 erros.append(f"{file.filename}: não é PDF")
                 continue
             try:
-                csv_bytes, _ = _pdf_to_csv_bytes(file)
-                csv_parts.append(csv_bytes)
+                extraidas, _ = _pdf_to_transacoes(file)
+                transacoes.extend(extraidas)
+                arquivos_ok += 1
             except ValueError as e:
                 erros.append(f"{file.filename}: {e}")
 
-        if not csv_parts:
+        if not arquivos_ok:
             msg = "; ".join(erros) if erros else "Nenhum arquivo processado com sucesso"
             return jsonify({"success": False, "error": msg}), 422
 
-        # Concatena todos os CSVs (um após o outro, sem cabeçalho)
-        combined_csv = b"\n".join(p.rstrip(b"\n") for p in csv_parts)
-
-        excel = processar(combined_csv, buscas)
+        excel = processar(transacoes, buscas)
 
-        nome_arquivo = "debitos.xlsx" if len(csv_parts) > 1 else (
+        nome_arquivo = "debitos.xlsx" if arquivos_ok > 1 else (
             files[0].filename.rsplit(".", 1)[0] + "_debitos.xlsx"
         )
         return send_file(
@@ -1,10 +1,11 @@
 import io
 import re
-import pandas as pd
 from openpyxl import Workbook
 from openpyxl.styles import PatternFill, Font, Alignment
 from openpyxl.utils import get_column_letter
 
+from extrator_contajur.auxiliares.transacao import Tipo, Transacao
+
 BLUE_FILL = PatternFill(start_color="BDD7EE", end_color="BDD7EE", fill_type="solid")
 HEADER_FILL = PatternFill(start_color="2E75B6", end_color="2E75B6", fill_type="solid")
 HEADER_FONT = Font(color="FFFFFF", bold=True)
@@ -48,8 +49,8 @@ def _write_header(ws):
         ws.column_dimensions[get_column_letter(col_idx)].width = width
 
 
-def _write_row(ws, row_num: int, row: pd.Series, highlight: bool):
-    values = [row["data"], row["descricao"], row["valor"], row["tipo"]]
+def _write_row(ws, row_num: int, row: Transacao, highlight: bool):
+    values = row.campos
     for col_idx, val in enumerate(values, start=1):
         cell = ws.cell(row=row_num, column=col_idx, value=val)
         if highlight:
@@ -58,10 +59,10 @@ def _write_row(ws, row_num: int, row: pd.Series, highlight: bool):
             cell.alignment = Alignment(wrap_text=False)
 
 
-def processar(file_content: bytes, buscas: list[dict]) -> io.BytesIO:
+def processar(transacoes: list[Transacao], buscas: list[dict]) -> io.BytesIO:
     """
     Parâmetros:
-        file_content: bytes do CSV (data;descricao;valor;tipo, sem cabeçalho)
+        transacoes: transações extraídas dos extratos (Transacao)
         buscas: [{"nome": str, "cpf": str}, ...]  — nome e/ou cpf podem ser vazios
 
     Retorna:
@@ -69,21 +70,7 @@ def processar(file_content: bytes, buscas: list[dict]) -> io.BytesIO:
           - "Todas D": todas as transações tipo D, encontradas destacadas em azul
           - Uma aba por busca com as transações encontradas para aquele CPF/nome
     """
-    try:
-        text = file_content.decode("utf-8-sig")
-    except UnicodeDecodeError:
-        text = file_content.decode("latin-1")
-
-    df = pd.read_csv(
-        io.StringIO(text),
-        header=None,
-        sep=";",
-        names=["data", "descricao", "valor", "tipo"],
-        on_bad_lines="skip",
-        dtype=str,
-    )
-
-    df_d = df[df["tipo"].str.strip() == "D"].copy().reset_index(drop=True)
+    debitos = [t for t in transacoes if t.tipo is Tipo.DEBITO]
 
     # Pré-processa buscas
     buscas_proc = []
@@ -103,8 +90,8 @@ def processar(file_content: bytes, buscas: list[dict]) -> io.BytesIO:
 
     # Para cada linha D, calcula quais buscas ela satisfaz
     match_flags = []  # lista de sets com índices das buscas que a linha atende
-    for _, row in df_d.iterrows():
-        desc = str(row["descricao"])
+    for row in debitos:
+        desc = row.descricao
         hits = set()
         for i, b in enumerate(buscas_proc):
             if _matches(desc, b["nome"], b["cpf_digits"]):
@@ -117,7 +104,7 @@ def processar(file_content: bytes, buscas: list[dict]) -> io.BytesIO:
     ws_all = wb.active
     ws_all.title = "Todas D"
     _write_header(ws_all)
-    for i, (_, row) in enumerate(df_d.iterrows()):
+    for i, row in enumerate(debitos):
         highlight = len(match_flags[i]) > 0
         _write_row(ws_all, i + 2, row, highlight)
     ws_all.freeze_panes = "A2"
@@ -127,7 +114,7 @@ def processar(file_content: bytes, buscas: list[dict]) -> io.BytesIO:
         ws = wb.create_sheet(title=b["sheet_name"])
         _write_header(ws)
         row_num = 2
-        for i, (_, row) in enumerate(df_d.iterrows()):
+        for i, row in enumerate(debitos):
             if b_idx in match_flags[i]:
                 _write_row(ws, row_num, row, highlight=True)
                 row_num += 1
@@ -12,15 +12,6 @@ from pathlib import Path
 from flask import Blueprint, jsonify, render_template, request, send_file, make_response
 from flask_cors import CORS
 
-from gnre_difal.leitor_dados import ler_planilha
-from gnre_difal.xml_builder import (
-    construir_envelope_soap_consulta,
-    construir_envelope_soap_recepcao,
-    construir_lote_xml,
-    construir_lote_xml_arquivo,
-    dividir_em_lotes,
-)
-from gnre_difal.exportador import salvar_log_protocolos, salvar_resultados
 from gnre_difal.models import RetornoGuia
 
 gnre_difal_bp = Blueprint(
@@ -292,6 +283,16 @@ def _executar_job(
     dry_run: bool,
 ) -> None:
     import gnre_difal.config as cfg  # import aqui para não misturar estado global
+    # Leitura (pandas) e XML (lxml) importados no primeiro job, não na subida do servidor
+    from gnre_difal.exportador import salvar_log_protocolos, salvar_resultados
+    from gnre_difal.leitor_dados import ler_planilha
+    from gnre_difal.xml_builder import (
+        construir_envelope_soap_consulta,
+        construir_envelope_soap_recepcao,
+        construir_lote_xml,
+        construir_lote_xml_arquivo,
+        dividir_em_lotes,
+    )
 
     try:
         _atualizar(job_id, status="lendo_dados")
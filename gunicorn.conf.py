@@ -0,0 +1,99 @@
+"""
+Configuração do gunicorn para produção, lida das variáveis de ambiente.
+
+    gunicorn -c gunicorn.conf.py home.main:app              # portal (Procfile)
+    PORT=5501 gunicorn -c gunicorn.conf.py api_server:app   # só a API
+
+Modelos de worker (GUNICORN_WORKER_CLASS):
+  - gthread (padrão): cada processo atende GUNICORN_THREADS requisições ao mesmo
+    tempo. O extrator de extratos manda os PDFs para o próprio pool de processos
+    (EXTRATOR_WORKERS), então a thread só espera e o processo continua atendendo
+    as outras rotas enquanto um lote é processado.
+  - sync: uma requisição por processo; isola melhor as rotas que processam no
+    próprio processo (conferência de notas, inventário, boletos), ao custo de mais
+    memória por requisição simultânea.
+  - gevent: exige o pacote gevent. Só ajuda em rotas que esperam rede (retenção
+    via Gemini, GNRE); o processamento de PDF trava o processo inteiro.
+
+A memória cresce com os processos: cada um carrega pandas e os parsers no
+primeiro uso e o extrator ainda tem o próprio pool. Sem EXTRATOR_WORKERS no
+ambiente, o pool de cada processo fica com as CPUs divididas entre os `workers`
+(no mínimo 1), para o total não passar de uma CPU por processo de extração; quem
+definir EXTRATOR_WORKERS deve fazer a mesma conta (EXTRATOR_WORKERS x workers). Com GUNICORN_MAX_REQUESTS,
+cada processo é trocado por um novo depois de tantas requisições (com um sorteio
+de até GUNICORN_MAX_REQUESTS_JITTER a mais, para não reciclarem todos juntos).
+No gthread, as conexões keep-alive que o processo reciclado ainda segurava são
+fechadas; com GUNICORN_MAX_REQUESTS=0 os processos não são reciclados.
+
+benchmarks/carga.py compara os modelos sob carga.
+"""
+import importlib.util
+import multiprocessing
+import os
+import sys
+
+_MODELOS_WORKER = {"sync": "sync", "gthread": "gthread", "thread": "gthread", "gevent": "gevent"}
+
+bind = os.getenv("GUNICORN_BIND") or f"0.0.0.0:{os.getenv('PORT', '5500')}"
+
+worker_class = _MODELOS_WORKER.get(os.getenv("GUNICORN_WORKER_CLASS", "gthread").strip().lower())
+if worker_class is None:
+    raise RuntimeError(
+        f"GUNICORN_WORKER_CLASS inválido: {os.getenv('GUNICORN_WORKER_CLASS')!r} "
+        f"(use {', '.join(sorted(_MODELOS_WORKER))})"
+    )
+if worker_class == "gevent" and importlib.util.find_spec("gevent") is None:
+    raise RuntimeError("GUNICORN_WORKER_CLASS=gevent exige o pacote gevent (pip install gevent)")
+
+# WEB_CONCURRENCY é o nome que as plataformas de deploy já definem
+workers = int(os.getenv("WEB_CONCURRENCY", min(multiprocessing.cpu_count() * 2 + 1, 4)))
+# Cada worker tem o próprio pool do extrator: divide as CPUs entre eles. Definido
+# aqui, antes de o app ser importado, vale para o mestre e para os workers
+os.environ.setdefault("EXTRATOR_WORKERS", str(max(1, multiprocessing.cpu_count() // workers)))
+threads = int(os.getenv("GUNICORN_THREADS", "4")) if worker_class == "gthread" else 1
+# Conexões simultâneas por processo no gevent
+worker_connections = int(os.getenv("GUNICORN_WORKER_CONNECTIONS", "100"))
+
+# Carrega o app uma vez no processo mestre, antes do fork: os workers sobem e são
+# reciclados mais rápido e compartilham a memória das importações. A thread de
+# limpeza dos ZIPs do extrator sobe no mestre e segue rodando lá
+preload_app = os.getenv("GUNICORN_PRELOAD", "1") != "0"
+
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "1000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "100"))
+
+# Um worker sync que não responde nesse tempo é morto; precisa cobrir o maior
+# lote de PDFs (cada arquivo tem até EXTRATOR_TIMEOUT_ARQUIVO segundos)
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "300"))
+# Prazo para as requisições em andamento terminarem depois de um SIGTERM
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "60"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+
+# Heartbeat dos workers em memória: em contêiner o /tmp pode ser disco lento
+if os.path.isdir("/dev/shm"):
+    worker_tmp_dir = "/dev/shm"
+
+accesslog = os.getenv("GUNICORN_ACCESSLOG", "-") or None
+errorlog = "-"
+loglevel = os.getenv("GUNICORN_LOGLEVEL", "info")
+
+
+
+def on_starting(server):
+    # As métricas somadas entre os workers (home.metricas) recomeçam a cada início
+    from extrator_contajur.auxiliares.estado_compartilhado import ESTADO_COMPARTILHADO
+    ESTADO_COMPARTILHADO.limpar()
+
+
+def worker_exit(server, worker):
+    # Reciclado (max_requests) ou encerrado, o worker espera os jobs assíncronos do
+    # extrator que ainda estão rodando em threads dele, dentro do graceful_timeout
+    app_extrator = sys.modules.get("extrator_contajur.app")
+    if app_extrator is not None:
+        restantes = app_extrator.aguardar_jobs(graceful_timeout)
+        if restantes:
+            server.log.warning("Worker %s encerrado com %s job(s) de extratos em andamento", worker.pid, restantes)
+    # Grava as métricas finais do worker para a soma entre os processos
+    estado = sys.modules.get("extrator_contajur.auxiliares.estado_compartilhado")
+    if estado is not None:
+        estado.ESTADO_COMPARTILHADO.gravar()
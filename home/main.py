@@ -18,6 +18,8 @@ from notas_locacao.app import notas_locacao_bp
 from extrator_d.app import extrator_d_bp
 from conciliacao.app import conciliacao_bp
 from gnre_difal.app import gnre_difal_bp
+from extrator_contajur.auxiliares.upload import RequisicaoUpload
+from home.metricas import instrumentar
 
 # Configurar o Flask
 base_dir = os.path.dirname(os.path.abspath(__file__))
@@ -25,6 +27,8 @@ app = Flask(__name__,
             template_folder=os.path.join(base_dir, 'templates'),
             static_folder=os.path.join(base_dir, 'static'))
 CORS(app)
+# Uploads grandes gravados direto em UPLOAD_DIR, sem uma segunda cópia (ver PDFEnviado)
+app.request_class = RequisicaoUpload
 
 # Configurações
 app.config['MAX_CONTENT_LENGTH'] = 80 * 1024 * 1024  # 100MB max file size
@@ -41,6 +45,9 @@ app.register_blueprint(extrator_d_bp)
 app.register_blueprint(conciliacao_bp)
 app.register_blueprint(gnre_difal_bp)
 
+# Métricas de todas as rotas em /metrics
+instrumentar(app)
+
 # Rota principal
 @app.route('/')
 def index():
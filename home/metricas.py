@@ -0,0 +1,268 @@
+"""
+Métricas do servidor no formato texto do Prometheus, sem dependências externas.
+
+`instrumentar(app)` mede todas as rotas de todos os blueprints (requisições por
+status, latência, bytes recebidos e enviados) e publica /metrics. Os dados do
+extrator (arquivos por banco, tempos por etapa e fila do pool de processos) são
+lidos na hora da coleta, de extrator_contajur.auxiliares.tempos e processamento.
+
+Com vários workers do gunicorn, cada processo grava os próprios valores numa
+pasta privada e a coleta soma os de todos (extrator_contajur.auxiliares.
+estado_compartilhado), inclusive os dos workers já reciclados: atendida por
+qualquer worker, /metrics mostra o servidor inteiro, com até
+EXTRATOR_ESTADO_INTERVALO segundos de atraso nos outros processos. Com
+METRICAS_TOKEN definido, /metrics exige o cabeçalho "Authorization: Bearer <token>".
+"""
+import bisect
+import os
+import threading
+import time
+
+from flask import Response, g, request
+
+from extrator_contajur.auxiliares.estado_compartilhado import (
+    ESTADO_COMPARTILHADO, juntar_series, somar_fotos,
+)
+
+METRICAS_TOKEN = os.getenv("METRICAS_TOKEN", "")
+
+# Faixas (le) das latências em segundos e dos tamanhos em bytes
+FAIXAS_SEGUNDOS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+FAIXAS_BYTES = (1024, 10 * 1024, 100 * 1024, 1024 ** 2, 10 * 1024 ** 2, 100 * 1024 ** 2)
+
+_TIPO_CONTEUDO = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escapar(valor):
+    return str(valor).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _rotulos(nomes, valores, extra=None):
+    pares = [f'{nome}="{_escapar(valor)}"' for nome, valor in zip(nomes, valores)]
+    if extra:
+        pares.append(extra)
+    return "{" + ",".join(pares) + "}" if pares else ""
+
+
+def _numero(valor):
+    if valor == float("inf"):
+        return "+Inf"
+    return repr(float(valor)) if isinstance(valor, float) else str(valor)
+
+
+def linhas_histograma(nome, nomes_rotulos, valores_rotulos, faixas, contagens, soma, total):
+    """
+    Linhas _bucket/_sum/_count de uma série de histograma. `contagens[i]` conta as
+    observações da faixa i (não acumulado), com uma posição a mais para o +Inf.
+    """
+    acumulado = 0
+    for limite, contagem in zip(tuple(faixas) + (float("inf"),), contagens):
+        acumulado += contagem
+        rotulos = _rotulos(nomes_rotulos, valores_rotulos, f'le="{_numero(limite)}"')
+        yield f"{nome}_bucket{rotulos} {acumulado}"
+    rotulos = _rotulos(nomes_rotulos, valores_rotulos)
+    yield f"{nome}_sum{rotulos} {_numero(soma)}"
+    yield f"{nome}_count{rotulos} {total}"
+
+
+class _Metrica:
+    tipo = None
+
+    def __init__(self, nome, ajuda, rotulos=()):
+        self.nome = nome
+        self.ajuda = ajuda
+        self.rotulos = tuple(rotulos)
+        self.compartilhada = False
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def cabecalho(self):
+        return [f"# HELP {self.nome} {self.ajuda}", f"# TYPE {self.nome} {self.tipo}"]
+
+    def foto(self):
+        """Séries deste processo em JSON: [[rótulos, valor], ...]."""
+        with self._lock:
+            return [[list(valores), self._copiar(valor)] for valores, valor in self._series.items()]
+
+    @staticmethod
+    def _copiar(valor):
+        return valor
+
+    def _atuais(self):
+        """{rótulos: valor} somados entre os processos (só deste, fora do estado compartilhado)."""
+        fotos = ESTADO_COMPARTILHADO.ler(self.nome) if self.compartilhada else self.foto()
+        return {tuple(valores): valor for valores, valor in fotos}
+
+
+class Contador(_Metrica):
+    tipo = "counter"
+
+    def inc(self, *valores_rotulos, valor=1):
+        if self.compartilhada:
+            ESTADO_COMPARTILHADO.tocar()
+        with self._lock:
+            self._series[valores_rotulos] = self._series.get(valores_rotulos, 0) + valor
+
+    def linhas(self):
+        series = sorted(self._atuais().items())
+        yield from self.cabecalho()
+        for valores, total in series:
+            yield f"{self.nome}{_rotulos(self.rotulos, valores)} {_numero(total)}"
+
+
+class Histograma(_Metrica):
+    tipo = "histogram"
+
+    def __init__(self, nome, ajuda, rotulos=(), faixas=FAIXAS_SEGUNDOS):
+        super().__init__(nome, ajuda, rotulos)
+        self.faixas = tuple(faixas)
+
+    @staticmethod
+    def _copiar(valor):
+        contagens, soma, total = valor
+        return [list(contagens), soma, total]
+
+    def observar(self, valor, *valores_rotulos):
+        if self.compartilhada:
+            ESTADO_COMPARTILHADO.tocar()
+        with self._lock:
+            serie = self._series.get(valores_rotulos)
+            if serie is None:
+                serie = self._series[valores_rotulos] = [[0] * (len(self.faixas) + 1), 0.0, 0]
+            serie[0][bisect.bisect_left(self.faixas, valor)] += 1
+            serie[1] += valor
+            serie[2] += 1
+
+    def linhas(self):
+        series = sorted(self._atuais().items())
+        yield from self.cabecalho()
+        for valores, (contagens, soma, total) in series:
+            yield from linhas_histograma(self.nome, self.rotulos, valores, self.faixas, contagens, soma, total)
+
+
+class RegistroMetricas:
+    """
+    Métricas registradas e coletores (funções que geram linhas na hora da coleta).
+    As métricas registradas entram no estado compartilhado entre os processos.
+    """
+
+    def __init__(self):
+        self._metricas = []
+        self._coletores = []
+
+    def _registrar(self, metrica):
+        ESTADO_COMPARTILHADO.fonte(metrica.nome, metrica.foto, juntar_series)
+        metrica.compartilhada = True
+        self._metricas.append(metrica)
+        return metrica
+
+    def contador(self, nome, ajuda, rotulos=()):
+        return self._registrar(Contador(nome, ajuda, rotulos))
+
+    def histograma(self, nome, ajuda, rotulos=(), faixas=FAIXAS_SEGUNDOS):
+        return self._registrar(Histograma(nome, ajuda, rotulos, faixas))
+
+    def coletor(self, funcao):
+        self._coletores.append(funcao)
+        return funcao
+
+    def texto(self):
+        linhas = []
+        for metrica in self._metricas:
+            linhas.extend(metrica.linhas())
+        for coletor in self._coletores:
+            linhas.extend(coletor())
+        return "\n".join(linhas) + "\n"
+
+
+REGISTRO = RegistroMetricas()
+
+REQUISICOES = REGISTRO.contador(
+    "http_requisicoes_total", "Requisições atendidas, por blueprint, rota, método e status.",
+    ("blueprint", "rota", "metodo", "status"))
+DURACAO = REGISTRO.histograma(
+    "http_requisicao_duracao_segundos", "Tempo de resposta das requisições.",
+    ("blueprint", "rota", "metodo"))
+BYTES_RECEBIDOS = REGISTRO.histograma(
+    "http_requisicao_bytes", "Tamanho do corpo das requisições.", ("blueprint", "rota"), FAIXAS_BYTES)
+BYTES_ENVIADOS = REGISTRO.histograma(
+    "http_resposta_bytes", "Tamanho do corpo das respostas (quando conhecido).", ("blueprint", "rota"), FAIXAS_BYTES)
+
+
+def _foto_pool():
+    """[tarefas pendentes, processos do pool] deste processo do servidor."""
+    from extrator_contajur.auxiliares.processamento import PIPELINE_EXTRATOS, tarefas_pendentes
+
+    return [tarefas_pendentes(), max(0, PIPELINE_EXTRATOS.workers)]
+
+
+# Valores do momento: um worker que terminou deixa de contar
+ESTADO_COMPARTILHADO.fonte(
+    "extrator_pool", _foto_pool, lambda fotos: somar_fotos(fotos, [0, 0]), acumulativa=False)
+
+
+@REGISTRO.coletor
+def _coletar_extrator():
+    """Arquivos por banco, tempos por etapa e fila do pool do extrator de extratos."""
+    from extrator_contajur.auxiliares.tempos import HISTOGRAMA_TEMPOS
+
+    yield "# HELP extrator_arquivos_total PDFs de extrato processados ou identificados, por banco e resultado."
+    yield "# TYPE extrator_arquivos_total counter"
+    for (banco, sucesso), total in sorted(HISTOGRAMA_TEMPOS.arquivos().items()):
+        yield f"extrator_arquivos_total{_rotulos(('banco', 'sucesso'), (banco, str(sucesso).lower()))} {total}"
+
+    nome = "extrator_etapa_duracao_segundos"
+    yield f"# HELP {nome} Duração de cada etapa do processamento dos extratos, por banco."
+    yield f"# TYPE {nome} histogram"
+    faixas = [limite / 1000 for limite in HISTOGRAMA_TEMPOS.faixas]
+    for banco, por_etapa in sorted(HISTOGRAMA_TEMPOS.resumo().items()):
+        for etapa, dados in sorted(por_etapa.items()):
+            yield from linhas_histograma(
+                nome, ("banco", "etapa"), (banco, etapa), faixas,
+                dados['faixas'], dados['soma_ms'] / 1000, dados['contagem'])
+
+    pendentes, workers = ESTADO_COMPARTILHADO.ler("extrator_pool")
+    yield "# HELP extrator_pool_tarefas_pendentes PDFs aguardando ou em execução nos pools de processos."
+    yield "# TYPE extrator_pool_tarefas_pendentes gauge"
+    yield f"extrator_pool_tarefas_pendentes {pendentes}"
+    yield "# HELP extrator_pool_workers Processos dos pools do extrator, somados entre os workers (0 = processamento em série)."
+    yield "# TYPE extrator_pool_workers gauge"
+    yield f"extrator_pool_workers {workers}"
+
+
+def _inicio_requisicao():
+    g._metricas_inicio = time.perf_counter()
+
+
+def _fim_requisicao(response):
+    inicio = g.pop('_metricas_inicio', None)
+    if inicio is None:
+        return response
+    blueprint = request.blueprint or "app"
+    rota = request.url_rule.rule if request.url_rule is not None else "desconhecida"
+    REQUISICOES.inc(blueprint, rota, request.method, str(response.status_code))
+    DURACAO.observar(time.perf_counter() - inicio, blueprint, rota, request.method)
+    if request.content_length:
+        BYTES_RECEBIDOS.observar(request.content_length, blueprint, rota)
+    if response.content_length is not None:
+        BYTES_ENVIADOS.observar(response.content_length, blueprint, rota)
+    return response
+
+
+def metrics():
+    """Métricas no formato texto do Prometheus."""
+    if METRICAS_TOKEN and request.headers.get("Authorization") != f"Bearer {METRICAS_TOKEN}":
+        return Response("Não autorizado\n", status=401, mimetype="text/plain")
+    return Response(REGISTRO.texto(), content_type=_TIPO_CONTEUDO)
+
+
+def instrumentar(app):
+    """
+    Mede todas as requisições do app (de qualquer blueprint), publica /metrics e liga a
+    soma das métricas entre os processos do servidor.
+    """
+    ESTADO_COMPARTILHADO.ativar()
+    app.before_request(_inicio_requisicao)
+    app.after_request(_fim_requisicao)
+    app.add_url_rule("/metrics", "metrics", metrics, methods=["GET"])
+    return app
@@ -1,23 +1,21 @@
 import os
-import pandas as pd
-import pdfplumber
 import zipfile
 from flask import Blueprint, render_template, request, send_file
 from io import BytesIO
 
-# Importação dos modelos
-from inventario.models.gestao_estoque import GestaoEstoque
-from inventario.models.modelo_brasart import ModeloBrasArt
-from inventario.models.modelo_listagem_simples import ModeloListagemSimples
-from inventario.models.modelo_p7 import ModeloP7
-from inventario.models.modelo_p7_2 import ModeloP72
-from inventario.models.modelo_p7_3 import ModeloP73
-from inventario.models.modelo_registro_inventario import ModeloRI
-from inventario.models.posicao_estoque import PosicaoEstoque
-
 inventario_bp = Blueprint('inventario', __name__)
 
 def identificar_modelo(primeira_pagina_texto):
+    # Modelos importados no primeiro uso: dependem do pandas
+    from inventario.models.gestao_estoque import GestaoEstoque
+    from inventario.models.modelo_brasart import ModeloBrasArt
+    from inventario.models.modelo_listagem_simples import ModeloListagemSimples
+    from inventario.models.modelo_p7 import ModeloP7
+    from inventario.models.modelo_p7_2 import ModeloP72
+    from inventario.models.modelo_p7_3 import ModeloP73
+    from inventario.models.modelo_registro_inventario import ModeloRI
+    from inventario.models.posicao_estoque import PosicaoEstoque
+
     if "LIVRO REGISTRO DE INVENTÁRIO - RI - MODELO P7" in primeira_pagina_texto:
         return ModeloP7
     elif "Livro Registro de Inventário - RI - Modelo P7" in primeira_pagina_texto:
@@ -42,6 +40,9 @@ def inventario_page():
 
 @inventario_bp.route('/inventario/upload', methods=['POST'])
 def upload():
+    import pandas as pd
+    import pdfplumber
+
     files = request.files.getlist('inventarios')
     if not files:
         return "Nenhum arquivo enviado", 400
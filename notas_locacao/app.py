@@ -1,10 +1,11 @@
 import io
 import re
 import concurrent.futures
-import pdfplumber
+from contextlib import ExitStack
 from flask import Blueprint, request, jsonify, send_file, render_template
 from flask_cors import CORS
 
+from extrator_contajur.auxiliares.upload import PDFEnviado, eh_fonte_caminho
 from .processador import processar_nota
 
 notas_locacao_bp = Blueprint('notas_locacao', __name__, url_prefix='/notas-locacao')
@@ -28,12 +29,15 @@ def _has_two_docs(text: str) -> bool:
     return False
 
 
-def _ocr_pdf(file_bytes: bytes) -> str:
-    """Fallback OCR via pytesseract (PDFs escaneados)."""
+def _ocr_pdf(fonte) -> str:
+    """Fallback OCR via pytesseract (PDFs escaneados). `fonte`: bytes ou caminho do PDF."""
     try:
-        from pdf2image import convert_from_bytes
+        from pdf2image import convert_from_bytes, convert_from_path
         import pytesseract
-        images = convert_from_bytes(file_bytes, dpi=300)
+        if eh_fonte_caminho(fonte):
+            images = convert_from_path(fonte, dpi=300)
+        else:
+            images = convert_from_bytes(fonte, dpi=300)
         print(f"[NOTAS] OCR: {len(images)} página(s) convertida(s)")
         return "\n".join(
             pytesseract.image_to_string(img, lang='por') for img in images
@@ -47,11 +51,13 @@ def _ocr_pdf(file_bytes: bytes) -> str:
         return ""
 
 
-def _extract_text_from_pdf(file_bytes: bytes) -> str:
+def _extract_text_from_pdf(fonte) -> str:
     # Sempre usa pdfplumber como base principal
+    import pdfplumber
+
     text = ""
     try:
-        with pdfplumber.open(io.BytesIO(file_bytes)) as pdf:
+        with pdfplumber.open(fonte if eh_fonte_caminho(fonte) else io.BytesIO(fonte)) as pdf:
             for page in pdf.pages:
                 t = page.extract_text()
                 if t:
@@ -68,7 +74,7 @@ def _extract_text_from_pdf(file_bytes: bytes) -> str:
 
     # Falta o 2º CNPJ: roda OCR só para complementar o CNPJ do destinatário
     print("[NOTAS] menos de 2 CNPJs — rodando OCR apenas para buscar CNPJ do destinatário...")
-    ocr_text = _ocr_pdf(file_bytes)
+    ocr_text = _ocr_pdf(fonte)
     ocr_cnpjs = _CNPJ_RE.findall(ocr_text)
     print(f"[NOTAS] OCR → {len(ocr_text)} chars | CNPJs encontrados: {ocr_cnpjs}")
 
@@ -84,10 +90,10 @@ def _extract_text_from_pdf(file_bytes: bytes) -> str:
         return text
 
 
-def _process_single(filename: str, file_bytes: bytes) -> dict:
+def _process_single(filename: str, fonte) -> dict:
     print(f"\n[NOTAS] ── processando: {filename} ──")
     try:
-        text = _extract_text_from_pdf(file_bytes)
+        text = _extract_text_from_pdf(fonte)
         if not text.strip():
             print(f"[NOTAS] {filename} → nenhum texto extraído")
             return {"filename": filename, "success": False, "error": "Nenhum texto extraído do PDF"}
@@ -131,41 +137,43 @@ def upload():
     if not files or all(f.filename == '' for f in files):
         return jsonify({'success': False, 'error': 'Nenhum arquivo selecionado'}), 400
 
-    file_payloads = []
-    for file in files:
-        if not file or file.filename == '':
-            continue
-        if not file.filename.lower().endswith('.pdf'):
-            file_payloads.append({
-                'filename': file.filename,
-                'bytes': None,
-                'error': 'Extensão inválida (esperado .pdf)',
-            })
-            continue
-        content = file.read()
-        if not content.startswith(b'%PDF-'):
-            file_payloads.append({
-                'filename': file.filename,
-                'bytes': None,
-                'error': 'Conteúdo não é um PDF válido',
-            })
-            continue
-        file_payloads.append({'filename': file.filename, 'bytes': content, 'error': None})
-
     results = []
-
-    valid = [p for p in file_payloads if p['bytes'] is not None]
-    if valid:
-        with concurrent.futures.ThreadPoolExecutor() as executor:
-            futures = [
-                executor.submit(_process_single, p['filename'], p['bytes'])
-                for p in valid
-            ]
-            for future, p in zip(futures, valid):
-                try:
-                    results.append(future.result())
-                except Exception as e:
-                    results.append({'filename': p['filename'], 'success': False, 'error': str(e)})
+    file_payloads = []
+    # Todo PDFEnviado entra na pilha assim que é criado: os temporários são apagados
+    # mesmo se um upload seguinte ou o processamento falhar
+    with ExitStack() as pilha:
+        for file in files:
+            if not file or file.filename == '':
+                continue
+            if not file.filename.lower().endswith('.pdf'):
+                file_payloads.append({
+                    'filename': file.filename,
+                    'pdf': None,
+                    'error': 'Extensão inválida (esperado .pdf)',
+                })
+                continue
+            pdf = pilha.enter_context(PDFEnviado.de_upload(file))
+            if not pdf.eh_pdf:
+                file_payloads.append({
+                    'filename': file.filename,
+                    'pdf': None,
+                    'error': 'Conteúdo não é um PDF válido',
+                })
+                continue
+            file_payloads.append({'filename': file.filename, 'pdf': pdf, 'error': None})
+
+        valid = [p for p in file_payloads if p['pdf'] is not None]
+        if valid:
+            with concurrent.futures.ThreadPoolExecutor() as executor:
+                futures = [
+                    executor.submit(_process_single, p['filename'], p['pdf'].fonte)
+                    for p in valid
+                ]
+                for future, p in zip(futures, valid):
+                    try:
+                        results.append(future.result())
+                    except Exception as e:
+                        results.append({'filename': p['filename'], 'success': False, 'error': str(e)})
 
     for p in file_payloads:
         if p['error']:
@@ -0,0 +1,76 @@
+# processador_lote/cli.py
+"""
+Processador em lote pela linha de comando, sem interface gráfica (ver lote.py).
+
+    python processador_lote/cli.py PASTA [PASTA ...]
+    python processador_lote/cli.py -w 8 --diario /dados/diario.jsonl /dados/clientes/*
+    python processador_lote/cli.py --refazer PASTA      # ignora o diário
+    python processador_lote/cli.py --vigiar PASTA       # modo contínuo, até Ctrl+C
+
+Os CSVs são gravados na pasta de cada PDF (as subpastas entram). Rodar de novo (ou depois de um Ctrl+C)
+continua de onde parou: os arquivos já concluídos estão no diário. As linhas de
+tempo em JSON de cada arquivo saem no stderr; EXTRATOR_LOG_TEMPOS=0 as desliga.
+Com --vigiar, as pastas continuam sendo acompanhadas e cada PDF novo ou alterado
+é processado assim que termina de ser copiado.
+Termina com código 1 se algum arquivo falhou e 130 se foi interrompido.
+"""
+import argparse
+import sys
+from datetime import datetime
+from pathlib import Path
+
+# Adicionar o diretório pai ao path para importar extrator_contajur
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from extrator_contajur.auxiliares.processamento import EXTRATOR_TIMEOUT_ARQUIVO, EXTRATOR_WORKERS  # noqa: E402
+from processador_lote.lote import (  # noqa: E402
+    PROCESSADOR_LOTE_DIARIO, PROCESSADOR_LOTE_ESPERA, PROCESSADOR_LOTE_INTERVALO, ProcessadorLote,
+)
+
+_PREFIXOS = {"success": "ok", "error": "ERRO", "warning": "aviso", "info": ".."}
+
+
+def _log(mensagem, nivel):
+    print(f"[{datetime.now():%H:%M:%S}] {_PREFIXOS.get(nivel, '..'):>5} {mensagem}", flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Processa em lote os extratos em PDF das pastas")
+    parser.add_argument('pastas', nargs='+', help="pastas com os PDFs (com as subpastas)")
+    parser.add_argument('-w', '--workers', type=int, default=EXTRATOR_WORKERS,
+                        help="processos em paralelo (padrão: %(default)s)")
+    parser.add_argument('--diario', default=PROCESSADOR_LOTE_DIARIO, help="arquivo do diário (padrão: %(default)s)")
+    parser.add_argument('--timeout', type=float, default=EXTRATOR_TIMEOUT_ARQUIVO,
+                        help="tempo limite por arquivo, em segundos (padrão: %(default)s)")
+    parser.add_argument('--refazer', action='store_true', help="processa de novo os arquivos do diário")
+    parser.add_argument('--vigiar', action='store_true',
+                        help="continua acompanhando as pastas e processa os PDFs que chegarem")
+    parser.add_argument('--intervalo', type=float, default=PROCESSADOR_LOTE_INTERVALO,
+                        help="com --vigiar, segundos entre varreduras (padrão: %(default)s)")
+    parser.add_argument('--espera', type=float, default=PROCESSADOR_LOTE_ESPERA,
+                        help="com --vigiar, segundos que um PDF precisa ficar sem mudar (padrão: %(default)s)")
+    args = parser.parse_args(argv)
+
+    processador = ProcessadorLote(args.diario, workers=args.workers, timeout=args.timeout,
+                                  refazer=args.refazer, ao_log=_log)
+    if args.vigiar:
+        resumo = processador.vigiar(args.pastas, intervalo=args.intervalo, espera=args.espera)
+        _log(f"Sucesso: {resumo.sucesso}, falha: {resumo.falha}, já processados: {resumo.pulados}", "info")
+        return 1 if resumo.falha else 0
+    pdfs = processador.listar_pdfs(args.pastas)
+    if not pdfs:
+        _log("Nenhum arquivo PDF encontrado nas pastas", "warning")
+        return 0
+    _log(f"Total: {len(pdfs)} arquivo(s) PDF, {processador.workers} processo(s)", "info")
+
+    resumo = processador.executar(pdfs)
+    _log(f"Sucesso: {resumo.sucesso}, falha: {resumo.falha}, já processados: {resumo.pulados}, "
+         f"pendentes: {resumo.total - resumo.pulados - resumo.sucesso - resumo.falha}", "info")
+    if resumo.cancelado:
+        _log("Lote interrompido; rode de novo para continuar", "warning")
+        return 130
+    return 1 if resumo.falha else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,777 @@
+# processador_lote/lote.py
+"""
+Processamento em lote de pastas de extratos, sem interface: usado pela GUI
+(processadorgui.py) e pela linha de comando (cli.py).
+
+As pastas são varridas com as subpastas (ocultas ficam de fora), e .pdf vale em
+qualquer caixa. Os PDFs são processados num pool de processos, os maiores
+primeiro (para nenhum arquivo grande ficar sozinho no fim); cada processo extrai o extrato
+pelo PIPELINE_EXTRATOS, monta o nome com o cliente e o período que ele achou
+(RENOMEADOR) e grava o CSV num arquivo temporário na pasta do PDF. O processo
+principal dá o nome final: se
+outro PDF do diário já gerou um CSV com o mesmo nome (dois extratos do mesmo
+cliente, banco e período), este ganha um sufixo _2, _3... em vez de sobrescrever
+o outro.
+
+O diário (DiarioLote) é o manifesto dos PDFs: um JSON por linha com caminho,
+mtime, tamanho e SHA-256 do PDF, banco, nome e caminho do CSV, situação (ok,
+copia ou erro) e o erro. A próxima execução pula os arquivos que já estão lá,
+inalterados e com o CSV ainda no lugar, então uma árvore grande é lida uma vez
+e depois só o que mudou; um lote cancelado ou interrompido continua de onde
+parou. Arquivos com erro são tentados de novo. Um PDF com o mesmo conteúdo de
+outro (o mesmo extrato copiado em várias pastas) não é processado de novo: o
+CSV do outro é copiado para a pasta dele. Só os PDFs com o tamanho de algum
+outro têm o hash calculado antes de processar.
+
+No modo contínuo (ProcessadorLote.vigiar), as pastas são varridas a cada poucos
+segundos e só os PDFs novos ou alterados entram no pool, depois de ficarem
+parados por PROCESSADOR_LOTE_ESPERA segundos (um PDF ainda sendo copiado para a
+pasta não é lido pela metade). A varredura é por polling, não por eventos do
+sistema de arquivos, porque as pastas dos clientes costumam ser de rede.
+
+Cada processo interrompe o próprio arquivo no tempo limite (SIGALRM), mas o sinal
+não chega a um processo preso em código C. Como garantia, o processo principal
+dá prazo de relógio a cada arquivo (_PoolLote): passado o prazo, o arquivo falha,
+o pool é trocado por um novo e os outros arquivos em andamento são reenviados.
+"""
+import concurrent.futures
+import json
+import multiprocessing
+import os
+import shutil
+import signal
+import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from pathlib import Path
+from typing import NamedTuple
+
+from extrator_contajur.auxiliares.documento import banco_identificado
+from extrator_contajur.auxiliares.processamento import (
+    EXTRATOR_TIMEOUT_ARQUIVO, EXTRATOR_WORKERS, PIPELINE_EXTRATOS, TempoEsgotado, medir, tempo_limite,
+)
+from extrator_contajur.auxiliares.renomeador import RENOMEADOR
+from extrator_contajur.auxiliares.upload import hash_fonte
+from extrator_contajur.auxiliares.utils import ResultadoExtrato
+
+PROCESSADOR_LOTE_DIARIO = os.getenv(
+    "PROCESSADOR_LOTE_DIARIO", str(Path.home() / ".processador_lote" / "diario.jsonl")
+)
+
+# Modo contínuo: intervalo entre varreduras e quanto tempo um PDF precisa ficar
+# sem mudar (mtime e tamanho) para ser processado, em segundos
+PROCESSADOR_LOTE_INTERVALO = float(os.getenv("PROCESSADOR_LOTE_INTERVALO", "2"))
+PROCESSADOR_LOTE_ESPERA = float(os.getenv("PROCESSADOR_LOTE_ESPERA", "5"))
+
+# Rota nos ganchos do pipeline (logs e histograma de tempos)
+ROTA_LOTE = "lote"
+
+# Segundos além do tempo limite até o processo principal dar um arquivo do pool como
+# esgotado (cobre a subida do processo e a importação dos parsers no primeiro arquivo)
+_FOLGA_PRAZO = 30
+
+
+class ResumoLote(NamedTuple):
+    total: int
+    pulados: int
+    sucesso: int
+    falha: int
+    cancelado: bool
+
+
+def varrer_pdfs(pasta):
+    """
+    PDFs da pasta e das subpastas, em ordem, com o os.stat_result de cada um. Pula
+    arquivos e pastas ocultos e não segue links de pastas; pastas ilegíveis são puladas.
+    """
+    try:
+        with os.scandir(pasta) as iterador:
+            entradas = sorted(iterador, key=lambda entrada: entrada.name)
+    except OSError:
+        return
+    for entrada in entradas:
+        if entrada.name.startswith("."):
+            continue
+        try:
+            if entrada.is_dir(follow_symlinks=False):
+                yield from varrer_pdfs(entrada.path)
+            elif entrada.name.lower().endswith(".pdf") and entrada.is_file():
+                yield Path(entrada.path), entrada.stat()
+        except OSError:
+            continue  # removido durante a varredura
+
+
+def _gravar_csv_temporario(pasta, transacoes):
+    """Grava o CSV num arquivo oculto na pasta; o processo principal o renomeia para o nome final."""
+    descritor, temporario = tempfile.mkstemp(prefix=".", suffix=".csv.tmp", dir=pasta)
+    try:
+        with os.fdopen(descritor, 'wb') as arquivo:
+            ResultadoExtrato(transacoes).gravar_csv(arquivo)
+    except BaseException:
+        os.remove(temporario)
+        raise
+    return temporario
+
+
+def _copiar_temporario(origem, pasta):
+    """Copia o CSV `origem` para um arquivo oculto na pasta, como _gravar_csv_temporario."""
+    descritor, temporario = tempfile.mkstemp(prefix=".", suffix=".csv.tmp", dir=pasta)
+    os.close(descritor)
+    try:
+        shutil.copyfile(origem, temporario)
+    except BaseException:
+        os.remove(temporario)
+        raise
+    return temporario
+
+
+def _descartar(caminho):
+    try:
+        os.remove(caminho)
+    except OSError:
+        pass
+
+
+def _resultado(caminho, erro=None):
+    return {'caminho': str(caminho), 'mtime': None, 'tamanho': None, 'sha256': None, 'banco': None,
+            'nome': None, 'temporario': None, 'transacoes': 0, 'tempos': {}, 'erro': erro}
+
+
+def processar_arquivo(caminho, timeout=EXTRATOR_TIMEOUT_ARQUIVO):
+    """
+    Processa um PDF do lote e grava o CSV num temporário na pasta dele. Roda no pool
+    de processos; retorna um dicionário com caminho, mtime e tamanho (lidos antes de
+    processar), sha256, banco, nome (sugerido para o CSV), temporario, transacoes,
+    tempos e erro (None no sucesso). Erros viram resultado, nunca exceção.
+    """
+    caminho = Path(caminho)
+    resultado = _resultado(caminho)
+    tempos = resultado['tempos']
+    try:
+        with tempo_limite(timeout), medir(tempos, 'total'):
+            # Antes do hash: se o PDF mudar durante o processamento, o diário fica com
+            # o mtime antigo e a próxima execução processa a versão nova
+            info = caminho.stat()
+            resultado['mtime'], resultado['tamanho'] = info.st_mtime, info.st_size
+            resultado['sha256'] = hash_fonte(caminho)
+            extracao = PIPELINE_EXTRATOS.extrair(caminho, caminho.name, tempos=tempos)
+            banco, transacoes = extracao.banco, extracao.transacoes
+            if not banco_identificado(banco):
+                resultado['erro'] = "Banco não identificado"
+                return resultado
+            resultado['banco'] = banco
+            if not transacoes:
+                resultado['erro'] = "Nenhuma transação encontrada"
+                return resultado
+            nome = RENOMEADOR.montar_nome(extracao.cliente, banco, extracao.periodo, caminho.stem,
+                                          incluir_banco=True)
+            with medir(tempos, 'csv'):
+                resultado['temporario'] = _gravar_csv_temporario(caminho.parent, transacoes)
+            resultado['nome'] = nome
+            resultado['transacoes'] = len(transacoes)
+    except TempoEsgotado:
+        resultado['erro'] = f"Tempo limite de {timeout:g}s excedido"
+    except Exception as e:
+        resultado['erro'] = str(e)
+    return resultado
+
+
+def _tamanho(pdf):
+    try:
+        return pdf.stat().st_size
+    except OSError:
+        return 0
+
+
+def _iniciar_processo():
+    # Ctrl+C chega a todo o grupo de processos: quem decide parar o lote é o processo
+    # principal, que deixa os arquivos em andamento terminarem
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+class DiarioLote:
+    """
+    Diário (manifesto) dos PDFs processados: um JSON por linha, gravado e descarregado
+    em disco a cada arquivo. Vale a última linha de cada caminho; linhas incompletas
+    (de uma queda no meio da gravação) são ignoradas. Quando as linhas passam do
+    dobro dos PDFs (e de COMPACTAR_A_PARTIR), o arquivo é reescrito só com a última
+    linha de cada um.
+    """
+
+    COMPACTAR_A_PARTIR = 1000
+
+    def __init__(self, caminho=PROCESSADOR_LOTE_DIARIO):
+        self.caminho = Path(caminho)
+        self._entradas = {}
+        self._donos = {}
+        self._por_hash = {}  # sha256 → {caminho: None}, dos PDFs com sucesso
+        self._tamanhos = set()  # tamanhos dos PDFs com sucesso
+        self._lock = threading.Lock()
+        self._carregar()
+
+    def _carregar(self):
+        linhas = 0
+        try:
+            with open(self.caminho, encoding='utf-8') as f:
+                for linha in f:
+                    linhas += 1
+                    try:
+                        self._guardar(json.loads(linha))
+                    except (ValueError, KeyError, TypeError):
+                        continue
+        except OSError:
+            return
+        if linhas > max(self.COMPACTAR_A_PARTIR, 2 * len(self._entradas)):
+            try:
+                self.compactar()
+            except OSError:
+                pass  # fica para a próxima
+
+    def _guardar(self, entrada):
+        self._entradas[entrada['caminho']] = entrada
+        if entrada.get('saida') and not entrada.get('erro'):
+            self._donos[entrada['saida']] = entrada['caminho']
+            if entrada.get('sha256'):
+                self._por_hash.setdefault(entrada['sha256'], {})[entrada['caminho']] = None
+                self._tamanhos.add(entrada['tamanho'])
+
+    def compactar(self):
+        """Reescreve o arquivo só com a entrada atual de cada PDF (troca atômica)."""
+        with self._lock:
+            temporario = self.caminho.with_name(f".{self.caminho.name}.tmp")
+            with open(temporario, 'w', encoding='utf-8') as f:
+                for entrada in self._entradas.values():
+                    f.write(json.dumps(entrada, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporario, self.caminho)
+
+    def entrada(self, pdf):
+        return self._entradas.get(str(pdf))
+
+    def tem_tamanho(self, tamanho):
+        """Se algum PDF processado com sucesso tem esse tamanho (antes de calcular hashes)."""
+        return tamanho in self._tamanhos
+
+    def por_hash(self, sha256, exceto=None):
+        """PDF processado com sucesso com esse SHA-256 e o CSV ainda no lugar (None se não há)."""
+        for caminho in self._por_hash.get(sha256, ()):
+            entrada = self._entradas[caminho]
+            if caminho != str(exceto) and entrada.get('sha256') == sha256 and not entrada.get('erro') \
+                    and entrada.get('saida') and os.path.exists(entrada['saida']):
+                return Path(caminho)
+        return None
+
+    def dono(self, saida):
+        """Caminho do PDF que gerou o CSV `saida` (None se nenhum do diário)."""
+        return self._donos.get(str(saida))
+
+    def concluido(self, pdf):
+        """
+        Se o PDF já foi processado com sucesso e não mudou desde então (mesmo mtime e
+        tamanho ou, se mudaram, o mesmo SHA-256) e o CSV gerado ainda existe.
+        """
+        entrada = self._entradas.get(str(pdf))
+        if entrada is None or entrada.get('erro') or not entrada.get('saida'):
+            return False
+        if not os.path.exists(entrada['saida']):
+            return False
+        try:
+            info = pdf.stat()
+            if entrada['mtime'] == info.st_mtime and entrada['tamanho'] == info.st_size:
+                return True
+            if hash_fonte(pdf) != entrada['sha256']:
+                return False
+        except OSError:
+            return False
+        # Arquivo copiado ou tocado sem mudar o conteúdo: atualiza o mtime no diário
+        self.registrar({**entrada, 'mtime': info.st_mtime, 'tamanho': info.st_size})
+        return True
+
+    def registrar(self, entrada):
+        with self._lock:
+            self._guardar(entrada)
+            self.caminho.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.caminho, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(entrada, ensure_ascii=False) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+
+class _Duplicatas:
+    """
+    Acha, entre os PDFs a processar, os que têm o mesmo conteúdo de um do diário
+    (viram cópia) ou de um já enviado ao pool (esperam por ele). O hash só é
+    calculado quando há outro PDF do mesmo tamanho.
+    """
+
+    def __init__(self, diario, usar_diario=True):
+        self.diario = diario
+        self.usar_diario = usar_diario
+        self._enviados = {}  # tamanho → {PDF enviado: sha256, ou None se ainda não foi preciso}
+        self._tamanho = {}  # PDF enviado → tamanho
+        self._aguardando = {}  # PDF enviado → cópias que esperam por ele
+
+    def classificar(self, pdf):
+        """
+        ("processar", None), ("copiar", origem do diário) ou ("aguardar", origem
+        enviada). Em "processar", o PDF passa a contar como enviado.
+        """
+        try:
+            tamanho = pdf.stat().st_size
+        except OSError:
+            return "processar", None
+        enviados = self._enviados.setdefault(tamanho, {})
+        sha = None
+        if enviados or (self.usar_diario and self.diario.tem_tamanho(tamanho)):
+            sha = self._hash(pdf)
+        if sha:
+            for outro in enviados:
+                if enviados[outro] is None:
+                    enviados[outro] = self._hash(outro)
+                if enviados[outro] == sha:
+                    self._aguardando.setdefault(outro, []).append(pdf)
+                    return "aguardar", outro
+            origem = self.diario.por_hash(sha, exceto=pdf) if self.usar_diario else None
+            if origem is not None:
+                return "copiar", origem
+        enviados[pdf] = sha
+        self._tamanho[pdf] = tamanho
+        return "processar", None
+
+    def concluido(self, pdf):
+        """Tira o PDF dos enviados e devolve as cópias que esperavam por ele."""
+        tamanho = self._tamanho.pop(pdf, None)
+        if tamanho is not None:
+            self._enviados[tamanho].pop(pdf, None)
+        return self._aguardando.pop(pdf, [])
+
+    @staticmethod
+    def _hash(pdf):
+        try:
+            return hash_fonte(pdf)
+        except OSError:
+            return None
+
+
+class VigiaPastas:
+    """
+    Acompanha os PDFs das pastas (com subpastas) por varredura. verificar() devolve
+    os PDFs novos ou alterados desde a última entrega que estão parados (mesmo
+    mtime e tamanho) há pelo menos `espera` segundos; cada versão sai uma vez só.
+    """
+
+    def __init__(self, pastas, espera=PROCESSADOR_LOTE_ESPERA):
+        self.pastas = [Path(pasta).resolve() for pasta in pastas]
+        self.espera = espera
+        self._arquivos = {}  # PDF → [(mtime_ns, tamanho), visto desde, entregue]
+
+    def _varrer(self):
+        for pasta in self.pastas:
+            # Pasta fora do ar não lista nada: fica para a próxima varredura
+            for pdf, info in varrer_pdfs(pasta):
+                yield pdf, (info.st_mtime_ns, info.st_size)
+
+    def verificar(self, agora=None):
+        agora = time.monotonic() if agora is None else agora
+        vistos, prontos = set(), []
+        for pdf, assinatura in self._varrer():
+            vistos.add(pdf)
+            estado = self._arquivos.get(pdf)
+            if estado is None or estado[0] != assinatura:
+                self._arquivos[pdf] = [assinatura, agora, False]
+            elif not estado[2] and agora - estado[1] >= self.espera:
+                estado[2] = True
+                prontos.append(pdf)
+        for pdf in self._arquivos.keys() - vistos:
+            del self._arquivos[pdf]
+        return sorted(prontos)
+
+
+class _PoolLote:
+    """
+    Pool de processos do lote com no máximo `workers` arquivos enviados; os demais
+    esperam na fila daqui. Assim todo arquivo enviado está num processo, e o prazo
+    de relógio (timeout + _FOLGA_PRAZO) conta de quando ele começa a rodar.
+
+    Um arquivo que passa do prazo falha, os processos do pool são encerrados e um
+    pool novo recebe de volta, no início da fila, os outros arquivos que estavam em
+    andamento. Se um processo morre sozinho (BrokenProcessPool), os arquivos em
+    andamento falham e a fila segue num pool novo.
+    """
+
+    def __init__(self, criar_pool, workers, timeout):
+        self._criar_pool = criar_pool
+        self.workers = workers
+        self.timeout = timeout
+        self._pool = None
+        self._fila = deque()
+        self._futuros = {}  # futuro → PDF
+        self._inicios = {}  # futuro → quando começou a rodar (monotonic)
+
+    def __len__(self):
+        return len(self._fila) + len(self._futuros)
+
+    def __contains__(self, pdf):
+        return pdf in self._fila or pdf in self._futuros.values()
+
+    def enviar(self, pdf):
+        self._fila.append(pdf)
+        self._preencher()
+
+    def cancelar_fila(self):
+        """Tira da fila e retorna os PDFs que ainda não foram para um processo."""
+        fila = list(self._fila)
+        self._fila.clear()
+        return fila
+
+    def _preencher(self):
+        while self._fila and len(self._futuros) < self.workers:
+            if self._pool is None:
+                self._pool = self._criar_pool(self.workers)
+            pdf = self._fila.popleft()
+            try:
+                futuro = self._pool.submit(processar_arquivo, str(pdf), self.timeout)
+            except BrokenProcessPool:
+                self._fila.appendleft(pdf)
+                self._trocar_pool()
+                continue
+            self._futuros[futuro] = pdf
+
+    def _trocar_pool(self, encerrar_processos=False):
+        """Descarta o pool (o próximo envio cria outro); com encerrar_processos, mata os processos dele."""
+        pool, self._pool = self._pool, None
+        if pool is None:
+            return
+        if encerrar_processos:
+            for processo in list((pool._processes or {}).values()):
+                processo.kill()
+        pool.shutdown(wait=encerrar_processos, cancel_futures=True)
+
+    def esperar(self, intervalo):
+        """
+        Espera até `intervalo` segundos por arquivos concluídos e retorna [(PDF, resultado)]
+        dos que terminaram ou passaram do prazo (ver processar_arquivo).
+        """
+        if not self._futuros:
+            return []
+        concluidos, _ = concurrent.futures.wait(
+            self._futuros, timeout=intervalo, return_when=concurrent.futures.FIRST_COMPLETED)
+        prontos, quebrado = [], False
+        for futuro in concluidos:
+            pdf = self._futuros.pop(futuro)
+            self._inicios.pop(futuro, None)
+            try:
+                resultado = futuro.result()
+            except Exception as e:
+                quebrado = quebrado or isinstance(e, BrokenProcessPool)
+                resultado = _resultado(pdf, f"Erro inesperado: {e}")
+            prontos.append((pdf, resultado))
+        if quebrado:
+            self._trocar_pool()
+        elif self.timeout:
+            prontos.extend(self._vencer_prazos())
+        self._preencher()
+        return prontos
+
+    def _vencer_prazos(self):
+        agora = time.monotonic()
+        vencidos = [
+            futuro for futuro in self._futuros
+            if futuro.running() and agora - self._inicios.setdefault(futuro, agora) > self.timeout + _FOLGA_PRAZO
+        ]
+        if not vencidos:
+            return []
+        prontos = []
+        for futuro in vencidos:
+            pdf = self._futuros.pop(futuro)
+            prontos.append((pdf, _resultado(pdf, f"Tempo limite de {self.timeout:g}s excedido (processo encerrado)")))
+        # Não há como parar só o processo preso: o pool todo é encerrado, e os outros
+        # arquivos em andamento, se não chegaram a terminar, voltam para o início da fila
+        andamento, self._futuros, self._inicios = self._futuros, {}, {}
+        self._trocar_pool(encerrar_processos=True)
+        reenviar = []
+        for futuro, pdf in andamento.items():
+            if futuro.done() and not futuro.cancelled() and futuro.exception() is None:
+                prontos.append((pdf, futuro.result()))
+            else:
+                reenviar.append(pdf)
+        self._fila.extendleft(reversed(reenviar))
+        return prontos
+
+    def encerrar(self, esperar=True):
+        """Fecha o pool; com esperar, aguarda os arquivos em andamento."""
+        if self._pool is not None:
+            try:
+                self._pool.shutdown(wait=esperar, cancel_futures=True)
+            except KeyboardInterrupt:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+class ProcessadorLote:
+    """
+    Processa PDFs de extratos em lote, em paralelo e retomável (ver o início do módulo).
+
+    ao_log(mensagem, nivel) recebe as mensagens (nivel: info, success, warning, error)
+    e ao_progresso(feitos, total) o andamento; os dois são chamados da thread que
+    roda executar() ou vigiar(). Com refazer=True, o diário é ignorado e tudo é
+    processado de novo.
+    """
+
+    def __init__(self, diario=PROCESSADOR_LOTE_DIARIO, workers=EXTRATOR_WORKERS,
+                 timeout=EXTRATOR_TIMEOUT_ARQUIVO, refazer=False, ao_log=None, ao_progresso=None):
+        self.diario = DiarioLote(diario)
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.refazer = refazer
+        self.ao_log = ao_log or (lambda mensagem, nivel: None)
+        self.ao_progresso = ao_progresso or (lambda feitos, total: None)
+        self._cancelado = threading.Event()
+
+    def cancelar(self):
+        """Para de iniciar arquivos novos; os que estão em andamento terminam e entram no diário."""
+        self._cancelado.set()
+
+    @property
+    def cancelado(self):
+        return self._cancelado.is_set()
+
+    def listar_pdfs(self, pastas):
+        """PDFs das pastas e subpastas, na ordem das pastas; um PDF em duas pastas da lista sai uma vez."""
+        pdfs, vistos = [], set()
+        for pasta in pastas:
+            if not os.path.isdir(pasta):
+                self.ao_log(f"Pasta não encontrada, ignorada: {pasta}", "warning")
+                continue
+            encontrados = [pdf.resolve() for pdf, _ in varrer_pdfs(pasta)]
+            encontrados = [pdf for pdf in encontrados if pdf not in vistos]
+            vistos.update(encontrados)
+            self.ao_log(f"{len(encontrados)} PDF(s) encontrado(s) em: {pasta}", "info")
+            pdfs.extend(encontrados)
+        return pdfs
+
+    def executar(self, pdfs):
+        """Processa os PDFs e retorna o ResumoLote. Ctrl+C (KeyboardInterrupt) cancela o lote."""
+        pdfs = [Path(pdf).resolve() for pdf in pdfs]
+        pendentes = pdfs if self.refazer else [pdf for pdf in pdfs if not self.diario.concluido(pdf)]
+        pulados = len(pdfs) - len(pendentes)
+        if pulados:
+            self.ao_log(f"{pulados} arquivo(s) já processado(s) em execuções anteriores, pulado(s)", "info")
+
+        feitos, sucesso, falha = pulados, 0, 0
+        self.ao_progresso(feitos, len(pdfs))
+
+        def contar(ok):
+            nonlocal feitos, sucesso, falha
+            if ok:
+                sucesso += 1
+            else:
+                falha += 1
+            feitos += 1
+            self.ao_progresso(feitos, len(pdfs))
+
+        duplicatas = _Duplicatas(self.diario, usar_diario=not self.refazer)
+        a_processar, copias = [], []
+        for pdf in pendentes:
+            acao, origem = duplicatas.classificar(pdf)
+            if acao == "processar":
+                a_processar.append(pdf)
+            elif acao == "copiar":
+                copias.append((pdf, origem))
+        for pdf, origem in copias:
+            contar(self._copiar(pdf, origem))
+        if not a_processar:
+            return ResumoLote(len(pdfs), pulados, sucesso, falha, self.cancelado)
+        # Os maiores primeiro: um PDF grande no fim da fila deixaria os outros processos parados
+        a_processar.sort(key=_tamanho, reverse=True)
+
+        pool = _PoolLote(self._novo_pool, min(self.workers, len(a_processar)), self.timeout)
+        esperar = True
+        try:
+            for pdf in a_processar:
+                pool.enviar(pdf)
+            while pool:
+                try:
+                    prontos = pool.esperar(0.5)
+                    if self.cancelado:
+                        pool.cancelar_fila()
+                    for pdf, resultado in prontos:
+                        contar(self._registrar(pdf, resultado))
+                        for copia in duplicatas.concluido(pdf):
+                            contar(self._copiar(copia, pdf))
+                except KeyboardInterrupt:
+                    if self.cancelado:
+                        # Segundo Ctrl+C: não espera nem os arquivos em andamento
+                        esperar = False
+                        raise
+                    self.ao_log("Interrompido: aguardando os arquivos em andamento", "warning")
+                    self.cancelar()
+        finally:
+            pool.encerrar(esperar)
+
+        return ResumoLote(len(pdfs), pulados, sucesso, falha, self.cancelado)
+
+    def vigiar(self, pastas, intervalo=PROCESSADOR_LOTE_INTERVALO, espera=PROCESSADOR_LOTE_ESPERA):
+        """
+        Modo contínuo: processa cada PDF novo ou alterado das pastas assim que ele
+        para de mudar (ver VigiaPastas), até cancelar() ou Ctrl+C. Os PDFs que já
+        estão no diário são pulados e as cópias de outro PDF copiam o CSV dele, como
+        em executar(). Retorna o ResumoLote do que foi visto; ao_progresso recebe
+        (concluídos, recebidos).
+        """
+        vigia = VigiaPastas(pastas, espera)
+        for pasta in vigia.pastas:
+            if not pasta.is_dir():
+                self.ao_log(f"Pasta não encontrada (será verificada de novo): {pasta}", "warning")
+        self.ao_log(f"Acompanhando {len(vigia.pastas)} pasta(s) a cada {intervalo:g}s", "info")
+
+        de_novo = set()  # PDFs que mudaram enquanto eram processados
+        enviados, pulados, sucesso, falha = 0, 0, 0, 0
+        duplicatas = _Duplicatas(self.diario, usar_diario=not self.refazer)
+        pool = _PoolLote(self._novo_pool, self.workers, self.timeout)
+        esperar = True
+        proxima_varredura = 0.0
+
+        def contar(ok):
+            nonlocal sucesso, falha
+            if ok:
+                sucesso += 1
+            else:
+                falha += 1
+            self.ao_progresso(sucesso + falha, enviados)
+
+        def enviar(pdf):
+            nonlocal enviados, pulados
+            if pdf in pool:
+                de_novo.add(pdf)
+                return
+            if not self.refazer and self.diario.concluido(pdf):
+                pulados += 1
+                return
+            acao, origem = duplicatas.classificar(pdf)
+            enviados += 1
+            if acao == "copiar":
+                contar(self._copiar(pdf, origem))
+            elif acao == "processar":
+                pool.enviar(pdf)
+                self.ao_log(f"Novo arquivo: {pdf.name}", "info")
+                self.ao_progresso(sucesso + falha, enviados)
+
+        try:
+            while pool or not self.cancelado:
+                try:
+                    if self.cancelado:
+                        for pdf in pool.cancelar_fila():
+                            enviados -= 1 + len(duplicatas.concluido(pdf))
+                    elif time.monotonic() >= proxima_varredura:
+                        proxima_varredura = time.monotonic() + intervalo
+                        for pdf in vigia.verificar():
+                            enviar(pdf)
+
+                    if pool:
+                        prontos = pool.esperar(intervalo)
+                    else:
+                        prontos = ()
+                        self._cancelado.wait(intervalo)
+
+                    for pdf, resultado in prontos:
+                        contar(self._registrar(pdf, resultado))
+                        for copia in duplicatas.concluido(pdf):
+                            contar(self._copiar(copia, pdf))
+                        if pdf in de_novo and not self.cancelado:
+                            de_novo.discard(pdf)
+                            enviar(pdf)
+                except KeyboardInterrupt:
+                    if self.cancelado:
+                        esperar = False
+                        raise
+                    self.ao_log("Interrompido: aguardando os arquivos em andamento", "warning")
+                    self.cancelar()
+        finally:
+            pool.encerrar(esperar)
+
+        return ResumoLote(enviados + pulados, pulados, sucesso, falha, self.cancelado)
+
+    def _novo_pool(self, workers):
+        return concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_iniciar_processo,
+        )
+
+    def _copiar(self, pdf, origem):
+        """Registra o PDF como cópia de `origem` (mesmo conteúdo), copiando o CSV dela em vez de processar."""
+        resultado = _resultado(pdf)
+        resultado['origem'] = str(origem)
+        entrada = self.diario.entrada(origem)
+        try:
+            info = pdf.stat()
+            resultado['mtime'], resultado['tamanho'] = info.st_mtime, info.st_size
+            if entrada is None or entrada.get('erro') or not entrada.get('saida'):
+                motivo = entrada.get('erro') if entrada else None
+                resultado['erro'] = f"Mesmo conteúdo de {origem}, que falhou" + (f": {motivo}" if motivo else "")
+            else:
+                resultado.update(sha256=entrada['sha256'], banco=entrada['banco'], transacoes=entrada['transacoes'],
+                                 nome=entrada.get('nome') or os.path.basename(entrada['saida']))
+                resultado['temporario'] = _copiar_temporario(entrada['saida'], pdf.parent)
+        except OSError as e:
+            resultado['erro'] = f"Falha ao copiar o CSV de {origem}: {e}"
+        return self._registrar(pdf, resultado)
+
+    def _registrar(self, pdf, resultado):
+        """Nome final do CSV, log, diário e ganchos do pipeline de um arquivo concluído; retorna se deu certo."""
+        erro, saida, origem = resultado['erro'], None, resultado.get('origem')
+        if resultado['banco']:
+            self.ao_log(f"{pdf.name}: {resultado['banco']}", "info")
+        if not erro:
+            saida = self._destino(pdf, resultado['nome'])
+            try:
+                os.replace(resultado['temporario'], saida)
+            except OSError as e:
+                _descartar(resultado['temporario'])
+                erro, saida = f"Falha ao gravar o CSV: {e}", None
+        if erro:
+            self.ao_log(f"{pdf.name}: {erro}", "error")
+        elif origem:
+            self.ao_log(f"{pdf.name} → {saida} (cópia de {origem})", "success")
+        else:
+            self.ao_log(f"{pdf.name} → {saida}", "success")
+
+        try:
+            self.diario.registrar({
+                'caminho': str(pdf),
+                'mtime': resultado['mtime'],
+                'tamanho': resultado['tamanho'],
+                'sha256': resultado['sha256'],
+                'banco': resultado['banco'],
+                'nome': resultado['nome'],
+                'saida': str(saida) if saida else None,
+                'transacoes': resultado['transacoes'],
+                'situacao': "erro" if erro else ("copia" if origem else "ok"),
+                'origem': origem,
+                'erro': erro,
+                'em': datetime.now().isoformat(timespec='seconds'),
+            })
+        except OSError as e:
+            self.ao_log(f"Falha ao gravar o diário ({self.diario.caminho}): {e}", "warning")
+
+        if origem is None:
+            PIPELINE_EXTRATOS.concluir(ROTA_LOTE, pdf.name, resultado['banco'], resultado['tempos'],
+                                       sucesso=erro is None, transacoes=resultado['transacoes'])
+        return erro is None
+
+    def _destino(self, pdf, nome):
+        """
+        Caminho do CSV na pasta do PDF. Um nome que já é de outro PDF do diário ganha
+        sufixo; o CSV anterior do próprio PDF (ou um sem dono, de outra ferramenta) é
+        sobrescrito.
+        """
+        base, extensao = os.path.splitext(nome)
+        destino, numero = pdf.parent / nome, 1
+        while self.diario.dono(destino) not in (None, str(pdf)):
+            numero += 1
+            destino = pdf.parent / f"{base}_{numero}{extensao}"
+        return destino
@@ -2,19 +2,15 @@
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from pathlib import Path
+import queue
 import threading
 from datetime import datetime
-import os
 import sys
 
 # Adicionar o diretório pai ao path para importar extrator_contajur
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from extrator_contajur.auxiliares.pdf_reader import read_pdf
-from extrator_contajur.auxiliares.pdf_reader2 import read_pdf2
-from extrator_contajur.banco import get_processor
-from extrator_contajur.auxiliares.xml_to_csv import xml_to_csv
-from extrator_contajur.auxiliares.renomeador import RenomeadorExtrato
+from processador_lote.lote import ProcessadorLote
 
 
 class BatchProcessorGUI:
@@ -25,10 +21,12 @@ class BatchProcessorGUI:
         self.root.resizable(True, True)
         
         self.input_folders = []  # Lista de pastas de entrada
-        self.is_processing = False
-        self.renomeador = RenomeadorExtrato()
+        self.processador = None
+        # Eventos da thread de processamento; só a thread do Tk mexe nos widgets
+        self.eventos = queue.Queue()
         
         self.setup_ui()
+        self.root.after(100, self._drenar_eventos)
         
     def setup_ui(self):
         """Configura a interface do usuário"""
@@ -72,7 +70,8 @@ class BatchProcessorGUI:
         # Nota sobre saída
         note_frame = ttk.Frame(main_frame)
         note_frame.grid(row=1, column=0, sticky=(tk.W, tk.E), pady=(0, 5))
-        ttk.Label(note_frame, text="Os CSVs gerados serão salvos na mesma pasta do PDF de origem.", 
+        ttk.Label(note_frame, text="Os CSVs gerados serão salvos na mesma pasta do PDF de origem. "
+                                   "Arquivos já processados e inalterados são pulados.", 
                   foreground="gray").grid(row=0, column=0, sticky=tk.W)
 
         # --- Botões de ação ---
@@ -87,6 +86,11 @@ class BatchProcessorGUI:
         
         ttk.Button(button_frame, text="Limpar Log", command=self.clear_log).grid(row=0, column=2, padx=5)
         
+        # Modo contínuo: continua acompanhando as pastas até Cancelar
+        self.watch_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(button_frame, text="Acompanhar pastas (processar PDFs que chegarem)",
+                        variable=self.watch_var).grid(row=0, column=3, padx=5)
+        
         # --- Barra de progresso ---
         progress_frame = ttk.Frame(main_frame)
         progress_frame.grid(row=3, column=0, sticky=(tk.W, tk.E), pady=5)
@@ -159,14 +163,32 @@ class BatchProcessorGUI:
     # ── Log ─────────────────────────────────────────────────────────────────
 
     def log_message(self, message, tag="info"):
+        """Pode ser chamado de qualquer thread: a mensagem entra na fila de eventos."""
+        self.eventos.put(("log", message, tag))
+
+    def _escrever_log(self, message, tag):
         timestamp = datetime.now().strftime("%H:%M:%S")
         self.log_text.insert(tk.END, f"[{timestamp}] {message}\n", tag)
         self.log_text.see(tk.END)
-        self.root.update_idletasks()
         
     def clear_log(self):
         self.log_text.delete(1.0, tk.END)
 
+    def _drenar_eventos(self):
+        """Aplica na interface os eventos da fila (log, progresso, fim do lote)."""
+        try:
+            while True:
+                evento, *args = self.eventos.get_nowait()
+                if evento == "log":
+                    self._escrever_log(*args)
+                elif evento == "progresso":
+                    self._atualizar_progresso(*args)
+                elif evento == "fim":
+                    self._finalizar(*args)
+        except queue.Empty:
+            pass
+        self.root.after(100, self._drenar_eventos)
+
     # ── Processamento ────────────────────────────────────────────────────────
         
     def start_processing(self):
@@ -175,120 +197,77 @@ class BatchProcessorGUI:
             messagebox.showerror("Erro", "Adicione pelo menos uma pasta de entrada!")
             return
 
-        # Coletar todos os PDFs de todas as pastas
-        pdf_files = []
-        for folder in self.input_folders:
-            if not os.path.exists(folder):
-                self.log_message(f"Pasta não encontrada, ignorada: {folder}", "warning")
-                continue
-            found = list(Path(folder).glob("*.pdf"))
-            self.log_message(f"{len(found)} PDF(s) encontrado(s) em: {folder}", "info")
-            pdf_files.extend(found)
+        processador = ProcessadorLote(
+            ao_log=self.log_message,
+            ao_progresso=lambda feitos, total: self.eventos.put(("progresso", feitos, total)),
+        )
+        if self.watch_var.get():
+            self.log_message(f"Acompanhando {len(self.input_folders)} pasta(s); Cancelar para parar", "info")
+            self.log_message("=" * 60, "info")
+            self._iniciar(processador, processador.vigiar, list(self.input_folders))
+            return
 
+        pdf_files = processador.listar_pdfs(self.input_folders)
         if not pdf_files:
             messagebox.showwarning("Aviso", "Nenhum arquivo PDF encontrado nas pastas selecionadas!")
             return
             
-        self.log_message(f"Total: {len(pdf_files)} arquivo(s) PDF para processar", "info")
+        self.log_message(f"Total: {len(pdf_files)} arquivo(s) PDF para processar "
+                         f"({processador.workers} em paralelo)", "info")
         self.log_message("=" * 60, "info")
-        
+        self._iniciar(processador, processador.executar, pdf_files)
+
+    def _iniciar(self, processador, executar, argumento):
         self.process_btn.config(state=tk.DISABLED)
         self.cancel_btn.config(state=tk.NORMAL)
-        self.is_processing = True
+        self.processador = processador
         
-        thread = threading.Thread(target=self.process_files, args=(pdf_files,), daemon=True)
+        thread = threading.Thread(target=self.process_files, args=(executar, argumento), daemon=True)
         thread.start()
         
     def cancel_processing(self):
-        self.is_processing = False
-        self.log_message("Processamento cancelado pelo usuário", "warning")
-        self.process_btn.config(state=tk.NORMAL)
+        if self.processador is None:
+            return
+        self.processador.cancelar()
+        self.log_message("Cancelando: os arquivos em andamento serão concluídos", "warning")
         self.cancel_btn.config(state=tk.DISABLED)
         
-    def process_files(self, pdf_files):
-        """Processa todos os arquivos PDF, salvando o CSV na mesma pasta do PDF"""
-        total_files = len(pdf_files)
-        successful = 0
-        failed = 0
-        
-        self.progress_bar['maximum'] = total_files
-        self.progress_bar['value'] = 0
-        
-        for index, pdf_file in enumerate(pdf_files, 1):
-            if not self.is_processing:
-                break
-                
-            self.log_message(f"\n[{index}/{total_files}] Processando: {pdf_file.name}", "info")
-            
-            # A saída é sempre a mesma pasta do PDF de origem
-            output_folder = pdf_file.parent
-            
-            try:
-                with open(pdf_file, 'rb') as file:
-                    text, identified_bank = read_pdf(file)
-                    
-                    if not text or identified_bank.startswith("Erro") or identified_bank == "Banco não identificado":
-                        self.log_message(f"Banco não identificado", "error")
-                        failed += 1
-                        continue
-                    
-                    self.log_message(f"   Banco identificado: {identified_bank}", "info")
-                    
-                    if identified_bank in ['Asaas', 'Bradesco', 'Sicoob1', 'Sicoob2', 'Sicoob3', 
-                                          'Stone', 'Itaú4', 'Banco do Brasil1', 'Safra', 
-                                          'Santander2', 'Efi1', 'Efi2', 'Mercado Pago']:
-                        file.seek(0)
-                        text = read_pdf2(file)
-                    
-                    processor = get_processor(identified_bank)
-                    xml_data, txt_data = processor(text)
-                    
-                    if xml_data is None or txt_data is None:
-                        self.log_message(f"Nenhuma transação encontrada", "error")
-                        failed += 1
-                        continue
-                    
-                    xml_data.seek(0)
-                    csv_data = xml_to_csv(xml_data)
-                    
-                    output_filename = self.renomeador.gerar_nome_arquivo(
-                        text,
-                        identified_bank,
-                        pdf_file.stem,
-                        incluir_banco=True
-                    )
-                    self.log_message(f"Nome gerado: {output_filename}", "info")
-                    
-                    output_path = output_folder / output_filename
-                    
-                    with open(output_path, 'wb') as output_file:
-                        output_file.write(csv_data.getvalue())
-                    
-                    self.log_message(f"Salvo em: {output_path}", "success")
-                    successful += 1
-                    
-            except Exception as e:
-                self.log_message(f"Erro: {str(e)}", "error")
-                failed += 1
-            
-            self.progress_bar['value'] = index
-            self.progress_label.config(text=f"{index} / {total_files} arquivos processados")
-            
-        # Finalizar
-        self.log_message("=" * 60, "info")
-        self.log_message(f"Processamento concluído!", "info")
-        self.log_message(f"Sucesso: {successful} arquivo(s)", "success")
-        if failed > 0:
-            self.log_message(f"Falha: {failed} arquivo(s)", "error")
-        
+    def process_files(self, executar, argumento):
+        """Roda o lote ou o modo contínuo (na thread de processamento) e avisa a interface no fim"""
+        try:
+            resumo = executar(argumento)
+        except Exception as e:
+            self.log_message(f"Erro: {str(e)}", "error")
+            resumo = None
+        self.eventos.put(("fim", resumo))
+
+    def _atualizar_progresso(self, feitos, total):
+        self.progress_bar['maximum'] = total
+        self.progress_bar['value'] = feitos
+        self.progress_label.config(text=f"{feitos} / {total} arquivos processados")
+
+    def _finalizar(self, resumo):
+        self.processador = None
         self.process_btn.config(state=tk.NORMAL)
         self.cancel_btn.config(state=tk.DISABLED)
-        self.is_processing = False
+        if resumo is None:
+            messagebox.showerror("Erro", "O processamento foi interrompido por um erro. Veja o log.")
+            return
+
+        titulo = "Cancelado" if resumo.cancelado else "Concluído"
+        self._escrever_log("=" * 60, "info")
+        self._escrever_log(f"Processamento {titulo.lower()}!", "info")
+        self._escrever_log(f"Sucesso: {resumo.sucesso} arquivo(s)", "success")
+        if resumo.pulados:
+            self._escrever_log(f"Já processados: {resumo.pulados} arquivo(s)", "info")
+        if resumo.falha > 0:
+            self._escrever_log(f"Falha: {resumo.falha} arquivo(s)", "error")
         
-        messagebox.showinfo("Concluído", 
-                          f"Processamento concluído!\n\n"
-                          f"Sucesso: {successful}\n"
-                          f"Falha: {failed}")
+        messagebox.showinfo(titulo, 
+                          f"Processamento {titulo.lower()}!\n\n"
+                          f"Sucesso: {resumo.sucesso}\n"
+                          f"Já processados: {resumo.pulados}\n"
+                          f"Falha: {resumo.falha}")
 
 
 def main():